@@ -168,6 +168,7 @@ __COMPONENTS__ = [
 
 from appbuilder.core.message import Message
 from appbuilder.core.agent import AgentRuntime
+from appbuilder.core.pipeline import Pipeline, PipelineResult
 from appbuilder.core.user_session import UserSession
 
 from appbuilder.utils.logger_util import logger
@@ -179,9 +180,11 @@ from appbuilder.core.utils import get_model_list
 
 from appbuilder.core.console.appbuilder_client.appbuilder_client import AppBuilderClient
 from appbuilder.core.console.appbuilder_client.async_appbuilder_client import AsyncAppBuilderClient
+from appbuilder.core.console.appbuilder_client.answer_accumulator import AnswerAccumulator
 from appbuilder.core.console.appbuilder_client.appbuilder_client import AgentBuilder
-from appbuilder.core.console.appbuilder_client.appbuilder_client import get_app_list, get_all_apps, describe_apps
+from appbuilder.core.console.appbuilder_client.appbuilder_client import get_app_list, get_all_apps, describe_apps, iter_apps
 from appbuilder.core.console.component_client.component_client import ComponentClient
+from appbuilder.core.console.component_client.async_component_client import AsyncComponentClient
 from appbuilder.core.console.knowledge_base.knowledge_base import KnowledgeBase
 from appbuilder.core.console.knowledge_base.data_class import CustomProcessRule, DocumentSource, DocumentChoices, DocumentChunker, DocumentSeparator, DocumentPattern, DocumentProcessOption
 
@@ -221,11 +224,14 @@ __all__ = [
     "get_model_list",
     "AppBuilderClient",
     "AsyncAppBuilderClient",
+    "AnswerAccumulator",
     "AgentBuilder",
     "ComponentClient",
+    "AsyncComponentClient",
     "get_app_list",
     "get_all_apps",
     "describe_apps",
+    "iter_apps",
     "KnowledgeBase",
     "CustomProcessRule",
     "DocumentSource",
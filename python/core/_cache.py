@@ -0,0 +1,322 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in response cache for deterministic component calls"""
+
+import json
+import time
+import base64
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import requests
+from multidict import CIMultiDict, CIMultiDictProxy
+from requests.structures import CaseInsensitiveDict
+
+from appbuilder.utils import json_util
+
+
+class CachedResponse:
+    r"""缓存的HTTP响应，只保存状态码、响应头与响应体"""
+
+    __slots__ = ("status", "headers", "content")
+
+    def __init__(self, status: int, headers: dict, content: bytes):
+        self.status = status
+        self.headers = headers
+        self.content = content
+
+    def dumps(self) -> str:
+        return json.dumps({
+            "status": self.status,
+            "headers": self.headers,
+            "content": base64.b64encode(self.content).decode(),
+        })
+
+    @classmethod
+    def loads(cls, value: str) -> "CachedResponse":
+        data = json.loads(value)
+        return cls(data["status"], data["headers"], base64.b64decode(data["content"]))
+
+    def to_response(self, url: str, response_class=requests.Response) -> requests.Response:
+        r"""转换为requests.Response，供同步组件使用"""
+        response = response_class()
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = url
+        return response
+
+    def to_async_response(self) -> "AsyncCachedResponse":
+        r"""转换为与aiohttp.ClientResponse接口一致的对象，供异步组件使用"""
+        return AsyncCachedResponse(self)
+
+
+class _CachedStreamReader:
+    def __init__(self, content: bytes):
+        self._content = content
+
+    async def iter_any(self):
+        if self._content:
+            yield self._content
+
+    async def iter_chunked(self, n: int):
+        for i in range(0, len(self._content), n):
+            yield self._content[i:i + n]
+
+    async def read(self, n: int = -1) -> bytes:
+        content, self._content = self._content, b""
+        return content
+
+
+class AsyncCachedResponse:
+    r"""命中缓存时异步session返回的响应"""
+
+    def __init__(self, cached: CachedResponse):
+        self.status = cached.status
+        self.headers = CIMultiDictProxy(CIMultiDict(cached.headers))
+        self.content = _CachedStreamReader(cached.content)
+        self._body = cached.content
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return self._body.decode(encoding)
+
+    async def json(self, *args, loads=json_util.loads, **kwargs):
+        return loads(self._body)
+
+    def release(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class MemoryCache:
+    r"""进程内LRU缓存，条目超过ttl秒后失效，线程安全。
+
+    Examples:
+
+    .. code-block:: python
+
+        from appbuilder.core._cache import MemoryCache
+
+        ocr = appbuilder.GeneralOCR()
+        ocr.enable_cache(MemoryCache(maxsize=4096, ttl=600))
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 3600):
+        r"""MemoryCache初始化方法.
+
+        参数:
+            maxsize(int, 可选): 最多缓存的响应数，超过时淘汰最久未使用的条目，默认为1024。
+            ttl(float, 可选): 条目有效期，单位秒，为None时不过期，默认为3600。
+        返回：
+            无
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expire, value = item
+            if expire is not None and expire < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedResponse):
+        expire = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expire, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SQLiteCache:
+    r"""基于sqlite的磁盘缓存，进程重启后仍然有效，多个进程可以共用同一个文件。
+
+    Examples:
+
+    .. code-block:: python
+
+        from appbuilder.core._cache import SQLiteCache
+
+        translation = appbuilder.Translation()
+        translation.enable_cache(SQLiteCache("/tmp/appbuilder_cache.db", ttl=86400))
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = 86400):
+        r"""SQLiteCache初始化方法.
+
+        参数:
+            path(str): sqlite数据库文件路径，不存在时自动创建。
+            ttl(float, 可选): 条目有效期，单位秒，为None时不过期，默认为86400。
+        返回：
+            无
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expire REAL)"
+            )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expire FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expire = row
+        # 磁盘缓存跨进程使用，过期时间使用墙上时间
+        if expire is not None and expire < time.time():
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+            return None
+        return CachedResponse.loads(value)
+
+    def set(self, key: str, value: CachedResponse):
+        expire = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, expire) VALUES (?, ?, ?)",
+                (key, value.dumps(), expire),
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM response_cache")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+
+def _fingerprint(value):
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, dict):
+        return {str(k): _fingerprint(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_fingerprint(v) for v in value]
+    # 文件对象、生成器、表单等无法稳定哈希的请求体不缓存
+    raise TypeError("unhashable request payload: {}".format(type(value)))
+
+
+class ResponseCache:
+    r"""组件级的响应缓存，将组件名与版本作为命名空间，并记录命中(hits)与未命中(misses)次数。
+
+    由Component.enable_cache创建并绑定到组件的HTTP客户端，同一个存储后端可以被多个组件共用。
+    缓存key包含鉴权密钥的哈希，使用不同密钥的调用方互不命中对方的缓存，密钥本身不写入存储后端。
+    """
+
+    def __init__(self, backend, name: str, version: str = ""):
+        self.backend = backend
+        self.name = name
+        self.version = version
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, method: str, url: str, params=None, data=None, json_body=None,
+                 credential: Optional[str] = None) -> Optional[str]:
+        r"""根据鉴权密钥、请求方法、接口地址与请求参数生成稳定的缓存key，请求体无法哈希时返回None.
+
+        url为包含网关地址的完整地址，不同网关的相同接口不会共用缓存。
+        """
+        try:
+            payload = json.dumps(
+                [method.upper(), url, _fingerprint(params), _fingerprint(data), _fingerprint(json_body)],
+                sort_keys=True, ensure_ascii=False,
+            )
+        except (TypeError, ValueError):
+            return None
+        namespace = hashlib.sha256((credential or "").encode()).hexdigest()[:16]
+        return "{}:{}:{}:{}".format(self.name, self.version, namespace, hashlib.sha256(payload.encode()).hexdigest())
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: CachedResponse):
+        self.backend.set(key, value)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def is_cacheable(status: int, headers) -> bool:
+    r"""只缓存成功的非流式响应"""
+    if status != requests.codes.ok:
+        return False
+    return "text/event-stream" not in headers.get("Content-Type", "")
+
+
+def is_error_body(content: bytes) -> bool:
+    r"""判断HTTP 200响应的响应体是否为错误信息，此类响应(如QPS超限、鉴权失败)不缓存.
+
+    百度智能云API以error_code/error_msg返回错误，AppBuilder网关以非0的code与message返回错误。
+    """
+    if content.lstrip()[:1] != b"{":
+        return False
+    try:
+        body = json_util.loads(content)
+    except ValueError:
+        return False
+    if not isinstance(body, dict):
+        return False
+    if "error_code" in body:
+        return True
+    return "message" in body and body.get("code") not in (None, 0, "0", "")
+
+
+# 未指定存储后端时所有组件共用的进程内缓存
+default_memory_cache = MemoryCache()
@@ -16,32 +16,432 @@
 
 import os
 import uuid
-from typing import Optional
+import asyncio
+import logging
+import threading
+from typing import Callable, Optional
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
-from aiohttp import ClientResponse
+from urllib3 import PoolManager
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from aiohttp import ClientResponse, TCPConnector
 
 from appbuilder.utils.logger_util import logger
 from appbuilder import get_default_header
 
 from appbuilder.core._exception import *
-from appbuilder.core._session import InnerSession, AsyncInnerSession
+from appbuilder.core._session import (
+    InnerSession,
+    AsyncInnerSession,
+    HTTPXInnerSession,
+    AsyncHTTPXInnerSession,
+    create_httpx_client,
+    import_httpx,
+)
+from appbuilder.core._retry import RetryPolicy
 from appbuilder.core.constants import (
     GATEWAY_URL,
     GATEWAY_URL_V2,
     CONSOLE_OPENAPI_VERSION,
     CONSOLE_OPENAPI_PREFIX,
     SECRET_KEY_PREFIX,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_POOL_BLOCK,
+    HTTP_ASYNC_LIMIT,
+    HTTP_ASYNC_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_TRANSPORT,
+    HTTP_TRANSPORT_REQUESTS,
+    HTTP_TRANSPORT_HTTPX,
 )
 from appbuilder.utils.logger_util import logger
 
 
+class ConnectionPoolStats:
+    r"""共享连接池的连接计数器，用于验证高并发下的连接复用情况"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.connections_acquired = 0
+
+    def record_opened(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_acquired(self):
+        with self._lock:
+            self.connections_acquired += 1
+
+    @property
+    def connections_reused(self) -> int:
+        r"""从连接池中取出的已有连接数量"""
+        return max(self.connections_acquired - self.connections_opened, 0)
+
+    def to_dict(self) -> dict:
+        return {
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "connections_acquired": self.connections_acquired,
+        }
+
+
+class _CountingPoolMixin:
+    stats: Optional[ConnectionPoolStats] = None
+
+    def _new_conn(self):
+        if self.stats is not None:
+            self.stats.record_opened()
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        if self.stats is not None:
+            self.stats.record_acquired()
+        return super()._get_conn(timeout=timeout)
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _SharedPoolManager(PoolManager):
+    def __init__(self, stats: ConnectionPoolStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+        self.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool.stats = self.stats
+        return pool
+
+
+class SharedPoolHTTPAdapter(HTTPAdapter):
+    r"""复用进程级共享连接池的HTTPAdapter。
+
+    每个HTTPClient仍持有独立的Adapter（及其重试策略），但底层的PoolManager由
+    HTTPConnectionPoolRegistry按网关地址统一管理，从而在多个组件实例之间复用keep-alive连接。
+    """
+
+    def __init__(self, pool_manager: PoolManager, max_retries=0):
+        self._shared_pool_manager = pool_manager
+        super().__init__(
+            pool_maxsize=pool_manager.connection_pool_kw.get("maxsize", HTTP_POOL_MAXSIZE),
+            pool_block=pool_manager.connection_pool_kw.get("block", HTTP_POOL_BLOCK),
+            max_retries=max_retries,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = self._shared_pool_manager
+
+    def close(self):
+        # 共享连接池由HTTPConnectionPoolRegistry统一管理，关闭单个session时不释放底层连接
+        for proxy in self.proxy_manager.values():
+            proxy.clear()
+
+
+def _finish_watcher(watcher):
+    # watcher在yield处等待，对应条目已移除时finally中没有需要等待的操作，可以同步结束
+    try:
+        watcher.aclose().send(None)
+    except StopIteration:
+        pass
+
+
+class _PerLoopMap:
+    r"""按事件循环保存TCPConnector或session，值需提供closed属性与异步的close方法.
+
+    值会强引用所在的事件循环，因此以id(loop)为key并在事件循环关闭时移除：asyncio.run等在关闭事件循环前调用
+    loop.shutdown_asyncgens()，此时关闭并移除对应的值；未经shutdown_asyncgens直接关闭的事件循环在下次创建值时移除。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # id(loop) -> (loop, value, watcher)
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def values(self) -> list:
+        return [entry[1] for entry in list(self._entries.values())]
+
+    def get_or_create(self, create: Callable):
+        r"""返回当前事件循环对应的值，不存在或已关闭时调用create创建，必须在事件循环中调用"""
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(id(loop))
+        if entry is not None and not entry[1].closed:
+            return entry[1]
+        with self._lock:
+            entry = self._entries.get(id(loop))
+            if entry is not None and not entry[1].closed:
+                return entry[1]
+            stale = self._pop_closed_loops()
+            watcher = entry[2] if entry is not None else self._watch(loop)
+            value = create()
+            self._entries[id(loop)] = (loop, value, watcher)
+        if entry is None:
+            # 第一次迭代时异步生成器注册到当前事件循环，由shutdown_asyncgens负责结束
+            try:
+                watcher.asend(None).send(None)
+            except StopIteration:
+                pass
+        for stale_watcher in stale:
+            _finish_watcher(stale_watcher)
+        return value
+
+    def pop(self):
+        r"""移除并返回当前事件循环对应的值，不存在时返回None"""
+        with self._lock:
+            entry = self._entries.pop(id(asyncio.get_running_loop()), None)
+        if entry is None:
+            return None
+        _finish_watcher(entry[2])
+        return entry[1]
+
+    def _pop_closed_loops(self) -> list:
+        stale = []
+        for key, (loop, _, watcher) in list(self._entries.items()):
+            if loop.is_closed():
+                del self._entries[key]
+                stale.append(watcher)
+        return stale
+
+    async def _watch(self, loop):
+        try:
+            yield
+        finally:
+            with self._lock:
+                entry = self._entries.pop(id(loop), None)
+            if entry is not None and not entry[1].closed:
+                await entry[1].close()
+
+
+class HTTPConnectionPoolRegistry:
+    r"""进程级共享HTTP连接池注册表, 是一个全局单例。
+
+    按网关地址维护共享的urllib3 PoolManager，所有同步组件、AppBuilderClient、KnowledgeBase、
+    Dataset及Assistant相关类创建的HTTPClient都会从这里获取连接池，避免每个组件实例重复建立TCP+TLS连接。
+
+    连接池参数默认从环境变量中读取:
+        APPBUILDER_HTTP_POOL_CONNECTIONS: 每个网关缓存的host连接池数量
+        APPBUILDER_HTTP_POOL_MAXSIZE: 每个host保持的最大连接数
+        APPBUILDER_HTTP_POOL_BLOCK: 连接数达到上限时是否阻塞等待空闲连接
+
+    异步客户端(AsyncHTTPClient)按事件循环共享一个aiohttp TCPConnector，参数默认从环境变量中读取:
+        APPBUILDER_HTTP_ASYNC_LIMIT: 同时打开的最大连接数
+        APPBUILDER_HTTP_ASYNC_LIMIT_PER_HOST: 每个host同时打开的最大连接数，0表示不限制
+        APPBUILDER_HTTP_KEEPALIVE_TIMEOUT: 空闲keep-alive连接的保留时间，单位秒
+        APPBUILDER_HTTP_DNS_CACHE_TTL: DNS解析结果的缓存时间，单位秒
+
+    Examples:
+
+    .. code-block:: python
+
+        from appbuilder.core._client import connection_pool_registry
+
+        connection_pool_registry.configure(pool_maxsize=64)
+        ...
+        print(connection_pool_registry.stats())
+    """
+    _instance = None
+    _initialized = False
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self._lock = threading.Lock()
+        self._pools = {}
+        self._stats = {}
+        self._httpx_clients = {}
+        # TCPConnector绑定在创建它的事件循环上，按事件循环分别共享，事件循环关闭时释放
+        self._connectors = _PerLoopMap()
+        self.pool_connections = int(
+            os.getenv("APPBUILDER_HTTP_POOL_CONNECTIONS", HTTP_POOL_CONNECTIONS))
+        self.pool_maxsize = int(
+            os.getenv("APPBUILDER_HTTP_POOL_MAXSIZE", HTTP_POOL_MAXSIZE))
+        self.pool_block = os.getenv(
+            "APPBUILDER_HTTP_POOL_BLOCK", str(HTTP_POOL_BLOCK)).lower() == "true"
+        self.async_limit = int(
+            os.getenv("APPBUILDER_HTTP_ASYNC_LIMIT", HTTP_ASYNC_LIMIT))
+        self.async_limit_per_host = int(
+            os.getenv("APPBUILDER_HTTP_ASYNC_LIMIT_PER_HOST", HTTP_ASYNC_LIMIT_PER_HOST))
+        self.keepalive_timeout = float(
+            os.getenv("APPBUILDER_HTTP_KEEPALIVE_TIMEOUT", HTTP_KEEPALIVE_TIMEOUT))
+        self.dns_cache_ttl = int(
+            os.getenv("APPBUILDER_HTTP_DNS_CACHE_TTL", HTTP_DNS_CACHE_TTL))
+
+    def __new__(cls, *args, **kwargs):
+        """
+        单例模式
+        """
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+        return cls._instance
+
+    def configure(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        async_limit: Optional[int] = None,
+        async_limit_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+        dns_cache_ttl: Optional[int] = None,
+    ):
+        r"""设置连接池参数，仅对之后新创建的连接池生效，如需对已有网关生效请先调用clear。
+
+        参数:
+            pool_connections(int, 可选): 每个网关缓存的host连接池数量。
+            pool_maxsize(int, 可选): 每个host保持的最大连接数。
+            pool_block(bool, 可选): 连接数达到上限时是否阻塞等待空闲连接。
+            async_limit(int, 可选): 异步客户端同时打开的最大连接数。
+            async_limit_per_host(int, 可选): 异步客户端每个host同时打开的最大连接数，0表示不限制。
+            keepalive_timeout(float, 可选): 异步客户端空闲keep-alive连接的保留时间，单位秒。
+            dns_cache_ttl(int, 可选): 异步客户端DNS解析结果的缓存时间，单位秒。
+        返回：
+            无
+        """
+        with self._lock:
+            if pool_connections is not None:
+                self.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if pool_block is not None:
+                self.pool_block = pool_block
+            if async_limit is not None:
+                self.async_limit = async_limit
+            if async_limit_per_host is not None:
+                self.async_limit_per_host = async_limit_per_host
+            if keepalive_timeout is not None:
+                self.keepalive_timeout = keepalive_timeout
+            if dns_cache_ttl is not None:
+                self.dns_cache_ttl = dns_cache_ttl
+
+    @staticmethod
+    def _key(gateway: str) -> str:
+        return gateway.rstrip("/")
+
+    def get(self, gateway: str) -> PoolManager:
+        r"""获取指定网关对应的共享PoolManager，不存在时创建。
+
+        参数:
+            gateway(str): 网关地址。
+        返回：
+            PoolManager: 共享的urllib3连接池管理器。
+        """
+        key = self._key(gateway)
+        pool_manager = self._pools.get(key)
+        if pool_manager is not None:
+            return pool_manager
+        with self._lock:
+            if key not in self._pools:
+                stats = self._stats.setdefault(key, ConnectionPoolStats())
+                self._pools[key] = _SharedPoolManager(
+                    stats,
+                    num_pools=self.pool_connections,
+                    maxsize=self.pool_maxsize,
+                    block=self.pool_block,
+                )
+            return self._pools[key]
+
+    def get_httpx_client(self, gateway: str):
+        r"""获取指定网关对应的共享httpx.Client(HTTP/2)，不存在时创建。
+
+        同一网关上的并发请求复用少量HTTP/2连接多路复用，连接数上限与keep-alive连接数沿用pool_maxsize。
+
+        参数:
+            gateway(str): 网关地址。
+        返回：
+            httpx.Client: 共享的httpx客户端。
+        """
+        key = self._key(gateway)
+        client = self._httpx_clients.get(key)
+        if client is not None:
+            return client
+        httpx = import_httpx()
+        with self._lock:
+            if key not in self._httpx_clients:
+                limits = httpx.Limits(
+                    max_connections=self.pool_maxsize if self.pool_block else None,
+                    max_keepalive_connections=self.pool_maxsize,
+                )
+                self._httpx_clients[key] = create_httpx_client(limits=limits)
+            return self._httpx_clients[key]
+
+    def get_connector(self) -> TCPConnector:
+        r"""获取当前事件循环共享的aiohttp TCPConnector，不存在或已关闭时创建，必须在事件循环中调用。
+
+        参数:
+            无
+        返回：
+            TCPConnector: 当前事件循环共享的连接器。
+        """
+        return self._connectors.get_or_create(lambda: TCPConnector(
+            limit=self.async_limit,
+            limit_per_host=self.async_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+        ))
+
+    async def aclose_connector(self):
+        r"""关闭当前事件循环共享的TCPConnector，通常在ASGI服务的shutdown阶段调用"""
+        connector = self._connectors.pop()
+        if connector is not None and not connector.closed:
+            await connector.close()
+
+    def stats(self, gateway: Optional[str] = None) -> dict:
+        r"""返回连接计数，包括新建连接数(connections_opened)与复用连接数(connections_reused)。
+
+        参数:
+            gateway(str, 可选): 网关地址，为空时返回所有网关的计数。
+        返回：
+            dict: 连接计数。
+        """
+        if gateway is not None:
+            stats = self._stats.get(self._key(gateway))
+            return stats.to_dict() if stats else ConnectionPoolStats().to_dict()
+        return {key: stats.to_dict() for key, stats in self._stats.items()}
+
+    def clear(self):
+        r"""关闭并移除所有共享连接池及计数"""
+        with self._lock:
+            for pool_manager in self._pools.values():
+                pool_manager.clear()
+            for client in self._httpx_clients.values():
+                client.close()
+            self._pools = {}
+            self._stats = {}
+            self._httpx_clients = {}
+
+
+connection_pool_registry = HTTPConnectionPoolRegistry()
+
+
 class HTTPClient:
     r"""HTTPClient类,实现与后端服务交互的公共方法"""
 
     def __init__(
-        self, secret_key: Optional[str] = None, gateway: str = "", gateway_v2: str = ""
+        self,
+        secret_key: Optional[str] = None,
+        gateway: str = "",
+        gateway_v2: str = "",
+        transport: Optional[str] = None,
     ):
         r"""HTTPClient初始化方法.
 
@@ -49,6 +449,8 @@ class HTTPClient:
             secret_key(str,可选): 用户鉴权token, 默认从环境变量中获取: os.getenv("APPBUILDER_TOKEN", "").
             gateway(str, 可选): 后端网关服务地址，默认从环境变量中获取: os.getenv("GATEWAY_URL", "")
             gateway_v2(str, 可选): 后端OpenAPI网关服务地址，当前仅AgentBuilder使用。默认从环境变量中获取: os.getenv("GATEWAY_URL_V2", "")
+            transport(str, 可选): HTTP传输层实现，可选 "requests" 或 "httpx"(HTTP/2多路复用，需安装httpx[http2])。
+                默认从环境变量中获取: os.getenv("APPBUILDER_HTTP_TRANSPORT", "requests")
         返回：
             无
         """
@@ -60,9 +462,66 @@ class HTTPClient:
         # Console OpenAPI
         self._init_gateway_url_v2(gateway_v2)
 
-        self.session = InnerSession()
+        self._init_transport(transport)
+
         self.retry = Retry(total=0, backoff_factor=0.1)
-        self.session.mount(self.gateway, HTTPAdapter(max_retries=self.retry))
+        self.response_cache = None
+        self.request_coalescer = None
+        self._init_session()
+
+    def set_response_cache(self, cache):
+        r"""设置session使用的响应缓存，为None时关闭缓存.
+
+        参数:
+            cache(ResponseCache): 组件级响应缓存，通常由Component.enable_cache创建。
+        返回：
+            无
+        """
+        self.response_cache = cache
+        self.session.response_cache = cache
+
+    def set_request_coalescer(self, coalescer):
+        r"""设置session使用的请求合并，为None时关闭请求合并.
+
+        参数:
+            coalescer(RequestCoalescer): 组件级请求合并，通常由Component.enable_coalescing创建。
+        返回：
+            无
+        """
+        self.request_coalescer = coalescer
+        self.session.request_coalescer = coalescer
+
+    def _init_transport(self, transport: Optional[str]):
+        self.transport = (
+            transport if transport else os.getenv("APPBUILDER_HTTP_TRANSPORT", HTTP_TRANSPORT)
+        ).lower()
+        if self.transport not in (HTTP_TRANSPORT_REQUESTS, HTTP_TRANSPORT_HTTPX):
+            raise ValueError(
+                'transport must be "{}" or "{}", got "{}"'.format(
+                    HTTP_TRANSPORT_REQUESTS, HTTP_TRANSPORT_HTTPX, self.transport
+                )
+            )
+
+    def _init_session(self):
+        if self.transport == HTTP_TRANSPORT_HTTPX:
+            self.session = HTTPXInnerSession(
+                client=connection_pool_registry.get_httpx_client(self.gateway)
+            )
+        else:
+            self.session = InnerSession()
+        self.session.rate_limit_key = self.secret_key
+        self._mount_shared_pool(self.gateway)
+        if self.gateway_v2 != self.gateway:
+            self._mount_shared_pool(self.gateway_v2)
+
+    def _mount_shared_pool(self, gateway: str):
+        if self.transport == HTTP_TRANSPORT_HTTPX:
+            self.session.mount(gateway, connection_pool_registry.get_httpx_client(gateway))
+            return
+        pool_manager = connection_pool_registry.get(gateway)
+        self.session.mount(
+            gateway, SharedPoolHTTPAdapter(pool_manager, max_retries=self.retry)
+        )
 
     def _init_gateway_url(self, gateway: str):
         if not gateway and not os.getenv("GATEWAY_URL"):
@@ -104,7 +563,7 @@ class HTTPClient:
             self.secret_key = "{} {}".format(
                 secret_key_prefix, self.secret_key)
 
-        logger.debug("AppBuilder Secret key: {}\n".format(self.secret_key))
+        logger.debug("AppBuilder Secret key: %s\n", self.secret_key)
 
     @staticmethod
     def check_response_header(response: requests.Response):
@@ -114,11 +573,12 @@ class HTTPClient:
         """
         status_code = response.status_code
         if status_code == requests.codes.ok:
-            response_headers = "\n\t".join([f"{key} : {value}" for key, value in response.headers.items()])
-            message = "\nrequest_id : {} \nhttp status : {}\nresponse headers : \n\t{}".format(
-                __class__.response_request_id(response), status_code, response_headers
-            )
-            logger.debug(message)
+            if logger.isEnabledFor(logging.DEBUG):
+                response_headers = "\n\t".join([f"{key} : {value}" for key, value in response.headers.items()])
+                message = "\nrequest_id : {} \nhttp status : {}\nresponse headers : \n\t{}".format(
+                    __class__.response_request_id(response), status_code, response_headers
+                )
+                logger.debug(message)
             return
         message = "request_id={} , http status code is {}, body is {}".format(
             __class__.response_request_id(response), status_code, response.text
@@ -151,7 +611,7 @@ class HTTPClient:
         # host + fix prefix + sub service path
         prefix = prefix if prefix else "/rpc/2.0/cloud_hub"
         final_url = self.gateway + prefix + sub_path
-        logger.debug("Service url: {}\n".format(final_url))
+        logger.debug("Service url: %s\n", final_url)
         return final_url
 
     def service_url_v2(self, sub_path: str, client_token: str = None):
@@ -171,7 +631,7 @@ class HTTPClient:
                 final_url += "&clientToken=" + client_token
             else:
                 final_url += "?clientToken=" + client_token
-        logger.debug("Service url: {}\n".format(final_url))
+        logger.debug("Service url: %s\n", final_url)
         return final_url
 
     @staticmethod
@@ -206,7 +666,7 @@ class HTTPClient:
         )
         auth_header["X-Bce-Request-Id"] = request_id if request_id else new_request_id
         auth_header["X-Appbuilder-Authorization"] = self.secret_key
-        logger.debug("Request header: {}\n".format(auth_header))
+        logger.debug("Request header: %s\n", auth_header)
         return auth_header
 
     def auth_header_v2(self, request_id: Optional[str] = None):
@@ -218,7 +678,7 @@ class HTTPClient:
         )
         auth_header["X-Bce-Request-Id"] = request_id if request_id else new_request_id
         auth_header["Authorization"] = self.secret_key
-        logger.debug("Request header: {}\n".format(auth_header))
+        logger.debug("Request header: %s\n", auth_header)
         return auth_header
 
     @staticmethod
@@ -230,9 +690,9 @@ class HTTPClient:
     def check_param(func):
         def inner(*args, **kwargs):
             retry = kwargs.get("retry", 0)
-            if retry < 0 or not isinstance(retry, int):
+            if not isinstance(retry, RetryPolicy) and (not isinstance(retry, int) or retry < 0):
                 raise InvalidRequestArgumentError(
-                    'Rqeuest argument "retry" format error. Expected retry >=0. Got {}'.format(
+                    'Rqeuest argument "retry" format error. Expected retry >=0 or RetryPolicy. Got {}'.format(
                         retry
                     )
                 )
@@ -249,9 +709,72 @@ class HTTPClient:
 
 
 class AsyncHTTPClient(HTTPClient):
-    def __init__(self, secret_key=None, gateway="", gateway_v2=""):
-        super().__init__(secret_key, gateway, gateway_v2)
-        self.session = AsyncInnerSession()
+    r"""AsyncHTTPClient类，实现与后端服务异步交互的公共方法。
+
+    session在首次访问时于当前运行的事件循环中创建（线程安全），同一事件循环上的所有AsyncHTTPClient
+    共享HTTPConnectionPoolRegistry中的TCPConnector。支持 `async with` 与 `aclose()` 释放session。
+
+    Examples:
+
+    .. code-block:: python
+
+        async with AsyncHTTPClient() as client:
+            response = await client.session.post(url, json=data)
+    """
+
+    def __init__(self, secret_key=None, gateway="", gateway_v2="", transport=None):
+        self._sessions = _PerLoopMap()
+        super().__init__(secret_key, gateway, gateway_v2, transport)
+
+    def _init_session(self):
+        # session与事件循环绑定，延迟到首次在事件循环中访问时创建
+        pass
+
+    def _create_session(self):
+        # httpx.AsyncClient的连接同样绑定在事件循环上，由各session自行管理
+        if self.transport == HTTP_TRANSPORT_HTTPX:
+            session = AsyncHTTPXInnerSession()
+        else:
+            session = AsyncInnerSession(
+                connector=connection_pool_registry.get_connector(), connector_owner=False
+            )
+        session.rate_limit_key = self.secret_key
+        session.response_cache = self.response_cache
+        session.request_coalescer = self.request_coalescer
+        return session
+
+    def set_response_cache(self, cache):
+        self.response_cache = cache
+        for session in list(self._sessions.values()):
+            session.response_cache = cache
+
+    def set_request_coalescer(self, coalescer):
+        self.request_coalescer = coalescer
+        for session in list(self._sessions.values()):
+            session.request_coalescer = coalescer
+
+    @property
+    def session(self):
+        r"""当前事件循环对应的session，不存在或已关闭时创建"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                "AsyncHTTPClient.session must be accessed inside a running event loop"
+            )
+        return self._sessions.get_or_create(self._create_session)
+
+    async def aclose(self):
+        r"""关闭当前事件循环对应的session，共享的TCPConnector不会被关闭"""
+        session = self._sessions.pop()
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
     @staticmethod
     async def check_response_header(response: ClientResponse):
@@ -316,7 +839,7 @@ class AssistantHTTPClient(HTTPClient):
         auth_header["X-Bce-Request-Id"] = request_id if request_id else new_request_id
         auth_header["X-Appbuilder-Authorization"] = self.secret_key
         auth_header["Content-Type"] = "application/json"
-        logger.debug("Request header: {}\n".format(auth_header))
+        logger.debug("Request header: %s\n", auth_header)
         return auth_header
 
     @staticmethod
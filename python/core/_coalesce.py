@@ -0,0 +1,357 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in single-flight coalescing of identical in-flight requests"""
+
+import json
+import asyncio
+import hashlib
+import threading
+from typing import Callable, Optional, Sequence
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from appbuilder.core._cache import _fingerprint
+from appbuilder.utils import json_util
+
+
+class _StreamTee:
+    r"""缓存上游响应的数据块，任意数量的读者都可以从头读取，由读得最快的读者从上游拉取下一块"""
+
+    def __init__(self, chunks, close: Callable, on_done: Callable):
+        self._chunks = iter(chunks)
+        self._close = close
+        self._on_done = on_done
+        self._buffer = []
+        self._done = False
+        self._error = None
+        self._lock = threading.Lock()
+        # 同一时间只有一个读者从上游拉取，落后的读者读取已缓存的数据块时不需要等待
+        self._pull_lock = threading.Lock()
+
+    def _pull(self):
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            error = None
+        except BaseException as e:
+            error = e
+        else:
+            with self._lock:
+                self._buffer.append(chunk)
+            return
+        with self._lock:
+            self._done, self._error = True, error
+        try:
+            self._close()
+        finally:
+            self._on_done()
+
+    def read(self):
+        r"""从头产出全部数据块，上游出错时在读到出错位置后抛出同一异常"""
+        i = 0
+        while True:
+            with self._lock:
+                if i < len(self._buffer):
+                    chunk = self._buffer[i]
+                elif self._done:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                else:
+                    chunk = None
+            if chunk is None:
+                with self._pull_lock:
+                    with self._lock:
+                        pending = i >= len(self._buffer) and not self._done
+                    if pending:
+                        self._pull()
+                continue
+            i += 1
+            yield chunk
+
+
+class _AsyncStreamTee:
+    r"""_StreamTee的异步版本，拉取在独立的Task中进行，某个读者被取消不影响其他读者"""
+
+    def __init__(self, chunks, close: Callable, on_done: Callable):
+        self._chunks = chunks.__aiter__()
+        self._close = close
+        self._on_done = on_done
+        self._buffer = []
+        self._done = False
+        self._error = None
+        self._pulling = None
+
+    async def _pull(self):
+        try:
+            self._buffer.append(await self._chunks.__anext__())
+            return
+        except StopAsyncIteration:
+            error = None
+        except BaseException as e:
+            error = e
+        finally:
+            self._pulling = None
+        self._done, self._error = True, error
+        try:
+            self._close()
+        finally:
+            self._on_done()
+
+    async def read(self):
+        i = 0
+        while True:
+            if i < len(self._buffer):
+                i += 1
+                yield self._buffer[i - 1]
+                continue
+            if self._done:
+                if self._error is not None:
+                    raise self._error
+                return
+            if self._pulling is None:
+                self._pulling = asyncio.ensure_future(self._pull())
+            await asyncio.shield(self._pulling)
+
+
+class CoalescedResponseMixin:
+    r"""合并请求的同步响应，响应体从_StreamTee读取，与requests.Response接口一致"""
+
+    _tee = None
+
+    def init_from(self, response, url: str, tee: _StreamTee):
+        self.status_code = response.status_code
+        self.headers = CaseInsensitiveDict(response.headers)
+        self.encoding = requests.utils.get_encoding_from_headers(self.headers)
+        self.reason = getattr(response, "reason", None)
+        self.url = getattr(response, "url", None) or url
+        self._tee = tee
+        return self
+
+    @property
+    def content(self) -> bytes:
+        if self._content is False:
+            self._content = b"".join(self._tee.read())
+        return self._content
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        chunks = self._tee.read()
+        if decode_unicode:
+            chunks = requests.utils.stream_decode_response_unicode(chunks, self)
+        return chunks
+
+    def close(self):
+        pass
+
+
+class _AsyncCoalescedStreamReader:
+    def __init__(self, tee: _AsyncStreamTee):
+        self._tee = tee
+
+    def iter_any(self):
+        return self._tee.read()
+
+    async def iter_chunked(self, n: int):
+        async for chunk in self._tee.read():
+            for i in range(0, len(chunk), n):
+                yield chunk[i:i + n]
+
+    async def read(self, n: int = -1) -> bytes:
+        return b"".join([chunk async for chunk in self._tee.read()])
+
+
+class AsyncCoalescedResponse:
+    r"""合并请求的异步响应，与aiohttp.ClientResponse接口一致"""
+
+    def __init__(self, response, tee: _AsyncStreamTee):
+        self.status = response.status
+        self.headers = response.headers
+        self.reason = getattr(response, "reason", None)
+        self.url = getattr(response, "url", None)
+        self.content = _AsyncCoalescedStreamReader(tee)
+        self._body = None
+
+    async def read(self) -> bytes:
+        if self._body is None:
+            self._body = await self.content.read()
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return (await self.read()).decode(encoding)
+
+    async def json(self, *args, loads=json_util.loads, **kwargs):
+        return loads(await self.read())
+
+    def release(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _is_event_stream(headers) -> bool:
+    return "text/event-stream" in headers.get("Content-Type", "")
+
+
+def _release_response(response, method: str = "close"):
+    release = getattr(response, method, None)
+    if release is not None:
+        release()
+
+
+async def _iter_body(body: bytes):
+    if body:
+        yield body
+
+
+def _noop():
+    pass
+
+
+class RequestCoalescer:
+    r"""组件级的请求合并(single-flight)，相同请求在上一个请求完成前到达时不再访问服务端，共享上一个请求的响应.
+
+    请求相同指请求方法、接口地址与请求参数一致，ignore_keys列出的请求体顶层字段(如每次随机生成的用户id)不参与比较。
+    非流式响应在收到完整响应体后即结束合并；流式(text/event-stream)响应在各调用方之间分流，每个调用方都从第一个
+    数据块开始读取，上游数据流读完前到达的相同请求同样加入分流。上游出错时所有调用方收到同一异常。
+    由Component.enable_coalescing创建并绑定到组件的HTTP客户端。
+    """
+
+    def __init__(self, name: str, ignore_keys: Sequence[str] = ()):
+        self.name = name
+        self.ignore_keys = tuple(ignore_keys)
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._ainflight = {}
+        self.upstream = 0
+        self.coalesced = 0
+
+    def _strip(self, body):
+        if isinstance(body, dict) and self.ignore_keys:
+            return {k: v for k, v in body.items() if k not in self.ignore_keys}
+        return body
+
+    def make_key(self, method: str, url: str, params=None, data=None, json_body=None) -> Optional[str]:
+        r"""生成合并请求的key，请求体无法哈希时返回None"""
+        try:
+            payload = json.dumps(
+                [method.upper(), url, _fingerprint(params), _fingerprint(self._strip(data)),
+                 _fingerprint(self._strip(json_body))],
+                sort_keys=True, ensure_ascii=False,
+            )
+        except (TypeError, ValueError):
+            return None
+        return "{}:{}".format(self.name, hashlib.sha256(payload.encode()).hexdigest())
+
+    def _count(self, leader: bool):
+        with self._lock:
+            if leader:
+                self.upstream += 1
+            else:
+                self.coalesced += 1
+
+    def _forget(self, table: dict, key, entry):
+        with self._lock:
+            if table.get(key) is entry:
+                del table[key]
+
+    def request(self, key: str, url: str, fetch: Callable, response_class):
+        r"""同步请求：第一个调用方执行fetch，其余调用方等待并共享其响应"""
+        with self._lock:
+            entry = self._inflight.get(key)
+            leader = entry is None
+            if leader:
+                entry = self._inflight[key] = {"event": threading.Event(), "response": None, "error": None}
+        self._count(leader)
+        if leader:
+            try:
+                response = fetch()
+                if _is_event_stream(response.headers):
+                    entry["tee"] = _StreamTee(response.iter_content(chunk_size=None),
+                                              lambda: _release_response(response),
+                                              lambda: self._forget(self._inflight, key, entry))
+                else:
+                    entry["tee"] = _StreamTee([response.content], _noop, _noop)
+                    self._forget(self._inflight, key, entry)
+                entry["response"] = response
+            except BaseException as e:
+                entry["error"] = e
+                self._forget(self._inflight, key, entry)
+                raise
+            finally:
+                entry["event"].set()
+        else:
+            entry["event"].wait()
+            if entry["error"] is not None:
+                raise entry["error"]
+        return response_class().init_from(entry["response"], url, entry["tee"])
+
+    async def arequest(self, key: str, fetch: Callable):
+        r"""异步请求，同一事件循环中的相同请求合并；发起请求的调用方被取消时，等待的调用方之一重新发起请求"""
+        loop = asyncio.get_running_loop()
+        table_key = (id(loop), key)
+        while True:
+            with self._lock:
+                entry = self._ainflight.get(table_key)
+                leader = entry is None
+                if leader:
+                    entry = self._ainflight[table_key] = {"future": loop.create_future()}
+            if leader:
+                break
+            try:
+                tee, response = await asyncio.shield(entry["future"])
+            except asyncio.CancelledError:
+                if entry["future"].cancelled():
+                    continue
+                raise
+            self._count(False)
+            return AsyncCoalescedResponse(response, tee)
+
+        self._count(True)
+        future = entry["future"]
+        try:
+            response = await fetch()
+        except asyncio.CancelledError:
+            self._forget(self._ainflight, table_key, entry)
+            future.cancel()
+            raise
+        except BaseException as e:
+            self._forget(self._ainflight, table_key, entry)
+            future.set_exception(e)
+            # 没有等待者时避免asyncio报告未获取的异常
+            future.exception()
+            raise
+        try:
+            if _is_event_stream(response.headers):
+                tee = _AsyncStreamTee(response.content.iter_any(), lambda: _release_response(response, "release"),
+                                      lambda: self._forget(self._ainflight, table_key, entry))
+            else:
+                tee = _AsyncStreamTee(_iter_body(await response.read()), _noop, _noop)
+                self._forget(self._ainflight, table_key, entry)
+        except BaseException as e:
+            self._forget(self._ainflight, table_key, entry)
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()
+            raise
+        future.set_result((tee, response))
+        return AsyncCoalescedResponse(response, tee)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"upstream": self.upstream, "coalesced": self.coalesced}
@@ -0,0 +1,161 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming multipart/form-data encoder for file uploads"""
+
+import os
+import uuid
+import asyncio
+import mimetypes
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+# 每次从磁盘读取的字节数，上传时内存占用与文件大小无关
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartEncoder:
+    r"""流式multipart/form-data编码器。
+
+    与requests的files参数不同，编码器不会把整个请求体读入内存，而是在发送时按chunk_size分块读取文件，
+    并预先计算Content-Length，因此上传大文件时内存占用恒定。文件在每次发送时打开、发送完毕或出错时立即关闭，
+    请求被重试时从头重新读取。
+
+    编码器同时支持同步迭代(requests、httpx)与异步迭代(aiohttp、httpx.AsyncClient)，通过data参数传给session，
+    并使用headers中的Content-Type与Content-Length。
+
+    Examples:
+
+    .. code-block:: python
+
+        from appbuilder.core._multipart import MultipartEncoder
+
+        encoder = MultipartEncoder(
+            fields=[("app_id", app_id), ("file", ("test.pdf", "/path/to/test.pdf"))],
+            progress_callback=lambda uploaded, total: print(uploaded, total),
+        )
+        headers.update(encoder.headers)
+        response = http_client.session.post(url, data=encoder, headers=headers)
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[Tuple[str, Union[str, Tuple]]],
+        boundary: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ):
+        r"""MultipartEncoder初始化方法.
+
+        参数:
+            fields(list): 表单字段列表，元素为(name, value)。普通字段的value为str，文件字段的value为
+                (filename, path)或(filename, path, content_type)，path为本地文件路径。
+            boundary(str, 可选): multipart分隔符，默认随机生成。
+            chunk_size(int, 可选): 每次读取文件的字节数，默认为64KB。
+            progress_callback(Callable[[int, int], None], 可选): 上传进度回调，参数为已发送字节数与总字节数。
+        返回：
+            无
+        """
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self._parts = []
+        for name, value in fields:
+            if isinstance(value, tuple):
+                filename, path = value[0], value[1]
+                content_type = value[2] if len(value) > 2 else None
+                if not os.path.isfile(path):
+                    raise FileNotFoundError("File {} does not exist".format(path))
+                content_type = content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                header = (
+                    '--{}\r\nContent-Disposition: form-data; name="{}"; filename="{}"\r\n'
+                    "Content-Type: {}\r\n\r\n".format(self.boundary, _quote(name), _quote(filename), content_type)
+                )
+                self._parts.append((header.encode("utf-8"), path))
+            else:
+                header = '--{}\r\nContent-Disposition: form-data; name="{}"\r\n\r\n'.format(
+                    self.boundary, _quote(name))
+                self._parts.append((header.encode("utf-8") + str(value).encode("utf-8"), None))
+        self._footer = "--{}--\r\n".format(self.boundary).encode("utf-8")
+        self.length = sum(
+            len(header) + (os.path.getsize(path) if path is not None else 0) + 2
+            for header, path in self._parts
+        ) + len(self._footer)
+
+    @property
+    def content_type(self) -> str:
+        return "multipart/form-data; boundary={}".format(self.boundary)
+
+    @property
+    def headers(self) -> dict:
+        r"""发送请求时需要设置的Content-Type与Content-Length"""
+        return {"Content-Type": self.content_type, "Content-Length": str(self.length)}
+
+    def __len__(self):
+        return self.length
+
+    def _report(self, uploaded: int):
+        if self.progress_callback is not None:
+            self.progress_callback(uploaded, self.length)
+
+    def __iter__(self):
+        # 每次迭代都从头生成请求体，重试时可以重新发送
+        uploaded = 0
+        for header, path in self._parts:
+            yield header
+            uploaded += len(header)
+            if path is not None:
+                with open(path, "rb") as f:
+                    while True:
+                        chunk = f.read(self.chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+                        uploaded += len(chunk)
+                        self._report(uploaded)
+            yield b"\r\n"
+            uploaded += 2
+        yield self._footer
+        self._report(uploaded + len(self._footer))
+
+    async def __aiter__(self):
+        loop = asyncio.get_running_loop()
+        uploaded = 0
+        for header, path in self._parts:
+            yield header
+            uploaded += len(header)
+            if path is not None:
+                # 在线程池中读取磁盘，不阻塞事件循环
+                f = await loop.run_in_executor(None, open, path, "rb")
+                try:
+                    while True:
+                        chunk = await loop.run_in_executor(None, f.read, self.chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+                        uploaded += len(chunk)
+                        self._report(uploaded)
+                finally:
+                    f.close()
+            yield b"\r\n"
+            uploaded += 2
+        yield self._footer
+        self._report(uploaded + len(self._footer))
+
+    def to_bytes(self) -> bytes:
+        r"""返回完整的请求体，仅用于调试与小文件"""
+        return b"".join(self)
@@ -0,0 +1,118 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy cursor paginator with next-page prefetch, and a TTL cache for full listings"""
+
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, Iterator, List, Optional
+
+
+def _item_id(item) -> str:
+    return item.id
+
+
+class Paginator:
+    r"""基于游标的惰性分页器，逐页请求并逐条产出，每收到一页即在后台请求下一页。
+
+    游标分页的下一页依赖上一页的最后一条，页与页之间无法并行；预取使下一页的网络往返与调用方处理当前页重叠，
+    调用方只关心前几条时也不必等待全部分页完成。某页条数小于page_size时视为最后一页。
+
+    Examples:
+
+    .. code-block:: python
+
+        from appbuilder.core._paginator import Paginator
+
+        paginator = Paginator(lambda marker: describe_apps(marker=marker, maxKeys=100), page_size=100)
+        for app in paginator:
+            print(app.id)
+    """
+
+    def __init__(self, fetch: Callable[[Optional[str]], list], page_size: int = 100,
+                 cursor: Callable[[object], str] = _item_id, prefetch: bool = True):
+        r"""Paginator初始化方法.
+
+        参数:
+            fetch(Callable[[Optional[str]], list]): 请求一页数据的函数，参数为游标，首页为None。
+            page_size(int, 可选): 每页条数，需与fetch请求的条数一致，默认为100。
+            cursor(Callable, 可选): 由一页的最后一条得到下一页游标的函数，默认取其id属性。
+            prefetch(bool, 可选): 是否在后台预取下一页，默认为True。
+        返回：
+            无
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive, got {}".format(page_size))
+        self.fetch = fetch
+        self.page_size = page_size
+        self.cursor = cursor
+        self.prefetch = prefetch
+
+    def pages(self) -> Iterator[list]:
+        r"""逐页产出非空的数据页"""
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        try:
+            page = self.fetch(None)
+            while True:
+                last = len(page) < self.page_size
+                future = None
+                if not last:
+                    marker = self.cursor(page[-1])
+                    if executor is not None:
+                        # 复制调用方的上下文，保证trace等上下文变量在预取线程中可见
+                        future = executor.submit(contextvars.copy_context().run, self.fetch, marker)
+                if page:
+                    yield page
+                if last:
+                    return
+                page = future.result() if future is not None else self.fetch(marker)
+        finally:
+            # 调用方提前停止迭代时丢弃尚未开始的预取
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def __iter__(self) -> Iterator:
+        for page in self.pages():
+            yield from page
+
+
+class ListingCache:
+    r"""完整列表的进程内缓存，读取时按调用方给定的ttl判断是否过期，线程安全"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def get(self, key: Hashable, ttl: Optional[float]) -> Optional[List]:
+        r"""返回缓存时间不超过ttl秒的列表副本，ttl为None或未命中时返回None"""
+        if ttl is None:
+            return None
+        with self._lock:
+            item = self._data.get(key)
+        if item is None or time.monotonic() - item[0] > ttl:
+            return None
+        return list(item[1])
+
+    def set(self, key: Hashable, value: List):
+        with self._lock:
+            self._data[key] = (time.monotonic(), tuple(value))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
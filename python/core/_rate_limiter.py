@@ -0,0 +1,282 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Token bucket rate limiter shared by sync and async callers"""
+
+import time
+import asyncio
+import threading
+from urllib.parse import urlparse
+from typing import Dict, Optional, Tuple, Union
+
+
+class RateLimiter:
+    r"""令牌桶限流器，线程安全，同步与异步调用方可以共用同一个实例。
+
+    令牌以每秒rate个的速度生成，桶中最多积累burst个令牌。获取令牌时若桶已空，调用方预定下一个令牌并在锁外等待，
+    因此并发调用方按到达顺序依次放行，总体速率不超过rate。
+
+    Examples:
+
+    .. code-block:: python
+
+        from appbuilder.core._rate_limiter import RateLimiter
+
+        limiter = RateLimiter(rate=2)
+        for message in messages:
+            limiter.acquire()
+            ocr.run(message)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        r"""RateLimiter初始化方法.
+
+        参数:
+            rate(float): 每秒允许通过的请求数，必须大于0。
+            burst(int, 可选): 允许的突发请求数，即令牌桶容量，默认为1。
+        返回：
+            无
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0, got {}".format(rate))
+        self.rate = float(rate)
+        self.burst = max(int(burst), 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def __repr__(self):
+        return "RateLimiter(rate={}, burst={})".format(self.rate, self.burst)
+
+    def _reserve(self) -> float:
+        r"""预定一个令牌，返回需要等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            self._acquired += 1
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+            self._throttled += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            return wait
+
+    def stats(self) -> dict:
+        r"""返回限流计数，包括获取令牌次数(acquired)、需要等待的次数(throttled)、
+        累计等待秒数(total_wait)与单次最长等待秒数(max_wait)"""
+        with self._lock:
+            return {
+                "acquired": self._acquired,
+                "throttled": self._throttled,
+                "total_wait": self._total_wait,
+                "max_wait": self._max_wait,
+            }
+
+    def acquire(self) -> float:
+        r"""阻塞直到获取一个令牌.
+
+        返回：
+            float: 本次等待的秒数。
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self) -> float:
+        r"""在事件循环中等待直到获取一个令牌，不阻塞其他协程.
+
+        返回：
+            float: 本次等待的秒数。
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class RateLimiterRegistry:
+    r"""进程级限流器注册表, 是一个全局单例。
+
+    按接口路径(endpoint)配置限流规则，按(secret_key, endpoint)维护令牌桶，同一进程内使用同一个secret_key
+    调用同一接口的所有线程、组件实例与事件循环共享配额，突发请求在客户端排队平滑发出，而不是被网关以429拒绝。
+
+    HTTPClient/AsyncHTTPClient创建的session在每次发送请求（包括重试）前从这里获取令牌，未配置规则的接口不受影响。
+    组件可以通过类属性rate_limits声明默认规则，用户通过configure覆盖。
+
+    Examples:
+
+    .. code-block:: python
+
+        from appbuilder.core._rate_limiter import rate_limiter_registry
+
+        # 通用文字识别接口限制为每秒10次，允许5次突发
+        rate_limiter_registry.configure("/v1/bce/aip/ocr/v1/accurate_basic", rate=10, burst=5)
+        ...
+        print(rate_limiter_registry.stats("/v1/bce/aip/ocr/v1/accurate_basic"))
+    """
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+        """
+        单例模式
+        """
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self._lock = threading.Lock()
+        self._defaults = {}
+        self._overrides = {}
+        self._rules = {}
+        self._resolved = {}
+        self._limiters = {}
+
+    @staticmethod
+    def _endpoint(url: str) -> str:
+        if url.startswith("/"):
+            return url
+        return urlparse(url).path
+
+    @staticmethod
+    def _rule(rate: float, burst: int = 1) -> Tuple[float, int]:
+        if rate <= 0:
+            raise ValueError("rate must be > 0, got {}".format(rate))
+        return float(rate), max(int(burst), 1)
+
+    def _rebuild(self):
+        rules = dict(self._defaults)
+        for endpoint, rule in self._overrides.items():
+            if rule is None:
+                rules.pop(endpoint, None)
+            else:
+                rules[endpoint] = rule
+        self._rules = rules
+        self._resolved = {}
+        self._limiters = {
+            key: limiter for key, limiter in self._limiters.items()
+            if rules.get(key[1]) == (limiter.rate, limiter.burst)
+        }
+
+    def configure(self, endpoint: str, rate: Optional[float], burst: int = 1):
+        r"""设置接口的限流规则，覆盖组件声明的默认规则，已创建的令牌桶按新规则重建.
+
+        参数:
+            endpoint(str): 接口路径，如 /v1/bce/aip/ocr/v1/accurate_basic，与网关前缀无关。
+            rate(float): 每秒允许的请求数，为None时取消该接口的限流。
+            burst(int, 可选): 允许的突发请求数，默认为1。
+        返回：
+            无
+        """
+        rule = None if rate is None else self._rule(rate, burst)
+        with self._lock:
+            self._overrides[self._endpoint(endpoint)] = rule
+            self._rebuild()
+
+    def register_defaults(self, rules: Dict[str, Union[float, Tuple[float, int]]]):
+        r"""注册组件声明的默认规则，configure设置的规则优先.
+
+        参数:
+            rules(dict): 接口路径到rate或(rate, burst)的映射。
+        返回：
+            无
+        """
+        if not rules:
+            return
+        with self._lock:
+            for endpoint, rule in rules.items():
+                rule = self._rule(*rule) if isinstance(rule, tuple) else self._rule(rule)
+                self._defaults[self._endpoint(endpoint)] = rule
+            self._rebuild()
+
+    def _resolve(self, path: str) -> Optional[str]:
+        # 请求路径包含网关前缀(如/rpc/2.0/cloud_hub)，按最长后缀匹配规则，匹配结果按路径缓存
+        try:
+            return self._resolved[path]
+        except KeyError:
+            pass
+        match = None
+        for endpoint in self._rules:
+            if path.endswith(endpoint) and (match is None or len(endpoint) > len(match)):
+                match = endpoint
+        self._resolved[path] = match
+        return match
+
+    def get_limiter(self, secret_key: Optional[str], url: str) -> Optional[RateLimiter]:
+        r"""返回secret_key调用url对应的令牌桶，url未配置限流规则时返回None.
+
+        参数:
+            secret_key(str): 用户鉴权token，None表示不区分用户。
+            url(str): 请求url。
+        返回：
+            RateLimiter: 令牌桶，或None。
+        """
+        if not self._rules:
+            return None
+        endpoint = self._resolve(self._endpoint(url))
+        if endpoint is None:
+            return None
+        key = (secret_key, endpoint)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(key)
+                rule = self._rules.get(endpoint)
+                if limiter is None and rule is not None:
+                    limiter = RateLimiter(*rule)
+                    self._limiters[key] = limiter
+        return limiter
+
+    def stats(self, endpoint: Optional[str] = None) -> dict:
+        r"""返回限流计数，同一接口不同secret_key的计数合并统计.
+
+        参数:
+            endpoint(str, 可选): 规则中的接口路径，为空时返回所有接口的计数。
+        返回：
+            dict: 限流计数，字段含义见RateLimiter.stats。
+        """
+        result = {}
+        for (_, path), limiter in list(self._limiters.items()):
+            stats = limiter.stats()
+            total = result.setdefault(path, {"acquired": 0, "throttled": 0, "total_wait": 0.0, "max_wait": 0.0})
+            total["acquired"] += stats["acquired"]
+            total["throttled"] += stats["throttled"]
+            total["total_wait"] += stats["total_wait"]
+            total["max_wait"] = max(total["max_wait"], stats["max_wait"])
+        if endpoint is not None:
+            return result.get(self._endpoint(endpoint),
+                              {"acquired": 0, "throttled": 0, "total_wait": 0.0, "max_wait": 0.0})
+        return result
+
+    def clear(self):
+        r"""移除configure设置的规则及所有令牌桶与计数，组件声明的默认规则保留"""
+        with self._lock:
+            self._overrides = {}
+            self._limiters = {}
+            self._rebuild()
+
+
+rate_limiter_registry = RateLimiterRegistry()
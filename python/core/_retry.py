@@ -0,0 +1,165 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-request retry policy for InnerSession"""
+
+import time
+import random
+import asyncio
+from email.utils import parsedate_to_datetime
+from typing import Optional, Iterable, Union
+
+import aiohttp
+import requests
+from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
+
+# aiohttp>=3.10 才区分建连超时(ConnectionTimeoutError)
+_AIOHTTP_CONNECT_ERRORS = (aiohttp.ClientConnectorError,) + (
+    (aiohttp.ConnectionTimeoutError,) if hasattr(aiohttp, "ConnectionTimeoutError") else ())
+
+
+class RetryPolicy:
+    r"""单次请求的重试策略。
+
+    与挂载在HTTPAdapter上的urllib3 Retry不同，RetryPolicy随请求传入InnerSession，不修改任何共享状态，
+    同一个组件实例可以在线程池中被并发调用，且每次调用使用各自的重试次数。
+
+    重试规则:
+        1. 连接未建立（建连失败、建连超时）的请求总是可以重试；
+        2. 幂等请求（GET/HEAD/PUT/DELETE/OPTIONS/TRACE，或显式指定idempotent=True）在读超时、
+           连接中断以及命中retry_on_status的状态码时重试；
+        3. 非幂等请求（如POST）仅在服务端明确拒绝处理时（429）重试；
+        4. 响应携带Retry-After头时优先按其等待，否则按指数退避并叠加随机抖动等待。
+
+    Examples:
+
+    .. code-block:: python
+
+        import appbuilder
+        from appbuilder.core._retry import RetryPolicy
+
+        ocr = appbuilder.GeneralOCR()
+        # 通用文字识别是无副作用的请求，可以声明为幂等，从而在5xx时也进行重试
+        out = ocr.run(message, retry=RetryPolicy(total=3, idempotent=True))
+    """
+
+    IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"])
+    RETRY_ON_STATUS = frozenset([429, 500, 502, 503, 504])
+    NON_IDEMPOTENT_RETRY_ON_STATUS = frozenset([429])
+
+    def __init__(
+        self,
+        total: int = 0,
+        backoff_factor: float = 0.1,
+        backoff_max: float = 10.0,
+        backoff_jitter: float = 0.1,
+        retry_on_status: Optional[Iterable[int]] = None,
+        idempotent: Optional[bool] = None,
+        respect_retry_after: bool = True,
+        retry_after_max: float = 60.0,
+    ):
+        r"""RetryPolicy初始化方法.
+
+        参数:
+            total(int, 可选): 最大重试次数，默认为0，表示不重试。
+            backoff_factor(float, 可选): 指数退避系数，第n次重试前等待 backoff_factor * 2 ** n 秒。
+            backoff_max(float, 可选): 指数退避的最大等待时间，单位秒。
+            backoff_jitter(float, 可选): 在退避时间上叠加的随机抖动上限，单位秒。
+            retry_on_status(Iterable[int], 可选): 需要重试的HTTP状态码，默认为 429/500/502/503/504。
+            idempotent(bool, 可选): 请求是否幂等，默认为None，表示根据请求方法判断。
+            respect_retry_after(bool, 可选): 是否遵循响应中的Retry-After头。
+            retry_after_max(float, 可选): Retry-After等待时间的上限，单位秒。
+        返回：
+            无
+        """
+        if total < 0:
+            raise ValueError("total must be >= 0, got {}".format(total))
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.backoff_jitter = backoff_jitter
+        self.retry_on_status = frozenset(
+            retry_on_status) if retry_on_status is not None else self.RETRY_ON_STATUS
+        self.idempotent = idempotent
+        self.respect_retry_after = respect_retry_after
+        self.retry_after_max = retry_after_max
+
+    @classmethod
+    def from_value(cls, retry: Union[int, "RetryPolicy", None]) -> Optional["RetryPolicy"]:
+        r"""将组件接口中的retry参数（int或RetryPolicy）转换为RetryPolicy，负数与0一样表示不重试"""
+        if retry is None or isinstance(retry, RetryPolicy):
+            return retry
+        return cls(total=max(retry, 0))
+
+    def __repr__(self):
+        return "RetryPolicy(total={}, backoff_factor={}, idempotent={})".format(
+            self.total, self.backoff_factor, self.idempotent)
+
+    def is_idempotent(self, method: str) -> bool:
+        if self.idempotent is not None:
+            return self.idempotent
+        return method.upper() in self.IDEMPOTENT_METHODS
+
+    def is_retry_status(self, method: str, status_code: int) -> bool:
+        if self.is_idempotent(method):
+            return status_code in self.retry_on_status
+        return status_code in self.retry_on_status & self.NON_IDEMPOTENT_RETRY_ON_STATUS
+
+    def is_retry_exception(self, method: str, error: Exception) -> bool:
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.exceptions.ConnectionError):
+            reason = error.args[0] if error.args else None
+            reason = getattr(reason, "reason", reason)
+            if isinstance(reason, (NewConnectionError, ConnectTimeoutError)):
+                return True
+            return self.is_idempotent(method)
+        if isinstance(error, requests.exceptions.Timeout):
+            return self.is_idempotent(method)
+        # 异步请求(aiohttp)的异常
+        if isinstance(error, _AIOHTTP_CONNECT_ERRORS):
+            return True
+        if isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)):
+            return self.is_idempotent(method)
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        r"""第attempt次（从0开始）重试前的指数退避等待时间"""
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        if self.backoff_jitter > 0:
+            delay += random.uniform(0, self.backoff_jitter)
+        return delay
+
+    def retry_after(self, response) -> Optional[float]:
+        r"""解析响应中的Retry-After头，支持秒数与HTTP日期两种格式"""
+        if not self.respect_retry_after:
+            return None
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), self.retry_after_max)
+
+    def wait_time(self, attempt: int, response=None) -> float:
+        if response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        return self.backoff(attempt)
@@ -12,15 +12,140 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+import asyncio
+import inspect
+import logging
 import requests
 import json
 import aiohttp
 from aiohttp import ClientSession, hdrs
+from urllib3.exceptions import NewConnectionError
+from appbuilder.core._retry import RetryPolicy
+from appbuilder.core._rate_limiter import rate_limiter_registry
+from appbuilder.core._cache import CachedResponse, is_cacheable, is_error_body
+from appbuilder.core._coalesce import CoalescedResponseMixin
+from appbuilder.core._multipart import MultipartEncoder
+from appbuilder.utils import json_util
 from appbuilder.utils.logger_util import logger
 from appbuilder.utils.trace.tracer_wrapper import session_post
 
 
+def _request_with_retry(method, url, retry, send, limiter=None):
+    """
+    Call send() and retry it according to the retry policy, shared by all sync session backends.
+
+    When a rate limiter is given, every attempt (including retries) waits for a token first.
+    """
+    if limiter is not None:
+        _send = send
+
+        def send():
+            limiter.acquire()
+            return _send()
+
+    policy = RetryPolicy.from_value(retry)
+    if policy is None or policy.total == 0:
+        return send()
+
+    attempt = 0
+    while True:
+        try:
+            response = send()
+        except requests.exceptions.RequestException as e:
+            if attempt >= policy.total or not policy.is_retry_exception(method, e):
+                raise
+            wait = policy.wait_time(attempt)
+            logger.debug("Retry %s %s in %.3fs after error: %s", method, url, wait, e)
+        else:
+            if attempt >= policy.total or not policy.is_retry_status(method, response.status_code):
+                return response
+            wait = policy.wait_time(attempt, response)
+            logger.debug("Retry %s %s in %.3fs after http status %s",
+                         method, url, wait, response.status_code)
+            response.close()
+        time.sleep(wait)
+        attempt += 1
+
+
+def _request_with_cache(session, method, url, retry, send, params=None, data=None, json=None,
+                        files=None, stream=False):
+    """
+    Send a sync request with the session's rate limiter, serving it from the session's response cache when enabled.
+
+    When the session has a request coalescer, identical concurrent requests share one upstream call.
+    """
+    limiter = rate_limiter_registry.get_limiter(session.rate_limit_key, url)
+    fetch = lambda: _request_with_retry(method, url, retry, send, limiter)
+    coalescer = session.request_coalescer
+    if coalescer is not None and not files:
+        coalesce_key = coalescer.make_key(method, url, params, data, json)
+        if coalesce_key is not None:
+            _fetch = fetch
+            fetch = lambda: coalescer.request(coalesce_key, url, _fetch, CoalescedInnerResponse)
+    cache = session.response_cache
+    key = None
+    if cache is not None and not stream and not files:
+        key = cache.make_key(method, url, params, data, json, credential=session.rate_limit_key)
+    if key is None:
+        return fetch()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached.to_response(url, InnerResponse)
+    response = fetch()
+    if is_cacheable(response.status_code, response.headers) and not is_error_body(response.content):
+        cache.set(key, CachedResponse(response.status_code, dict(response.headers), response.content))
+    return response
+
+
+def _has_content_type(headers) -> bool:
+    return bool(headers) and any(k.lower() == "content-type" for k in headers)
+
+
+def _json_headers(headers):
+    if _has_content_type(headers):
+        return headers
+    headers = dict(headers) if headers else {}
+    headers["Content-Type"] = "application/json"
+    return headers
+
+
+def _encode_json_body(kwargs: dict):
+    """
+    Serialize the json argument with the SDK json codec, instead of the stdlib json used by requests.
+    """
+    kwargs["data"] = json_util.dumps_bytes(kwargs.pop("json"))
+    kwargs["headers"] = _json_headers(kwargs.get("headers"))
+
+
+class InnerResponse(requests.Response):
+    """
+    requests.Response that parses json() with the SDK json codec.
+    """
+
+    def json(self, **kwargs):
+        encoding = self.encoding
+        if kwargs or (encoding and encoding.lower() not in ("utf-8", "utf8")):
+            return super().json(**kwargs)
+        try:
+            return json_util.loads(self.content)
+        except json.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
+class CoalescedInnerResponse(CoalescedResponseMixin, InnerResponse):
+    """
+    InnerResponse shared by coalesced requests, its body is replayed from the upstream response.
+    """
+
+
 class InnerSession(requests.sessions.Session):
+    # 限流器按(rate_limit_key, endpoint)共享配额，由HTTPClient设置为secret_key
+    rate_limit_key = None
+    # 组件开启缓存时由HTTPClient设置为ResponseCache
+    response_cache = None
+    # 组件开启请求合并时由HTTPClient设置为RequestCoalescer
+    request_coalescer = None
 
     def __init__(self, *args, **kwargs):
         """
@@ -52,12 +177,36 @@ class InnerSession(requests.sessions.Session):
                 curl += " \\\n-d '{0}'".format(request.body)
         return curl
 
+    def request(self, method, url, *args, retry=None, **kwargs):
+        """
+        Send request using inner session, retry according to the per-request retry policy.
+
+        retry can be an int (max retry count) or a RetryPolicy. It is only used by this call,
+        so the same session can be shared by concurrent callers with different retry settings.
+        """
+        if args:
+            send = lambda: super(InnerSession, self).request(method, url, *args, **kwargs)
+            return _request_with_retry(
+                method, url, retry, send, rate_limiter_registry.get_limiter(self.rate_limit_key, url))
+        data, json_body = kwargs.get("data"), kwargs.get("json")
+        if json_body is not None and data is None and not kwargs.get("files"):
+            _encode_json_body(kwargs)
+        send = lambda: super(InnerSession, self).request(method, url, **kwargs)
+        return _request_with_cache(
+            self, method, url, retry, send,
+            params=kwargs.get("params"), data=data, json=json_body,
+            files=kwargs.get("files"), stream=kwargs.get("stream"),
+        )
+
     def send(self, request, **kwargs):
         """
         Send request using inner session.
         """
-        logger.debug("Curl Command:\n" + self.build_curl(request) + "\n")
-        return super(InnerSession, self).send(request, **kwargs)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Curl Command:\n" + self.build_curl(request) + "\n")
+        response = super(InnerSession, self).send(request, **kwargs)
+        response.__class__ = InnerResponse
+        return response
 
     @session_post
     def post(self, url, data=None, json=None, **kwargs):
@@ -76,12 +225,26 @@ class InnerSession(requests.sessions.Session):
         return super().put(url=url, data=data, **kwargs)
 
 
+class AsyncInnerResponse(aiohttp.ClientResponse):
+    """
+    aiohttp.ClientResponse that parses json() with the SDK json codec.
+    """
+
+    async def json(self, *, encoding=None, loads=json_util.loads, content_type="application/json"):
+        return await super().json(encoding=encoding, loads=loads, content_type=content_type)
+
+
 class AsyncInnerSession(ClientSession):
+    rate_limit_key = None
+    response_cache = None
+    request_coalescer = None
 
     def __init__(self, *args, **kwargs):
         """
         Initialize inner session.
         """
+        kwargs.setdefault("json_serialize", json_util.dumps)
+        kwargs.setdefault("response_class", AsyncInnerResponse)
         super(AsyncInnerSession, self).__init__(*args, **kwargs)
 
     async def build_curl(self, method, url, data=None, json_data=None, **kwargs) -> str:
@@ -109,18 +272,525 @@ class AsyncInnerSession(ClientSession):
 
         return curl
 
+    async def post(self, url, data=None, json=None, retry=None, **kwargs):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Curl Command:\n" + await self.build_curl(hdrs.METH_POST, url, data=data, json_data=json, **kwargs) + "\n")
+        kwargs = _aiohttp_kwargs(kwargs)
+        return await _arequest_with_cache(
+            self, hdrs.METH_POST, url, retry,
+            lambda: super(AsyncInnerSession, self).post(url=url, data=data, json=json, **kwargs),
+            data=data, json=json, params=kwargs.get("params"),
+        )
+
+    async def delete(self, url, retry=None, **kwargs):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Curl Command:\n" + await self.build_curl(hdrs.METH_DELETE, url, **kwargs) + "\n")
+        kwargs = _aiohttp_kwargs(kwargs)
+        return await _arequest_with_cache(
+            self, hdrs.METH_DELETE, url, retry,
+            lambda: super(AsyncInnerSession, self).delete(url=url, **kwargs),
+            params=kwargs.get("params"),
+        )
+
+    async def get(self, url, retry=None, **kwargs):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Curl Command:\n" + await self.build_curl(hdrs.METH_GET, url, **kwargs) + "\n")
+        kwargs = _aiohttp_kwargs(kwargs)
+        return await _arequest_with_cache(
+            self, hdrs.METH_GET, url, retry,
+            lambda: super(AsyncInnerSession, self).get(url=url, **kwargs),
+            params=kwargs.get("params"),
+        )
+
+    async def put(self, url, data=None, retry=None, **kwargs):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Curl Command:\n" + await self.build_curl(hdrs.METH_PUT, url, data=data, **kwargs) + "\n")
+        kwargs = _aiohttp_kwargs(kwargs)
+        return await _arequest_with_cache(
+            self, hdrs.METH_PUT, url, retry,
+            lambda: super(AsyncInnerSession, self).put(url=url, data=data, **kwargs),
+            data=data, params=kwargs.get("params"),
+        )
+
+
+async def _arequest_with_cache(session, method, url, retry, send, params=None, data=None, json=None,
+                               files=None):
+    """
+    Send an async request with the session's rate limiter, serving it from the session's response cache when enabled.
+
+    When the session has a request coalescer, identical concurrent requests on the same event loop share one upstream call.
+    """
+    limiter = rate_limiter_registry.get_limiter(session.rate_limit_key, url)
+    fetch = lambda: _arequest_with_retry(method, url, retry, send, limiter)
+    coalescer = session.request_coalescer
+    if coalescer is not None and not files:
+        coalesce_key = coalescer.make_key(method, url, params, data, json)
+        if coalesce_key is not None:
+            _fetch = fetch
+            fetch = lambda: coalescer.arequest(coalesce_key, _fetch)
+    cache = session.response_cache
+    key = None
+    if cache is not None and not files:
+        key = cache.make_key(method, url, params, data, json, credential=session.rate_limit_key)
+    if key is None:
+        return await fetch()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached.to_async_response()
+    response = await fetch()
+    if is_cacheable(response.status, response.headers):
+        content = await response.read()
+        if not is_error_body(content):
+            cache.set(key, CachedResponse(response.status, dict(response.headers), content))
+    return response
+
+
+def _aiohttp_kwargs(kwargs):
+    """
+    Convert requests style arguments used by components to aiohttp: (connect, read) timeout tuple.
+    """
+    timeout = kwargs.get("timeout")
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        kwargs["timeout"] = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+    return kwargs
+
+
+async def _arequest_with_retry(method, url, retry, send, limiter=None):
+    """
+    Await send() and retry it according to the retry policy, shared by all async session backends.
+
+    When a rate limiter is given, every attempt (including retries) waits for a token first.
+    """
+    if limiter is not None:
+        _send = send
+
+        async def send():
+            await limiter.aacquire()
+            return await _send()
+
+    policy = RetryPolicy.from_value(retry)
+    if policy is None or policy.total == 0:
+        return await send()
+
+    attempt = 0
+    while True:
+        try:
+            response = await send()
+        except (aiohttp.ClientError, asyncio.TimeoutError, requests.exceptions.RequestException) as e:
+            if attempt >= policy.total or not policy.is_retry_exception(method, e):
+                raise
+            wait = policy.wait_time(attempt)
+            logger.debug("Retry %s %s in %.3fs after error: %s", method, url, wait, e)
+        else:
+            if attempt >= policy.total or not policy.is_retry_status(method, response.status):
+                return response
+            wait = policy.wait_time(attempt, response)
+            logger.debug("Retry %s %s in %.3fs after http status %s",
+                         method, url, wait, response.status)
+            released = response.release()
+            if inspect.isawaitable(released):
+                await released
+        await asyncio.sleep(wait)
+        attempt += 1
+
+
+def import_httpx(http2: bool = True):
+    """
+    Import httpx lazily, httpx is an optional dependency only used by the httpx transport.
+    """
+    try:
+        import httpx
+        if http2:
+            import h2
+    except ImportError:
+        raise ImportError(
+            "The httpx transport requires httpx with HTTP/2 support, "
+            "please install it first: python3 -m pip install 'httpx[http2]'"
+        )
+    return httpx
+
+
+def create_httpx_client(http2: bool = True, limits=None, is_async: bool = False):
+    """
+    Create a httpx client which behaves like requests: follow redirects and no default timeout.
+    """
+    httpx = import_httpx(http2)
+    client_cls = httpx.AsyncClient if is_async else httpx.Client
+    kwargs = {"http2": http2, "follow_redirects": True, "timeout": None}
+    if limits is not None:
+        kwargs["limits"] = limits
+    return client_cls(**kwargs)
+
+
+def _httpx_timeout(httpx, timeout):
+    """
+    Convert requests/aiohttp style timeout (float, (connect, read) tuple or ClientTimeout) to httpx.Timeout.
+    """
+    if timeout is None or isinstance(timeout, (int, float)):
+        return timeout
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(None, connect=connect, read=read)
+    if isinstance(timeout, aiohttp.ClientTimeout):
+        return httpx.Timeout(
+            None,
+            connect=timeout.connect or timeout.sock_connect or timeout.total,
+            read=timeout.sock_read or timeout.total,
+        )
+    return timeout
+
+
+def _httpx_content(data):
+    """
+    requests/aiohttp accept raw body in data, httpx expects it in content.
+    """
+    if isinstance(data, (bytes, str, MultipartEncoder)):
+        return None, data
+    return data, None
+
+
+def _convert_httpx_error(httpx, error):
+    """
+    Convert httpx exceptions to requests exceptions, so that callers and RetryPolicy work
+    the same regardless of the transport.
+    """
+    message = str(error)
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.exceptions.ConnectTimeout(message)
+    if isinstance(error, httpx.ConnectError):
+        return requests.exceptions.ConnectionError(NewConnectionError(None, message))
+    if isinstance(error, httpx.TimeoutException):
+        return requests.exceptions.ReadTimeout(message)
+    if isinstance(error, (httpx.NetworkError, httpx.RemoteProtocolError)):
+        return requests.exceptions.ConnectionError(message)
+    if isinstance(error, httpx.TooManyRedirects):
+        return requests.exceptions.TooManyRedirects(message)
+    return requests.exceptions.RequestException(message)
+
+
+def _build_httpx_curl(httpx, request) -> str:
+    """
+    Generate cURL command from httpx request object.
+    """
+    curl = "curl -X {0} -L '{1}' \\\n".format(request.method, request.url)
+    headers = [
+        "-H '{0}: {1}' \\".format(k, v)
+        for k, v in request.headers.items()
+        if k.lower() != "content-length"
+    ]
+    if headers:
+        headers[-1] = headers[-1].rstrip(" \\")
+    curl += "\n".join(headers)
+    try:
+        body = request.content
+    except httpx.RequestNotRead:
+        # multipart或流式请求体，不在curl中展开
+        body = None
+    if body:
+        curl += " \\\n-d '{0}'".format(body.decode("utf-8", errors="replace"))
+    return curl
+
+
+class HTTPXResponse:
+    """
+    Wrap httpx.Response with the subset of requests.Response interface used by the SDK.
+    """
+
+    def __init__(self, response):
+        self._response = response
+        self._httpx = import_httpx(http2=False)
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.reason = response.reason_phrase
+        self.http_version = response.http_version
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def encoding(self):
+        return self._response.encoding
+
+    @property
+    def content(self) -> bytes:
+        try:
+            return self._response.read()
+        except self._httpx.HTTPError as e:
+            raise _convert_httpx_error(self._httpx, e) from e
+
+    @property
+    def text(self) -> str:
+        self.content
+        return self._response.text
+
+    def json(self, **kwargs):
+        if kwargs:
+            return json.loads(self.content, **kwargs)
+        return json_util.loads(self.content)
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        try:
+            if decode_unicode:
+                yield from self._response.iter_text(chunk_size)
+            else:
+                yield from self._response.iter_bytes(chunk_size)
+        except self._httpx.HTTPError as e:
+            raise _convert_httpx_error(self._httpx, e) from e
+
+    def iter_lines(self, chunk_size=512, decode_unicode=False, delimiter=None):
+        pending = None
+        for chunk in self.iter_content(chunk_size=chunk_size, decode_unicode=decode_unicode):
+            if pending is not None:
+                chunk = pending + chunk
+            lines = chunk.split(delimiter) if delimiter else chunk.splitlines()
+            if lines and lines[-1] and chunk and lines[-1][-1] == chunk[-1]:
+                pending = lines.pop()
+            else:
+                pending = None
+            yield from lines
+        if pending is not None:
+            yield pending
+
+    def __iter__(self):
+        return self.iter_content(128)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                "{} Error: {} for url: {}".format(self.status_code, self.reason, self.url),
+                response=self,
+            )
+
+    def close(self):
+        self._response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class HTTPXInnerSession:
+    """
+    InnerSession implemented on httpx, requests to the same host are multiplexed over HTTP/2 connections.
+
+    It keeps the post/get/put/delete interface of InnerSession (including the per-request retry),
+    and returns responses compatible with requests.Response, so components work unchanged.
+    """
+
+    rate_limit_key = None
+    response_cache = None
+    request_coalescer = None
+
+    def __init__(self, client=None, http2: bool = True):
+        """
+        Initialize httpx inner session.
+        """
+        self._httpx = import_httpx(http2)
+        self._owns_client = client is None
+        self._client = client if client is not None else create_httpx_client(http2=http2)
+        self._mounts = []
+
+    def mount(self, prefix: str, client):
+        """
+        Use the given httpx.Client for urls starting with prefix, longest prefix wins.
+        """
+        self._mounts = [(p, c) for p, c in self._mounts if p != prefix]
+        self._mounts.append((prefix, client))
+        self._mounts.sort(key=lambda item: len(item[0]), reverse=True)
+
+    def get_client(self, url: str):
+        for prefix, client in self._mounts:
+            if url.startswith(prefix):
+                return client
+        return self._client
+
+    def request(self, method, url, params=None, data=None, headers=None, files=None, json=None,
+                timeout=None, stream=False, allow_redirects=True, retry=None, **kwargs):
+        """
+        Send request using httpx, retry according to the per-request retry policy.
+        """
+        client = self.get_client(url)
+        data, content = _httpx_content(data)
+        json_body = json
+        if json is not None and data is None and content is None and not files:
+            # 使用SDK的json编解码器序列化请求体
+            content, json, headers = json_util.dumps_bytes(json), None, _json_headers(headers)
+
+        def send():
+            request = client.build_request(
+                method, url, params=params, data=data, content=content, files=files, json=json,
+                headers=headers, timeout=_httpx_timeout(self._httpx, timeout), **kwargs
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Curl Command:\n" + _build_httpx_curl(self._httpx, request) + "\n")
+            try:
+                response = client.send(request, stream=stream, follow_redirects=allow_redirects)
+            except self._httpx.HTTPError as e:
+                raise _convert_httpx_error(self._httpx, e) from e
+            return HTTPXResponse(response)
+
+        return _request_with_cache(self, method, url, retry, send, params=params,
+                                   data=data if json_body is not None or content is None else content,
+                                   json=json_body, files=files, stream=stream)
+
+    @session_post
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    @session_post
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    @session_post
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    @session_post
+    def put(self, url, data=None, **kwargs):
+        return self.request("PUT", url, data=data, **kwargs)
+
+    def close(self):
+        # 挂载的共享client由HTTPConnectionPoolRegistry统一管理，这里只关闭自己创建的client
+        if self._owns_client:
+            self._client.close()
+
+
+class _AsyncHTTPXStreamReader:
+    """
+    The subset of aiohttp.StreamReader interface used by the SDK.
+    """
+
+    def __init__(self, response):
+        self._response = response
+
+    def iter_any(self):
+        return self._response.aiter_bytes()
+
+    def iter_chunked(self, n: int):
+        return self._response.aiter_bytes(n)
+
+    async def read(self) -> bytes:
+        return await self._response.aread()
+
+
+class AsyncHTTPXResponse:
+    """
+    Wrap httpx.Response with the subset of aiohttp.ClientResponse interface used by the SDK.
+    """
+
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.reason = response.reason_phrase
+        self.http_version = response.http_version
+        self.content = _AsyncHTTPXStreamReader(response)
+
+    async def read(self) -> bytes:
+        return await self._response.aread()
+
+    async def text(self, encoding=None) -> str:
+        content = await self._response.aread()
+        if encoding:
+            return content.decode(encoding)
+        return self._response.text
+
+    async def json(self, **kwargs):
+        if kwargs:
+            return json.loads(await self._response.aread(), **kwargs)
+        return json_util.loads(await self._response.aread())
+
+    def release(self):
+        return self._response.aclose()
+
+    async def aclose(self):
+        await self._response.aclose()
+
+
+def _split_form_data(form_data: aiohttp.FormData):
+    """
+    Split aiohttp.FormData into httpx data and files arguments.
+    """
+    data, files = {}, {}
+    for type_options, headers, value in form_data._fields:
+        name = type_options["name"]
+        filename = type_options.get("filename")
+        if filename is not None:
+            content_type = headers.get(hdrs.CONTENT_TYPE)
+            files[name] = (filename, value, content_type) if content_type else (filename, value)
+        else:
+            data[name] = value
+    return data, files
+
+
+class AsyncHTTPXInnerSession:
+    """
+    AsyncInnerSession implemented on httpx.AsyncClient, supports HTTP/2 multiplexing.
+
+    Responses are always streamed, like aiohttp, and provide status/headers/json()/text()/content.iter_any().
+    """
+
+    rate_limit_key = None
+    response_cache = None
+    request_coalescer = None
+
+    def __init__(self, client=None, http2: bool = True):
+        """
+        Initialize async httpx inner session.
+        """
+        self._httpx = import_httpx(http2)
+        self._client = client if client is not None else create_httpx_client(http2=http2, is_async=True)
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    async def request(self, method, url, params=None, data=None, json=None, headers=None,
+                      timeout=None, allow_redirects=True, retry=None, **kwargs):
+        files = None
+        if isinstance(data, aiohttp.FormData):
+            data, files = _split_form_data(data)
+        data, content = _httpx_content(data)
+        json_body = json
+        if json is not None and data is None and content is None and not files:
+            content, json, headers = json_util.dumps_bytes(json), None, _json_headers(headers)
+
+        async def send():
+            # httpx.AsyncClient只接受异步迭代的流式请求体，每次发送(包括重试)重新生成
+            body = content.__aiter__() if isinstance(content, MultipartEncoder) else content
+            request = self._client.build_request(
+                method, url, params=params, data=data, content=body, files=files, json=json,
+                headers=headers, timeout=_httpx_timeout(self._httpx, timeout), **kwargs
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Curl Command:\n" + _build_httpx_curl(self._httpx, request) + "\n")
+            try:
+                response = await self._client.send(request, stream=True, follow_redirects=allow_redirects)
+            except self._httpx.HTTPError as e:
+                raise _convert_httpx_error(self._httpx, e) from e
+            return AsyncHTTPXResponse(response)
+
+        return await _arequest_with_cache(self, method, url, retry, send, params=params,
+                                          data=data if json_body is not None or content is None else content,
+                                          json=json_body, files=files)
+
     async def post(self, url, data=None, json=None, **kwargs):
-        logger.debug("Curl Command:\n" + await self.build_curl(hdrs.METH_POST, url, data=data, json_data=json, **kwargs) + "\n")
-        return await super().post(url=url, data=data, json=json, **kwargs)
+        return await self.request(hdrs.METH_POST, url, data=data, json=json, **kwargs)
 
     async def delete(self, url, **kwargs):
-        logger.debug("Curl Command:\n" + await self.build_curl(hdrs.METH_DELETE, url, **kwargs) + "\n")
-        return await super().delete(url=url, **kwargs)
+        return await self.request(hdrs.METH_DELETE, url, **kwargs)
 
     async def get(self, url, **kwargs):
-        logger.debug("Curl Command:\n" + await self.build_curl(hdrs.METH_GET, url, **kwargs) + "\n")
-        return await super().get(url=url, **kwargs)
+        return await self.request(hdrs.METH_GET, url, **kwargs)
 
     async def put(self, url, data=None, **kwargs):
-        logger.debug("Curl Command:\n" + await self.build_curl(hdrs.METH_PUT, url, data=data, **kwargs) + "\n")
-        return await super().put(url=url, data=data, **kwargs)
+        return await self.request(hdrs.METH_PUT, url, data=data, **kwargs)
+
+    async def close(self):
+        await self._client.aclose()
@@ -576,22 +576,24 @@ class AgentRuntime(BaseModel):
             
             tmp_message = self.component.run(conversation_id=conversation_id, query=message.content, file_ids=file_ids,
                                       stream=True, tool_choice=self.tool_choice, action=action)
-            res_message=list(tmp_message.content)
-            
+            tmp_message.content = _iterate_answers(conversation_id, interrupt_ids, tmp_message.content)
+            return tmp_message
+
+        def _iterate_answers(conversation_id, interrupt_ids, answers):
+            # 逐块产出回答，不等待整个流结束；流结束后记录中断事件ID
             interrupt_event_id = None
-            for ans in res_message:
+            for ans in answers:
                 for event in ans.events:
                     if event.content_type == "chatflow_interrupt":
                         interrupt_event_id = event.detail.get("interrupt_event_id")
                     if event.content_type == "publish_message" and event.event_type == "chatflow":
                         answer = event.detail.get("message")
                         ans.answer += answer
-                        
+                yield ans
+
             if interrupt_event_id is not None:
                 interrupt_ids.append(interrupt_event_id)
                 interrupt_dict[conversation_id] = interrupt_ids
-            tmp_message.content = res_message
-            return tmp_message
 
         @cl.on_chat_start
         async def start():
@@ -608,15 +610,12 @@ class AgentRuntime(BaseModel):
             await msg.update()
 
             stream_message = _chat(message)
-            detail_json_list = []
-            for part in stream_message.content:
+            accumulator = appbuilder.AnswerAccumulator()
+            for part in accumulator.wrap(stream_message):
                 if token := part.answer or "":
                     await msg.stream_token(token)
-                for event in part.events:
-                    detail = event.detail
-                    detail_json = json.dumps(
-                        detail, indent=4, ensure_ascii=False)
-                    detail_json_list.append(detail_json)
+            detail_json_list = [json.dumps(event.detail, indent=4, ensure_ascii=False)
+                                for event in accumulator.events]
             await msg.update()
 
             @cl.step(name="详细信息")
@@ -20,6 +20,7 @@ import json
 from typing import Optional
 from appbuilder.core.assistant.type import assistant_type
 from appbuilder.core._client import AssistantHTTPClient
+from appbuilder.core._multipart import MultipartEncoder
 
 from appbuilder.core._exception import AppBuilderServerException,HTTPConnectionException
 from appbuilder.utils.trace.tracer_wrapper import assistent_tool_trace
@@ -29,13 +30,14 @@ class Files(object):
         self._http_client = AssistantHTTPClient()
 
     @assistent_tool_trace
-    def create(self, file_path: str, purpose: str = "assistant") -> assistant_type.AssistantFilesCreateResponse:
+    def create(self, file_path: str, purpose: str = "assistant", progress_callback=None) -> assistant_type.AssistantFilesCreateResponse:
         """
         上传文件到助理存储中。
         
         Args:
             file_path (str): 要上传的文件路径。
             purpose (str, optional): 上传文件的用途。默认为 "assistant"。
+            progress_callback (Callable[[int, int], None], optional): 上传进度回调，参数为已上传字节数与总字节数。默认为 None。
         
         Returns:
             assistant_type.AssistantFilesCreateResponse: 上传文件后返回的响应对象。
@@ -50,19 +52,19 @@ class Files(object):
         if not os.path.exists(file_path):
             raise ValueError("File {} not exists".format(file_path))
 
-        with open(file_path, 'rb') as f:
-            files = [
-                ('file',(os.path.basename(file_path), f))
-            ]
-
-            response = self._http_client.session.post(
-                url,
-                headers=headers,
-                files=files,
-                params={
-                    'purpose': purpose
-                }
-            )
+        files = MultipartEncoder(
+            fields=[('file', (os.path.basename(file_path), file_path))],
+            progress_callback=progress_callback,
+        )
+        headers.update(files.headers)
+        response = self._http_client.session.post(
+            url,
+            headers=headers,
+            data=files,
+            params={
+                'purpose': purpose
+            }
+        )
 
         self._http_client.check_response_header(response)
 
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-import json
 from typing import Optional, Union
 from appbuilder.core.assistant.threads.runs.steps import Steps
 from appbuilder.core.assistant.threads.runs.stream_helper import AssistantStreamManager
@@ -22,6 +21,7 @@ from appbuilder.core.assistant.type import assistant_type
 from appbuilder.core.assistant.type import public_type
 from appbuilder.core._client import AssistantHTTPClient
 from appbuilder.utils.sse_util import SSEClient
+from appbuilder.utils import json_util
 from appbuilder.utils.trace.tracer_wrapper import assistent_tool_trace, assistant_run_trace, assistent_stream_run_trace, assistent_stream_run_with_handler_trace
 
 
@@ -397,7 +397,7 @@ class Runs():
                 data = event.data
                 if len(data) == 0:
                     data = event.raw
-                data = json.loads(data)
+                data = json_util.loads(data)
 
                 if event_class == "status":
                     result = thread_type.StreamRunStatus(**data)
@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-import json
 from typing import Optional, Iterator, Union
 from appbuilder.core.assistant.type import thread_type
 from appbuilder.utils.sse_util import SSEClient
+from appbuilder.utils import json_util
 from appbuilder.utils.logger_util import logger
 
 
@@ -352,13 +352,13 @@ class AssistantEventHandler():
         if event_type == 'ping':
             self.__timeout_process__(event)
         elif event_type == 'message':
-            data = json.loads(raw_data)
+            data = json_util.loads(raw_data)
             stream_run_message = thread_type.StreamRunMessage(**data)
             self.stream_run_context.set_current_event(stream_run_message)
             self.messages(stream_run_message)
             return stream_run_message
         elif event_type == 'status':
-            data = json.loads(raw_data)
+            data = json_util.loads(raw_data)
             stream_run_status = thread_type.StreamRunStatus(**data)
             self.stream_run_context.set_current_event(stream_run_status)
 
@@ -14,15 +14,22 @@
 
 """Component模块包括组件基类，用户自定义组件需要继承Component类，并至少实现run方法"""
 import json
+import asyncio
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 
 from enum import Enum
 
 from pydantic import BaseModel
 from pydantic import Field, field_validator
 from typing import (
-    Dict, List, Optional, Any, Generator, Union, AsyncGenerator)
+    Dict, List, Optional, Any, Generator, Union, AsyncGenerator, Tuple)
 from appbuilder.core.utils import ttl_lru_cache
 from appbuilder.core._client import HTTPClient, AsyncHTTPClient
+from appbuilder.core._rate_limiter import RateLimiter, rate_limiter_registry
+from appbuilder.core._cache import ResponseCache, default_memory_cache
+from appbuilder.core._coalesce import RequestCoalescer
 from appbuilder.core.message import Message
 
 class ComponentArguments(BaseModel):
@@ -192,6 +199,16 @@ class Component:
     """
 
     manifests = []
+    # 组件调用的云端接口的默认限流规则，接口路径到每秒请求数rate或(rate, burst)的映射，
+    # 在定义子类时注册到rate_limiter_registry，可通过rate_limiter_registry.configure覆盖
+    rate_limits: Dict[str, Union[float, Tuple[float, int]]] = {}
+    # 开启请求合并时默认忽略的请求体顶层字段，用于排除每次调用随机生成的字段
+    coalesce_ignore_keys: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "rate_limits" in cls.__dict__:
+            rate_limiter_registry.register_defaults(cls.rate_limits)
 
     def __init__(
         self,
@@ -246,6 +263,7 @@ class Component:
             self._http_client = AsyncHTTPClient(self.secret_key, self.gateway)
         else:
             self._http_client = HTTPClient(self.secret_key, self.gateway)
+        self._bind_http_client(self._http_client)
 
     @property
     def http_client(self):
@@ -265,12 +283,167 @@ class Component:
                     self.secret_key, self.gateway)
             else:
                 self._http_client = HTTPClient(self.secret_key, self.gateway)
+            self._bind_http_client(self._http_client)
         return self._http_client
 
+    @property
+    def async_http_client(self) -> AsyncHTTPClient:
+        """
+        获取异步接口(arun/atool_eval)使用的异步 HTTP 客户端实例，首次访问时按同步客户端的配置创建。
+
+        同一事件循环上的所有异步客户端共享一个TCPConnector，可以在单个事件循环中并发大量组件调用。
+
+        Args:
+            无
+
+        Returns:
+            AsyncHTTPClient: 异步 HTTP 客户端实例。
+
+        """
+        http_client = self.http_client
+        if isinstance(http_client, AsyncHTTPClient):
+            return http_client
+        async_http_client = getattr(self, "_async_http_client", None)
+        if async_http_client is None:
+            async_http_client = AsyncHTTPClient(
+                http_client.secret_key,
+                http_client.gateway,
+                http_client.gateway_v2,
+                http_client.transport,
+            )
+            self._bind_http_client(async_http_client)
+            self._async_http_client = async_http_client
+        return async_http_client
+
+    def enable_cache(self, cache=None):
+        """
+        为当前组件实例开启响应缓存，相同的请求（接口地址与请求参数一致）直接返回缓存的响应，不再访问网络。
+
+        只缓存成功的非流式响应，适用于翻译、OCR、Embedding等输入相同则输出相同的组件。
+        缓存key包含组件名、版本、接口地址与请求参数的哈希，不同组件可以共用同一个存储后端。
+
+        Args:
+            cache (MemoryCache | SQLiteCache, optional): 缓存存储后端，默认为进程内共享的MemoryCache(LRU, ttl 3600秒)。
+
+        Returns:
+            None
+
+        """
+        backend = cache if cache is not None else default_memory_cache
+        name = getattr(self, "name", None) or type(self).__name__
+        self._response_cache = ResponseCache(backend, name, getattr(self, "version", ""))
+        for http_client in (getattr(self, "_http_client", None), getattr(self, "_async_http_client", None)):
+            if http_client is not None:
+                http_client.set_response_cache(self._response_cache)
+
+    def disable_cache(self):
+        """
+        关闭当前组件实例的响应缓存，已缓存的内容保留在存储后端中。
+
+        Returns:
+            None
+
+        """
+        self._response_cache = None
+        for http_client in (getattr(self, "_http_client", None), getattr(self, "_async_http_client", None)):
+            if http_client is not None:
+                http_client.set_response_cache(None)
+
+    def cache_stats(self) -> dict:
+        """
+        获取当前组件实例的缓存命中(hits)与未命中(misses)次数，未开启缓存时均为0。
+
+        Returns:
+            dict: 缓存计数。
+
+        """
+        response_cache = getattr(self, "_response_cache", None)
+        if response_cache is None:
+            return {"hits": 0, "misses": 0}
+        return response_cache.stats()
+
+    def enable_coalescing(self, ignore_keys=None):
+        """
+        为当前组件实例开启请求合并(single-flight)：相同的请求在前一个相同请求完成前到达时，不再单独访问服务端，
+        而是共享前一个请求的响应，流式响应在各调用方之间分流，每个调用方都能读到完整的数据流。
+
+        适用于短时间内大量用户发送相同输入的场景。与缓存不同，请求完成后不保留响应，也适用于大模型等输出不确定的组件。
+        同步调用在多个线程之间合并，异步调用在同一事件循环内合并。
+
+        Args:
+            ignore_keys (Sequence[str], optional): 比较请求时忽略的请求体顶层字段，默认为组件的coalesce_ignore_keys。
+
+        Returns:
+            None
+
+        """
+        if ignore_keys is None:
+            ignore_keys = self.coalesce_ignore_keys
+        name = getattr(self, "name", None) or type(self).__name__
+        self._request_coalescer = RequestCoalescer(name, ignore_keys)
+        for http_client in (getattr(self, "_http_client", None), getattr(self, "_async_http_client", None)):
+            if http_client is not None:
+                http_client.set_request_coalescer(self._request_coalescer)
+
+    def disable_coalescing(self):
+        """
+        关闭当前组件实例的请求合并，正在进行的合并请求不受影响。
+
+        Returns:
+            None
+
+        """
+        self._request_coalescer = None
+        for http_client in (getattr(self, "_http_client", None), getattr(self, "_async_http_client", None)):
+            if http_client is not None:
+                http_client.set_request_coalescer(None)
+
+    def coalescing_stats(self) -> dict:
+        """
+        获取当前组件实例实际访问服务端的请求数(upstream)与被合并的请求数(coalesced)，未开启请求合并时均为0。
+
+        Returns:
+            dict: 请求计数。
+
+        """
+        request_coalescer = getattr(self, "_request_coalescer", None)
+        if request_coalescer is None:
+            return {"upstream": 0, "coalesced": 0}
+        return request_coalescer.stats()
+
+    def _bind_http_client(self, http_client):
+        response_cache = getattr(self, "_response_cache", None)
+        if response_cache is not None:
+            http_client.set_response_cache(response_cache)
+        request_coalescer = getattr(self, "_request_coalescer", None)
+        if request_coalescer is not None:
+            http_client.set_request_coalescer(request_coalescer)
+
     def __call__(self, *inputs, **kwargs):
         r"""implement __call__ method"""
         return self.run(*inputs, **kwargs)
 
+    async def aclose(self):
+        """
+        释放组件在当前事件循环中持有的异步HTTP会话，未使用过异步接口时无操作。
+
+        Args:
+            无
+
+        Returns:
+            None
+
+        """
+        for http_client in (getattr(self, "_http_client", None), getattr(self, "_async_http_client", None)):
+            if isinstance(http_client, AsyncHTTPClient):
+                await http_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
     def tool_eval(self, *input, **kwargs) -> Generator:
         """
         对给定的输入执行工具的FunctionCall。
@@ -298,21 +471,51 @@ class Component:
         """
         raise NotImplementedError
 
-    def batch(self, *args, **kwargs) -> List[Message]:
+    def batch(
+        self,
+        *args,
+        max_concurrency: int = 1,
+        return_exceptions: bool = False,
+        rate_limit: Optional[float] = None,
+        **kwargs
+    ) -> List[Union[Message, Exception]]:
         """
         批量处理输入并返回结果列表。
 
         Args:
             *args: 可变数量的输入参数，每个参数将依次被处理。
+            max_concurrency (int, optional): 最大并发数，大于1时在线程池中并发调用run。默认为1，即顺序执行。
+            return_exceptions (bool, optional): 为True时单个输入的异常作为结果返回，不中断整个批次。默认为False。
+            rate_limit (float, optional): 每秒最多发起的run调用次数，用于避免触发网关的QPS限制。默认为None，不限速。
             **kwargs: 关键字参数，这些参数将被传递给每个输入的处理函数。
 
         Returns:
-            List[Message]: 包含处理结果的列表，每个元素对应一个输入参数的处理结果。
+            List[Union[Message, Exception]]: 包含处理结果的列表，顺序与输入一致，每个元素对应一个输入参数的处理结果，
+            return_exceptions为True时失败的输入对应其异常。
 
         """
-
-        results = [self.run(inp, **kwargs) for inp in args]
-        return results
+        limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        def call(inp):
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                return self.run(inp, **kwargs)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        if max_concurrency <= 1 or len(args) <= 1:
+            return [call(inp) for inp in args]
+
+        executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(args)))
+        try:
+            # 每个任务复制调用方的上下文，保证trace等上下文变量在工作线程中可见
+            futures = [executor.submit(contextvars.copy_context().run, call, inp) for inp in args]
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def non_stream_tool_eval(self, *args, **kwargs) -> Union[ComponentOutput, dict]:
         """
@@ -337,33 +540,71 @@ class Component:
 
     async def atool_eval(self, *args, **kwargs) -> AsyncGenerator:
         r"""
-        atool_eval method,待子类重写实现
+        atool_eval method,调用云端API的组件应重写为基于async_http_client的实现，
+        默认在线程池中逐个迭代tool_eval的结果，避免阻塞事件循环
 
         Args:
             args: list of arguments
             kwargs: keyword arguments
         """
-        return None
+        loop = asyncio.get_running_loop()
+        iterator = iter(self.tool_eval(*args, **kwargs))
+        sentinel = object()
+        # 在当前上下文的副本中迭代，使trace等contextvars在线程池中可见
+        step = functools.partial(contextvars.copy_context().run, next, iterator, sentinel)
+        while True:
+            result = await loop.run_in_executor(None, step)
+            if result is sentinel:
+                break
+            yield result
 
     async def arun(self, *args, **kwargs) -> Optional[Message]:
         r"""
-        arun method,待子类重写实现
+        arun method,调用云端API的组件应重写为基于async_http_client的实现，
+        默认在线程池中执行run，避免阻塞事件循环
 
         Args:
             args: list of arguments
             kwargs: keyword arguments
         """
-        return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(contextvars.copy_context().run, self.run, *args, **kwargs))
 
-    async def abatch(self, *args, **kwargs) -> List[Message]:
+    async def abatch(
+        self,
+        *args,
+        max_concurrency: int = 1,
+        return_exceptions: bool = False,
+        rate_limit: Optional[float] = None,
+        **kwargs
+    ) -> List[Union[Message, Exception]]:
         r"""
-        abatch method,待子类重写实现
+        异步批量处理输入，最多max_concurrency个arun同时执行，参数含义与batch一致
 
         Args:
             args: list of arguments
+            max_concurrency: 最大并发数，默认为1
+            return_exceptions: 为True时单个输入的异常作为结果返回，默认为False
+            rate_limit: 每秒最多发起的arun调用次数，默认为None，不限速
             kwargs: keyword arguments
         """
-        return None
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        async def call(inp):
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.aacquire()
+                return await self.arun(inp, **kwargs)
+
+        tasks = [asyncio.ensure_future(call(inp)) for inp in args]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        finally:
+            # 未开启return_exceptions时，一个输入失败后取消其余尚未完成的调用
+            for task in tasks:
+                task.cancel()
 
     def _trace(self, **data) -> None:
         r"""pass"""
@@ -96,6 +96,30 @@ class AnimalRecognition(Component):
             Message: 识别结果的消息对象
         
         """
+        req = self._build_run_request(message)
+        result = self._recognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步根据输入消息运行动物识别功能
+        
+        Args:
+            message (Message): 输入的消息对象，其中应包含需要识别的图像数据或URL
+            timeout (float, optional): 超时时间，单位为秒。默认为None，表示无超时限制。Defaults to None.
+            retry (int, optional): 重试次数。默认为0，表示不重试。Defaults to 0.
+        
+        Returns:
+            Message: 识别结果的消息对象
+        
+        """
+        req = self._build_run_request(message)
+        result = await self._arecognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> AnimalRecognitionRequest:
         inp = AnimalRecognitionInMsg(**message.content)
         req = AnimalRecognitionRequest()
         if inp.raw_image:
@@ -104,7 +128,10 @@ class AnimalRecognition(Component):
             req.url = inp.url
         req.top_num = 6
         req.baike_num = 0
-        result = self._recognize(req, timeout, retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: AnimalRecognitionResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = AnimalRecognitionOutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -123,20 +150,48 @@ class AnimalRecognition(Component):
                    返回：
                        response (obj: `AnimalRecognitionResponse`): 动物识别返回结果
                """
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(
+        self,
+        request: AnimalRecognitionRequest,
+        timeout: float = None,
+        retry: int = 0,
+        request_id: str = None,
+    ) -> AnimalRecognitionResponse:
+        r"""异步调用底层接口进行动物识别
+
+                   参数:
+                       request (obj: `AnimalRecognitionRequest`) : 动物识别输入参数
+                   返回：
+                       response (obj: `AnimalRecognitionResponse`): 动物识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: AnimalRecognitionRequest, request_id: str = None):
         if not request.image and not request.url:
             raise ValueError("request format error, one of image or url must be set")
 
         data = AnimalRecognitionRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/image-classify/v1/animal")
-        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/image-classify/v1/animal")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> AnimalRecognitionResponse:
         self.__class__._check_service_error(request_id, data)
         animalRes = AnimalRecognitionResponse.from_json(json.dumps(data))
         animalRes.request_id = request_id
@@ -172,6 +227,35 @@ class AnimalRecognition(Component):
         else:
             return rec_res
 
+    async def atool_eval(
+        self,
+        name: str,
+        streaming: bool,
+        origin_query: str,
+        **kwargs,
+    ) -> Union[Generator[str, None, None], str]:
+        """
+        用于工具的异步执行，通过调用底层接口进行动物识别。
+        
+        Args:
+            name (str): 工具名。
+            streaming (bool): 是否流式返回。
+            origin_query (str): 用户原始query。
+            **kwargs: 工具调用的额外关键字参数。
+        
+        Returns:
+            Union[Generator[str, None, None], str]: 动物识别结果，包括识别出的动物类别和相应的置信度信息。
+        """
+        traceid = kwargs.get("traceid")
+        img_name = kwargs.get("img_name", "")
+        img_url = kwargs.get("img_url", "")
+        file_urls = kwargs.get("file_urls", {})
+        rec_res = await self._arecognize_w_post_process(img_name, img_url, file_urls, request_id=traceid)
+        if streaming:
+            yield rec_res
+        else:
+            yield rec_res
+
     def _recognize_w_post_process(self, img_name, img_url, file_urls, request_id=None) -> str:
         r"""调底层接口对图片或图片url进行动物识别，并返回类别及其置信度
                    参数:
@@ -181,6 +265,25 @@ class AnimalRecognition(Component):
                    返回：
                        str: 动物识别结果，包括识别出的动物类别和相应的置信度信息
         """
+        req = self._build_tool_eval_request(img_name, img_url, file_urls)
+        result = self._recognize(req, request_id=request_id)
+        return self._build_tool_eval_text(result)
+
+    async def _arecognize_w_post_process(self, img_name, img_url, file_urls, request_id=None) -> str:
+        r"""异步调底层接口对图片或图片url进行动物识别，并返回类别及其置信度
+                   参数:
+                       img_name (str): 图片文件名
+                       img_url (str): 图片url
+                       file_urls (dict): 文件名与对应文件url的映射
+                   返回：
+                       str: 动物识别结果，包括识别出的动物类别和相应的置信度信息
+        """
+        req = self._build_tool_eval_request(img_name, img_url, file_urls)
+        result = await self._arecognize(req, request_id=request_id)
+        return self._build_tool_eval_text(result)
+
+    @staticmethod
+    def _build_tool_eval_request(img_name: str, img_url: str, file_urls: dict) -> AnimalRecognitionRequest:
         req = AnimalRecognitionRequest()
         if img_name in file_urls:
             req.url = file_urls[img_name]
@@ -190,7 +293,10 @@ class AnimalRecognition(Component):
             req.url = img_url
         req.top_num = TOP_NUM
         req.baike_num = BAIKE_NUM
-        result = self._recognize(req, request_id=request_id)
+        return req
+
+    @staticmethod
+    def _build_tool_eval_text(result: AnimalRecognitionResponse) -> str:
         result_dict = proto.Message.to_dict(result)
         rec_res = "模型识别结果为：\n"
         for rec_info in result_dict['result']:
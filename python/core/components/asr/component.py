@@ -17,6 +17,7 @@ r"""ASR component.
 import os
 import uuid
 import json
+import asyncio
 
 import requests
 import tempfile
@@ -111,6 +112,34 @@ class ASR(Component):
         Returns:
             Message: 语音识别结果，格式如：Message(content={"result": ["识别结果"]})。
         """
+        request = self._build_run_request(message, audio_format, rate)
+        traceid = kwargs.get("traceid", "")
+        response = self._recognize(request, timeout, retry, request_id=traceid)
+        return self._build_run_output(response)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, audio_format: str = "pcm", rate: int = 16000,
+            timeout: float = None, retry: int = 0, **kwargs) -> Message:
+        r"""
+        异步执行语音识别操作，并返回识别结果。
+        
+        Args:
+            message (Message): 输入消息对象，包含待识别的音频数据。该参数为必需项，格式如：Message(content={"raw_audio": b"..."})。
+            audio_format (str, optional): 音频文件格式，支持pcm/wav/amr/m4a，不区分大小写，推荐使用pcm格式。默认为"pcm"。
+            rate (int, optional): 音频采样率，固定为16000。默认为16000。
+            timeout (float, optional): HTTP请求超时时间。默认为None。
+            retry (int, optional): HTTP请求重试次数。默认为0。
+        
+        Returns:
+            Message: 语音识别结果，格式如：Message(content={"result": ["识别结果"]})。
+        """
+        request = self._build_run_request(message, audio_format, rate)
+        traceid = kwargs.get("traceid", "")
+        response = await self._arecognize(request, timeout, retry, request_id=traceid)
+        return self._build_run_output(response)
+
+    @staticmethod
+    def _build_run_request(message: Message, audio_format: str, rate: int) -> ShortSpeechRecognitionRequest:
         inp = ASRInMsg(**message.content)
         request = ShortSpeechRecognitionRequest()
         request.format = audio_format
@@ -118,8 +147,10 @@ class ASR(Component):
         request.cuid = str(uuid.uuid4())
         request.dev_pid = "80001"
         request.speech = inp.raw_audio
-        traceid = kwargs.get("traceid", "")
-        response = self._recognize(request, timeout, retry, request_id=traceid)
+        return request
+
+    @staticmethod
+    def _build_run_output(response: ShortSpeechRecognitionResponse) -> Message:
         out = ASROutMsg(result=list(response.result))
         return Message(content=out.model_dump())
 
@@ -141,21 +172,55 @@ class ASR(Component):
         返回:
             obj:`ShortSpeechRecognitionResponse`: 接口返回的输出消息。
         """
+        url, params, headers = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, params=params, headers=headers, data=request.speech,
+                                                 timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(
+            self,
+            request: ShortSpeechRecognitionRequest,
+            timeout: float = None,
+            retry: int = 0,
+            request_id: str = None,
+    ) -> ShortSpeechRecognitionResponse:
+        """
+        异步使用给定的输入并返回语音识别的结果。
+
+        参数:
+            request (obj:`ShortSpeechRecognitionRequest`): 输入请求，这是一个必需的参数。
+            timeout (float, 可选): 请求的超时时间。
+            retry (int, 可选): 请求的重试次数。
+
+        返回:
+            obj:`ShortSpeechRecognitionResponse`: 接口返回的输出消息。
+        """
+        url, params, headers = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, params=params, headers=headers, data=request.speech,
+                                                 timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: ShortSpeechRecognitionRequest, request_id: str = None):
         ContentType = "audio/" + request.format + ";rate=" + str(request.rate)
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = ContentType
         params = {
             'dev_pid': request.dev_pid,
             'cuid': request.cuid
         }
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-        response = self.http_client.session.post(self.http_client.service_url("/v1/bce/aip_speech/asrpro"),
-                                                 params=params, headers=headers, data=request.speech, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip_speech/asrpro")
+        return url, params, headers
+
+    def _parse_response(self, request_id: str, data: dict) -> ShortSpeechRecognitionResponse:
         self.__class__._check_service_error(request_id, data)
         response = ShortSpeechRecognitionResponse.from_json(payload=json.dumps(data))
         response.request_id = request_id
@@ -196,6 +261,69 @@ class ASR(Component):
             InvalidRequestArgumentError: 如果未设置文件名或文件URL不存在，则抛出此异常。
         
         """
+        file_url, file_type = self._parse_tool_eval_file(kwargs)
+
+        audio_file = tempfile.NamedTemporaryFile("wb", suffix=file_type)
+        audio_file.write(requests.get(file_url).content)
+
+        raw_audios = _convert(audio_file.name, file_type)
+        text = ""
+        for raw_audio in raw_audios:
+            content_data = {"audio_format": file_type, "raw_audio": raw_audio, "rate": DEFAULT_FRAME_RATE}
+            msg = Message(content_data)
+            out = self.run(msg)
+            text += "".join(out.content["result"])
+        results = {"识别结果": text}
+        audio_file.close()
+        res = json.dumps(results, ensure_ascii=False, indent=4)
+        if streaming:
+            yield from self._build_tool_eval_stream(res)
+        else:
+            return res
+
+    async def atool_eval(self, name: str, streaming: bool, **kwargs):
+        """
+        异步评估给定文件名或文件URL的语音识别结果。
+        
+        Args:
+            name (str): 函数调用名称。
+            streaming (bool): 是否以流的方式返回结果。
+            **kwargs: 关键字参数，用于指定文件名、文件URL等参数。
+        
+        Returns:
+            如果streaming为True，则通过生成器逐个返回包含识别结果的消息对象；
+            如果streaming为False，则返回包含识别结果的JSON字符串。
+        
+        Raises:
+            InvalidRequestArgumentError: 如果未设置文件名或文件URL不存在，则抛出此异常。
+        
+        """
+        file_url, file_type = self._parse_tool_eval_file(kwargs)
+
+        audio_file = tempfile.NamedTemporaryFile("wb", suffix=file_type)
+        response = await self.async_http_client.session.get(file_url)
+        audio_file.write(await response.read())
+
+        # 音频转码为CPU密集操作，放到线程池中执行，避免阻塞事件循环
+        raw_audios = await asyncio.get_running_loop().run_in_executor(
+            None, _convert, audio_file.name, file_type)
+        text = ""
+        for raw_audio in raw_audios:
+            content_data = {"audio_format": file_type, "raw_audio": raw_audio, "rate": DEFAULT_FRAME_RATE}
+            msg = Message(content_data)
+            out = await self.arun(msg)
+            text += "".join(out.content["result"])
+        results = {"识别结果": text}
+        audio_file.close()
+        res = json.dumps(results, ensure_ascii=False, indent=4)
+        if streaming:
+            for output in self._build_tool_eval_stream(res):
+                yield output
+        else:
+            yield res
+
+    @staticmethod
+    def _parse_tool_eval_file(kwargs: dict):
         file_url = kwargs.get("file_url", None)
         if not file_url:
             file_urls = kwargs.get("file_urls", {})
@@ -211,33 +339,22 @@ class ASR(Component):
 
         _, file_type = os.path.splitext(os.path.basename(urlparse(file_url).path))
         file_type = file_type.strip('.')
+        return file_url, file_type
 
-        audio_file = tempfile.NamedTemporaryFile("wb", suffix=file_type)
-        audio_file.write(requests.get(file_url).content)
-
-        raw_audios = _convert(audio_file.name, file_type)
-        text = ""
-        for raw_audio in raw_audios:
-            content_data = {"audio_format": file_type, "raw_audio": raw_audio, "rate": DEFAULT_FRAME_RATE}
-            msg = Message(content_data)
-            out = self.run(msg)
-            text += "".join(out.content["result"])
-        results = {"识别结果": text}
-        audio_file.close()
-        res = json.dumps(results, ensure_ascii=False, indent=4)
-        if streaming:
-            yield {
+    @staticmethod
+    def _build_tool_eval_stream(res: str) -> list:
+        return [
+            {
                 "type": "text",
                 "text": res,
                 "visible_scope": 'llm',
-            }
-            yield {
+            },
+            {
                 "type": "text",
                 "text": "",
                 "visible_scope": 'user',
-            }
-        else:
-            return res
+            },
+        ]
 
 
 def _convert(path, file_type):
@@ -64,13 +64,40 @@ class DishRecognition(Component):
             Message: 包含菜品识别结果的输出消息。例如，Message(content={'result': [{'name': '剁椒鱼头', 'calorie': '127'}]})
 
         """
+        req = self._build_run_request(message)
+        result = self._recognize(req, timeout=timeout, retry=retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步根据输入图片进行菜品识别。
+
+        Args:
+            message (Message): 输入待识别图片，支持传图片二进制流和图片URL。
+            timeout (float, optional): 请求超时时间，默认为 None。
+            retry (int, optional): 重试次数，默认为 0。
+
+        Returns:
+            Message: 包含菜品识别结果的输出消息。例如，Message(content={'result': [{'name': '剁椒鱼头', 'calorie': '127'}]})
+
+        """
+        req = self._build_run_request(message)
+        result = await self._arecognize(req, timeout=timeout, retry=retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> DishRecognitionRequest:
         inp = DishRecognitionInMsg(**message.content)
         req = DishRecognitionRequest()
         if inp.raw_image:
             req.image = base64.b64encode(inp.raw_image)
         if inp.url:
             req.url = inp.url
-        result = self._recognize(req, timeout=timeout, retry=retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: DishRecognitionResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = DishRecognitionOutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -85,6 +112,34 @@ class DishRecognition(Component):
         :param retry: 请求失败时的重试次数，默认为 0。
         :return: 包含食物识别结果的响应对象。
         """
+        url, headers, request_data = self._build_http_request(self.http_client, request)
+        response = self.http_client.session.post(url, headers=headers, data=request_data, timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: DishRecognitionRequest, timeout: float = None,
+                   retry: int = 0) -> DishRecognitionResponse:
+        """
+        异步发起食物识别请求并返回识别结果。
+
+        :param request: 包含执行识别所需信息的 DishRecognitionRequest 对象。
+        :param timeout: 请求超时时间（秒），默认为 None。
+        :param retry: 请求失败时的重试次数，默认为 0。
+        :return: 包含食物识别结果的响应对象。
+        """
+        url, headers, request_data = self._build_http_request(self.async_http_client, request)
+        response = await self.async_http_client.session.post(url, headers=headers, data=request_data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: DishRecognitionRequest):
         if not request.image and not request.url:
             raise ValueError("request format error, one of image or url must be set")
         if not request.top_num:
@@ -92,17 +147,13 @@ class DishRecognition(Component):
         if not request.filter_threshold:
             request.filter_threshold = 0.95
         request_data = DishRecognitionRequest.to_dict(request)
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header()
+        headers = client.auth_header()
         headers['content-type'] = 'application/x-www-form-urlencoded'
 
-        url = self.http_client.service_url("/v1/bce/aip/image-classify/v2/dish")
-        response = self.http_client.session.post(url, headers=headers, data=request_data, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/image-classify/v2/dish")
+        return url, headers, request_data
+
+    def _parse_response(self, request_id: str, data: dict) -> DishRecognitionResponse:
         if "error_code" in data and "error_msg" in data:
             raise AppBuilderServerException(request_id=request_id, service_err_code=data["error_code"], service_err_message=data["error_msg"])
         return DishRecognitionResponse(data)
@@ -70,6 +70,37 @@ class DocCropEnhance(Component):
             'points': [{'x': 220, 'y': 705}, {'x': 240, 'y': 0}, {'x': 885, 'y': 2}, {'x': 980, 'y': 759}]},
             mtype=dict)
         """
+        req = self._build_run_request(message, enhance_type)
+        result = self._recognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, enhance_type: int = 0, timeout: float = None, retry: int = 0) -> Message:
+        r"""
+        异步文档矫正增强
+        
+        Args:
+            message (Message): 输入图片或图片url下载地址用于执行操作。举例: Message(content={"raw_image": b"...",
+            "enhance_type": 3})或 Message(content={"url": "https://image/download/url"})。
+            enhance_type (int, 可选): 选择是否开启图像增强功能，如开启可选择增强效果，可选值如下：
+                - 0：默认值，不开启增强功能
+                - 1：去阴影
+                - 2：增强并锐化
+                - 3：黑白滤镜。
+            timeout (float, 可选): HTTP超时时间
+            retry (int, 可选): HTTP重试次数
+        
+        Returns:
+            Message: 识别结果。举例: Message(name=msg, content={'image_processed': '...',
+            'points': [{'x': 220, 'y': 705}, {'x': 240, 'y': 0}, {'x': 885, 'y': 2}, {'x': 980, 'y': 759}]},
+            mtype=dict)
+        """
+        req = self._build_run_request(message, enhance_type)
+        result = await self._arecognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message, enhance_type: int) -> DocCropEnhanceRequest:
         inp = DocCropEnhanceInMsg(**message.content)
         req = DocCropEnhanceRequest()
         if inp.raw_image:
@@ -80,7 +111,10 @@ class DocCropEnhance(Component):
         if enhance_type not in enhance_type_set:
             raise InvalidRequestArgumentError(f"mismatched argument enhance_type, expected enhance_type in {enhance_type_set}")
         req.enhance_type = enhance_type
-        result = self._recognize(req, timeout, retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: DocCropEnhanceResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = DocCropEnhanceOutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -93,20 +127,42 @@ class DocCropEnhance(Component):
                    返回：
                        response (obj: `DocCropEnhanceResponse`): 文档矫正增强返回结果
                """
+        url, headers, req = self._build_http_request(self.http_client, request)
+        response = self.http_client.session.post(url, headers=headers, data=req, timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: DocCropEnhanceRequest, timeout: float = None,
+                   retry: int = 0) -> DocCropEnhanceResponse:
+        r"""异步文档矫正增强调用
+                   参数:
+                       request (obj: `DocCropEnhanceRequest`) : 文档矫正增强输入参数
+                   返回：
+                       response (obj: `DocCropEnhanceResponse`): 文档矫正增强返回结果
+               """
+        url, headers, req = self._build_http_request(self.async_http_client, request)
+        response = await self.async_http_client.session.post(url, headers=headers, data=req, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: DocCropEnhanceRequest):
         if not request.image and not request.url:
             raise ValueError("request argument error, one of image or url must be set")
 
         req = json.dumps(DocCropEnhanceRequest.to_dict(request))
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header()
+        headers = client.auth_header()
         headers['content-type'] = 'application/json'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/doc_crop_enhance")
-        response = self.http_client.session.post(url, headers=headers, data=req, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/ocr/v1/doc_crop_enhance")
+        return url, headers, req
+
+    def _parse_response(self, request_id: str, data: dict) -> DocCropEnhanceResponse:
         self.__class__._check_service_error(request_id, data)
         res = DocCropEnhanceResponse.from_json(json.dumps(data))
         res.request_id = request_id
@@ -172,10 +172,8 @@ class DocFormatConverter(Component):
         data = json.loads(DocFormatConverterSubmitRequest.to_json(request, preserving_proto_field_name=True))
         headers = self.http_client.auth_header(request_id)
         headers['Content-Type'] = 'application/x-www-form-urlencoded'
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
 
-        response = self.http_client.session.post(url, data=data, headers=headers, timeout=timeout)
+        response = self.http_client.session.post(url, data=data, headers=headers, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
@@ -205,9 +203,7 @@ class DocFormatConverter(Component):
         headers = self.http_client.auth_header(request_id)
         headers['content-type'] = "application/x-www-form-urlencoded"
 
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-        response = self.http_client.session.post(url, data=data, headers=headers, timeout=timeout)
+        response = self.http_client.session.post(url, data=data, headers=headers, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
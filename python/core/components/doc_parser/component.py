@@ -160,40 +160,76 @@ class DocParser(Component):
         
         """
         file_path = input_message.content
+        url, headers, payload = self._build_http_request(self.http_client, file_path)
+        response = self.http_client.session.post(
+            url=url,
+            headers=headers,
+            data=payload,
+        )
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data, return_raw)
 
+    @HTTPClient.check_param
+    async def arun(self, input_message: Message, return_raw=False) -> Message:
+        """
+        异步对传入的文件进行解析
+        
+        Args:
+            input_message (Message[str]): 输入为文件的路径
+            return_raw (bool, optional): 是否返回云端服务的原始结果。默认为False。
+        
+        Returns:
+            Message[ParseResult]: 文件的解析结果。
+        
+        Raises:
+            ValueError: 如果传入的文件路径不是字符串类型。
+            AppBuilderServerException: 如果文件解析过程中出现异常，将抛出该异常。
+        
+        """
+        file_path = input_message.content
+        url, headers, payload = self._build_http_request(self.async_http_client, file_path)
+        response = await self.async_http_client.session.post(
+            url=url,
+            headers=headers,
+            data=payload,
+        )
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data, return_raw)
+
+    def _build_http_request(self, client, file_path: str):
         if not isinstance(file_path, str):
             raise ValueError("file_path should be str type")
 
         with open(file_path, "rb") as f:
             param = self.config.dict(by_alias=True)
             param["data"] = base64.b64encode(f.read()).decode()
-            param["name"] = os.path.basename(file_path)
-            payload = json.dumps({"file_list": [param]})
-            headers = self.http_client.auth_header()
-            headers["Content-Type"] = "application/json"
-            response = self.http_client.session.post(
-                url=self.http_client.service_url(self.base_url),
-                headers=headers,
-                data=payload,
-            )
-            self.http_client.check_response_header(response)
-            self.http_client.check_response_json(response.json())
-            request_id = self.http_client.response_request_id(response)
-            response = response.json()
-            if response["error_code"] != 0:
-                logger.error(
-                    "doc parser service log_id {} err {}".format(
-                        response["log_id"], response["error_msg"]
-                    )
-                )
-                raise AppBuilderServerException(
-                    request_id=request_id,
-                    service_err_code=response["error_code"],
-                    service_err_message=response["error_msg"],
+        param["name"] = os.path.basename(file_path)
+        payload = json.dumps({"file_list": [param]})
+        headers = client.auth_header()
+        headers["Content-Type"] = "application/json"
+        return client.service_url(self.base_url), headers, payload
+
+    def _parse_response(self, request_id: str, response: dict, return_raw: bool) -> Message:
+        if response["error_code"] != 0:
+            logger.error(
+                "doc parser service log_id {} err {}".format(
+                    response["log_id"], response["error_msg"]
                 )
-            parse_result = self.make_parse_result(response["result"]["result_list"][0])
-            if return_raw:
-                parse_result["raw"] = response
+            )
+            raise AppBuilderServerException(
+                request_id=request_id,
+                service_err_code=response["error_code"],
+                service_err_message=response["error_msg"],
+            )
+        parse_result = self.make_parse_result(response["result"]["result_list"][0])
+        if return_raw:
+            parse_result["raw"] = response
 
         parse_result = ParseResult.parse_obj(parse_result)
         return Message(parse_result)
@@ -91,10 +91,9 @@ class Embedding(EmbeddingBaseComponent):
         """
         request to gateway
         """
-        headers = self.http_client.auth_header()
-        headers["Content-Type"] = "application/json"
+        url, headers = self._build_http_request(self.http_client)
         resp = self.http_client.session.post(
-            url=self.http_client.service_url(self.base_url),
+            url=url,
             headers=headers,
             json=payload,
         )
@@ -103,6 +102,27 @@ class Embedding(EmbeddingBaseComponent):
 
         return resp.json()
 
+    async def _arequest(self, payload: dict) -> dict:
+        """
+        async request to gateway
+        """
+        url, headers = self._build_http_request(self.async_http_client)
+        resp = await self.async_http_client.session.post(
+            url=url,
+            headers=headers,
+            json=payload,
+        )
+        await self.async_http_client.check_response_header(resp)
+        data = await resp.json()
+        self._check_response_json(data)
+
+        return data
+
+    def _build_http_request(self, client):
+        headers = client.auth_header()
+        headers["Content-Type"] = "application/json"
+        return client.service_url(self.base_url), headers
+
     def _batchify(self, texts: List[str], batch_size: int = 16) -> List[List[str]]:
         """
         batchify input text list
@@ -123,9 +143,22 @@ class Embedding(EmbeddingBaseComponent):
         for batch in batches:
             result = self._request({"input": batch})
             results.extend(result['data'])
-        results = Message([result['embedding'] for result in results])
+        return self._build_batch_output(results)
+
+    async def _abatch(self, texts: List[str]) -> Message[List[List[float]]]:
+        """
+        async batch run implement
+        """
+        batches = self._batchify(texts)
+        results = []
+        for batch in batches:
+            result = await self._arequest({"input": batch})
+            results.extend(result['data'])
+        return self._build_batch_output(results)
 
-        return results
+    @staticmethod
+    def _build_batch_output(results: List[dict]) -> Message[List[List[float]]]:
+        return Message([result['embedding'] for result in results])
 
     @components_run_trace
     def run(self, text: Union[Message[str], str]) -> Message[List[float]]:
@@ -142,6 +175,20 @@ class Embedding(EmbeddingBaseComponent):
 
         return Message(self._batch([_text]).content[0])
 
+    async def arun(self, text: Union[Message[str], str]) -> Message[List[float]]:
+        """
+        异步处理给定的文本或消息对象，并返回包含处理结果的消息对象。
+        
+        Args:
+            text (Union[Message[str], str]): 待处理的文本或消息对象。
+        
+        Returns:
+            Message[List[float]]: 处理后的结果，封装在消息对象中。结果是一个浮点数列表。
+        """
+        _text = text if isinstance(text, str) else text.content
+
+        return Message((await self._abatch([_text])).content[0])
+
     def batch(self, texts: Union[Message[List[str]], List[str]]) -> Message[List[List[float]]]:
         """
         批量处理文本数据。
@@ -138,9 +138,6 @@ class NL2Sql(Component):
         headers = self.http_client.auth_header()
         headers["Content-Type"] = "application/json"
 
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-
         payload = {"query": query,
                    "table_schemas": table_schemas,
                    "session": [session_record.dict() for session_record in session],
@@ -151,7 +148,7 @@ class NL2Sql(Component):
 
         server_url = self.http_client.service_url(prefix="", sub_path=self.server_sub_path)
         response = self.http_client.session.post(url=server_url, headers=headers,
-                                                 json=payload, timeout=timeout)
+                                                 json=payload, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
@@ -132,9 +132,6 @@ class SelectTable(Component):
         headers = self.http_client.auth_header()
         headers["Content_Type"] = "application/json"
 
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-
         payload = {"query": query,
                    "table_descriptions": table_descriptions,
                    "session": [session_record.dict() for session_record in session],
@@ -143,7 +140,7 @@ class SelectTable(Component):
 
         server_url = self.http_client.service_url(sub_path=self.server_sub_path)
         response = self.http_client.session.post(url=server_url, headers=headers,
-                                                 json=payload, timeout=timeout)
+                                                 json=payload, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
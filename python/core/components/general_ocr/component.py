@@ -107,6 +107,31 @@ class GeneralOCR(Component):
             Message: 包含识别结果的消息对象。
         
         """
+        request = self._build_run_request(message, language_type)
+        result = self._recognize(request, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0, language_type: str = 'CHN_ENG') -> Message:
+        """
+        异步在通用文字识别的基础上，提供更高精度的识别服务，支持更多语种识别
+        
+        Args:
+            message (Message): 包含识别任务的输入信息的消息对象。
+            timeout (float, optional): 超时时间，单位秒。默认为None，表示不设置超时。
+            retry (int, optional): 重试次数。默认为0，表示不重试。
+            language_type (str, optional): 识别语言类型，可选值为'CHN_ENG'（中英文）和'CHN'（中文）。默认为'CHN_ENG'。
+        
+        Returns:
+            Message: 包含识别结果的消息对象。
+        
+        """
+        request = self._build_run_request(message, language_type)
+        result = await self._arecognize(request, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message, language_type: str) -> GeneralOCRRequest:
         inp = GeneralOCRInMsg(**message.content)
         request = GeneralOCRRequest()
         if inp.raw_image:
@@ -115,7 +140,10 @@ class GeneralOCR(Component):
             request.url = inp.url
         request.detect_direction = "true"
         request.language_type = language_type
-        result = self._recognize(request, timeout, retry)
+        return request
+
+    @staticmethod
+    def _build_run_output(result: GeneralOCRResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = GeneralOCROutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -134,21 +162,50 @@ class GeneralOCR(Component):
                    返回：
                        response (obj: `GeneralOCRResponse`): 通用文字识别返回结果
                """
-        if not request.image and not request.url and not request.pdf_file and not request.ofd_file:
-            raise ValueError(
-                "request format error, one of image or url or must pdf_file or ofd_file be set")
-        data = GeneralOCRRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
-        headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/accurate_basic")
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
         response = self.http_client.session.post(
-            url, headers=headers, data=data, timeout=timeout)
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
         request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(
+        self,
+        request: GeneralOCRRequest,
+        timeout: float = None,
+        retry: int = 0,
+        request_id: str = None,
+    ) -> GeneralOCRResponse:
+        r"""异步调用底层接口进行通用文字识别
+                   参数:
+                       request (obj: `GeneralOCRRequest`) : 通用文字识别输入参数
+
+                   返回：
+                       response (obj: `GeneralOCRResponse`): 通用文字识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: GeneralOCRRequest, request_id: str = None):
+        if not request.image and not request.url and not request.pdf_file and not request.ofd_file:
+            raise ValueError(
+                "request format error, one of image or url or must pdf_file or ofd_file be set")
+        data = GeneralOCRRequest.to_dict(request)
+        headers = client.auth_header(request_id)
+        headers['content-type'] = 'application/x-www-form-urlencoded'
+        url = client.service_url("/v1/bce/aip/ocr/v1/accurate_basic")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict):
         self.__class__._check_service_error(request_id, data)
         ocr_response = GeneralOCRResponse.from_json(payload=json.dumps(data))
         ocr_response.request_id = request_id
@@ -191,6 +248,44 @@ class GeneralOCR(Component):
             InvalidRequestArgumentError: 如果请求格式错误（例如未设置文件名或指定文件名对应的URL不存在），则抛出此异常。
         
         """
+        request, traceid = self._build_tool_eval_request(kwargs)
+        res = self._build_tool_eval_result(self._recognize(request, request_id=traceid))
+        if streaming:
+            yield from self._build_tool_eval_stream(res)
+        else:
+            return res
+
+    async def atool_eval(self, name: str, streaming: bool, **kwargs):
+        r"""
+        异步根据给定的参数执行OCR识别功能。
+        
+        Args:
+            name (str): 函数名称，此处未使用，但为保持一致性保留。
+            streaming (bool): 是否以流式方式返回结果。如果为True，则逐个返回结果，否则返回全部结果。
+            kwargs: 关键字参数，支持以下参数：
+                traceid (str): 请求的唯一标识符，用于追踪请求和响应。
+                img_url (str): 待识别图片的URL。
+                file_urls (dict): 包含文件名和对应URL的字典。如果提供了img_url，则忽略此参数。
+                img_name (str): 待识别图片的文件名，与file_urls配合使用。
+        
+        Returns:
+            如果streaming为False，则返回包含识别结果的JSON字符串。
+            如果streaming为True，则逐个返回包含识别结果的字典。
+        
+        Raises:
+            InvalidRequestArgumentError: 如果请求格式错误（例如未设置文件名或指定文件名对应的URL不存在），则抛出此异常。
+        
+        """
+        request, traceid = self._build_tool_eval_request(kwargs)
+        res = self._build_tool_eval_result(await self._arecognize(request, request_id=traceid))
+        if streaming:
+            for output in self._build_tool_eval_stream(res):
+                yield output
+        else:
+            yield res
+
+    @staticmethod
+    def _build_tool_eval_request(kwargs: dict):
         traceid = kwargs.get("traceid")
         img_url = kwargs.get("img_url", None)
         language_type = kwargs.get("language_type", 'CHN_ENG')
@@ -208,21 +303,27 @@ class GeneralOCR(Component):
         req = GeneralOCRRequest(url=img_url)
         req.detect_direction = "true"
         req.language_type = language_type
-        result = proto.Message.to_dict(self._recognize(req, request_id=traceid))
+        return req, traceid
+
+    @staticmethod
+    def _build_tool_eval_result(response: GeneralOCRResponse) -> str:
+        result = proto.Message.to_dict(response)
         results = {
             "识别结果": " \n".join(item["words"] for item in result["words_result"])
         }
-        res = json.dumps(results, ensure_ascii=False, indent=4)
-        if streaming:
-            yield {
+        return json.dumps(results, ensure_ascii=False, indent=4)
+
+    @staticmethod
+    def _build_tool_eval_stream(res: str) -> list:
+        return [
+            {
                 "type": "text",
                 "text": res,
                 "visible_scope": 'llm',
-            }
-            yield {
+            },
+            {
                 "type": "text",
                 "text": "",
                 "visible_scope": 'user',
-            }
-        else:
-            return res
+            },
+        ]
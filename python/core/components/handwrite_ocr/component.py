@@ -79,6 +79,29 @@ class HandwriteOCR(Component):
         Returns:
             Message: 手写体模型识别结果.
         """
+        request = self._build_run_request(message)
+        response = self._recognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        r"""
+        异步输入图片并识别其中的文字
+        
+        Args:
+            message (Message): 输入图片或图片url下载地址用于执行识别操作.例如: Message(content={"raw_image": b"..."}) 或 Message(content={"url": "https://image/download/url"}).
+            timeout (float, optional): HTTP超时时间. 默认为None.
+            retry (int, optional): HTTP重试次数. 默认为0.
+        
+        Returns:
+            Message: 手写体模型识别结果.
+        """
+        request = self._build_run_request(message)
+        response = await self._arecognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> HandwriteOCRRequest:
         inp = HandwriteOCRInMsg(**message.content)
         request = HandwriteOCRRequest()
         if inp.url:
@@ -89,7 +112,10 @@ class HandwriteOCR(Component):
         request.probability = "false"
         request.detect_direction = "true"
         request.detect_alteration = "true"
-        response = self._recognize(request, timeout, retry)
+        return request
+
+    @staticmethod
+    def _build_run_output(response: HandwriteOCRResponse) -> Message:
         out = HandwriteOCROutMsg()
         out.direction = response.direction
         [out.contents.append(
@@ -125,12 +151,53 @@ class HandwriteOCR(Component):
         """
         traceid = kwargs.get("traceid")
         result = ""
+        for file_name, req in self._iter_tool_eval_requests(kwargs):
+            response = self._recognize(req, request_id=traceid)
+            result += self._build_tool_eval_text(file_name, response)
+
+        if streaming:
+            yield from self._build_tool_eval_stream(result)
+        else:
+            return result
+
+    async def atool_eval(self, name: str, streaming: bool, **kwargs):
+        r"""
+        异步对指定文件或URL进行手写识别。
+        
+        Args:
+            name (str): 任务名称。
+            streaming (bool): 是否以流式形式返回结果。
+            kwargs: 其他参数，包括：
+                traceid (str, optional): 请求的traceid，用于标识请求的唯一性。默认为None。
+                file_names (List[str], optional): 待识别的文件名列表。默认为None，此时会从kwargs中获取'files'参数。
+                file_urls (Dict[str, str], optional): 文件名与URL的映射字典。默认为空字典。
+        
+        Returns:
+            如果streaming为True，则以生成器形式返回识别结果，否则直接返回结果字符串。
+        
+        Raises:
+            InvalidRequestArgumentError: 如果请求格式错误，例如指定的文件名对应的URL不存在。
+        
+        """
+        traceid = kwargs.get("traceid")
+        result = ""
+        for file_name, req in self._iter_tool_eval_requests(kwargs):
+            response = await self._arecognize(req, request_id=traceid)
+            result += self._build_tool_eval_text(file_name, response)
+
+        if streaming:
+            for output in self._build_tool_eval_stream(result):
+                yield output
+        else:
+            yield result
+
+    @staticmethod
+    def _iter_tool_eval_requests(kwargs: dict):
         file_names = kwargs.get("file_names", None)
         if not file_names:
             file_names = kwargs.get("files")
         file_urls = kwargs.get("file_urls", {})
         for file_name in file_names:
-
             if utils.is_url(file_name):
                 file_url = file_name
             else:
@@ -143,23 +210,27 @@ class HandwriteOCR(Component):
             req.probability = "false"
             req.detect_direction = "true"
             req.detect_alteration = "true"
-            response = self._recognize(req, request_id=traceid)
-            text = "".join([w.words for w in response.words_result])
-            result += f"{file_name}的手写识别结果是：{text} "
+            yield file_name, req
 
-        if streaming:
-            yield {
+    @staticmethod
+    def _build_tool_eval_text(file_name: str, response: HandwriteOCRResponse) -> str:
+        text = "".join([w.words for w in response.words_result])
+        return f"{file_name}的手写识别结果是：{text} "
+
+    @staticmethod
+    def _build_tool_eval_stream(result: str) -> list:
+        return [
+            {
                 "type": "text",
                 "text": result,
                 "visible_scope": 'llm',
-            }
-            yield {
+            },
+            {
                 "type": "text",
                 "text": "",
                 "visible_scope": "user",
-            }
-        else:
-            return result
+            },
+        ]
 
     def _recognize(
         self, 
@@ -175,19 +246,47 @@ class HandwriteOCR(Component):
                    返回：
                        response (obj: `HandwriteOCRResponse`): 通用文字识别返回结果
                """
-        if not request.image and not request.url:
-            raise ValueError("request format error, one of image or url must be set")
-        data = HandwriteOCRRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
-        headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/handwriting")
-        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout)
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
         request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(
+        self, 
+        request: HandwriteOCRRequest, 
+        timeout: float = None, 
+        retry: int = 0,
+        request_id: str = None,
+    ) -> HandwriteOCRResponse:
+        r"""异步调用底层接口进行通用文字识别
+                    参数:
+                       request (obj: `HandwriteOCRRequest`) : 通用文字识别输入参数
+
+                   返回：
+                       response (obj: `HandwriteOCRResponse`): 通用文字识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: HandwriteOCRRequest, request_id: str = None):
+        if not request.image and not request.url:
+            raise ValueError("request format error, one of image or url must be set")
+        data = HandwriteOCRRequest.to_dict(request)
+        headers = client.auth_header(request_id)
+        headers['content-type'] = 'application/x-www-form-urlencoded'
+        url = client.service_url("/v1/bce/aip/ocr/v1/handwriting")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> HandwriteOCRResponse:
         self.__class__._check_service_error(request_id, data)
         ocr_response = HandwriteOCRResponse(data)
         ocr_response.request_id = request_id
@@ -15,6 +15,7 @@
 r"""图像内容理解"""
 import base64
 import time
+import asyncio
 
 from appbuilder.core.component import Component
 from appbuilder.core.message import Message
@@ -25,6 +26,10 @@ from typing import Generator, Union
 from appbuilder.utils.trace.tracer_wrapper import components_run_trace, components_run_stream_trace
 
 
+# 单个任务查询结果的最小间隔(秒)，避免触发限流（>1QPS）
+POLL_INTERVAL = 1.1
+
+
 class ImageUnderstand(Component):
     r"""
     图像内容理解组件，即对于输入的一张图片（可正常解码，且长宽比适宜）与问题，输出对图片的描述
@@ -49,6 +54,8 @@ class ImageUnderstand(Component):
      """
     name = "image_understanding"
     version = "v1"
+    # 查询结果接口超过1QPS会触发限流，同一secret_key的所有查询共享该配额
+    rate_limits = {"/v1/bce/aip/image-classify/v1/image-understanding/get-result": 1 / 1.1}
     manifests = [
         {
             "name": "image_understanding",
@@ -97,6 +104,31 @@ class ImageUnderstand(Component):
             Message: 模型识别结果.
         
         """
+        request = self._build_run_request(message)
+        response = self.__recognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步执行图像内容理解
+        
+        Args:
+            message (Message): 输入图片或图片url下载地址用于执行识别操作. 举例: Message(content={"raw_image": b"...", "question": "图片主要内容是什么？"})
+                              或 Message(content={"url": "https://image/download/url", "question": "图片主要内容是什么？"}).
+            timeout (float, optional): HTTP超时时间. 默认为 None.
+            retry (int, optional): HTTP重试次数. 默认为 0.
+        
+        Returns:
+            Message: 模型识别结果.
+        
+        """
+        request = self._build_run_request(message)
+        response = await self._arecognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> ImageUnderstandRequest:
         inp = ImageUnderstandInMsg(**message.content)
         request = ImageUnderstandRequest()
         # 兼容新参数，确保输出结果一致
@@ -116,7 +148,10 @@ class ImageUnderstand(Component):
         request.output_CHN = True
         if inp.language == "en":
             request.output_CHN = False
-        response = self.__recognize(request, timeout, retry)
+        return request
+
+    @staticmethod
+    def _build_run_output(response: ImageUnderstandResponse) -> Message:
         out = ImageUnderstandOutMsg(description=response.result.description_to_llm)
         return Message(content=out.model_dump())
 
@@ -135,24 +170,13 @@ class ImageUnderstand(Component):
             返回：
                 response (obj: `ImageUnderstandResponse`): 图像内容理解输出
         """
-        if not request.image and not request.url:
-            raise ValueError("request format error, one of image or url must be set")
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-        data = ImageUnderstandRequest.to_dict(request)
-        headers = self.http_client.auth_header(request_id)
-        headers['Content-Type'] = 'application/json'
-        url = self.http_client.service_url("/v1/bce/aip/image-classify/v1/image-understanding/request")
-        response = self.http_client.session.post(url, json=data, timeout=timeout, headers=headers)
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, json=data, timeout=timeout, retry=retry, headers=headers)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
         request_id = self.http_client.response_request_id(response)
-        self.__class__.__check_create_task_service_error(request_id, data)
-        task = ImageUnderstandTask(data, request_id=request_id)
-        task_id = task.result.get("task_id", "")
-        if task_id == "":
-            raise AppBuilderServerException(request_id=request_id, service_err_message="empty task_id")
+        task_id = self._parse_task_id(request_id, data)
         url = self.http_client.service_url("/v1/bce/aip/image-classify/v1/image-understanding/get-result")
         while True:
             response = self.http_client.session.post(url, json={"task_id": task_id}, timeout=timeout, headers=headers)
@@ -160,15 +184,72 @@ class ImageUnderstand(Component):
             data = response.json()
             self.http_client.check_response_json(data)
             request_id = self.http_client.response_request_id(response)
-            self.__class__.__check_service_error(request_id, data.get("result", {}))
-            # 处理成功
-            response = ImageUnderstandResponse(data)
-            if response.result.ret_code == 0:
-                return ImageUnderstandResponse(data)
-            # 还在处理中
-            if response.result.ret_code == 1:
-                # 避免触发限流（>1QPS），等待1.1秒
-                time.sleep(1.1)
+            result = self._parse_response(request_id, data)
+            if result is not None:
+                return result
+            # 还在处理中，每个任务至少间隔POLL_INTERVAL秒再查询，rate_limits中的限流规则只作为共享同一密钥的全局上限
+            time.sleep(POLL_INTERVAL)
+
+    async def _arecognize(
+        self, 
+        request: ImageUnderstandRequest, 
+        timeout: float = None,
+        retry: int = 0,
+        request_id: str = None,
+    ) -> ImageUnderstandResponse:
+        r"""异步调用底层接口进行图像内容理解
+
+            参数:
+                request (obj: `ImageUnderstandRequest`) : 图像内容理解输入
+
+            返回：
+                response (obj: `ImageUnderstandResponse`): 图像内容理解输出
+        """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, json=data, timeout=timeout, retry=retry, headers=headers)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        task_id = self._parse_task_id(request_id, data)
+        url = self.async_http_client.service_url("/v1/bce/aip/image-classify/v1/image-understanding/get-result")
+        while True:
+            response = await self.async_http_client.session.post(url, json={"task_id": task_id}, timeout=timeout, headers=headers)
+            await self.async_http_client.check_response_header(response)
+            data = await response.json()
+            self.async_http_client.check_response_json(data)
+            request_id = await self.async_http_client.response_request_id(response)
+            result = self._parse_response(request_id, data)
+            if result is not None:
+                return result
+            # 还在处理中，每个任务至少间隔POLL_INTERVAL秒再查询，rate_limits中的限流规则只作为共享同一密钥的全局上限
+            await asyncio.sleep(POLL_INTERVAL)
+
+    @staticmethod
+    def _build_http_request(client, request: ImageUnderstandRequest, request_id: str = None):
+        if not request.image and not request.url:
+            raise ValueError("request format error, one of image or url must be set")
+        data = ImageUnderstandRequest.to_dict(request)
+        headers = client.auth_header(request_id)
+        headers['Content-Type'] = 'application/json'
+        url = client.service_url("/v1/bce/aip/image-classify/v1/image-understanding/request")
+        return url, headers, data
+
+    def _parse_task_id(self, request_id: str, data: dict) -> str:
+        self.__class__.__check_create_task_service_error(request_id, data)
+        task = ImageUnderstandTask(data, request_id=request_id)
+        task_id = task.result.get("task_id", "")
+        if task_id == "":
+            raise AppBuilderServerException(request_id=request_id, service_err_message="empty task_id")
+        return task_id
+
+    def _parse_response(self, request_id: str, data: dict):
+        self.__class__.__check_service_error(request_id, data.get("result", {}))
+        # 处理成功
+        response = ImageUnderstandResponse(data)
+        if response.result.ret_code == 0:
+            return ImageUnderstandResponse(data)
+        return None
 
     @components_run_stream_trace
     def tool_eval(
@@ -196,19 +277,40 @@ class ImageUnderstand(Component):
         file_urls = kwargs.get("file_urls", {})
         rec_res = self._recognize_w_post_process(img_name, img_url, file_urls, request_id=traceid)
         if streaming:
-            yield {
-                "type": "text",
-                "text": rec_res,
-                "visible_scope": 'llm',
-            }
-            yield {
-                "type": "text",
-                "text": "",
-                "visible_scope": 'user',
-            }
+            yield from self._build_tool_eval_stream(rec_res)
         else:
             return rec_res
 
+    async def atool_eval(
+        self,
+        name: str,
+        streaming: bool,
+        origin_query: str,
+        **kwargs,
+    ) -> Union[Generator[str, None, None], str]:
+        """
+        用于工具的异步执行，调用底层接口进行图像内容理解
+        
+        Args:
+            name (str): 工具名
+            streaming (bool): 是否流式返回
+            origin_query (str): 用户原始query
+            **kwargs: 工具调用的额外关键字参数
+        
+        Returns:
+            Union[Generator[str, None, None], str]: 图片内容理解结果
+        """
+        traceid = kwargs.get("traceid")
+        img_name = kwargs.get("img_name", "")
+        img_url = kwargs.get("img_url", "")
+        file_urls = kwargs.get("file_urls", {})
+        rec_res = await self._arecognize_w_post_process(img_name, img_url, file_urls, request_id=traceid)
+        if streaming:
+            for output in self._build_tool_eval_stream(rec_res):
+                yield output
+        else:
+            yield rec_res
+
     def _recognize_w_post_process(
         self,
         img_name,
@@ -227,6 +329,49 @@ class ImageUnderstand(Component):
             返回：
                 str: 图片内容理解结果
         """
+        req = self._build_tool_eval_request(img_name, img_url, file_urls, question)
+        response = self.__recognize(req, request_id=request_id)
+        return self._build_tool_eval_text(response)
+
+    async def _arecognize_w_post_process(
+        self,
+        img_name,
+        img_url,
+        file_urls,
+        question="图片内容有哪些",
+        request_id=None,
+    ) -> str:
+        r"""
+            参数:
+                img_name (str): 图片文件名
+                img_url (bool): 图片url
+                question (str): 询问有关图片内容的问题
+                file_urls (dict): 文件名与对应文件url的映射
+
+            返回：
+                str: 图片内容理解结果
+        """
+        req = self._build_tool_eval_request(img_name, img_url, file_urls, question)
+        response = await self._arecognize(req, request_id=request_id)
+        return self._build_tool_eval_text(response)
+
+    @staticmethod
+    def _build_tool_eval_stream(rec_res: str) -> list:
+        return [
+            {
+                "type": "text",
+                "text": rec_res,
+                "visible_scope": 'llm',
+            },
+            {
+                "type": "text",
+                "text": "",
+                "visible_scope": 'user',
+            },
+        ]
+
+    @staticmethod
+    def _build_tool_eval_request(img_name: str, img_url: str, file_urls: dict, question: str) -> ImageUnderstandRequest:
         req = ImageUnderstandRequest()
         # 兼容新参数，确保输出结果一致
         req.subject_detect = False
@@ -238,7 +383,10 @@ class ImageUnderstand(Component):
             if img_url in file_urls:
                 img_url = file_urls[img_url]
             req.url = img_url
-        response = self.__recognize(req, request_id=request_id)
+        return req
+
+    @staticmethod
+    def _build_tool_eval_text(response: ImageUnderstandResponse) -> str:
         description_to_llm = response.result.description_to_llm
         description_processed = description_to_llm.rsplit("。", 2)[0]
         return description_processed
@@ -57,13 +57,41 @@ class LandmarkRecognition(Component):
             Message: 地标识别结果的消息对象。
                 例如：Message(content={"landmark": b"狮身人面像"})
         """
+        request = self._build_run_request(message)
+        response = self.__recognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步执行地标识别任务
+        
+        Args:
+            message (Message): 输入消息对象，包含待识别的图片或图片URL。
+                例如：Message(content={"raw_image": b"..."}) 或 Message(content={"url": "https://image/download/url"})。
+            timeout (float, optional): HTTP请求的超时时间。默认为None。
+            retry (int, optional): HTTP请求的重试次数。默认为0。
+        
+        Returns:
+            Message: 地标识别结果的消息对象。
+                例如：Message(content={"landmark": b"狮身人面像"})
+        """
+        request = self._build_run_request(message)
+        response = await self._arecognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> LandmarkRecognitionRequest:
         inp = LandmarkRecognitionInMsg(**message.content)
         request = LandmarkRecognitionRequest()
         if inp.raw_image:
             request.image = base64.b64encode(inp.raw_image)
         if inp.url:
             request.url = inp.url
-        response = self.__recognize(request, timeout, retry)
+        return request
+
+    @staticmethod
+    def _build_run_output(response: LandmarkRecognitionResponse) -> Message:
         out = LandmarkRecognitionOutMsg(landmark=response.result.get("landmark", ""))
         return Message(content=out.model_dump())
 
@@ -77,20 +105,43 @@ class LandmarkRecognition(Component):
             返回：
                 response (obj: `LandmarkRecognitionResponse`): 地标识别返回结果
         """
+        url, headers, data = self._build_http_request(self.http_client, request)
+        response = self.http_client.session.post(url, data=data, timeout=timeout, retry=retry, headers=headers)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: LandmarkRecognitionRequest, timeout: float = None,
+                    retry: int = 0) -> LandmarkRecognitionResponse:
+        r"""异步调用底层接口进行地标识别
 
+            参数:
+                request (obj: `LandmarkRecognitionRequest`) : 地标识别输入参数
+
+            返回：
+                response (obj: `LandmarkRecognitionResponse`): 地标识别返回结果
+        """
+        url, headers, data = self._build_http_request(self.async_http_client, request)
+        response = await self.async_http_client.session.post(url, data=data, timeout=timeout, retry=retry, headers=headers)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: LandmarkRecognitionRequest):
         if not request.image and not request.url:
             raise ValueError("request format error, one of image or url must be set")
         data = LandmarkRecognitionRequest.to_dict(request)
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header()
+        headers = client.auth_header()
         headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/image-classify/v1/landmark")
-        response = self.http_client.session.post(url, data=data, timeout=timeout, headers=headers)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/image-classify/v1/landmark")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> LandmarkRecognitionResponse:
         self.__class__.__check_service_error(request_id, data)
         return LandmarkRecognitionResponse(data, request_id=request_id)
 
@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import itertools
+import contextvars
 import json
 import uuid
 from enum import Enum
@@ -29,8 +31,9 @@ from appbuilder.utils.logger_util import logger
 from typing import Dict, List, Optional, Any
 
 from appbuilder.core.component import ComponentArguments
-from appbuilder.core.utils import ModelInfo, ttl_lru_cache
-from appbuilder.utils.sse_util import SSEClient
+from appbuilder.core.utils import ModelInfo, model_catalog
+from appbuilder.utils.sse_util import SSEClient, AsyncSSEClient
+from appbuilder.utils import json_util
 from appbuilder.core._exception import AppBuilderServerException, ModelNotSupportedException
 
 
@@ -115,26 +118,28 @@ class CompletionResponse(object):
                 raise AppBuilderServerException(self.log_id, self.error_no, self.result)
 
             else:
-                data = response.json()
+                self.parse_blocking_data(response.json())
 
-                if data.get("code") and "message" in data:
-                    raise AppBuilderServerException(self.log_id, data["code"], data["message"])
+    def parse_blocking_data(self, data: dict):
+        """解析非流式返回的数据，更新result、extra与token_usage"""
+        if data.get("code") and "message" in data:
+            raise AppBuilderServerException(self.log_id, data["code"], data["message"])
 
-                if "code" in data and "message" in data and "requestId" in data:
-                    raise AppBuilderServerException(self.log_id, data["code"], data["message"])
+        if "code" in data and "message" in data and "requestId" in data:
+            raise AppBuilderServerException(self.log_id, data["code"], data["message"])
 
-                if "code" in data and "message" in data and "status" in data:
-                    raise AppBuilderServerException(self.log_id, data["code"], data["message"])
+        if "code" in data and "message" in data and "status" in data:
+            raise AppBuilderServerException(self.log_id, data["code"], data["message"])
 
-                self.result = data.get("answer", None)
-                trace_log_list = data.get("trace_log", None)
-                if trace_log_list is not None:
-                    for trace_log in trace_log_list:
-                        key = trace_log["tool"]
-                        result_list = trace_log["result"]
-                        result_list = ResultProcessor.process(key, result_list)
-                        self.extra[key] = result_list
-                self.token_usage = data.get("usage", {})
+        self.result = data.get("answer", None)
+        trace_log_list = data.get("trace_log", None)
+        if trace_log_list is not None:
+            for trace_log in trace_log_list:
+                key = trace_log["tool"]
+                result_list = trace_log["result"]
+                result_list = ResultProcessor.process(key, result_list)
+                self.extra[key] = result_list
+        self.token_usage = data.get("usage", {})
 
     def parse_stream_data(self, event):
         """解析流式数据块并提取answer字段"""
@@ -142,7 +147,7 @@ class CompletionResponse(object):
         raw_str = event.raw
         if parsed_str:
             try:
-                data = json.loads(parsed_str)
+                data = json_util.loads(parsed_str)
                 if data.get("code") and "message" in data:
                     raise AppBuilderServerException(self.log_id, data["code"], data["message"])
                 if "code" in data and "message" in data and "requestId" in data:
@@ -156,7 +161,7 @@ class CompletionResponse(object):
                 raise AppBuilderServerException("unknown", "unknown", parsed_str)
         else:
             try:
-                data = json.loads(raw_str)
+                data = json_util.loads(raw_str)
                 if "code" in data and "message" in data:
                     raise AppBuilderServerException(self.log_id, data["code"], data["message"])
                 return data
@@ -201,17 +206,9 @@ class CompletionResponse(object):
             def __next__(self):
                 try:
                     result_json = next(self._content)
-                    char = result_json.get("answer", "")
-                    result_list = result_json.get("result")
-                    key = result_json.get("tool")
-                    if result_list is not None:
-                        result_list = ResultProcessor.process(key, result_list)
-                        message.extra = {key: result_list}  # Update the original extra
-                    else:
-                        message.extra = {}
+                    char = _update_stream_message(message, result_json)
                     if "usage" in result_json:
-                        self._token_usage = result_json.get("usage")
-                        message.token_usage = self._token_usage
+                        self._token_usage = message.token_usage
                     self._concat += char
                     return char
                 except StopIteration:
@@ -224,6 +221,92 @@ class CompletionResponse(object):
             message.content = IterableWrapper(message.content)
         return message
 
+def _update_stream_message(message, result_json: dict) -> str:
+    """用一个流式数据块更新message的extra与token_usage，返回该数据块的answer"""
+    result_list = result_json.get("result")
+    key = result_json.get("tool")
+    if result_list is not None:
+        result_list = ResultProcessor.process(key, result_list)
+        message.extra = {key: result_list}  # Update the original extra
+    else:
+        message.extra = {}
+    if "usage" in result_json:
+        message.token_usage = result_json.get("usage")
+    return result_json.get("answer", "")
+
+
+class AsyncCompletionResponse(CompletionResponse):
+    r"""CompletionResponse的异步版本，基于aiohttp响应与AsyncSSEClient，通过create创建。"""
+
+    def __init__(self, log_id: Optional[str] = None):
+        """初始化客户端状态，不读取响应。"""
+        self.error_no = 0
+        self.error_msg = ""
+        self.log_id = log_id
+        self.extra = {}
+        self.token_usage = {}
+        self.result = None
+
+    @classmethod
+    async def create(cls, response, stream: bool = False) -> "AsyncCompletionResponse":
+        """读取aiohttp响应并创建AsyncCompletionResponse，流式返回时result为异步生成器。"""
+        self = cls(response.headers.get("X-Appbuilder-Request-Id", None))
+        if response.status != 200:
+            self.error_no = response.status
+            self.error_msg = "error"
+            self.result = await response.text()
+            raise AppBuilderServerException(self.log_id, self.error_no, self.result)
+
+        if stream:
+            async def stream_data():
+                sse_client = AsyncSSEClient(response)
+                async for event in sse_client.events():
+                    if not event:
+                        continue
+                    answer = self.parse_stream_data(event)
+                    if answer is not None:
+                        yield answer
+
+            self.result = stream_data()
+        else:
+            self.parse_blocking_data(await response.json())
+        return self
+
+    def message_iterable_wrapper(self, message):
+        """
+        对模型输出的 Message 对象进行包装。
+        当 Message 是流式数据时，content为异步迭代器，数据被迭代完后，将重新更新 content 为 blocking 的字符串。
+        """
+
+        class AsyncIterableWrapper:
+            def __init__(self, stream_content):
+                self._content = stream_content
+                self._concat = []
+                self._token_usage = {}
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                try:
+                    result_json = await self._content.__anext__()
+                except StopAsyncIteration:
+                    message.content = "".join(self._concat)  # Update the original content
+                    raise
+                char = _update_stream_message(message, result_json)
+                if "usage" in result_json:
+                    self._token_usage = message.token_usage
+                self._concat.append(char)
+                return char
+
+            async def aclose(self):
+                await self._content.aclose()
+
+        if isinstance(message.content, collections.abc.AsyncGenerator):
+            message.content = AsyncIterableWrapper(message.content)
+        return message
+
+
 class ResultProcessor:
     @staticmethod
     def process(key, result_list):
@@ -253,7 +336,8 @@ class CompletionBaseComponent(Component):
     model_name: str = ""
     model_type: str = "chat"
     excluded_models: List[str] = ["Yi-34B-Chat", "ChatLaw"]
-    model_info: ModelInfo = None
+    # 请求体中的user为每次调用随机生成的id，不影响模型输出
+    coalesce_ignore_keys = ("user",)
     model_config: Dict[str, Any] = {
         "model": {
             "provider": "baidu",
@@ -291,26 +375,32 @@ class CompletionBaseComponent(Component):
         if not lazy_certification:
             self._check_model_and_get_model_url(self.model_name, self.model_type)
 
-    @ttl_lru_cache(seconds_to_live=1 * 60 * 60) # 1h 
-    def set_secret_key_and_gateway(self, secret_key: Optional[str] = None, gateway: str = ""):
-        super(CompletionBaseComponent, self).set_secret_key_and_gateway(
-                secret_key=secret_key, gateway=gateway)
-        self.__class__.model_info = ModelInfo(client=self.http_client)
+    @property
+    def model_info(self) -> ModelInfo:
+        """当前密钥与网关对应的模型目录，由进程级的model_catalog缓存并在所有组件实例间共享"""
+        return model_catalog.get(self.http_client)
+
+    async def _aload_model_info(self):
+        """异步生成请求前调用，模型目录需要拉取时在线程池中完成，之后生成请求时的查询命中缓存，不阻塞事件循环"""
+        if model_catalog.peek(self.http_client) is not None:
+            return
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        await loop.run_in_executor(
+            None, context.run, self._check_model_and_get_model_url, self.model_name, self.model_type)
 
-    @ttl_lru_cache(seconds_to_live=1 * 60 * 60) # 1h 
     def _check_model_and_get_model_url(self, model, model_type):
         if model and model in self.excluded_models:
             raise ModelNotSupportedException(f"unsupport model, epected model in {self.excluded_models}, got {model}")
         if not model:
             raise ValueError("illegal argument, model_name can't be empty")
-        if self.__class__.model_info is None:
-            self.set_secret_key_and_gateway()
-        m_type = self.model_info.get_model_type(model)
+        model_info = self.model_info
+        m_type = model_info.get_model_type(model)
         if m_type != model_type:
             raise ModelNotSupportedException(
                 f"unsupport model_type for model {model}, expected model_type in {model_type}, got {m_type}")
 
-        model_url = self.model_info.get_model_url(model)
+        model_url = model_info.get_model_url(model)
         return model_url
 
     def gene_request(self, query, inputs, response_mode, message_id, model_config):
@@ -342,7 +432,56 @@ class CompletionBaseComponent(Component):
         Returns:
             obj:`Message`: Output message after running model.
         """
+        request, timeout, retry, request_id = self._build_completion_request(kwargs)
+        response = self.completion(
+            version=self.version,
+            base_url=self.base_url,
+            request=request,
+            timeout=timeout,
+            retry=retry,
+            request_id=request_id
+        )
+
+        if response.error_no != 0:
+            raise AppBuilderServerException(service_err_code=response.error_no, service_err_message=response.error_msg)
+
+        return response.to_message()
+
+    async def arun(self, *args, **kwargs):
+        """
+        异步运行模型，参数与run一致。
+
+        stream为True时返回的message.content为异步迭代器，逐个产出回答片段，迭代结束后content更新为完整回答，
+        extra与token_usage随数据块更新，与run的流式返回语义一致。
+        只重写了run而没有重写arun的子类，在线程池中执行其run。
+
+        Args:
+            **kwargs: Keyword arguments for both component specific inputs and model config.
+
+        Returns:
+            obj:`Message`: Output message after running model.
+        """
+        if type(self).arun is CompletionBaseComponent.arun and type(self).run is not CompletionBaseComponent.run:
+            return await super(CompletionBaseComponent, self).arun(*args, **kwargs)
 
+        await self._aload_model_info()
+        request, timeout, retry, request_id = self._build_completion_request(kwargs)
+        response = await self.acompletion(
+            version=self.version,
+            base_url=self.base_url,
+            request=request,
+            timeout=timeout,
+            retry=retry,
+            request_id=request_id
+        )
+
+        if response.error_no != 0:
+            raise AppBuilderServerException(service_err_code=response.error_no, service_err_message=response.error_msg)
+
+        return response.to_message()
+
+    def _build_completion_request(self, kwargs: dict):
+        """根据run/arun的关键字参数生成请求，返回(request, timeout, retry, request_id)"""
         timeout = kwargs.get('timeout')
         retry = kwargs.get('retry', 0)
         request_id = kwargs.get('request_id')
@@ -362,19 +501,7 @@ class CompletionBaseComponent(Component):
         query, inputs, response_mode, user_id = self.get_compeliton_params(specific_inputs, model_config_inputs)
         model_config = self.get_model_config(model_config_inputs, other_params)
         request = self.gene_request(query, inputs, response_mode, user_id, model_config)
-        response = self.completion(
-            version=self.version,
-            base_url=self.base_url,
-            request=request,
-            timeout=timeout,
-            retry=retry,
-            request_id=request_id
-        )
-
-        if response.error_no != 0:
-            raise AppBuilderServerException(service_err_code=response.error_no, service_err_message=response.error_msg)
-
-        return response.to_message()
+        return request, timeout, retry, request_id
 
     def get_compeliton_params(self, specific_inputs, model_config_inputs):
         """获取模型请求参数"""
@@ -390,29 +517,36 @@ class CompletionBaseComponent(Component):
 
         return query, inputs, response_mode, user_id
 
-    def get_model_config(self, model_config_inputs: ModelArgsConfig, other_params: dict = {}):
-        """获取模型配置信息"""
-        self.model_config["model"]["name"] = self.model_name
+    def get_model_config(self, model_config_inputs: ModelArgsConfig, other_params: Optional[dict] = None) -> dict:
+        """获取本次请求的模型配置信息
+
+        以类属性model_config为模板生成新的配置，不修改模板，同一组件可以在多个线程中以不同参数并发调用，
+        某次调用的参数也不会残留到后续调用中。
+        """
+        model = dict(self.model_config["model"])
+        model["name"] = self.model_name
 
         model_url = self._check_model_and_get_model_url(self.model_name, self.model_type)
         if model_url:
-            self.model_config["model"]["url"] = model_url
+            model["url"] = model_url
 
-        self.model_config["model"]["completion_params"]["temperature"] = model_config_inputs.temperature
-        self.model_config["model"]["completion_params"]["top_p"] = model_config_inputs.top_p
-        self.model_config["model"]["completion_params"]["max_output_tokens"] = model_config_inputs.max_output_tokens
-        self.model_config["model"]["completion_params"]["disable_search"] = model_config_inputs.disable_search
-        self.model_config["model"]["completion_params"]["response_format"] = model_config_inputs.response_format
-        self.model_config["model"]["completion_params"]["stop"] = model_config_inputs.stop
+        completion_params = dict(model.get("completion_params", {}))
+        completion_params["temperature"] = model_config_inputs.temperature
+        completion_params["top_p"] = model_config_inputs.top_p
+        completion_params["max_output_tokens"] = model_config_inputs.max_output_tokens
+        completion_params["disable_search"] = model_config_inputs.disable_search
+        completion_params["response_format"] = model_config_inputs.response_format
+        completion_params["stop"] = model_config_inputs.stop
 
-        if len(other_params) > 0:
+        if other_params:
             logger.info("Some paramters are not expected by the model configuration, we assume they will be used in llm completion api")
 
             for k, v in other_params.items():
-                self.model_config["model"]["completion_params"][k] = v
+                completion_params[k] = v
                 logger.info("Add parameter: {}, value: {} in completion_params.".format(k, v))
-            
-        return self.model_config
+
+        model["completion_params"] = completion_params
+        return {**self.model_config, "model": model}
 
     def completion(
         self,
@@ -433,11 +567,34 @@ class CompletionBaseComponent(Component):
         stream = True if request.response_mode == "streaming" else False
         url = self.http_client.service_url(completion_url, self.base_url)
         response = self.http_client.session.post(url, json=request.params, headers=headers, timeout=timeout,
-                                                 stream=stream)
+                                                 stream=stream, retry=retry)
         
         return self.gene_response(response, stream)
 
 
+    async def acompletion(
+        self,
+        version,
+        base_url,
+        request: CompletionRequest,
+        timeout: float = None,
+        retry: int = 0,
+        request_id: str = None,
+    ) -> AsyncCompletionResponse:
+        r"""completion的异步版本，基于async_http_client发送请求，流式返回时不占用线程"""
+
+        headers = self.async_http_client.auth_header(request_id)
+        headers["Content-Type"] = "application/json"
+
+        completion_url = "/" + self.version + "/api/llm/" + self.name
+
+        stream = True if request.response_mode == "streaming" else False
+        url = self.async_http_client.service_url(completion_url, self.base_url)
+        response = await self.async_http_client.session.post(url, json=request.params, headers=headers,
+                                                             timeout=timeout, retry=retry)
+
+        return await AsyncCompletionResponse.create(response, stream)
+
     @staticmethod
     def check_service_error(data: dict):
         r"""check service internal error.
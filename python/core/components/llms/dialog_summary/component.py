@@ -85,3 +85,19 @@ class DialogSummary(CompletionBaseComponent):
         
         """
         return super().run(message=message, stream=stream, temperature=temperature, top_p=top_p)
+
+    async def arun(self, message, stream=False, temperature=1e-10, top_p=0):
+        """
+        异步运行模型，参数与run一致。
+        
+        Args:
+            message (obj:`Message`): 输入消息，用于模型的主要输入内容。这是一个必需的参数。
+            stream (bool, optional): 指定是否以流式形式返回响应，为True时message.content为异步迭代器。默认为 False。
+            temperature (float, optional): 模型配置的温度参数，默认值为 1e-10。
+            top_p (float, optional): 影响输出文本的多样性，默认值为 0。
+        
+        Returns:
+            obj:`Message`: 模型运行后的输出消息。
+        
+        """
+        return await super().arun(message=message, stream=stream, temperature=temperature, top_p=top_p)
@@ -15,7 +15,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 
-from appbuilder.core.components.llms.base import CompletionBaseComponent, ModelArgsConfig
+from appbuilder.core.components.llms.base import CompletionBaseComponent, ModelArgsConfig, AsyncCompletionResponse
 from appbuilder.core.message import Message
 from appbuilder.core._exception import AppBuilderServerException
 from appbuilder.utils.trace.tracer_wrapper import components_run_trace, components_run_stream_trace
@@ -141,9 +141,35 @@ class HallucinationDetection(CompletionBaseComponent):
         
         url = self.http_client.service_url("/app/hallucination_detection", self.base_url)
         response = self.http_client.session.post(url, json=request.params, headers=headers, timeout=timeout,
-                                                 stream=stream)
+                                                 stream=stream, retry=retry)
         return self.gene_response(response, stream)
 
+    async def acompletion(self, version, base_url, request, timeout: float = None,
+                          retry: int = 0):
+        """
+        completion的异步版本，基于async_http_client发送请求。
+        
+        Args:
+            version (str): API version.
+            base_url (str): Base URL of the API.
+            request (Request): Request object.
+            timeout (float, optional): Timeout for the request. Defaults to None.
+            retry (int, optional): Number of retries for the request. Defaults to 0.
+        
+        Returns:
+            AsyncCompletionResponse: Processed response object.
+        
+        """
+        headers = self.async_http_client.auth_header()
+        headers["Content-Type"] = "application/json"
+
+        stream = True if request.response_mode == "streaming" else False
+
+        url = self.async_http_client.service_url("/app/hallucination_detection", self.base_url)
+        response = await self.async_http_client.session.post(url, json=request.params, headers=headers,
+                                                             timeout=timeout, retry=retry)
+        return await AsyncCompletionResponse.create(response, stream)
+
     @components_run_trace
     def run(self, message, stream=False, temperature=1e-10, top_p=0.0):
         """
@@ -164,6 +190,44 @@ class HallucinationDetection(CompletionBaseComponent):
             AssertionError: 如果输入的 message 中缺少 query、context 或 answer。
             AppBuilderServerException: 如果请求执行失败，将抛出异常，包含服务错误码和错误信息。
         """
+        request = self._build_request(message, stream, temperature, top_p)
+        response = self.completion(self.version, self.base_url, request)
+
+        if response.error_no != 0:
+            raise AppBuilderServerException(service_err_code=response.error_no, service_err_message=response.error_msg)
+
+        result = response.to_message()
+
+        return result
+
+    async def arun(self, message, stream=False, temperature=1e-10, top_p=0.0):
+        """
+        异步运行模型，参数与run一致。
+        
+        Args:
+            message (Message): 输入消息，包含 query、context 和 answer。是必需的参数。
+            stream (bool, 可选): 是否以流式形式返回响应，为True时result.content为异步迭代器。默认为 False。
+            temperature (float, 可选): 模型配置的温度参数，默认值为 1e-10。
+            top_p (float, 可选): 影响输出文本的多样性，默认值为 0。
+        
+        Returns:
+            result (Message): 模型运行后的输出消息。
+        
+        Raises:
+            AssertionError: 如果输入的 message 中缺少 query、context 或 answer。
+            AppBuilderServerException: 如果请求执行失败，将抛出异常，包含服务错误码和错误信息。
+        """
+        await self._aload_model_info()
+        request = self._build_request(message, stream, temperature, top_p)
+        response = await self.acompletion(self.version, self.base_url, request)
+
+        if response.error_no != 0:
+            raise AppBuilderServerException(service_err_code=response.error_no, service_err_message=response.error_msg)
+
+        return response.to_message()
+
+    def _build_request(self, message, stream, temperature, top_p):
+        """校验输入并生成幻觉检测请求"""
         inputs = message.content
         query = inputs.pop('query', None)
         assert query, 'You must input query and query should not be empty'
@@ -174,15 +238,7 @@ class HallucinationDetection(CompletionBaseComponent):
         model_config_inputs = ModelArgsConfig(**{"stream": stream, "temperature": temperature, "top_p": top_p})
         model_config = self.get_model_config(model_config_inputs)
 
-        request = self.gene_request(query, inputs, response_mode, user_id, model_config)
-        response = self.completion(self.version, self.base_url, request)
-
-        if response.error_no != 0:
-            raise AppBuilderServerException(service_err_code=response.error_no, service_err_message=response.error_msg)
-
-        result = response.to_message()
-
-        return result
+        return self.gene_request(query, inputs, response_mode, user_id, model_config)
 
     @components_run_stream_trace
     def tool_eval(self, name: str, stream: bool = False, **kwargs):
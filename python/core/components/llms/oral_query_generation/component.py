@@ -140,7 +140,7 @@ class OralQueryGeneration(CompletionBaseComponent):
         
         url = self.http_client.service_url("/app/query_generation", self.base_url)
         response = self.http_client.session.post(url, json=request.params, headers=headers, timeout=timeout,
-                                                 stream=stream)
+                                                 stream=stream, retry=retry)
         return self.gene_response(response, stream)
 
     @components_run_trace
@@ -96,6 +96,34 @@ class Playground(CompletionBaseComponent):
         Returns:
             obj:`Message`: 模型运行后的输出消息。
         """
+        query_message = self._format_prompt(message)
+        return super().run(message=query_message, stream=stream, temperature=temperature, top_p=top_p,
+                           max_output_tokens=max_output_tokens, disable_search=disable_search, response_format=response_format, stop=stop, **kwargs)
+
+    async def arun(self, message, stream=False, temperature=1e-10, top_p=0.0, max_output_tokens=1024, disable_search=True, response_format='text', stop=[], **kwargs):
+        """
+        异步运行模型，参数与run一致。
+        
+        Args:
+            message (obj:`Message`): 输入消息，用于模型的主要输入内容。这是一个必需的参数。
+            stream (bool, 可选): 指定是否以流式形式返回响应，为True时message.content为异步迭代器。默认为 False。
+            temperature (float, 可选): 模型配置的温度参数，默认值为 1e-10。
+            top_p (float, 可选): 影响输出文本的多样性，默认值为 0。
+            max_output_tokens (int, 可选): 指定生成的文本的最大长度，默认最大输出token数为1024。
+            disable_search (bool, 可选): 是否强制关闭实时搜索功能，默认为 True，表示关闭。
+            response_format (str, 可选): 指定返回的消息格式，默认为 'text'。
+            stop (list[str], 可选): 生成停止标识。
+        
+        Returns:
+            obj:`Message`: 模型运行后的输出消息。
+        """
+        query_message = self._format_prompt(message)
+        return await super().arun(message=query_message, stream=stream, temperature=temperature, top_p=top_p,
+                                  max_output_tokens=max_output_tokens, disable_search=disable_search,
+                                  response_format=response_format, stop=stop, **kwargs)
+
+    def _format_prompt(self, message) -> Message:
+        """用输入消息填充prompt模板"""
         inputs = {}
 
         if isinstance(message.content, str):
@@ -111,9 +139,7 @@ class Playground(CompletionBaseComponent):
                     f"Missing input variable {key} in message {message.content}")
 
         prompt = self.prompt_template.format(**inputs)
-        query_message = Message(prompt)
-        return super().run(message=query_message, stream=stream, temperature=temperature, top_p=top_p,
-                           max_output_tokens=max_output_tokens, disable_search=disable_search, response_format=response_format, stop=stop, **kwargs)
+        return Message(prompt)
 
     def __parse__(self, prompt_template):
         last_end = 0
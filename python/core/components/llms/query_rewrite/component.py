@@ -92,6 +92,34 @@ class QueryRewrite(CompletionBaseComponent):
             ValueError: 如果输入消息为空或不符合要求，将抛出 ValueError 异常。
         
         """
+        self._convert_input(message, rewrite_type)
+        return super().run(message=message, rewrite_type=rewrite_type, stream=stream, temperature=temperature, top_p=top_p)
+
+    async def arun(self, message, rewrite_type="带机器人回复", stream=False, temperature=1e-10, top_p=0):
+        """
+        异步运行模型，参数与run一致。
+        
+        Args:
+            message (obj:`Message`): 输入消息，用于模型的主要输入内容。这是一个必需的参数。
+            rewrite_type (str, 可选): 改写类型选项，可选值为 '带机器人回复'，'仅用户查询'。默认为"带机器人回复"。
+            stream (bool, 可选): 指定是否以流式形式返回响应，为True时message.content为异步迭代器。默认为 False。
+            temperature (float, 可选): 模型配置的温度参数，默认值为 1e-10。
+            top_p (float, 可选): 影响输出文本的多样性，默认值为 0。
+        
+        Returns:
+            obj:`Message`: 模型运行后的输出消息。
+        
+        Raises:
+            ValueError: 如果输入消息为空或不符合要求，将抛出 ValueError 异常。
+        
+        """
+        self._convert_input(message, rewrite_type)
+        return await super().arun(message=message, rewrite_type=rewrite_type, stream=stream, temperature=temperature,
+                                  top_p=top_p)
+
+    @staticmethod
+    def _convert_input(message, rewrite_type):
+        """校验多轮对话输入，并按改写类型将其拼接为模型输入"""
         if message is None:
             raise ValueError("input message is required")
 
@@ -106,5 +134,3 @@ class QueryRewrite(CompletionBaseComponent):
         else:
             converted_input = ''.join([f"User1: {message.content[i]}\n" for i in range(0, len(message.content), 2)])
         message.content = converted_input
-
-        return super().run(message=message, rewrite_type=rewrite_type, stream=stream, temperature=temperature, top_p=top_p)
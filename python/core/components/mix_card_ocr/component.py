@@ -85,6 +85,30 @@ class MixCardOCR(Component):
         Returns:
             Message: 包含身份证识别结果的Message对象.
         """
+        request = self._build_run_request(message)
+        response = self._recognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步执行身份证识别操作
+        
+        Args:
+            message (Message): 包含待识别图片或图片下载URL的Message对象.
+                示例: Message(content={"raw_image": b"..."}) 或 Message(content={"url": "https://image/download/url"}).
+            timeout (float, 可选): HTTP请求的超时时间，默认为None.
+            retry (int, 可选): HTTP请求的重试次数，默认为0.
+        
+        Returns:
+            Message: 包含身份证识别结果的Message对象.
+        """
+        request = self._build_run_request(message)
+        response = await self._arecognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> MixCardOCRRequest:
         inp = MixCardOCRInMsg(**message.content)
         request = MixCardOCRRequest()
         if inp.url:
@@ -95,7 +119,10 @@ class MixCardOCR(Component):
         request.detect_quality = "false"
         request.detect_photo = "false"
         request.detect_card = "false"
-        response = self._recognize(request, timeout, retry)
+        return request
+
+    @staticmethod
+    def _build_run_output(response: MixCardOCRResponse) -> Message:
         out = MixCardOCROutMsg()
         for res in response.words_result:
             card_type = res.card_info.card_type
@@ -121,19 +148,41 @@ class MixCardOCR(Component):
                 返回：
                     response (obj: `GeneralOCRResponse`): 通用文字识别返回结果
                """
-        if not request.image and not request.url:
-            raise ValueError("request format error, one of image or url must be set")
-        data = MixCardOCRRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
-        headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/multi_idcard")
-        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout)
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
         request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: MixCardOCRRequest, timeout: float = None, retry: int = 0, request_id: str = None) -> MixCardOCRResponse:
+        r"""异步调用底层身份证混贴识别
+                参数:
+                    request (obj: `GeneralOCRRequest`) : 通用文字识别输入参数
+
+                返回：
+                    response (obj: `GeneralOCRResponse`): 通用文字识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: MixCardOCRRequest, request_id: str = None):
+        if not request.image and not request.url:
+            raise ValueError("request format error, one of image or url must be set")
+        data = MixCardOCRRequest.to_dict(request)
+        headers = client.auth_header(request_id)
+        headers['content-type'] = 'application/x-www-form-urlencoded'
+        url = client.service_url("/v1/bce/aip/ocr/v1/multi_idcard")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> MixCardOCRResponse:
         self.__class__._check_service_error(request_id, data)
         response = MixCardOCRResponse(data)
         response.request_id = request_id
@@ -177,6 +226,51 @@ class MixCardOCR(Component):
         """
         result = {}
         traceid = kwargs.get("traceid")
+        for file_name, request in self._iter_tool_eval_requests(kwargs):
+            response = self._recognize(request, request_id=traceid)
+            result[file_name] = self._build_tool_eval_result(response)
+
+        result = json.dumps(result, ensure_ascii=False)
+        if streaming:
+            yield from self._build_tool_eval_stream(result)
+        else:
+            return result
+
+    async def atool_eval(self, name: str, streaming: bool, **kwargs):
+        """
+        异步对指定文件进行OCR识别。
+        
+        Args:
+            name (str): API名称。
+            streaming (bool): 是否流式输出。如果为True，则逐个返回识别结果；如果为False，则一次性返回所有识别结果。
+            **kwargs: 其他参数。
+        
+        Returns:
+            如果streaming为False，则返回包含所有识别结果的JSON字符串。
+            如果streaming为True，则逐个返回包含识别结果的字典，每个字典包含以下字段：
+                type (str): 消息类型，固定为"text"。
+                text (str): 识别结果的JSON字符串。
+                visible_scope (str): 消息可见范围，可以是"llm"或"user"。
+        
+        Raises:
+            InvalidRequestArgumentError: 如果请求格式错误，即文件URL不存在时抛出。
+        
+        """
+        result = {}
+        traceid = kwargs.get("traceid")
+        for file_name, request in self._iter_tool_eval_requests(kwargs):
+            response = await self._arecognize(request, request_id=traceid)
+            result[file_name] = self._build_tool_eval_result(response)
+
+        result = json.dumps(result, ensure_ascii=False)
+        if streaming:
+            for output in self._build_tool_eval_stream(result):
+                yield output
+        else:
+            yield result
+
+    @staticmethod
+    def _iter_tool_eval_requests(kwargs: dict):
         file_names = kwargs.get("file_names", None)
         if not file_names:
             file_names = kwargs.get("files")
@@ -195,31 +289,34 @@ class MixCardOCR(Component):
             request.detect_quality = "false"
             request.detect_photo = "false"
             request.detect_card = "false"
-            response = self._recognize(request, request_id=traceid)
-            out = MixCardOCROutMsg()
-            for res in response.words_result:
-                card_type = res.card_info.card_type
-                if card_type != "idcard_back" and card_type != "idcard_front":
-                    continue
-                ref = out.front
-                if card_type == "idcard_back":
-                    ref = out.back
-                for key, val in res.card_result.items():
-                    ref.fields.append(MixCardField(key=key, value=val.words, position=None))
-            out.direction = response.direction
-            result[file_name] = out.dict()
+            yield file_name, request
 
-        result = json.dumps(result, ensure_ascii=False)
-        if streaming:
-            yield {
+    @staticmethod
+    def _build_tool_eval_result(response: MixCardOCRResponse) -> dict:
+        out = MixCardOCROutMsg()
+        for res in response.words_result:
+            card_type = res.card_info.card_type
+            if card_type != "idcard_back" and card_type != "idcard_front":
+                continue
+            ref = out.front
+            if card_type == "idcard_back":
+                ref = out.back
+            for key, val in res.card_result.items():
+                ref.fields.append(MixCardField(key=key, value=val.words, position=None))
+        out.direction = response.direction
+        return out.dict()
+
+    @staticmethod
+    def _build_tool_eval_stream(result: str) -> list:
+        return [
+            {
                 "type": "text",
                 "text": result,
                 "visible_scope": 'llm',
-            }
-            yield {
+            },
+            {
                 "type": "text",
                 "text": "",
                 "visible_scope": "user",
-            }
-        else:
-            return result
+            },
+        ]
@@ -96,13 +96,43 @@ class ObjectRecognition(Component):
                     "score":0.94553,"root":"植物-蔷薇科"},{"keyword":"姬娜果","score":0.730442,"root":"植物-其它"},
                     {"keyword":"红富士","score":0.505194,"root":"植物-其它"}]})
         """
+        req = self._build_run_request(message)
+        result = self._recognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步通用物体识别
+        
+        Args:
+            message (Message): 输入图片或图片url下载地址用于执行识别操作。
+                例如: Message(content={"raw_image": b"..."}) 或 Message(content={"url": "https://image/download/url"})。
+            timeout (float, optional): HTTP超时时间，默认为None。
+            retry (int, optional): HTTP重试次数，默认为0。
+        
+        Returns:
+            Message: 模型识别结果。
+                例如: Message(content={"result":[{"keyword":"苹果",
+                    "score":0.94553,"root":"植物-蔷薇科"},{"keyword":"姬娜果","score":0.730442,"root":"植物-其它"},
+                    {"keyword":"红富士","score":0.505194,"root":"植物-其它"}]})
+        """
+        req = self._build_run_request(message)
+        result = await self._arecognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> ObjectRecognitionRequest:
         inp = ObjectRecognitionInMsg(**message.content)
         req = ObjectRecognitionRequest()
         if inp.raw_image:
             req.image = base64.b64encode(inp.raw_image)
         if inp.url:
             req.url = inp.url
-        result = self._recognize(req, timeout, retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: ObjectRecognitionResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = ObjectRecognitionOutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -115,20 +145,42 @@ class ObjectRecognition(Component):
                    返回：
                        response (obj: `ObjectRecognitionResponse`): 通用物体与场景识别返回结果
                """
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: ObjectRecognitionRequest, timeout: float = None,
+                  retry: int = 0, request_id: str = None) -> ObjectRecognitionResponse:
+        r"""异步调用底层接口进行通用物体与场景识别
+                   参数:
+                       request (obj: `ObjectRecognitionRequest`) : 通用物体与场景识别输入参数
+                   返回：
+                       response (obj: `ObjectRecognitionResponse`): 通用物体与场景识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: ObjectRecognitionRequest, request_id: str = None):
         if not request.image and not request.url:
             raise ValueError("request format error, one of image or url must be set")
 
         data = ObjectRecognitionRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/image-classify/v2/advanced_general")
-        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/image-classify/v2/advanced_general")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> ObjectRecognitionResponse:
         self.__class__._check_service_error(request_id,data)
         object_response = ObjectRecognitionResponse.from_json(payload=json.dumps(data))
         object_response.request_id = request_id
@@ -176,6 +228,51 @@ class ObjectRecognition(Component):
             InvalidRequestArgumentError: 如果请求格式错误（如未设置文件名或文件URL不存在），则抛出此异常。
         """
         traceid = kwargs.get("traceid")
+        req = self._build_tool_eval_request(kwargs)
+        result = self._recognize(req, request_id=traceid)
+        res = self._build_tool_eval_text(result, kwargs.get("score_threshold", 0.5))
+        if streaming:
+            yield from self._build_tool_eval_stream(res)
+        else:
+            return res
+
+    async def atool_eval(self, name: str, streaming: bool, **kwargs):
+        """
+        异步评估并识别传入图像中的物体或场景。
+        
+        Args:
+            name (str): 调用此方法的对象名称。
+            streaming (bool): 是否以流式方式返回结果。如果是True，则以生成器形式返回结果；如果是False，则直接返回字符串形式的识别结果。
+            **kwargs: 任意关键字参数，支持以下参数：
+                traceid (str, optional): 请求的追踪ID，用于追踪请求处理流程。默认为None。
+                img_url (str, optional): 待识别图像的URL地址。默认为None，如果未指定，则尝试从file_urls和img_name参数中获取图像路径。
+                file_urls (dict, optional): 包含文件名和对应URL的字典。默认为空字典。
+                img_name (str, optional): 待识别图像的文件名。如果img_url未指定，则根据img_name从file_urls中获取图像的URL。默认为None。
+                score_threshold (float, optional): 置信度阈值，低于此阈值的识别结果将被忽略。默认为0.5。
+        
+        Returns:
+            如果streaming为True，则返回一个生成器，生成器中的元素为包含识别结果的字典，字典包含以下键：
+                type (str): 结果类型，固定为"text"。
+                text (str): 识别结果的JSON字符串表示。
+                visible_scope (str): 结果的可见范围，'llm'表示仅对LLM可见，'user'表示对用户可见。
+        
+            如果streaming为False，则直接返回识别结果的JSON字符串表示。
+        
+        Raises:
+            InvalidRequestArgumentError: 如果请求格式错误（如未设置文件名或文件URL不存在），则抛出此异常。
+        """
+        traceid = kwargs.get("traceid")
+        req = self._build_tool_eval_request(kwargs)
+        result = await self._arecognize(req, request_id=traceid)
+        res = self._build_tool_eval_text(result, kwargs.get("score_threshold", 0.5))
+        if streaming:
+            for output in self._build_tool_eval_stream(res):
+                yield output
+        else:
+            yield res
+
+    @staticmethod
+    def _build_tool_eval_request(kwargs: dict) -> ObjectRecognitionRequest:
         img_url = kwargs.get("img_url", None)
         if not img_url:
             file_urls = kwargs.get("file_urls", {})
@@ -186,9 +283,11 @@ class ObjectRecognition(Component):
             img_url = file_urls.get(img_name, None)
             if not img_url:
                 raise InvalidRequestArgumentError(f"request format error, file {img_name} url does not exist")
-        score_threshold = kwargs.get("score_threshold", 0.5)
-        req = ObjectRecognitionRequest(url=img_url)
-        result = proto.Message.to_dict(self._recognize(req, request_id=traceid))
+        return ObjectRecognitionRequest(url=img_url)
+
+    @staticmethod
+    def _build_tool_eval_text(result: ObjectRecognitionResponse, score_threshold: float) -> str:
+        result = proto.Message.to_dict(result)
         results = []
         for item in result["result"]:
             if item["score"] < score_threshold and len(results) > 0:
@@ -199,17 +298,19 @@ class ObjectRecognition(Component):
                 "所属类别": item["root"],
             }
             results.append(res)
-        res = json.dumps(results, ensure_ascii=False, indent=4)
-        if streaming:
-            yield {
+        return json.dumps(results, ensure_ascii=False, indent=4)
+
+    @staticmethod
+    def _build_tool_eval_stream(res: str) -> list:
+        return [
+            {
                 "type": "text",
                 "text": res,
                 "visible_scope": 'llm',
-            }
-            yield {
+            },
+            {
                 "type": "text",
                 "text": "",
                 "visible_scope": 'user',
-            }
-        else:
-            return res
\ No newline at end of file
+            },
+        ]
\ No newline at end of file
@@ -103,6 +103,30 @@ class PlantRecognition(Component):
         Returns:
             Message: 模型识别结果
         """
+        request = self._build_run_request(message)
+        response = self.__recognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步输入图片并识别其中的植物
+        
+        Args:
+            message (Message): 输入图片或图片url下载地址用于执行识别操作. 举例: Message(content={"raw_image": b"..."})
+            或 Message(content={"url": "https://image/download/uel"}).
+            timeout (float, optional): HTTP超时时间，默认为None
+            retry (int, optional): HTTP重试次数，默认为0
+        
+        Returns:
+            Message: 模型识别结果
+        """
+        request = self._build_run_request(message)
+        response = await self._arecognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> PlantRecognitionRequest:
         inp = PlantRecognitionInMsg(**message.content)
         request = PlantRecognitionRequest()
         if inp.url:
@@ -111,7 +135,10 @@ class PlantRecognition(Component):
             request.image = base64.b64encode(inp.raw_image)
         request.top_num = 5
         request.baike_num = 0
-        response = self.__recognize(request, timeout, retry)
+        return request
+
+    @staticmethod
+    def _build_run_output(response: PlantRecognitionResponse) -> Message:
         plant_score_list = []
         [plant_score_list.append(PlantScore(name=plant.name, score=plant.score)) for plant in response.result]
         out = PlantRecognitionOutMsg(plant_score_list=plant_score_list)
@@ -132,19 +159,48 @@ class PlantRecognition(Component):
             返回：
                 response (obj: `PlantRecognitionResponse`): 植物识别返回结果
         """
-        if not request.image and not request.url:
-            raise ValueError("request format error, one of image or url must be set")
-        data = PlantRecognitionRequest.to_dict(request)
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
-        headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/image-classify/v1/plant")
-        response = self.http_client.session.post(url, data=data, timeout=timeout, headers=headers)
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, data=data, timeout=timeout, retry=retry, headers=headers)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
         request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(
+        self,
+        request: PlantRecognitionRequest,
+        timeout: float = None,
+        retry: int = 0,
+        request_id: str = None,
+    ) -> PlantRecognitionResponse:
+        r"""异步调用底层接口植物识别
+
+            参数:
+                request (obj: `PlantRecognitionRequest`) : 植物识别输入参数
+
+            返回：
+                response (obj: `PlantRecognitionResponse`): 植物识别返回结果
+        """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, data=data, timeout=timeout, retry=retry, headers=headers)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: PlantRecognitionRequest, request_id: str = None):
+        if not request.image and not request.url:
+            raise ValueError("request format error, one of image or url must be set")
+        data = PlantRecognitionRequest.to_dict(request)
+        headers = client.auth_header(request_id)
+        headers['content-type'] = 'application/x-www-form-urlencoded'
+        url = client.service_url("/v1/bce/aip/image-classify/v1/plant")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> PlantRecognitionResponse:
         self.__class__.__check_service_error(request_id, data)
         return PlantRecognitionResponse(data, request_id=request_id)
 
@@ -178,6 +234,35 @@ class PlantRecognition(Component):
         else:
             return rec_res
 
+    async def atool_eval(
+        self, 
+        name: str, 
+        streaming: bool,
+        origin_query: str,
+        **kwargs,
+    ) -> Union[Generator[str, None, None], str]:
+        """
+        用于工具的异步执行，通过调用底层接口进行植物识别
+        
+        Args:
+            name (str): 工具名
+            streaming (bool): 是否流式返回
+            origin_query (str): 用户原始query
+            **kwargs: 工具调用的额外关键字参数
+        
+        Returns:
+            Union[Generator[str, None, None], str]: 植物识别结果，包括识别出的植物类别和相应的置信度信息
+        """
+        traceid = kwargs.get("traceid")
+        img_name = kwargs.get("img_name", "")
+        img_url = kwargs.get("img_url", "")
+        file_urls = kwargs.get("file_urls", {})
+        rec_res = await self._arecognize_w_post_process(img_name, img_url, file_urls, request_id=traceid)
+        if streaming:
+            yield rec_res
+        else:
+            yield rec_res
+
     def _recognize_w_post_process(self, img_name, img_url, file_urls, request_id=None):
         r"""调底层接口对图片或图片url进行植物识别，并返回类别及其置信度
             参数:
@@ -187,6 +272,25 @@ class PlantRecognition(Component):
             返回：
                str: 植物识别结果，包括识别出的动物类别和相应的置信度信息
          """
+        req = self._build_tool_eval_request(img_name, img_url, file_urls)
+        result = self.__recognize(req, request_id=request_id)
+        return self._build_tool_eval_text(result)
+
+    async def _arecognize_w_post_process(self, img_name, img_url, file_urls, request_id=None):
+        r"""异步调底层接口对图片或图片url进行植物识别，并返回类别及其置信度
+            参数:
+               img_name (str): 图片文件名
+               img_url (str): 图片url
+               file_urls (dict): 文件名与对应文件url的映射
+            返回：
+               str: 植物识别结果，包括识别出的动物类别和相应的置信度信息
+         """
+        req = self._build_tool_eval_request(img_name, img_url, file_urls)
+        result = await self._arecognize(req, request_id=request_id)
+        return self._build_tool_eval_text(result)
+
+    @staticmethod
+    def _build_tool_eval_request(img_name: str, img_url: str, file_urls: dict) -> PlantRecognitionRequest:
         req = PlantRecognitionRequest()
         if img_name in file_urls:
             req.url = file_urls[img_name]
@@ -196,7 +300,10 @@ class PlantRecognition(Component):
             req.url = img_url
         req.top_num = TOP_NUM
         req.baike_num = BAIKE_NUM
-        result = self.__recognize(req, request_id=request_id)
+        return req
+
+    @staticmethod
+    def _build_tool_eval_text(result: PlantRecognitionResponse) -> str:
         result_dict = proto.Message.to_dict(result)
         rec_res = "模型识别结果为：\n"
         for rec_info in result_dict['result']:
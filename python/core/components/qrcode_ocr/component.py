@@ -94,6 +94,37 @@ class QRcodeOCR(Component):
         Raises:
             InvalidRequestArgumentError: 如果 location 参数非法，将抛出该异常。
         """
+        req = self._build_run_request(message, location)
+        result = self._recognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, location: str = "true", timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步执行二维码识别操作。
+        
+        Args:
+            message (Message): 输入的图片或图片URL下载地址，用于执行识别操作。例如：
+                Message(content={"raw_image": b"...", "location": ""}) 或
+                Message(content={"url": "https://image/download/url"})。
+            location (str, 可选): 是否需要返回二维码位置信息，默认为 "true"。
+            timeout (float, 可选): HTTP请求的超时时间。
+            retry (int, 可选): HTTP请求的重试次数。
+        
+        Returns:
+            Message: 识别结果，包含识别到的二维码信息。例如：
+                Message(name=msg, content={'codes_result': [{'type': 'QR_CODE', 'text': ['http://weixin.qq.com/r/cS7M1PHE5qyZrbW393tj'],
+                    'location': {'top': 63, 'left': 950, 'width': 220, 'height': 211}}, ...]}, mtype=dict)
+        
+        Raises:
+            InvalidRequestArgumentError: 如果 location 参数非法，将抛出该异常。
+        """
+        req = self._build_run_request(message, location)
+        result = await self._arecognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message, location: str) -> QRcodeRequest:
         inp = QRcodeInMsg(**message.content)
         req = QRcodeRequest()
         if inp.raw_image:
@@ -104,7 +135,10 @@ class QRcodeOCR(Component):
             raise InvalidRequestArgumentError(
                 f"illegal location, expected location is 'true' or 'false', got {location}")
         req.location = location
-        result = self._recognize(req, timeout, retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: QRcodeResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = QRcodeOutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -117,23 +151,46 @@ class QRcodeOCR(Component):
                    返回：
                        response (obj: `QRcodeResponse`): 二维码识别返回结果
                """
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: QRcodeRequest, timeout: float = None,
+                   retry: int = 0, request_id: str = None) -> QRcodeResponse:
+        r"""异步调用二维码识别底层能力
+                   参数:
+                       request (obj: `QRcodeRequest`) : 二维码识别输入参数
+                   返回：
+                       response (obj: `QRcodeResponse`): 二维码识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: QRcodeRequest, request_id: str = None):
         if not request.image and not request.url:
             raise ValueError(
                 "request format error, one of image or url must be set")
 
         data = QRcodeRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = 'application/x-www-form-urlencoded'
         headers['Accept'] = 'application/json'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/qrcode")
-        response = self.http_client.session.post(
-            url, headers=headers, data=data, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/ocr/v1/qrcode")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> QRcodeResponse:
         self.__class__._check_service_error(request_id, data)
         res = QRcodeResponse.from_json(json.dumps(data))
         res.request_id = request_id
@@ -179,6 +236,57 @@ class QRcodeOCR(Component):
         """
         result = {}
         traceid = kwargs.get("traceid")
+        for file_name, req in self._iter_tool_eval_requests(kwargs):
+            resp = self._recognize(req, request_id=traceid)
+            result[file_name] = [
+                item["text"] for item in proto.Message.to_dict(resp).get("codes_result", [])
+            ]
+
+        result = json.dumps(result, ensure_ascii=False)
+        if streaming:
+            yield from self._build_tool_eval_stream(result)
+        else:
+            return result
+
+    async def atool_eval(self, name: str, streaming: bool, **kwargs):
+        """
+        异步评估工具函数
+        
+        Args:
+            name (str): 工具名称
+            streaming (bool): 是否流式输出
+            **kwargs: 其他关键字参数
+        
+        Keyword Args:
+            traceid (str): 请求的traceid
+            file_names (List[str]): 文件名列表
+            locations (str): 是否需要获取位置信息，可选值为'true'或'false'，默认为'false'
+            file_urls (Dict[str, str]): 文件名到文件URL的映射
+        
+        Returns:
+            Union[str, Generator[Dict[str, Any], None, None]]: 如果streaming为True，则返回一个生成器，生成两个字典，分别代表LLM和用户可见的内容；
+                                                              如果streaming为False，则返回一个JSON字符串，包含评估结果
+        
+        Raises:
+            InvalidRequestArgumentError: 如果请求格式错误，或者位置信息不合法，则抛出该异常
+        """
+        result = {}
+        traceid = kwargs.get("traceid")
+        for file_name, req in self._iter_tool_eval_requests(kwargs):
+            resp = await self._arecognize(req, request_id=traceid)
+            result[file_name] = [
+                item["text"] for item in proto.Message.to_dict(resp).get("codes_result", [])
+            ]
+
+        result = json.dumps(result, ensure_ascii=False)
+        if streaming:
+            for output in self._build_tool_eval_stream(result):
+                yield output
+        else:
+            yield result
+
+    @staticmethod
+    def _iter_tool_eval_requests(kwargs: dict):
         file_names = kwargs.get("file_names", None)
         location = kwargs.get("locations", "false")
         if not file_names:
@@ -200,22 +308,19 @@ class QRcodeOCR(Component):
                     f"illegal location, expected location is 'true' or 'false', got {location}"
                 )
             req.location = location
-            resp = self._recognize(req, request_id=traceid)
-            result[file_name] = [
-                item["text"] for item in proto.Message.to_dict(resp).get("codes_result", [])
-            ]
+            yield file_name, req
 
-        result = json.dumps(result, ensure_ascii=False)
-        if streaming:
-            yield {
+    @staticmethod
+    def _build_tool_eval_stream(result: str) -> list:
+        return [
+            {
                 "type": "text",
                 "text": result,
                 "visible_scope": 'llm',
-            }
-            yield {
+            },
+            {
                 "type": "text",
                 "text": "",
                 "visible_scope": "user",
-            }
-        else:
-            return result
+            },
+        ]
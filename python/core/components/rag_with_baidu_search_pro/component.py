@@ -16,7 +16,7 @@ from typing import Optional
 from pydantic import Field
 from appbuilder.core.component import Component, ComponentArguments
 from appbuilder.core.message import Message
-from appbuilder.core.utils import ModelInfo, ttl_lru_cache
+from appbuilder.core.utils import model_catalog
 from appbuilder.core._exception import AppBuilderServerException
 from appbuilder.core.components.rag_with_baidu_search_pro.model import ParseRagProResponse
 from appbuilder.utils.trace.tracer_wrapper import components_run_trace
@@ -81,7 +81,6 @@ class RagWithBaiduSearchPro(Component):
         self.instruction = instruction
         self.server_sub_path = "/v1/ai_engine/copilot_engine/service/v1/baidu_search_rag/general"
 
-    @ttl_lru_cache(seconds_to_live=1 * 60 * 60)  # 1h
     def set_secret_key_and_gateway(self, secret_key: Optional[str] = None, gateway: str = ""):
         """
         设置API密钥和网关地址。
@@ -96,7 +95,8 @@ class RagWithBaiduSearchPro(Component):
         """
         super(RagWithBaiduSearchPro, self).set_secret_key_and_gateway(
             secret_key=secret_key, gateway=gateway)
-        self.__class__.model_info = ModelInfo(client=self.http_client)
+        # 校验鉴权信息并预热共享的模型目录
+        model_catalog.get(self.http_client)
 
     @components_run_trace
     def run(
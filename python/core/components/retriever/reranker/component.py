@@ -85,10 +85,9 @@ class Reranker(Component):
         """
         request to gateway
         """
-        headers = self.http_client.auth_header()
-        headers["Content-Type"] = "application/json"
+        url, headers = self._build_http_request(self.http_client)
         resp = self.http_client.session.post(
-            url=self.http_client.service_url(self.base_url, "/"),
+            url=url,
             headers=headers,
             json=payload,
         )
@@ -97,10 +96,47 @@ class Reranker(Component):
 
         return resp.json()
 
+    async def _arequest(self, payload: dict) -> dict:
+        """
+        async request to gateway
+        """
+        url, headers = self._build_http_request(self.async_http_client)
+        resp = await self.async_http_client.session.post(
+            url=url,
+            headers=headers,
+            json=payload,
+        )
+        await self.async_http_client.check_response_header(resp)
+        data = await resp.json()
+        self._check_response_json(data)
+
+        return data
+
+    def _build_http_request(self, client):
+        headers = client.auth_header()
+        headers["Content-Type"] = "application/json"
+        return client.service_url(self.base_url, "/"), headers
+
     def _batch(self, query, texts: List[str]) -> List[dict]:
         """
         batch run implement
         """
+        params = self._build_batch_request(query, texts)
+        result = self._request(params)
+        result = result["result"]
+        return result
+
+    async def _abatch(self, query, texts: List[str]) -> List[dict]:
+        """
+        async batch run implement
+        """
+        params = self._build_batch_request(query, texts)
+        result = await self._arequest(params)
+        result = result["result"]
+        return result
+
+    @staticmethod
+    def _build_batch_request(query, texts: List[str]) -> dict:
         if len(texts) > 50:
             raise ValueError(f'Rerank texts max nums must be lower than 50, but got {len(texts)}')
         for v in texts:
@@ -113,9 +149,7 @@ class Reranker(Component):
                 "texts": texts
             }
         }
-        result = self._request(params)
-        result = result["result"]
-        return result
+        return params
 
     @components_run_trace
     def run(self, query: Union[Message[str], str],
@@ -134,3 +168,20 @@ class Reranker(Component):
         _texts = texts if isinstance(texts, List) else texts.content
 
         return Message(self._batch(_query, _texts))
+
+    async def arun(self, query: Union[Message[str], str],
+            texts: Union[Message[List[str]], List[str]]) -> Message[List[dict]]:
+        """
+        异步运行查询，对给定的文本集合进行批量处理，并返回处理后的结果列表。
+        
+        Args:
+            query (Union[Message[str], str]): 查询条件，可以是字符串或Message对象。
+            texts (Union[Message[List[str]], List[str]]): 待处理的文本集合，可以是字符串列表或包含字符串列表的Message对象。
+        
+        Returns:
+            Message[List[dict]]: 处理后的结果列表，每个元素是一个字典，包含处理后的文本信息。
+        """
+        _query = query if isinstance(query, str) else query.content
+        _texts = texts if isinstance(texts, List) else texts.content
+
+        return Message(await self._abatch(_query, _texts))
@@ -96,6 +96,43 @@ class TableOCR(Component):
                 1, 'col_end': 2, 'words': 'application/x-www-form-urlencoded'}], 'footer': []}]}, mtype=dict)
         
         """
+        req = self._build_run_request(message)
+        result = self._recognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步表格文字识别
+        
+        Args:
+            message (Message): 输入图片或图片url下载地址用于执行识别操作。
+                举例: Message(content={"raw_image": b"..."})
+                或 Message(content={"url": "https://image/download/url"})。
+            timeout (float, 可选): HTTP超时时间。
+            retry (int, 可选): HTTP重试次数。
+        
+        Returns:
+            message (Message): 识别结果。
+                举例: Message(name=msg, content={'tables_result': [{
+                'table_location': [{'x': 15, 'y': 15}, {'x': 371, 'y': 15}, {'x': 371, 'y': 98}, {'x': 15,
+                'y': 98}], 'header': [], 'body': [{'cell_location': [{'x': 15, 'y': 15}, {'x': 120, 'y': 15},
+                {'x': 120, 'y': 58}, {'x': 15, 'y': 58}], 'row_start': 0, 'row_end': 1, 'col_start': 0,
+                'col_end': 1, 'words': '参数'}, {'cell_location': [{'x': 120, 'y': 15}, {'x': 371, 'y': 15},
+                {'x': 371, 'y': 58}, {'x': 120, 'y': 58}], 'row_start': 0, 'row_end': 1, 'col_start': 1,
+                'col_end': 2, 'words': '值'}, {'cell_location': [{'x': 15, 'y': 58}, {'x': 120, 'y': 58},
+                {'x': 120, 'y': 98}, {'x': 15, 'y': 98}], 'row_start': 1, 'row_end': 2, 'col_start': 0,
+                'col_end': 1, 'words': 'Content-Type'}, {'cell_location': [{'x': 120, 'y': 58}, {'x': 371,
+                'y': 58}, {'x': 371, 'y': 98}, {'x': 120, 'y': 98}], 'row_start': 1, 'row_end': 2, 'col_start':
+                1, 'col_end': 2, 'words': 'application/x-www-form-urlencoded'}], 'footer': []}]}, mtype=dict)
+        
+        """
+        req = self._build_run_request(message)
+        result = await self._arecognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> TableOCRRequest:
         inp = TableOCRInMsg(**message.content)
         req = TableOCRRequest()
         if inp.raw_image:
@@ -103,7 +140,10 @@ class TableOCR(Component):
         if inp.url:
             req.url = inp.url
         req.cell_contents = "false"
-        result = self._recognize(req, timeout, retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: TableOCRResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = TableOCROutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -116,22 +156,45 @@ class TableOCR(Component):
                    返回：
                        response (obj: `TableOCRResponse`): 表格文字识别返回结果
                """
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: TableOCRRequest, timeout: float = None,
+                   retry: int = 0, request_id: str = None) -> TableOCRResponse:
+        r"""异步调用底层接口进行表格文字识别
+                   参数:
+                       request (obj: `TableOCRRequest`) : 表格文字识别输入参数
+                   返回：
+                       response (obj: `TableOCRResponse`): 表格文字识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: TableOCRRequest, request_id: str = None):
         if not request.image and not request.url:
             raise ValueError(
                 "request format error, one of image or url must be set")
 
         data = TableOCRRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/table")
-        response = self.http_client.session.post(
-            url, headers=headers, data=data, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/ocr/v1/table")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> TableOCRResponse:
         self.__class__._check_service_error(request_id, data)
         res = TableOCRResponse.from_json(json.dumps(data))
         res.request_id = request_id
@@ -211,6 +274,52 @@ class TableOCR(Component):
         """
         result = {}
         traceid = kwargs.get("traceid")
+        for file_name, req in self._iter_tool_eval_requests(kwargs):
+            resp = self._recognize(req, request_id=traceid)
+            result[file_name] = self._build_tool_eval_result(resp)
+
+        result = json.dumps(result, ensure_ascii=False)
+        if streaming:
+            yield from self._build_tool_eval_stream(result)
+        else:
+            return result
+
+    async def atool_eval(self, name: str, streaming: bool, **kwargs):
+        """
+        异步对传入文件进行处理，并返回处理结果。
+        
+        Args:
+            name (str): 工具的名称。
+            streaming (bool): 是否为流式处理。若为True，则以生成器形式返回结果；若为False，则直接返回结果。
+            **kwargs: 关键字参数，包含以下参数：
+                traceid (str): 请求的唯一标识符。
+                file_names (List[str]): 文件名列表，表示需要处理的文件名。
+                files (List[str]): 同file_names，用于兼容老版本接口。
+                file_urls (Dict[str, str]): 文件名和对应URL的映射字典。
+        
+        Returns:
+            若streaming为True，则以生成器形式返回处理结果，每个元素为包含type和text的字典，type固定为"text"，text为处理结果的JSON字符串。
+            若streaming为False，则直接返回处理结果的JSON字符串。
+        
+        Raises:
+            InvalidRequestArgumentError: 若传入文件名在file_urls中未找到对应的URL，则抛出此异常。
+        
+        """
+        result = {}
+        traceid = kwargs.get("traceid")
+        for file_name, req in self._iter_tool_eval_requests(kwargs):
+            resp = await self._arecognize(req, request_id=traceid)
+            result[file_name] = self._build_tool_eval_result(resp)
+
+        result = json.dumps(result, ensure_ascii=False)
+        if streaming:
+            for output in self._build_tool_eval_stream(result):
+                yield output
+        else:
+            yield result
+
+    @staticmethod
+    def _iter_tool_eval_requests(kwargs: dict):
         file_names = kwargs.get("file_names", None)
         if not file_names:
             file_names = kwargs.get("files")
@@ -227,22 +336,23 @@ class TableOCR(Component):
             req = TableOCRRequest()
             req.url = file_url
             req.cell_contents = "false"
-            resp = self._recognize(req, request_id=traceid)
-            tables_result = proto.Message.to_dict(resp)["tables_result"]
-            markdowns = self.get_table_markdown(tables_result)
-            result[file_name] = markdowns
+            yield file_name, req
 
-        result = json.dumps(result, ensure_ascii=False)
-        if streaming:
-            yield {
+    def _build_tool_eval_result(self, resp: TableOCRResponse) -> list:
+        tables_result = proto.Message.to_dict(resp)["tables_result"]
+        return self.get_table_markdown(tables_result)
+
+    @staticmethod
+    def _build_tool_eval_stream(result: str) -> list:
+        return [
+            {
                 "type": "text",
                 "text": result,
                 "visible_scope": 'llm',
-            }
-            yield {
+            },
+            {
                 "type": "text",
                 "text": "",
                 "visible_scope": "user",
-            }
-        else:
-            return result
+            },
+        ]
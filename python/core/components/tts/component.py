@@ -174,21 +174,19 @@ class TTS(Component):
             url = self.http_client.service_url("/v1/bce/paddle_speech/text2audio")
         else:
             raise ValueError("model '{}' is not supported".format(self.model))
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
         auth_header = self.http_client.auth_header()
         if self.model == self.Baidu_TTS:
             response = self.http_client.session.post(url, data=TTSRequest.to_dict(request), timeout=timeout,
-                                                     headers=auth_header)
+                                                     headers=auth_header, retry=retry)
         elif self.model == self.PaddleSpeech_TTS:
             auth_header = self.http_client.auth_header()
             auth_header['Content-type'] = "application/json"
             if not stream:
                 response = self.http_client.session.post(url, json=TTSRequest.to_dict(request),
-                                                         timeout=timeout, headers=auth_header)
+                                                         timeout=timeout, headers=auth_header, retry=retry)
             if stream:
                 response = self.http_client.session.post(url, json=TTSRequest.to_dict(request), timeout=(10, 200),
-                                                         headers=auth_header, stream=True)
+                                                         headers=auth_header, stream=True, retry=retry)
 
         self.http_client.check_response_header(response)
         content_type = response.headers.get("Content-Type", "application/json")
@@ -98,6 +98,30 @@ class AnimalRecognition(Component):
             Message: 识别结果的消息对象
         
         """
+        req = self._build_run_request(message)
+        result, _ = self._recognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步根据输入消息运行动物识别功能
+        
+        Args:
+            message (Message): 输入的消息对象，其中应包含需要识别的图像数据或URL
+            timeout (float, optional): 超时时间，单位为秒。默认为None，表示无超时限制。Defaults to None.
+            retry (int, optional): 重试次数。默认为0，表示不重试。Defaults to 0.
+        
+        Returns:
+            Message: 识别结果的消息对象
+        
+        """
+        req = self._build_run_request(message)
+        result, _ = await self._arecognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> AnimalRecognitionRequest:
         inp = AnimalRecognitionInMsg(**message.content)
         req = AnimalRecognitionRequest()
         if inp.raw_image:
@@ -106,7 +130,10 @@ class AnimalRecognition(Component):
             req.url = inp.url
         req.top_num = 6
         req.baike_num = 0
-        result, _ = self._recognize(req, timeout, retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: AnimalRecognitionResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = AnimalRecognitionOutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -125,20 +152,48 @@ class AnimalRecognition(Component):
                    返回：
                        response (obj: `AnimalRecognitionResponse`): 动物识别返回结果
                """
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(
+        self,
+        request: AnimalRecognitionRequest,
+        timeout: float = None,
+        retry: int = 0,
+        request_id: str = None,
+    ) -> AnimalRecognitionResponse:
+        r"""异步调用底层接口进行动物识别
+
+                   参数:
+                       request (obj: `AnimalRecognitionRequest`) : 动物识别输入参数
+                   返回：
+                       response (obj: `AnimalRecognitionResponse`): 动物识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: AnimalRecognitionRequest, request_id: str = None):
         if not request.image and not request.url:
             raise ValueError("request format error, one of image or url must be set")
 
         data = AnimalRecognitionRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/image-classify/v1/animal")
-        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/image-classify/v1/animal")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict):
         self.__class__._check_service_error(request_id, data)
         animalRes = AnimalRecognitionResponse.from_json(json.dumps(data))
         animalRes.request_id = request_id
@@ -169,6 +224,31 @@ class AnimalRecognition(Component):
         file_urls = kwargs.get("_sys_file_urls", {})
         yield from self._recognize_w_post_process(img_name, img_url, file_urls, request_id=traceid)
 
+    async def atool_eval(
+        self,
+        img_name: Optional[str] = "",
+        img_url: Optional[str] = "",
+        **kwargs,
+    ) -> Union[Generator[str, None, None], str]:
+        """
+        异步对图像进行工具评估。
+        
+        Args:
+            img_name (str): 图像名称。
+            img_url (str): 图像URL地址。
+            **kwargs: 其他关键字参数。
+        
+        Returns:
+            Union[Generator[str, None, None], str]: 返回一个生成器，生成图像识别结果，或者返回图像识别结果的字符串。
+        
+        """
+        if not img_name and not img_url:
+            raise ValueError("img_name or img_url is required")
+        traceid = kwargs.get("_sys_traceid", "")
+        file_urls = kwargs.get("_sys_file_urls", {})
+        async for output in self._arecognize_w_post_process(img_name, img_url, file_urls, request_id=traceid):
+            yield output
+
     def _recognize_w_post_process(self, img_name, img_url, file_urls, request_id=None) -> str: # type: ignore
         r"""调底层接口对图片或图片url进行动物识别，并返回类别及其置信度
         Args:
@@ -178,6 +258,29 @@ class AnimalRecognition(Component):
         Returns:
             str: 动物识别结果，包括识别出的动物类别和相应的置信度信息
         """
+        req = self._build_tool_eval_request(img_name, img_url, file_urls)
+        result, raw_data = self._recognize(req, request_id=request_id)
+        rec_res = self._build_tool_eval_text(result)
+        output = self.create_output(type="text", text=rec_res, raw_data=raw_data)
+        yield output
+
+    async def _arecognize_w_post_process(self, img_name, img_url, file_urls, request_id=None) -> str: # type: ignore
+        r"""异步调底层接口对图片或图片url进行动物识别，并返回类别及其置信度
+        Args:
+            img_name (str): 图片文件名
+            img_url (str): 图片url
+            file_urls (dict): 文件名与对应文件url的映射
+        Returns:
+            str: 动物识别结果，包括识别出的动物类别和相应的置信度信息
+        """
+        req = self._build_tool_eval_request(img_name, img_url, file_urls)
+        result, raw_data = await self._arecognize(req, request_id=request_id)
+        rec_res = self._build_tool_eval_text(result)
+        output = self.create_output(type="text", text=rec_res, raw_data=raw_data)
+        yield output
+
+    @staticmethod
+    def _build_tool_eval_request(img_name: str, img_url: str, file_urls: dict) -> AnimalRecognitionRequest:
         req = AnimalRecognitionRequest()
         if img_name in file_urls:
             req.url = file_urls[img_name]
@@ -187,13 +290,15 @@ class AnimalRecognition(Component):
             req.url = img_url
         req.top_num = TOP_NUM
         req.baike_num = BAIKE_NUM
-        result, raw_data = self._recognize(req, request_id=request_id)
+        return req
+
+    @staticmethod
+    def _build_tool_eval_text(result: AnimalRecognitionResponse) -> str:
         result_dict = proto.Message.to_dict(result)
         rec_res = "模型识别结果为：\n"
         for rec_info in result_dict['result']:
             rec_res += "类别: {} 置信度: {}\n".format(rec_info['name'], rec_info['score'])
-        output = self.create_output(type="text", text=rec_res, raw_data=raw_data)
-        yield output
+        return rec_res
 
     @staticmethod
     def _check_service_error(request_id: str, data: dict):
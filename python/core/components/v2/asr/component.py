@@ -17,6 +17,7 @@ r"""ASR component.
 import os
 import uuid
 import json
+import asyncio
 
 import requests
 import tempfile
@@ -113,6 +114,34 @@ class ASR(Component):
         Returns:
             Message: 语音识别结果，格式如：Message(content={"result": ["识别结果"]})。
         """
+        request = self._build_run_request(message, audio_format, rate)
+        traceid = kwargs.get("_sys_traceid", "")
+        response, _ = self._recognize(request, timeout, retry, request_id=traceid)
+        return self._build_run_output(response)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, audio_format: str = "pcm", rate: int = 16000,
+            timeout: float = None, retry: int = 0, **kwargs) -> Message:
+        r"""
+        异步执行语音识别操作，并返回识别结果。
+        
+        Args:
+            message (Message): 输入消息对象，包含待识别的音频数据。该参数为必需项，格式如：Message(content={"raw_audio": b"..."})。
+            audio_format (str, optional): 音频文件格式，支持pcm/wav/amr/m4a，不区分大小写，推荐使用pcm格式。默认为"pcm"。
+            rate (int, optional): 音频采样率，固定为16000。默认为16000。
+            timeout (float, optional): HTTP请求超时时间。默认为None。
+            retry (int, optional): HTTP请求重试次数。默认为0。
+        
+        Returns:
+            Message: 语音识别结果，格式如：Message(content={"result": ["识别结果"]})。
+        """
+        request = self._build_run_request(message, audio_format, rate)
+        traceid = kwargs.get("_sys_traceid", "")
+        response, _ = await self._arecognize(request, timeout, retry, request_id=traceid)
+        return self._build_run_output(response)
+
+    @staticmethod
+    def _build_run_request(message: Message, audio_format: str, rate: int) -> ShortSpeechRecognitionRequest:
         inp = ASRInMsg(**message.content)
         request = ShortSpeechRecognitionRequest()
         request.format = audio_format
@@ -120,8 +149,10 @@ class ASR(Component):
         request.cuid = str(uuid.uuid4())
         request.dev_pid = DEV_PID
         request.speech = inp.raw_audio
-        traceid = kwargs.get("_sys_traceid", "")
-        response, _ = self._recognize(request, timeout, retry, request_id=traceid)
+        return request
+
+    @staticmethod
+    def _build_run_output(response: ShortSpeechRecognitionResponse) -> Message:
         out = ASROutMsg(result=list(response.result))
         return Message(content=out.model_dump())
 
@@ -143,21 +174,55 @@ class ASR(Component):
         返回:
             obj:`ShortSpeechRecognitionResponse`: 接口返回的输出消息。
         """
+        url, params, headers = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, params=params, headers=headers, data=request.speech,
+                                                 timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(
+            self,
+            request: ShortSpeechRecognitionRequest,
+            timeout: float = None,
+            retry: int = 0,
+            request_id: str = None,
+    ) -> ShortSpeechRecognitionResponse:
+        """
+        异步使用给定的输入并返回语音识别的结果。
+
+        参数:
+            request (obj:`ShortSpeechRecognitionRequest`): 输入请求，这是一个必需的参数。
+            timeout (float, 可选): 请求的超时时间。
+            retry (int, 可选): 请求的重试次数。
+
+        返回:
+            obj:`ShortSpeechRecognitionResponse`: 接口返回的输出消息。
+        """
+        url, params, headers = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, params=params, headers=headers, data=request.speech,
+                                                 timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: ShortSpeechRecognitionRequest, request_id: str = None):
         ContentType = "audio/" + request.format + ";rate=" + str(request.rate)
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = ContentType
         params = {
             'dev_pid': request.dev_pid,
             'cuid': request.cuid
         }
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-        response = self.http_client.session.post(self.http_client.service_url("/v1/bce/aip_speech/asrpro"),
-                                                 params=params, headers=headers, data=request.speech, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip_speech/asrpro")
+        return url, params, headers
+
+    def _parse_response(self, request_id: str, data: dict):
         self.__class__._check_service_error(request_id, data)
         response = ShortSpeechRecognitionResponse.from_json(payload=json.dumps(data))
         response.request_id = request_id
@@ -202,6 +267,67 @@ class ASR(Component):
             InvalidRequestArgumentError: 请求格式错误。
         
         """
+        file_url, file_type = self._parse_tool_eval_file(file_url, file_name, file_type, kwargs)
+
+        audio_file = tempfile.NamedTemporaryFile("wb", suffix=file_type)
+        audio_file.write(requests.get(file_url).content)
+
+        raw_audios = _convert(audio_file.name, file_type)
+        text = ""
+        for raw_audio in raw_audios:
+            request = self._build_tool_eval_request(file_type, raw_audio)
+            traceid = kwargs.get("_sys_traceid", "")
+            response, raw_data = self._recognize(request, request_id=traceid)
+            text += "".join(list(response.result))
+        results = {"识别结果": text}
+        audio_file.close()
+        res = json.dumps(results, ensure_ascii=False, indent=4)
+        yield from self._build_tool_eval_outputs(res, raw_data)
+
+    async def atool_eval(self,
+                  file_url: Optional[str] = '',
+                  file_name: Optional[str] = '',
+                  file_type: Optional[str] = '',
+                  **kwargs):    
+        """
+        异步执行语音识别操作，并返回识别结果
+        
+        Args:
+            file_url (str, optional): 文件URL。默认为空字符串。
+            file_name (str, optional): 文件名。默认为空字符串。
+            file_type (str, optional): 文件类型。默认为空字符串。
+            **kwargs: 其他关键字参数。
+        
+        Returns:
+            Generator: 生成器，用于生成输出对象。
+        
+        Raises:
+            InvalidRequestArgumentError: 请求格式错误。
+        
+        """
+        file_url, file_type = self._parse_tool_eval_file(file_url, file_name, file_type, kwargs)
+
+        audio_file = tempfile.NamedTemporaryFile("wb", suffix=file_type)
+        response = await self.async_http_client.session.get(file_url)
+        audio_file.write(await response.read())
+
+        # 音频转码为CPU密集操作，放到线程池中执行，避免阻塞事件循环
+        raw_audios = await asyncio.get_running_loop().run_in_executor(
+            None, _convert, audio_file.name, file_type)
+        text = ""
+        for raw_audio in raw_audios:
+            request = self._build_tool_eval_request(file_type, raw_audio)
+            traceid = kwargs.get("_sys_traceid", "")
+            response, raw_data = await self._arecognize(request, request_id=traceid)
+            text += "".join(list(response.result))
+        results = {"识别结果": text}
+        audio_file.close()
+        res = json.dumps(results, ensure_ascii=False, indent=4)
+        for output in self._build_tool_eval_outputs(res, raw_data):
+            yield output
+
+    @staticmethod
+    def _parse_tool_eval_file(file_url: str, file_name: str, file_type: str, kwargs: dict):
         if not file_url:
             file_urls = kwargs.get("_sys_file_urls", {})
             file_path = file_name
@@ -217,27 +343,23 @@ class ASR(Component):
         if not file_type or file_type not in ["pcm", "wav", "amr", "m4a"]:
             _, file_type = os.path.splitext(os.path.basename(urlparse(file_url).path))
             file_type = file_type.strip('.')
+        return file_url, file_type
 
-        audio_file = tempfile.NamedTemporaryFile("wb", suffix=file_type)
-        audio_file.write(requests.get(file_url).content)
+    @staticmethod
+    def _build_tool_eval_request(file_type: str, raw_audio: bytes) -> ShortSpeechRecognitionRequest:
+        request = ShortSpeechRecognitionRequest()
+        request.format = file_type
+        request.rate = DEFAULT_FRAME_RATE
+        request.cuid = str(uuid.uuid4())
+        request.dev_pid = DEV_PID
+        request.speech = raw_audio
+        return request
 
-        raw_audios = _convert(audio_file.name, file_type)
-        text = ""
-        for raw_audio in raw_audios:
-            request = ShortSpeechRecognitionRequest()
-            request.format = file_type
-            request.rate = DEFAULT_FRAME_RATE
-            request.cuid = str(uuid.uuid4())
-            request.dev_pid = DEV_PID
-            request.speech = raw_audio
-            traceid = kwargs.get("_sys_traceid", "")
-            response, raw_data = self._recognize(request, request_id=traceid)
-            text += "".join(list(response.result))
-        results = {"识别结果": text}
-        audio_file.close()
-        res = json.dumps(results, ensure_ascii=False, indent=4)
-        yield self.create_output(type='text', text=res, raw_data=raw_data, visible_scope="llm")
-        yield self.create_output(type='text', text="", raw_data=raw_data, visible_scope="user")
+    def _build_tool_eval_outputs(self, res: str, raw_data: dict) -> list:
+        return [
+            self.create_output(type='text', text=res, raw_data=raw_data, visible_scope="llm"),
+            self.create_output(type='text', text="", raw_data=raw_data, visible_scope="user"),
+        ]
 
 
 def _convert(path, file_type):
@@ -106,6 +106,31 @@ class GeneralOCR(Component):
             Message: 包含识别结果的消息对象。
         
         """
+        request = self._build_run_request(message, language_type)
+        result, _ = self._recognize(request, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0, language_type: str = 'CHN_ENG') -> Message:
+        """
+        异步在通用文字识别的基础上，提供更高精度的识别服务，支持更多语种识别
+        
+        Args:
+            message (Message): 包含识别任务的输入信息的消息对象。
+            timeout (float, optional): 超时时间，单位秒。默认为None，表示不设置超时。
+            retry (int, optional): 重试次数。默认为0，表示不重试。
+            language_type (str, optional): 识别语言类型，可选值为'CHN_ENG'（中英文）和'CHN'（中文）。默认为'CHN_ENG'。
+        
+        Returns:
+            Message: 包含识别结果的消息对象。
+        
+        """
+        request = self._build_run_request(message, language_type)
+        result, _ = await self._arecognize(request, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message, language_type: str) -> GeneralOCRRequest:
         inp = GeneralOCRInMsg(**message.content)
         request = GeneralOCRRequest()
         if inp.raw_image:
@@ -114,7 +139,10 @@ class GeneralOCR(Component):
             request.url = inp.url
         request.detect_direction = "true"
         request.language_type = language_type
-        result, _ = self._recognize(request, timeout, retry)
+        return request
+
+    @staticmethod
+    def _build_run_output(result: GeneralOCRResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = GeneralOCROutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -133,21 +161,50 @@ class GeneralOCR(Component):
                    返回：
                        response (obj: `GeneralOCRResponse`): 通用文字识别返回结果
                """
-        if not request.image and not request.url and not request.pdf_file and not request.ofd_file:
-            raise ValueError(
-                "request format error, one of image or url or must pdf_file or ofd_file be set")
-        data = GeneralOCRRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
-        headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/accurate_basic")
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
         response = self.http_client.session.post(
-            url, headers=headers, data=data, timeout=timeout)
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
         request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(
+        self,
+        request: GeneralOCRRequest,
+        timeout: float = None,
+        retry: int = 0,
+        request_id: str = None,
+    ) -> GeneralOCRResponse:
+        r"""异步调用底层接口进行通用文字识别
+                   参数:
+                       request (obj: `GeneralOCRRequest`) : 通用文字识别输入参数
+
+                   返回：
+                       response (obj: `GeneralOCRResponse`): 通用文字识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: GeneralOCRRequest, request_id: str = None):
+        if not request.image and not request.url and not request.pdf_file and not request.ofd_file:
+            raise ValueError(
+                "request format error, one of image or url or must pdf_file or ofd_file be set")
+        data = GeneralOCRRequest.to_dict(request)
+        headers = client.auth_header(request_id)
+        headers['content-type'] = 'application/x-www-form-urlencoded'
+        url = client.service_url("/v1/bce/aip/ocr/v1/accurate_basic")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict):
         self.__class__._check_service_error(request_id, data)
         ocr_response = GeneralOCRResponse.from_json(payload=json.dumps(data))
         ocr_response.request_id = request_id
@@ -194,6 +251,42 @@ class GeneralOCR(Component):
             InvalidRequestArgumentError: 如果请求格式错误或文件URL不存在，将抛出此异常。
         
         """
+        request, traceid = self._build_tool_eval_request(img_name, img_url, language_type, kwargs)
+        result_response, raw_data = self._recognize(request, request_id=traceid)
+        yield from self._build_tool_eval_outputs(result_response, raw_data)
+
+    async def atool_eval(
+        self, 
+        img_name: Optional[str] = '',
+        img_url: Optional[str] = '',
+        language_type: Optional[str] = 'CHN_ENG',
+        **kwargs
+        ):
+        """
+        异步对图片中的文字进行识别并返回结果。
+        
+        Args:
+            img_name (str): 图片的文件名。
+            img_url (str): 图片的URL地址。
+            **kwargs: 其他参数，目前支持以下参数：
+                _sys_traceid (str): 系统追踪ID，用于跟踪请求。
+                language_type (str): 语言类型，默认为'CHN_ENG'（中英文混合）。
+                _sys_file_urls (dict): 文件URL字典，key为文件名，value为文件URL。
+                
+        Returns:
+            Generator: 生成器，每次生成一个包含识别结果的Output对象。
+        
+        Raises:
+            InvalidRequestArgumentError: 如果请求格式错误或文件URL不存在，将抛出此异常。
+        
+        """
+        request, traceid = self._build_tool_eval_request(img_name, img_url, language_type, kwargs)
+        result_response, raw_data = await self._arecognize(request, request_id=traceid)
+        for output in self._build_tool_eval_outputs(result_response, raw_data):
+            yield output
+
+    @staticmethod
+    def _build_tool_eval_request(img_name: str, img_url: str, language_type: str, kwargs: dict):
         if not img_name and not img_url:
             raise ValueError(
                 "request format error, one of image or url or must pdf_file or ofd_file be set")
@@ -212,11 +305,15 @@ class GeneralOCR(Component):
         req = GeneralOCRRequest(url=img_url)
         req.detect_direction = "true"
         req.language_type = language_type
-        result_response, raw_data = self._recognize(req, request_id=traceid)
+        return req, traceid
+
+    def _build_tool_eval_outputs(self, result_response: GeneralOCRResponse, raw_data: dict) -> list:
         result = proto.Message.to_dict(result_response)
         results = {
             "识别结果": " \n".join(item["words"] for item in result["words_result"])
         }
         res = json.dumps(results, ensure_ascii=False, indent=4)
-        yield self.create_output(type="text", text=res, raw_data=raw_data, visible_scope="llm")
-        yield self.create_output(type="text", text="", raw_data=raw_data, visible_scope="user")
+        return [
+            self.create_output(type="text", text=res, raw_data=raw_data, visible_scope="llm"),
+            self.create_output(type="text", text="", raw_data=raw_data, visible_scope="user"),
+        ]
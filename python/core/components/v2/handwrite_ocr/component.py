@@ -80,6 +80,29 @@ class HandwriteOCR(Component):
         Returns:
             Message: 手写体模型识别结果.
         """
+        request = self._build_run_request(message)
+        response = self._recognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        r"""
+        异步输入图片并识别其中的文字
+        
+        Args:
+            message (Message): 输入图片或图片url下载地址用于执行识别操作.例如: Message(content={"raw_image": b"..."}) 或 Message(content={"url": "https://image/download/url"}).
+            timeout (float, optional): HTTP超时时间. 默认为None.
+            retry (int, optional): HTTP重试次数. 默认为0.
+        
+        Returns:
+            Message: 手写体模型识别结果.
+        """
+        request = self._build_run_request(message)
+        response = await self._arecognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> HandwriteOCRRequest:
         inp = HandwriteOCRInMsg(**message.content)
         request = HandwriteOCRRequest()
         if inp.url:
@@ -90,7 +113,10 @@ class HandwriteOCR(Component):
         request.probability = "false"
         request.detect_direction = "true"
         request.detect_alteration = "true"
-        response = self._recognize(request, timeout, retry)
+        return request
+
+    @staticmethod
+    def _build_run_output(response: HandwriteOCRResponse) -> Message:
         out = HandwriteOCROutMsg()
         out.direction = response.direction
         [out.contents.append(
@@ -122,7 +148,36 @@ class HandwriteOCR(Component):
         """
         traceid = kwargs.get("_sys_traceid", "")
         result = ""
+        for file_name, req in self._iter_tool_eval_requests(file_names, kwargs):
+            response = self._recognize(req, request_id=traceid)
+            result += self._build_tool_eval_text(file_name, response)
+        yield from self._build_tool_eval_outputs(result)
+
+    async def atool_eval(self,
+                  file_names: Optional[list] = [],
+                  **kwargs):
+        """
+        异步工具评估函数
+        Args:
+            file_names (Optional[list]): 待识别文件的文件名列表
+            **kwargs: 其他参数
+        
+        Raises:
+            InvalidRequestArgumentError: 请求格式错误，文件url不存在
         
+        Yields:
+            Generator[Output]: 生成器，每次迭代产生一个输出对象
+        """
+        traceid = kwargs.get("_sys_traceid", "")
+        result = ""
+        for file_name, req in self._iter_tool_eval_requests(file_names, kwargs):
+            response = await self._arecognize(req, request_id=traceid)
+            result += self._build_tool_eval_text(file_name, response)
+        for output in self._build_tool_eval_outputs(result):
+            yield output
+
+    @staticmethod
+    def _iter_tool_eval_requests(file_names: list, kwargs: dict):
         sys_file_names = file_names
         if not sys_file_names:
             sys_file_names = kwargs.get('_sys_file_names', [])
@@ -142,25 +197,27 @@ class HandwriteOCR(Component):
             req.probability = "false"
             req.detect_direction = "true"
             req.detect_alteration = "true"
-            response = self._recognize(req, request_id=traceid)
-            text = "".join([w.words for w in response.words_result])
-            result += f"{file_name}的手写识别结果是：{text} "
+            yield file_name, req
+
+    @staticmethod
+    def _build_tool_eval_text(file_name: str, response: HandwriteOCRResponse) -> str:
+        text = "".join([w.words for w in response.words_result])
+        return f"{file_name}的手写识别结果是：{text} "
 
+    def _build_tool_eval_outputs(self, result: str) -> list:
         llm_result = self.create_output(
             type = "text",
             visible_scope= "llm",
             text=result,
             name="llm_text"
         )
-        yield llm_result
-
         user_result = self.create_output(
             type = "text",
             visible_scope= "user",
             text="",
             name="user_text"
         )
-        yield user_result
+        return [llm_result, user_result]
 
 
     def _recognize(
@@ -177,19 +234,47 @@ class HandwriteOCR(Component):
                    返回：
                        response (obj: `HandwriteOCRResponse`): 通用文字识别返回结果
                """
-        if not request.image and not request.url:
-            raise ValueError("request format error, one of image or url must be set")
-        data = request.model_dump()
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
-        headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/handwriting")
-        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout)
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
         request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(
+        self, 
+        request: HandwriteOCRRequest, 
+        timeout: float = None, 
+        retry: int = 0,
+        request_id: str = None,
+    ) -> HandwriteOCRResponse:
+        r"""异步调用底层接口进行通用文字识别
+                    参数:
+                       request (obj: `HandwriteOCRRequest`) : 通用文字识别输入参数
+
+                   返回：
+                       response (obj: `HandwriteOCRResponse`): 通用文字识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: HandwriteOCRRequest, request_id: str = None):
+        if not request.image and not request.url:
+            raise ValueError("request format error, one of image or url must be set")
+        data = request.model_dump()
+        headers = client.auth_header(request_id)
+        headers['content-type'] = 'application/x-www-form-urlencoded'
+        url = client.service_url("/v1/bce/aip/ocr/v1/handwriting")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> HandwriteOCRResponse:
         self.__class__._check_service_error(request_id, data)
         ocr_response = HandwriteOCRResponse(**data)
         ocr_response.request_id = request_id
@@ -86,6 +86,30 @@ class MixCardOCR(Component):
         Returns:
             Message: 包含身份证识别结果的Message对象.
         """
+        request = self._build_run_request(message)
+        response = self._recognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步执行身份证识别操作
+
+        Args:
+            message (Message): 包含待识别图片或图片下载URL的Message对象.
+                示例: Message(content={"raw_image": b"..."}) 或 Message(content={"url": "https://image/download/url"}).
+            timeout (float, 可选): HTTP请求的超时时间，默认为None.
+            retry (int, 可选): HTTP请求的重试次数，默认为0.
+
+        Returns:
+            Message: 包含身份证识别结果的Message对象.
+        """
+        request = self._build_run_request(message)
+        response = await self._arecognize(request, timeout, retry)
+        return self._build_run_output(response)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> MixCardOCRRequest:
         inp = MixCardOCRInMsg(**message.content)
         request = MixCardOCRRequest()
         if inp.url:
@@ -96,7 +120,10 @@ class MixCardOCR(Component):
         request.detect_quality = "false"
         request.detect_photo = "false"
         request.detect_card = "false"
-        response = self._recognize(request, timeout, retry)
+        return request
+
+    @staticmethod
+    def _build_run_output(response: MixCardOCRResponse) -> Message:
         out = MixCardOCROutMsg()
         for res in response.words_result:
             card_type = res.card_info.card_type
@@ -124,21 +151,44 @@ class MixCardOCR(Component):
                 返回：
                     response (obj: `GeneralOCRResponse`): 通用文字识别返回结果
                """
-        if not request.image and not request.url:
-            raise ValueError(
-                "request format error, one of image or url must be set")
-        data = request.model_dump()
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
-        headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/multi_idcard")
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
         response = self.http_client.session.post(
-            url, headers=headers, data=data, timeout=timeout)
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
         request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: MixCardOCRRequest, timeout: float = None, retry: int = 0, request_id: str = None) -> MixCardOCRResponse:
+        r"""异步调用底层身份证混贴识别
+                参数:
+                    request (obj: `GeneralOCRRequest`) : 通用文字识别输入参数
+
+                返回：
+                    response (obj: `GeneralOCRResponse`): 通用文字识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: MixCardOCRRequest, request_id: str = None):
+        if not request.image and not request.url:
+            raise ValueError(
+                "request format error, one of image or url must be set")
+        data = request.model_dump()
+        headers = client.auth_header(request_id)
+        headers['content-type'] = 'application/x-www-form-urlencoded'
+        url = client.service_url("/v1/bce/aip/ocr/v1/multi_idcard")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> MixCardOCRResponse:
         self.__class__._check_service_error(request_id, data)
         response = MixCardOCRResponse(**data)
         response.request_id = request_id
@@ -181,6 +231,44 @@ class MixCardOCR(Component):
 
         traceid = kwargs.get("_sys_traceid", "")
 
+        for file_name, request in self._iter_tool_eval_requests(file_names, kwargs):
+            response = self._recognize(request, request_id=traceid)
+            result[file_name] = self._build_tool_eval_result(response)
+
+        result = json.dumps(result, ensure_ascii=False)
+        yield from self._build_tool_eval_outputs(result)
+
+    async def atool_eval(self,
+                  file_names: Optional[list] = [],
+                  **kwargs):
+        """
+        异步对指定文件进行OCR识别。
+
+        Args:
+            file_names (Optional[List], optional): 要识别的文件名列表。 
+            **kwargs: 其他参数。
+
+        Returns:
+            ComponentOutput: 识别结果。
+
+        Raises:
+            InvalidRequestArgumentError: 如果请求格式错误，即文件URL不存在时抛出。
+
+        """
+        result = {}
+
+        traceid = kwargs.get("_sys_traceid", "")
+
+        for file_name, request in self._iter_tool_eval_requests(file_names, kwargs):
+            response = await self._arecognize(request, request_id=traceid)
+            result[file_name] = self._build_tool_eval_result(response)
+
+        result = json.dumps(result, ensure_ascii=False)
+        for output in self._build_tool_eval_outputs(result):
+            yield output
+
+    @staticmethod
+    def _iter_tool_eval_requests(file_names: list, kwargs: dict):
         sys_file_names = file_names
         if not sys_file_names:
             sys_file_names = kwargs.get("_sys_file_names", [])
@@ -202,34 +290,35 @@ class MixCardOCR(Component):
             request.detect_quality = "false"
             request.detect_photo = "false"
             request.detect_card = "false"
-            response = self._recognize(request, request_id=traceid)
-            out = MixCardOCROutMsg()
-            for res in response.words_result:
-                card_type = res.card_info.card_type
-                if card_type != "idcard_back" and card_type != "idcard_front":
-                    continue
-                ref = out.front
-                if card_type == "idcard_back":
-                    ref = out.back
-                for key, val in res.card_result.items():
-                    ref.fields.append(MixCardField(
-                        key=key, value=val.words, position=None))
-            out.direction = response.direction
-            result[file_name] = out.model_dump()
+            yield file_name, request
 
-        result = json.dumps(result, ensure_ascii=False)
+    @staticmethod
+    def _build_tool_eval_result(response: MixCardOCRResponse) -> dict:
+        out = MixCardOCROutMsg()
+        for res in response.words_result:
+            card_type = res.card_info.card_type
+            if card_type != "idcard_back" and card_type != "idcard_front":
+                continue
+            ref = out.front
+            if card_type == "idcard_back":
+                ref = out.back
+            for key, val in res.card_result.items():
+                ref.fields.append(MixCardField(
+                    key=key, value=val.words, position=None))
+        out.direction = response.direction
+        return out.model_dump()
+
+    def _build_tool_eval_outputs(self, result: str) -> list:
         llm_result = self.create_output(
             type="text",
             visible_scope="llm",
             text={"info": result},
             name="llm_text"
         )
-        yield llm_result
-
         user_result = self.create_output(
             type="text",
             visible_scope="user",
             text="",
             name="user_text"
         )
-        yield user_result
+        return [llm_result, user_result]
@@ -97,13 +97,43 @@ class ObjectRecognition(Component):
                     "score":0.94553,"root":"植物-蔷薇科"},{"keyword":"姬娜果","score":0.730442,"root":"植物-其它"},
                     {"keyword":"红富士","score":0.505194,"root":"植物-其它"}]})
         """
+        req = self._build_run_request(message)
+        result, _ = self._recognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步通用物体识别
+        
+        Args:
+            message (Message): 输入图片或图片url下载地址用于执行识别操作。
+                例如: Message(content={"raw_image": b"..."}) 或 Message(content={"url": "https://image/download/url"})。
+            timeout (float, optional): HTTP超时时间，默认为None。
+            retry (int, optional): HTTP重试次数，默认为0。
+        
+        Returns:
+            Message: 模型识别结果。
+                例如: Message(content={"result":[{"keyword":"苹果",
+                    "score":0.94553,"root":"植物-蔷薇科"},{"keyword":"姬娜果","score":0.730442,"root":"植物-其它"},
+                    {"keyword":"红富士","score":0.505194,"root":"植物-其它"}]})
+        """
+        req = self._build_run_request(message)
+        result, _ = await self._arecognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> ObjectRecognitionRequest:
         inp = ObjectRecognitionInMsg(**message.content)
         req = ObjectRecognitionRequest()
         if inp.raw_image:
             req.image = base64.b64encode(inp.raw_image)
         if inp.url:
             req.url = inp.url
-        result, _ = self._recognize(req, timeout, retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: ObjectRecognitionResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = ObjectRecognitionOutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -116,20 +146,42 @@ class ObjectRecognition(Component):
                    返回：
                        response (obj: `ObjectRecognitionResponse`): 通用物体与场景识别返回结果
                """
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: ObjectRecognitionRequest, timeout: float = None,
+                  retry: int = 0, request_id: str = None) -> ObjectRecognitionResponse:
+        r"""异步调用底层接口进行通用物体与场景识别
+                   参数:
+                       request (obj: `ObjectRecognitionRequest`) : 通用物体与场景识别输入参数
+                   返回：
+                       response (obj: `ObjectRecognitionResponse`): 通用物体与场景识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: ObjectRecognitionRequest, request_id: str = None):
         if not request.image and not request.url:
             raise ValueError("request format error, one of image or url must be set")
 
         data = ObjectRecognitionRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/image-classify/v2/advanced_general")
-        response = self.http_client.session.post(url, headers=headers, data=data, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/image-classify/v2/advanced_general")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict):
         self.__class__._check_service_error(request_id,data)
         object_response = ObjectRecognitionResponse.from_json(payload=json.dumps(data))
         object_response.request_id = request_id
@@ -171,6 +223,39 @@ class ObjectRecognition(Component):
         
         """
         traceid = kwargs.get("_sys_traceid", "")
+        req = self._build_tool_eval_request(img_url, img_name, kwargs)
+        result, raw_data = self._recognize(req, request_id=traceid)
+        res = self._build_tool_eval_text(result, kwargs.get("score_threshold", 0.5))
+        yield from self._build_tool_eval_outputs(res, raw_data)
+
+    async def atool_eval(self,
+                  img_url: Optional[str] = '',
+                  img_name: Optional[str] = '',
+                  **kwargs):
+        """
+        异步对给定的图片进行物体识别，并返回识别结果。
+        
+        Args:
+            img_url (str, optional): 图片的URL地址。默认为空字符串。
+            img_name (str, optional): 图片的名称。默认为空字符串。
+            **kwargs: 其他关键字参数。
+        
+        Returns:
+            Generator[Output, NoneType, NoneType]: 生成器，包含识别结果的输出对象。
+        
+        Raises:
+            InvalidRequestArgumentError: 如果请求格式错误，例如文件名未设置或文件URL不存在，则引发此异常。
+        
+        """
+        traceid = kwargs.get("_sys_traceid", "")
+        req = self._build_tool_eval_request(img_url, img_name, kwargs)
+        result, raw_data = await self._arecognize(req, request_id=traceid)
+        res = self._build_tool_eval_text(result, kwargs.get("score_threshold", 0.5))
+        for output in self._build_tool_eval_outputs(res, raw_data):
+            yield output
+
+    @staticmethod
+    def _build_tool_eval_request(img_url: str, img_name: str, kwargs: dict) -> ObjectRecognitionRequest:
         if not img_url:
             file_urls = kwargs.get("_sys_file_urls", {})
             img_path = img_name
@@ -180,9 +265,10 @@ class ObjectRecognition(Component):
             img_url = file_urls.get(img_name, None)
             if not img_url:
                 raise InvalidRequestArgumentError(f"request format error, file {img_name} url does not exist")
-        score_threshold = kwargs.get("score_threshold", 0.5)
-        req = ObjectRecognitionRequest(url=img_url)
-        result, raw_data = self._recognize(req, request_id=traceid)
+        return ObjectRecognitionRequest(url=img_url)
+
+    @staticmethod
+    def _build_tool_eval_text(result: ObjectRecognitionResponse, score_threshold: float) -> str:
         result = proto.Message.to_dict(result)
         results = []
         for item in result["result"]:
@@ -194,6 +280,10 @@ class ObjectRecognition(Component):
                 "所属类别": item["root"],
             }
             results.append(res)
-        res = json.dumps(results, ensure_ascii=False, indent=4)
-        yield self.create_output(type="text", text=res, raw_data=raw_data, visible_scope='llm')
-        yield self.create_output(type="text", text="", raw_data=raw_data, visible_scope='user')
\ No newline at end of file
+        return json.dumps(results, ensure_ascii=False, indent=4)
+
+    def _build_tool_eval_outputs(self, res: str, raw_data: dict) -> list:
+        return [
+            self.create_output(type="text", text=res, raw_data=raw_data, visible_scope='llm'),
+            self.create_output(type="text", text="", raw_data=raw_data, visible_scope='user'),
+        ]
\ No newline at end of file
@@ -95,6 +95,37 @@ class QRcodeOCR(Component):
         Raises:
             InvalidRequestArgumentError: 如果 location 参数非法，将抛出该异常。
         """
+        req = self._build_run_request(message, location)
+        result = self._recognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, location: str = "true", timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步执行二维码识别操作。
+        
+        Args:
+            message (Message): 输入的图片或图片URL下载地址，用于执行识别操作。例如：
+                Message(content={"raw_image": b"...", "location": ""}) 或
+                Message(content={"url": "https://image/download/url"})。
+            location (str, 可选): 是否需要返回二维码位置信息，默认为 "true"。
+            timeout (float, 可选): HTTP请求的超时时间。
+            retry (int, 可选): HTTP请求的重试次数。
+        
+        Returns:
+            Message: 识别结果，包含识别到的二维码信息。例如：
+                Message(name=msg, content={'codes_result': [{'type': 'QR_CODE', 'text': ['http://weixin.qq.com/r/cS7M1PHE5qyZrbW393tj'],
+                    'location': {'top': 63, 'left': 950, 'width': 220, 'height': 211}}, ...]}, mtype=dict)
+        
+        Raises:
+            InvalidRequestArgumentError: 如果 location 参数非法，将抛出该异常。
+        """
+        req = self._build_run_request(message, location)
+        result = await self._arecognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message, location: str) -> QRcodeRequest:
         inp = QRcodeInMsg(**message.content)
         req = QRcodeRequest()
         if inp.raw_image:
@@ -105,7 +136,10 @@ class QRcodeOCR(Component):
             raise InvalidRequestArgumentError(
                 f"illegal location, expected location is 'true' or 'false', got {location}")
         req.location = location
-        result = self._recognize(req, timeout, retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: QRcodeResponse) -> Message:
         out = QRcodeOutMsg(**result.model_dump())
         return Message(content=out.model_dump())
 
@@ -117,24 +151,48 @@ class QRcodeOCR(Component):
                    返回：
                        response (obj: `QRcodeResponse`): 二维码识别返回结果
                """
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: QRcodeRequest, timeout: float = None,
+                   retry: int = 0, request_id: str = None) -> QRcodeResponse:
+        r"""异步调用二维码识别底层能力
+                   参数:
+                       request (obj: `QRcodeRequest`) : 二维码识别输入参数
+                   返回：
+                       response (obj: `QRcodeResponse`): 二维码识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: QRcodeRequest, request_id: str = None):
         if not request.image and not request.url:
             raise ValueError(
                 "request format error, one of image or url must be set")
 
         data = QRcodeRequest.model_dump(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = 'application/x-www-form-urlencoded'
         headers['Accept'] = 'application/json'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/qrcode")
-        response = self.http_client.session.post(
-            url, headers=headers, data=data, timeout=timeout)
-        
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/ocr/v1/qrcode")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict) -> QRcodeResponse:
         self.__class__._check_service_error(request_id, data)
         res = QRcodeResponse(**data)
 
@@ -170,6 +228,40 @@ class QRcodeOCR(Component):
         """
         result = {}
         traceid = kwargs.get("_sys_traceid", "")
+        for file_name, req in self._iter_tool_eval_requests(file_names, location, kwargs):
+            resp = self._recognize(req, request_id=traceid)
+            result[file_name] = [
+                item["text"] for item in resp.model_dump().get("codes_result", [])
+            ]
+
+        result = json.dumps(result, ensure_ascii=False)
+        yield from self._build_tool_eval_outputs(result)
+
+    async def atool_eval(self, file_names:Optional[list]=[], location: Optional[str]="false",  **kwargs):
+        """
+        ToolEval方法的异步版本，用于执行二维码识别操作。
+        
+        Args:
+            file_names (list, 可选): 待识别文件的文件名列表。
+            location (str, 可选): 是否需要返回二维码位置信息，默认为 "false"。
+            
+        Yields:
+            ComponentOutput: 识别结果，包含识别到的二维码信息。
+        """
+        result = {}
+        traceid = kwargs.get("_sys_traceid", "")
+        for file_name, req in self._iter_tool_eval_requests(file_names, location, kwargs):
+            resp = await self._arecognize(req, request_id=traceid)
+            result[file_name] = [
+                item["text"] for item in resp.model_dump().get("codes_result", [])
+            ]
+
+        result = json.dumps(result, ensure_ascii=False)
+        for output in self._build_tool_eval_outputs(result):
+            yield output
+
+    @staticmethod
+    def _iter_tool_eval_requests(file_names: list, location: str, kwargs: dict):
         # file_name
         sys_file_names = file_names
         if not sys_file_names:
@@ -192,25 +284,19 @@ class QRcodeOCR(Component):
                     f"illegal location, expected location is 'true' or 'false', got {location}"
                 )
             req.location = location
-            resp = self._recognize(req, request_id=traceid)
-            result[file_name] = [
-                item["text"] for item in resp.model_dump().get("codes_result", [])
-            ]
+            yield file_name, req
 
-        result = json.dumps(result, ensure_ascii=False)
-        
+    def _build_tool_eval_outputs(self, result: str) -> list:
         llm_result = self.create_output(
             type="text",
             visible_scope="llm",
             text={"info": result},
             name="llm_text"
         )
-        yield llm_result
-
         user_result = self.create_output(
             type="text",
             visible_scope="user",
             text={"info": ""},
             name="user_text"
         )
-        yield user_result
+        return [llm_result, user_result]
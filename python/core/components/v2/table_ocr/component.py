@@ -98,6 +98,43 @@ class TableOCR(Component):
                 1, 'col_end': 2, 'words': 'application/x-www-form-urlencoded'}], 'footer': []}]}, mtype=dict)
         
         """
+        req = self._build_run_request(message)
+        result, _ = self._recognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步表格文字识别
+        
+        Args:
+            message (Message): 输入图片或图片url下载地址用于执行识别操作。
+                举例: Message(content={"raw_image": b"..."})
+                或 Message(content={"url": "https://image/download/url"})。
+            timeout (float, 可选): HTTP超时时间。
+            retry (int, 可选): HTTP重试次数。
+        
+        Returns:
+            message (Message): 识别结果。
+                举例: Message(name=msg, content={'tables_result': [{
+                'table_location': [{'x': 15, 'y': 15}, {'x': 371, 'y': 15}, {'x': 371, 'y': 98}, {'x': 15,
+                'y': 98}], 'header': [], 'body': [{'cell_location': [{'x': 15, 'y': 15}, {'x': 120, 'y': 15},
+                {'x': 120, 'y': 58}, {'x': 15, 'y': 58}], 'row_start': 0, 'row_end': 1, 'col_start': 0,
+                'col_end': 1, 'words': '参数'}, {'cell_location': [{'x': 120, 'y': 15}, {'x': 371, 'y': 15},
+                {'x': 371, 'y': 58}, {'x': 120, 'y': 58}], 'row_start': 0, 'row_end': 1, 'col_start': 1,
+                'col_end': 2, 'words': '值'}, {'cell_location': [{'x': 15, 'y': 58}, {'x': 120, 'y': 58},
+                {'x': 120, 'y': 98}, {'x': 15, 'y': 98}], 'row_start': 1, 'row_end': 2, 'col_start': 0,
+                'col_end': 1, 'words': 'Content-Type'}, {'cell_location': [{'x': 120, 'y': 58}, {'x': 371,
+                'y': 58}, {'x': 371, 'y': 98}, {'x': 120, 'y': 98}], 'row_start': 1, 'row_end': 2, 'col_start':
+                1, 'col_end': 2, 'words': 'application/x-www-form-urlencoded'}], 'footer': []}]}, mtype=dict)
+        
+        """
+        req = self._build_run_request(message)
+        result, _ = await self._arecognize(req, timeout, retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message) -> TableOCRRequest:
         inp = TableOCRInMsg(**message.content)
         req = TableOCRRequest()
         if inp.raw_image:
@@ -105,7 +142,10 @@ class TableOCR(Component):
         if inp.url:
             req.url = inp.url
         req.cell_contents = "false"
-        result, _ = self._recognize(req, timeout, retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: TableOCRResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
         out = TableOCROutMsg(**result_dict)
         return Message(content=out.model_dump())
@@ -118,22 +158,45 @@ class TableOCR(Component):
                    返回：
                        response (obj: `TableOCRResponse`): 表格文字识别返回结果
                """
+        url, headers, data = self._build_http_request(self.http_client, request, request_id)
+        response = self.http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        self.http_client.check_response_header(response)
+        data = response.json()
+        self.http_client.check_response_json(data)
+        request_id = self.http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    async def _arecognize(self, request: TableOCRRequest, timeout: float = None,
+                   retry: int = 0, request_id: str = None) -> TableOCRResponse:
+        r"""异步调用底层接口进行表格文字识别
+                   参数:
+                       request (obj: `TableOCRRequest`) : 表格文字识别输入参数
+                   返回：
+                       response (obj: `TableOCRResponse`): 表格文字识别返回结果
+               """
+        url, headers, data = self._build_http_request(self.async_http_client, request, request_id)
+        response = await self.async_http_client.session.post(
+            url, headers=headers, data=data, timeout=timeout, retry=retry)
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        self.async_http_client.check_response_json(data)
+        request_id = await self.async_http_client.response_request_id(response)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: TableOCRRequest, request_id: str = None):
         if not request.image and not request.url:
             raise ValueError(
                 "request format error, one of image or url must be set")
 
         data = TableOCRRequest.to_dict(request)
-        if self.http_client.retry.total != retry:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = 'application/x-www-form-urlencoded'
-        url = self.http_client.service_url("/v1/bce/aip/ocr/v1/table")
-        response = self.http_client.session.post(
-            url, headers=headers, data=data, timeout=timeout)
-        self.http_client.check_response_header(response)
-        data = response.json()
-        self.http_client.check_response_json(data)
-        request_id = self.http_client.response_request_id(response)
+        url = client.service_url("/v1/bce/aip/ocr/v1/table")
+        return url, headers, data
+
+    def _parse_response(self, request_id: str, data: dict):
         self.__class__._check_service_error(request_id, data)
         res = TableOCRResponse.from_json(json.dumps(data))
         res.request_id = request_id
@@ -209,6 +272,42 @@ class TableOCR(Component):
         """
         result = {}
         traceid = kwargs.get("_sys_traceid", "")
+        for file_name, req in self._iter_tool_eval_requests(file_names, kwargs):
+            resp, raw_data = self._recognize(req, request_id=traceid)
+            result[file_name] = self._build_tool_eval_result(resp)
+
+        result = json.dumps(result, ensure_ascii=False)
+        yield from self._build_tool_eval_outputs(result, raw_data)
+
+    async def atool_eval(self, 
+                  file_names: Optional[List[str]] = [],
+                  **kwargs):
+        """
+        异步处理并评估传入的文件列表，并返回表格数据的Markdown格式表示。
+        
+        Args:
+            file_names (List[str]): 待处理的文件列表。
+            **kwargs: 其他可选参数。
+        
+        Returns:
+            Generator: 生成包含处理结果的生成器。
+        
+        Raises:
+            InvalidRequestArgumentError: 如果请求格式错误，文件URL不存在。
+        
+        """
+        result = {}
+        traceid = kwargs.get("_sys_traceid", "")
+        for file_name, req in self._iter_tool_eval_requests(file_names, kwargs):
+            resp, raw_data = await self._arecognize(req, request_id=traceid)
+            result[file_name] = self._build_tool_eval_result(resp)
+
+        result = json.dumps(result, ensure_ascii=False)
+        for output in self._build_tool_eval_outputs(result, raw_data):
+            yield output
+
+    @staticmethod
+    def _iter_tool_eval_requests(file_names: list, kwargs: dict):
         file_urls = kwargs.get("_sys_file_urls", {})
         if not file_names:
             file_names = kwargs.get("_sys_file_names", [])
@@ -224,11 +323,14 @@ class TableOCR(Component):
             req = TableOCRRequest()
             req.url = file_url
             req.cell_contents = "false"
-            resp, raw_data = self._recognize(req, request_id=traceid)
-            tables_result = proto.Message.to_dict(resp)["tables_result"]
-            markdowns = self.get_table_markdown(tables_result)
-            result[file_name] = markdowns
+            yield file_name, req
 
-        result = json.dumps(result, ensure_ascii=False)
-        yield self.create_output(type="text", text=result, raw_data=raw_data, visible_scope="llm")
-        yield self.create_output(type="text", text="", raw_data=raw_data, visible_scope="user")
+    def _build_tool_eval_result(self, resp: TableOCRResponse) -> list:
+        tables_result = proto.Message.to_dict(resp)["tables_result"]
+        return self.get_table_markdown(tables_result)
+
+    def _build_tool_eval_outputs(self, result: str, raw_data: dict) -> list:
+        return [
+            self.create_output(type="text", text=result, raw_data=raw_data, visible_scope="llm"),
+            self.create_output(type="text", text="", raw_data=raw_data, visible_scope="user"),
+        ]
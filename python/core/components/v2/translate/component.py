@@ -100,11 +100,41 @@ class Translation(Component):
             Message: 返回的文本翻译结果。
             例如，Message(content={'from_lang': 'zh', 'to_lang': 'en', 'trans_result': [{'src': '你好', 'dst': 'hello'}]})
         """
+        req = self._build_run_request(message, from_lang, to_lang)
+        result, data = self._translate(req, timeout=timeout, retry=retry)
+        return self._build_run_output(result)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, from_lang: str = "auto", to_lang: str = "en",
+            timeout: float = None, retry: int = 0) -> Message:
+        """
+        异步根据提供的文本以及语种参数执行文本翻译
+
+        Args:
+            message (Message): 翻译文本。
+            from_lang (str): 翻译的源语言。默认为 "auto"。
+            to_lang (str): 翻译的目标语言。默认为 "en"。
+            timeout (float, optional): 翻译请求的超时时间。
+            retry (int, optional): 重试次数。
+
+        Returns:
+            Message: 返回的文本翻译结果。
+            例如，Message(content={'from_lang': 'zh', 'to_lang': 'en', 'trans_result': [{'src': '你好', 'dst': 'hello'}]})
+        """
+        req = self._build_run_request(message, from_lang, to_lang)
+        result, data = await self._atranslate(req, timeout=timeout, retry=retry)
+        return self._build_run_output(result)
+
+    @staticmethod
+    def _build_run_request(message: Message, from_lang: str, to_lang: str) -> TranslateRequest:
         req = TranslateRequest()
         req.q = message.content
         req.from_lang = from_lang
         req.to_lang = to_lang
-        result, data = self._translate(req, timeout=timeout, retry=retry)
+        return req
+
+    @staticmethod
+    def _build_run_output(result: TranslateResponse) -> Message:
         result_dict = proto.Message.to_dict(result)
 
         out = TranslateOutMsg(**result_dict["result"])
@@ -123,24 +153,53 @@ class Translation(Component):
         Returns:
             TranslateResponse: 文本翻译结果的响应体。
         """
+        url, headers, request_data = self._build_http_request(self.http_client, request, request_id)
+
+        response = self.http_client.session.post(url, headers=headers, data=request_data, timeout=timeout, retry=retry)
+
+        self.http_client.check_response_header(response)
+        data = response.json()
+        request_id = self.http_client.response_request_id(response)
+        self.http_client.check_response_json(data)
+        return self._parse_response(request_id, data)
+
+    async def _atranslate(self, request: TranslateRequest, timeout: float = None,
+                   retry: int = 0, request_id: str = None) -> TranslateResponse:
+        """
+        异步根据提供的 TranslateRequest 执行文本翻译。
+
+        Args:
+            request (TranslateRequest): 翻译请求参数。
+            timeout (float, optional): 请求超时时间。
+            retry (int, optional): 重试次数。
+
+        Returns:
+            TranslateResponse: 文本翻译结果的响应体。
+        """
+        url, headers, request_data = self._build_http_request(self.async_http_client, request, request_id)
+
+        response = await self.async_http_client.session.post(url, headers=headers, data=request_data, timeout=timeout, retry=retry)
+
+        await self.async_http_client.check_response_header(response)
+        data = await response.json()
+        request_id = await self.async_http_client.response_request_id(response)
+        self.async_http_client.check_response_json(data)
+        return self._parse_response(request_id, data)
+
+    @staticmethod
+    def _build_http_request(client, request: TranslateRequest, request_id: str = None):
         if not request.to_lang or not request.q:
             raise ValueError("params `to_lang` and `q` must be set")
         if not request.from_lang:
             request.from_lang = "auto"
         request_data = TranslateRequest.to_json(request)
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-        headers = self.http_client.auth_header(request_id)
+        headers = client.auth_header(request_id)
         headers['content-type'] = 'application/json;charset=utf-8'
 
-        url = self.http_client.service_url("/v1/bce/aip/mt/texttrans/v1")
-
-        response = self.http_client.session.post(url, headers=headers, data=request_data, timeout=timeout)
+        url = client.service_url("/v1/bce/aip/mt/texttrans/v1")
+        return url, headers, request_data
 
-        self.http_client.check_response_header(response)
-        data = response.json()
-        request_id = self.http_client.response_request_id(response)
-        self.http_client.check_response_json(data)
+    def _parse_response(self, request_id: str, data: dict):
         if "error_code" in data and "error_msg" in data:
             raise AppBuilderServerException(request_id=request_id, service_err_code=data["error_code"],
                                             service_err_message=data["error_msg"])
@@ -169,19 +228,58 @@ class Translation(Component):
         
         """
         traceid = kwargs.get("_sys_traceid", "")
-        text = q
+        req = self._build_tool_eval_request(q, to_lang)
+        result_response, raw_data = self._translate(req, request_id=traceid)
+        res = self._build_tool_eval_text(result_response)
+        yield from self._build_tool_eval_outputs(res, raw_data)
+
+    async def atool_eval(self, 
+                  q: str,
+                  to_lang: str = "en",
+                  **kwargs):
+        """
+        异步评估翻译工具的功能。
+        
+        Args:
+            q (str): 需要翻译的文本。
+            to_lang (str, optional): 目标语言，默认为 "en"。
+            **kwargs: 其他参数。
+        
+        Returns:
+            生成器，生成翻译结果。
+        
+        Raises:
+            InvalidRequestArgumentError: 如果参数 `q` 未设置，则引发此异常。
+        
+        """
+        traceid = kwargs.get("_sys_traceid", "")
+        req = self._build_tool_eval_request(q, to_lang)
+        result_response, raw_data = await self._atranslate(req, request_id=traceid)
+        res = self._build_tool_eval_text(result_response)
+        for output in self._build_tool_eval_outputs(res, raw_data):
+            yield output
+
+    @staticmethod
+    def _build_tool_eval_request(text: str, to_lang: str) -> TranslateRequest:
         req = TranslateRequest()
         if not text:
             raise InvalidRequestArgumentError("param `q` must be set")
         req.q = text
         req.to_lang = to_lang
-        result_response, raw_data = self._translate(req, request_id=traceid)
-        results = proto.Message.to_dict(result_response)["result"]
+        return req
+
+    @staticmethod
+    def _build_tool_eval_text(result: TranslateResponse) -> str:
+        results = proto.Message.to_dict(result)["result"]
         trans_result = results["trans_result"]
         res = {
             "原文本": "\n ".join(item["src"] for item in trans_result),
             "翻译结果": "\n ".join(item["dst"] for item in trans_result)
         }
-        res = json.dumps(res, ensure_ascii=False, indent=4)
-        yield self.create_output(type="text", text=res, raw_data=raw_data, visible_scope='llm')
-        yield self.create_output(type="text", text="", raw_data=raw_data, visible_scope='user')
+        return json.dumps(res, ensure_ascii=False, indent=4)
+
+    def _build_tool_eval_outputs(self, res: str, raw_data: dict) -> list:
+        return [
+            self.create_output(type="text", text=res, raw_data=raw_data, visible_scope='llm'),
+            self.create_output(type="text", text="", raw_data=raw_data, visible_scope='user'),
+        ]
@@ -66,19 +66,36 @@ class TreeMind(Component):
         ]
 
     def _post(self, query, **kwargs):
+        tree_mind_url, headers, payload = self._build_http_request(self.http_client, query, kwargs.get("_sys_traceid"))
+
+        response = self.http_client.session.post(tree_mind_url, headers=headers, json=payload)
+        self.http_client.check_response_header(response)
+        data = response.text
+        return self._parse_response(data)
+
+    async def _apost(self, query, **kwargs):
+        tree_mind_url, headers, payload = self._build_http_request(self.async_http_client, query, kwargs.get("_sys_traceid"))
+
+        response = await self.async_http_client.session.post(tree_mind_url, headers=headers, json=payload)
+        await self.async_http_client.check_response_header(response)
+        data = await response.text()
+        return self._parse_response(data)
+
+    @staticmethod
+    def _build_http_request(client, query: str, request_id: str = None):
         if query is None or query == "":
             raise InvalidRequestArgumentError("query is empty!" )
         request = TreeMindRequest(query_text=query)
-        headers = self.http_client.auth_header(kwargs.get("_sys_traceid"))
+        headers = client.auth_header(request_id)
 
         headers['Content-Type'] = 'application/json'
-        tree_mind_url = self.http_client.service_url("/v1/component/component/query_mind_open")
+        tree_mind_url = client.service_url("/v1/component/component/query_mind_open")
 
         payload = TreeMindRequest.model_dump(request)
+        return tree_mind_url, headers, payload
 
-        response = self.http_client.session.post(tree_mind_url, headers=headers, json=payload)
-        self.http_client.check_response_header(response)
-        data = response.text
+    @staticmethod
+    def _parse_response(data: str):
         treemind_dict = json.loads(data.split("data:")[-1])
         treemind_response = TreeMindResponse(**treemind_dict)
         jump_link = treemind_response.info.downloadInfo.fileInfo.jumpLink
@@ -99,7 +116,25 @@ class TreeMind(Component):
         """
 
         img_link, jump_link = self._post(query, **kwargs)
+        yield from self._build_tool_eval_outputs(query, img_link, jump_link)
 
+    async def atool_eval(
+            self,
+            query,
+            **kwargs,
+    ):
+        r"""异步调用树图查询接口
+        Args:
+            query (string): 用户想要生成思维导图的内容
+        Returns:
+            dict: 返回生成的思维导图的图片链接和跳转链接
+        """
+
+        img_link, jump_link = await self._apost(query, **kwargs)
+        for output in self._build_tool_eval_outputs(query, img_link, jump_link):
+            yield output
+
+    def _build_tool_eval_outputs(self, query: str, img_link: str, jump_link: str) -> list:
         inst = "你必须遵循指令，输出无需总结，只需要将，“原样输出内容”对应的内容原样输出即可：\n"
         img_res = f"原样输出内容：![图片url]({img_link})\n"
         jump_res = f"{query}的思维导图已经为您生成好了，您可以通过这个链接编辑：编辑链接：{jump_link}。"
@@ -112,7 +147,6 @@ class TreeMind(Component):
             visible_scope='llm',
             name="text"
         )
-        yield llm_result
         
         img_link_result = self.create_output(
             type="image",
@@ -123,7 +157,6 @@ class TreeMind(Component):
             visible_scope='all',
             name="img_link_url"
         )
-        yield img_link_result
 
         jump_link_result = self.create_output(
             type="urls",
@@ -133,7 +166,7 @@ class TreeMind(Component):
             visible_scope='all',
             name="jump_link_url"
         )
-        yield jump_link_result
+        return [llm_result, img_link_result, jump_link_result]
 
 
     @HTTPClient.check_param
@@ -147,7 +180,22 @@ class TreeMind(Component):
         """
         query = message.content
         img_link, jump_link = self._post(query, **kwargs)
+        return self._build_run_output(img_link, jump_link)
+
+    @HTTPClient.check_param
+    async def arun(self, message: Message, **kwargs) -> Message:
+        """异步运行组件
+        Args:
+            message (Message): 消息对象
+        Returns:
+            Message: 返回消息对象
+        """
+        query = message.content
+        img_link, jump_link = await self._apost(query, **kwargs)
+        return self._build_run_output(img_link, jump_link)
 
+    @staticmethod
+    def _build_run_output(img_link: str, jump_link: str) -> Message:
         result = {
             "result": "思维导图已经为您生成好了，您可以点击'img_link'对应的链接查看，如果您觉得这个思维导图还不够完美，或者您的想法需要更自由地表达，点击'edit_link'对应的链接，对思维导图变形、变色、变内容、甚至可以添加新的元素",
             "img_link": img_link,
@@ -13,4 +13,5 @@
 # limitations under the License.
 
 from .appbuilder_client import AppBuilderClient
-from .appbuilder_client import get_app_list, describe_apps
\ No newline at end of file
+from .appbuilder_client import get_app_list, describe_apps, iter_apps
+from .answer_accumulator import AnswerAccumulator
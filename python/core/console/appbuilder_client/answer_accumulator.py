@@ -0,0 +1,125 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import AsyncIterable, Iterable, Optional, Union
+
+from appbuilder.core.message import Message
+from appbuilder.core.console.appbuilder_client import data_class
+
+
+class AnswerAccumulator:
+    r"""流式回答聚合器。
+
+    逐个接收AppBuilderClient.run(stream=True)返回的AppBuilderClientAnswer（或lite模式下的LiteAnswer），
+    增量收集回答文本、事件与token用量。回答文本以列表缓存，读取时才拼接，避免逐token字符串拼接的平方复杂度；
+    任意时刻都可以读取当前累计的回答，流结束后通过result()得到完整结果，无需再次遍历。
+
+    Examples:
+
+    .. code-block:: python
+
+        import appbuilder
+
+        client = appbuilder.AppBuilderClient(app_id)
+        message = client.run(conversation_id, "你好", stream=True)
+        accumulator = appbuilder.AnswerAccumulator()
+        for answer in accumulator.wrap(message):
+            # 逐块转发给前端
+            print(answer.answer, end="")
+        print(accumulator.answer, accumulator.usage)
+        final = accumulator.result()
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._length = 0
+        self.message_id = ""
+        self.events = []
+        # 服务端按event_type分别统计token用量，每个事件携带该类型截至当前的累计值
+        self._usage = {}
+
+    def add(self, answer) -> "AnswerAccumulator":
+        r"""收集一个流式返回的回答块.
+
+        参数:
+            answer(AppBuilderClientAnswer | LiteAnswer): 流式返回的回答块。
+        返回：
+            AnswerAccumulator: 当前聚合器，便于链式调用。
+        """
+        if answer.answer:
+            self._chunks.append(answer.answer)
+            self._length += len(answer.answer)
+        if answer.message_id:
+            self.message_id = answer.message_id
+        for event in answer.events:
+            self.events.append(event)
+            usage = event.usage
+            if usage is not None:
+                self._usage[event.event_type] = usage
+        return self
+
+    def wrap(self, answers: Union[Message, Iterable]):
+        r"""边转发边收集，返回的生成器原样产出每个回答块.
+
+        参数:
+            answers(Message | Iterable): run(stream=True)返回的Message，或其content迭代器。
+        返回：
+            Generator: 原样产出每个回答块的生成器。
+        """
+        if isinstance(answers, Message):
+            answers = answers.content
+        for answer in answers:
+            self.add(answer)
+            yield answer
+
+    async def awrap(self, answers: Union[Message, AsyncIterable]):
+        r"""wrap的异步版本，用于AsyncAppBuilderClient.run(stream=True)的返回值"""
+        if isinstance(answers, Message):
+            answers = answers.content
+        async for answer in answers:
+            self.add(answer)
+            yield answer
+
+    @property
+    def answer(self) -> str:
+        r"""当前累计的回答文本"""
+        if len(self._chunks) > 1:
+            # 拼接后合并为一块，后续读取只需拼接新增部分
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def __len__(self):
+        r"""当前累计的回答文本长度，不触发拼接"""
+        return self._length
+
+    @property
+    def usage(self) -> Optional[data_class.Usage]:
+        r"""当前累计的token用量，为各event_type最新用量之和；没有用量信息时为None"""
+        if not self._usage:
+            return None
+        usages = list(self._usage.values())
+        return data_class.Usage(
+            prompt_tokens=sum(usage.prompt_tokens for usage in usages),
+            completion_tokens=sum(usage.completion_tokens for usage in usages),
+            total_tokens=sum(usage.total_tokens for usage in usages),
+            name=usages[-1].name,
+        )
+
+    def result(self) -> data_class.AppBuilderClientAnswer:
+        r"""返回到目前为止收集到的完整回答.
+
+        返回：
+            AppBuilderClientAnswer: 回答文本为所有回答块的拼接，events为所有事件；lite模式的事件会转换为Event。
+        """
+        events = [event.to_model() if isinstance(event, data_class.LiteEvent) else event for event in self.events]
+        return data_class.AppBuilderClientAnswer(answer=self.answer, message_id=self.message_id, events=events)
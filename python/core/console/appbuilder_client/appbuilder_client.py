@@ -17,13 +17,18 @@ import os
 import json
 import uuid
 import queue
-from typing import Optional, Union
+from typing import Iterable, Iterator, List, Optional, Union
 from appbuilder.core.component import Message, Component
 from appbuilder.core.manifest.models import Manifest
 from appbuilder.core.console.appbuilder_client import data_class
+from appbuilder.core.console.appbuilder_client.conversation_pool import ConversationPool, DEFAULT_CONVERSATION_TTL
+from appbuilder.core.console.appbuilder_client.batch_runner import run_batch
 from appbuilder.core._exception import AppBuilderServerException
 from appbuilder.utils.sse_util import SSEClient
+from appbuilder.utils import json_util
 from appbuilder.core._client import HTTPClient
+from appbuilder.core._multipart import MultipartEncoder
+from appbuilder.core._paginator import Paginator, ListingCache
 from appbuilder.utils.func_utils import deprecated
 from appbuilder.utils.trace.tracer_wrapper import client_run_trace, client_tool_trace
 
@@ -99,7 +104,7 @@ def describe_apps(
     headers = client.auth_header_v2()
     headers["Content-Type"] = "application/json"
     url = client.service_url_v2("/app?Action=DescribeApps")
-    request = data_class.DescribeAppsRequest(MaxKeys=maxKeys, Marker=marker)
+    request = data_class.DescribeAppsRequest(maxKeys=maxKeys, marker=marker)
     response = client.session.post(
         url=url,
         json=request.model_dump(),
@@ -113,31 +118,60 @@ def describe_apps(
     return out
 
 
+# get_all_apps的完整列表缓存，键为(secret_key, gateway)
+_app_listing_cache = ListingCache()
+
+
+def iter_apps(
+    page_size: int = 100,
+    secret_key: Optional[str] = None,
+    gateway: Optional[str] = None,
+    prefetch: bool = True,
+) -> Iterator[data_class.AppOverview]:
+    """
+    惰性遍历用户下状态为已发布的应用，逐页调用describe_apps，并在后台预取下一页。
+
+    Args:
+        page_size (int, optional): 每页请求的应用数，最大为100，默认值为100。
+        secret_key (Optional[str], optional): 认证密钥。如果未指定，则使用默认的密钥。默认值为None。
+        gateway (Optional[str], optional): 网关地址。如果未指定，则使用默认的地址。默认值为None。
+        prefetch (bool, optional): 是否在后台预取下一页，默认值为True。
+
+    Returns:
+        Iterator[data_class.AppOverview]: 逐个产出应用概览的生成器。
+
+    """
+    def fetch(marker):
+        return describe_apps(marker=marker, maxKeys=page_size, secret_key=secret_key, gateway=gateway)
+
+    return iter(Paginator(fetch, page_size=page_size, prefetch=prefetch))
+
+
 @client_tool_trace
-def get_all_apps():
+def get_all_apps(
+    secret_key: Optional[str] = None,
+    gateway: Optional[str] = None,
+    cache_ttl: Optional[float] = None,
+):
     """
     获取所有应用列表。
 
     Args:
-        无参数。
+        secret_key (Optional[str], optional): 认证密钥。如果未指定，则使用默认的密钥。默认值为None。
+        gateway (Optional[str], optional): 网关地址。如果未指定，则使用默认的地址。默认值为None。
+        cache_ttl (Optional[float], optional): 缓存有效期，单位秒。指定时若同一密钥与网关的完整列表在ttl秒内获取过，
+            直接返回缓存的列表而不请求服务端。默认值为None，总是请求服务端。
 
     Returns:
         List[App]: 包含所有应用信息的列表，每个元素为一个App对象，
         其中App对象的结构取决于get_app_list函数的返回结果。
 
     """
-    app_list = []
-    response_per_time = describe_apps(maxKeys=100)
-    list_len_per_time = len(response_per_time)
-    if list_len_per_time != 0:
-        app_list.extend(response_per_time)
-    while list_len_per_time == 100:
-        after_id = response_per_time[-1].id
-        response_per_time = describe_apps(marker=after_id, maxKeys=100)
-        list_len_per_time = len(response_per_time)
-        if list_len_per_time != 0:
-            app_list.extend(response_per_time)
-
+    key = (secret_key or os.getenv("APPBUILDER_TOKEN", ""), gateway or os.getenv("GATEWAY_URL_V2", ""))
+    app_list = _app_listing_cache.get(key, cache_ttl)
+    if app_list is None:
+        app_list = list(iter_apps(secret_key=secret_key, gateway=gateway))
+        _app_listing_cache.set(key, app_list)
     return app_list
 
 
@@ -181,6 +215,7 @@ class AppBuilderClient(Component):
                 " to get a valid app_id after your application is published."
             )
         self.app_id = app_id
+        self._conversation_pool = None
 
     @client_tool_trace
     def create_conversation(self) -> str:
@@ -195,6 +230,11 @@ class AppBuilderClient(Component):
             response (str): 唯一会话ID
 
         """
+        if self._conversation_pool is not None:
+            return self._conversation_pool.acquire()
+        return self._create_conversation()
+
+    def _create_conversation(self) -> str:
         headers = self.http_client.auth_header_v2()
         headers["Content-Type"] = "application/json"
         url = self.http_client.service_url_v2("/app/conversation")
@@ -206,8 +246,36 @@ class AppBuilderClient(Component):
         resp = data_class.CreateConversationResponse(**data)
         return resp.conversation_id
 
+    def enable_conversation_pool(self, size: int = 4, ttl: Optional[float] = DEFAULT_CONVERSATION_TTL):
+        r"""开启会话池，在后台线程中预先创建size个会话，create_conversation直接返回池中的会话，省去一次网络往返
+
+        会话被取出后在后台补充；每个会话只发放一次，创建超过ttl秒的会话被丢弃；池为空时create_conversation同步创建会话。
+
+        Args:
+            size (int): 池中保持的会话数，默认为4
+            ttl (float): 会话从创建起可发放的时长，单位秒，应小于服务端会话有效期，默认为24小时，None表示不过期
+
+        Returns:
+            None
+        """
+        self.disable_conversation_pool()
+        self._conversation_pool = ConversationPool(self._create_conversation, size=size, ttl=ttl)
+
+    def disable_conversation_pool(self):
+        r"""关闭会话池并停止后台创建会话"""
+        if self._conversation_pool is not None:
+            self._conversation_pool.close()
+            self._conversation_pool = None
+
+    def conversation_pool_stats(self) -> dict:
+        r"""返回会话池的命中(hits)、未命中(misses)、过期丢弃(expired)、后台创建(created)、创建失败(errors)次数与当前池大小(size)，
+        未开启会话池时返回空字典"""
+        if self._conversation_pool is None:
+            return {}
+        return self._conversation_pool.stats()
+
     @client_tool_trace
-    def upload_local_file(self, conversation_id, local_file_path: str) -> str:
+    def upload_local_file(self, conversation_id, local_file_path: str, progress_callback=None) -> str:
         r"""上传文件并将文件与会话ID进行绑定，后续可使用该文件ID进行对话，目前仅支持上传xlsx、jsonl、pdf、png等文件格式
 
         该接口用于在对话中上传文件供大模型处理，文件的有效期为7天并且不超过对话的有效期。一次只能上传一个文件。
@@ -215,6 +283,7 @@ class AppBuilderClient(Component):
         Args:
             conversation_id (str) : 会话ID
             local_file_path (str) : 本地文件路径
+            progress_callback (Callable[[int, int], None], optional) : 上传进度回调，参数为已上传字节数与总字节数
 
         Returns:
             response (str): 唯一文件ID
@@ -229,15 +298,19 @@ class AppBuilderClient(Component):
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"{filepath} does not exist")
 
-        multipart_form_data = {
-            "file": (os.path.basename(local_file_path), open(local_file_path, "rb")),
-            "app_id": (None, self.app_id),
-            "conversation_id": (None, conversation_id),
-        }
+        multipart_form_data = MultipartEncoder(
+            fields=[
+                ("file", (os.path.basename(local_file_path), filepath)),
+                ("app_id", self.app_id),
+                ("conversation_id", conversation_id),
+            ],
+            progress_callback=progress_callback,
+        )
         headers = self.http_client.auth_header_v2()
+        headers.update(multipart_form_data.headers)
         url = self.http_client.service_url_v2("/app/conversation/file/upload")
         response = self.http_client.session.post(
-            url, files=multipart_form_data, headers=headers
+            url, data=multipart_form_data, headers=headers
         )
         self.http_client.check_response_header(response)
         data = response.json()
@@ -256,6 +329,7 @@ class AppBuilderClient(Component):
         tool_choice: data_class.ToolChoice = None,
         end_user_id: str = None,
         action: data_class.Action = None,
+        lite: bool = False,
         **kwargs,
     ) -> Message:
         r"""运行智能体应用
@@ -270,6 +344,7 @@ class AppBuilderClient(Component):
             tool_choice(data_class.ToolChoice): 控制大模型使用组件的方式，默认为None
             end_user_id (str): 用户ID，用于区分不同用户
             action(data_class.Action): 对话时要进行的特殊操作。如回复工作流agent中“信息收集节点“的消息。
+            lite (bool): 为True时返回属性名相同的轻量对象data_class.LiteAnswer与data_class.LiteEvent，跳过逐事件的pydantic校验，适用于高吞吐的流式转发场景，默认为False
             kwargs: 其他参数
 
         Returns:
@@ -309,14 +384,46 @@ class AppBuilderClient(Component):
         request_id = self.http_client.response_request_id(response)
         if stream:
             client = SSEClient(response)
-            return Message(content=self._iterate_events(request_id, client.events()))
+            return Message(content=self._iterate_events(request_id, client.events(), lite))
         else:
             data = response.json()
+            if lite:
+                return Message(content=data_class.LiteAnswer.from_dict(data))
             resp = data_class.AppBuilderClientResponse(**data)
             out = data_class.AppBuilderClientAnswer()
             AppBuilderClient._transform(resp, out)
             return Message(content=out)
 
+    def batch_run(
+        self,
+        items: Iterable[Union[str, dict]],
+        max_concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+        output_path: Optional[str] = None,
+        resume: bool = False,
+        **kwargs,
+    ) -> List[dict]:
+        r"""批量运行智能体应用，每个输入在新的会话中运行，适用于离线评估等场景
+
+        最多max_concurrency个输入同时运行，每个输入依次创建会话、上传文件并以非流式方式运行，单个输入失败不影响其他输入。
+        每个输入完成后立即向output_path追加一行JSON结果，进程中断后使用resume=True重新调用，已成功的输入会被跳过。
+
+        Args:
+            items (Iterable[Union[str, dict]]): 输入序列，可以是任意长的生成器。元素为query字符串，或形如
+                {"id": ..., "query": ..., "file_paths": [...]}的字典，id默认为输入中的序号，断点续跑时输入顺序需保持不变
+            max_concurrency (int): 最大并发数，默认为4
+            rate_limit (float): 每秒最多开始运行的输入数，默认为None，不限速
+            output_path (str): JSONL结果文件路径，默认为None，不写文件
+            resume (bool): 为True时读取output_path中已成功的结果并跳过对应输入，新结果追加写入；为False时覆盖output_path，默认为False
+            kwargs: 传递给run的其他参数，如end_user_id，不支持stream=True
+
+        Returns:
+            results (list[dict]): 本次运行的结果，按完成顺序排列，每个结果包含id、query、status(success或error)、
+                conversation_id、file_ids、answer、message_id、error与elapsed(秒)
+        """
+        return run_batch(self, items, max_concurrency=max_concurrency, rate_limit=rate_limit,
+                         output_path=output_path, resume=resume, **kwargs)
+
     @client_run_trace
     def feedback(
         self,
@@ -466,18 +573,21 @@ class AppBuilderClient(Component):
         event_handler.reset_state()
 
     @staticmethod
-    def _iterate_events(request_id, events):
+    def _iterate_events(request_id, events, lite=False):
         for event in events:
             try:
                 data = event.data
                 if len(data) == 0:
                     data = event.raw
-                data = json.loads(data)
+                data = json_util.loads(data)
             except json.JSONDecodeError as e:
                 raise AppBuilderServerException(
                     request_id=request_id,
                     message="json decoder failed {}".format(str(e)),
                 )
+            if lite:
+                yield data_class.LiteAnswer.from_dict(data)
+                continue
             inp = data_class.AppBuilderClientResponse(**data)
             out = data_class.AppBuilderClientAnswer()
             AppBuilderClient._transform(inp, out)
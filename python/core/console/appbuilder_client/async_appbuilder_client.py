@@ -13,13 +13,16 @@
 # limitations under the License.
 import json
 import os
-from typing import Union
-from aiohttp import FormData
+from typing import Iterable, List, Optional, Union
 from appbuilder.core.component import Message, Component
 from appbuilder.core.console.appbuilder_client import data_class, AppBuilderClient
+from appbuilder.core.console.appbuilder_client.conversation_pool import AsyncConversationPool, DEFAULT_CONVERSATION_TTL
+from appbuilder.core.console.appbuilder_client.batch_runner import arun_batch
 from appbuilder.core.manifest.models import Manifest
+from appbuilder.core._multipart import MultipartEncoder
 from appbuilder.core._exception import AppBuilderServerException
 from appbuilder.utils.sse_util import AsyncSSEClient
+from appbuilder.utils import json_util
 
 
 class AsyncAppBuilderClient(Component):
@@ -32,6 +35,7 @@ class AsyncAppBuilderClient(Component):
                 " to get a valid app_id after your application is published."
             )
         self.app_id = app_id
+        self._conversation_pool = None
 
     async def create_conversation(self) -> str:
         r"""异步创建会话并返回会话ID
@@ -45,6 +49,11 @@ class AsyncAppBuilderClient(Component):
             response (str): 唯一会话ID
 
         """
+        if self._conversation_pool is not None:
+            return await self._conversation_pool.acquire()
+        return await self._create_conversation()
+
+    async def _create_conversation(self) -> str:
         headers = self.http_client.auth_header_v2()
         headers["Content-Type"] = "application/json"
         url = self.http_client.service_url_v2("/app/conversation")
@@ -56,6 +65,46 @@ class AsyncAppBuilderClient(Component):
         resp = data_class.CreateConversationResponse(**data)
         return resp.conversation_id
 
+    def enable_conversation_pool(self, size: int = 4, ttl: Optional[float] = DEFAULT_CONVERSATION_TTL):
+        r"""开启会话池，在事件循环的后台任务中预先创建size个会话，create_conversation直接返回池中的会话，省去一次网络往返
+
+        后台任务在首次调用create_conversation或prewarm_conversation_pool时启动；每个会话只发放一次，
+        创建超过ttl秒的会话被丢弃；池为空时create_conversation直接创建会话。
+
+        Args:
+            size (int): 池中保持的会话数，默认为4
+            ttl (float): 会话从创建起可发放的时长，单位秒，应小于服务端会话有效期，默认为24小时，None表示不过期
+
+        Returns:
+            None
+        """
+        if self._conversation_pool is not None:
+            self._conversation_pool.close()
+        self._conversation_pool = AsyncConversationPool(self._create_conversation, size=size, ttl=ttl)
+
+    async def prewarm_conversation_pool(self):
+        r"""在当前事件循环中启动会话池的后台任务，服务启动时调用可使首批会话提前就绪"""
+        if self._conversation_pool is not None:
+            await self._conversation_pool.prewarm()
+
+    async def disable_conversation_pool(self):
+        r"""关闭会话池并停止后台创建会话"""
+        if self._conversation_pool is not None:
+            pool, self._conversation_pool = self._conversation_pool, None
+            await pool.aclose()
+
+    def conversation_pool_stats(self) -> dict:
+        r"""返回会话池的命中(hits)、未命中(misses)、过期丢弃(expired)、后台创建(created)、创建失败(errors)次数与当前池大小(size)，
+        未开启会话池时返回空字典"""
+        if self._conversation_pool is None:
+            return {}
+        return self._conversation_pool.stats()
+
+    async def aclose(self):
+        r"""关闭会话池，并释放在当前事件循环中持有的异步HTTP会话"""
+        await self.disable_conversation_pool()
+        await super().aclose()
+
     async def run(
         self,
         conversation_id: str,
@@ -67,6 +116,7 @@ class AsyncAppBuilderClient(Component):
         tool_choice: data_class.ToolChoice = None,
         end_user_id: str = None,
         action: data_class.Action = None,
+        lite: bool = False,
         **kwargs,
     ) -> Message:
         r"""异步运行智能体应用
@@ -81,6 +131,7 @@ class AsyncAppBuilderClient(Component):
             tool_choice(data_class.ToolChoice): 控制大模型使用组件的方式，默认为None
             end_user_id (str): 用户ID，用于区分不同用户
             action(data_class.Action): 对话时要进行的特殊操作。如回复工作流agent中“信息收集节点“的消息。
+            lite (bool): 为True时返回属性名相同的轻量对象data_class.LiteAnswer与data_class.LiteEvent，跳过逐事件的pydantic校验，适用于高吞吐的流式转发场景，默认为False
             kwargs: 其他参数
 
         Returns:
@@ -120,15 +171,42 @@ class AsyncAppBuilderClient(Component):
         request_id = await self.http_client.response_request_id(response)
         if stream:
             client = AsyncSSEClient(response)
-            return Message(content=self._iterate_events(request_id, client.events()))
+            return Message(content=self._iterate_events(request_id, client.events(), lite))
         else:
             data = await response.json()
+            if lite:
+                return Message(content=data_class.LiteAnswer.from_dict(data))
             resp = data_class.AppBuilderClientResponse(**data)
             out = data_class.AppBuilderClientAnswer()
             AppBuilderClient._transform(resp, out)
             return Message(content=out)
 
-    async def upload_local_file(self, conversation_id, local_file_path: str) -> str:
+    async def batch_run(
+        self,
+        items: Iterable[Union[str, dict]],
+        max_concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+        output_path: Optional[str] = None,
+        resume: bool = False,
+        **kwargs,
+    ) -> List[dict]:
+        r"""异步批量运行智能体应用，每个输入在新的会话中运行，参数与返回值同AppBuilderClient.batch_run
+
+        Args:
+            items (Iterable[Union[str, dict]]): 输入序列，元素为query字符串或{"id", "query", "file_paths"}字典
+            max_concurrency (int): 最大并发数，默认为4
+            rate_limit (float): 每秒最多开始运行的输入数，默认为None，不限速
+            output_path (str): JSONL结果文件路径，默认为None，不写文件
+            resume (bool): 为True时跳过output_path中已成功的输入，默认为False
+            kwargs: 传递给run的其他参数，不支持stream=True
+
+        Returns:
+            results (list[dict]): 本次运行的结果，按完成顺序排列
+        """
+        return await arun_batch(self, items, max_concurrency=max_concurrency, rate_limit=rate_limit,
+                                output_path=output_path, resume=resume, **kwargs)
+
+    async def upload_local_file(self, conversation_id, local_file_path: str, progress_callback=None) -> str:
         r"""异步运行，上传文件并将文件与会话ID进行绑定，后续可使用该文件ID进行对话，目前仅支持上传xlsx、jsonl、pdf、png等文件格式
 
         该接口用于在对话中上传文件供大模型处理，文件的有效期为7天并且不超过对话的有效期。一次只能上传一个文件。
@@ -136,6 +214,7 @@ class AsyncAppBuilderClient(Component):
         Args:
             conversation_id (str) : 会话ID
             local_file_path (str) : 本地文件路径
+            progress_callback (Callable[[int, int], None], optional) : 上传进度回调，参数为已上传字节数与总字节数
 
         Returns:
             response (str): 唯一文件ID
@@ -149,17 +228,17 @@ class AsyncAppBuilderClient(Component):
         filepath = os.path.abspath(local_file_path)
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"{filepath} does not exist")
-        multipart_form_data = FormData()
-        multipart_form_data.add_field(
-            name="file",
-            value=open(local_file_path, "rb"),
-            filename=os.path.basename(local_file_path),
+        multipart_form_data = MultipartEncoder(
+            fields=[
+                ("file", (os.path.basename(local_file_path), filepath)),
+                ("app_id", self.app_id),
+                ("conversation_id", conversation_id),
+            ],
+            progress_callback=progress_callback,
         )
-        multipart_form_data.add_field(name="app_id", value=self.app_id)
-        multipart_form_data.add_field(
-            name="conversation_id", value=conversation_id)
 
         headers = self.http_client.auth_header_v2()
+        headers.update(multipart_form_data.headers)
         url = self.http_client.service_url_v2("/app/conversation/file/upload")
         response = await self.http_client.session.post(
             url, data=multipart_form_data, headers=headers
@@ -273,18 +352,21 @@ class AsyncAppBuilderClient(Component):
         await event_handler.reset_state()
 
     @staticmethod
-    async def _iterate_events(request_id, events):
+    async def _iterate_events(request_id, events, lite=False):
         async for event in events:
             try:
                 data = event.data
                 if len(data) == 0:
                     data = event.raw
-                data = json.loads(data)
+                data = json_util.loads(data)
             except json.JSONDecodeError as e:
                 raise AppBuilderServerException(
                     request_id=request_id,
                     message="json decoder failed {}".format(str(e)),
                 )
+            if lite:
+                yield data_class.LiteAnswer.from_dict(data)
+                continue
             inp = data_class.AppBuilderClientResponse(**data)
             out = data_class.AppBuilderClientAnswer()
             AppBuilderClient._transform(inp, out)
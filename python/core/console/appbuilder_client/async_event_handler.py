@@ -11,8 +11,31 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import inspect
+import contextvars
+from appbuilder.core.component import Component
 from appbuilder.utils.logger_util import logger
 from appbuilder.core.console.appbuilder_client import data_class
+from appbuilder.core.console.appbuilder_client.event_handler import (
+    _build_tool_registry,
+    _tool_eval_arguments,
+    _tool_eval_output_text,
+    _tool_output_text,
+    _tool_error_output,
+)
+
+
+async def _acall_tool(tool, arguments):
+    if isinstance(tool, Component):
+        outputs = [output async for output in tool.atool_eval(**_tool_eval_arguments(tool, arguments))]
+        return _tool_eval_output_text(outputs)
+    if inspect.iscoroutinefunction(tool):
+        return await tool(**arguments)
+    # 同步函数在线程池中执行，避免阻塞事件循环
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, lambda: context.run(tool, **arguments))
 
 
 class AppBuilderClientRunContext(object):
@@ -36,8 +59,79 @@ class AppBuilderClientRunContext(object):
 
 
 class AsyncAppBuilderEventHandler(object):
-    def __init__(self):
-        pass
+    # 子类未调用父类__init__时使用的默认值
+    _tool_registry = {}
+    max_tool_workers = None
+
+    def __init__(self, local_tools=None, tool_timeout: float = None, max_tool_workers: int = None):
+        """
+        初始化事件处理器。
+
+        Args:
+            local_tools (dict | list, optional): 本地工具，工具名到函数、协程函数或Component的映射，也可以是它们的列表，
+                此时函数使用函数名、Component使用manifests中的name作为工具名。注册后，interrupt默认并发执行所有工具调用。
+            tool_timeout (float, optional): 每个工具调用的超时时间，单位秒，默认为None，不限制。
+            max_tool_workers (int, optional): 同时执行的最大工具调用数，默认为None，即一次中断内的所有工具调用同时执行。
+
+        Returns:
+            None
+
+        """
+        self._tool_registry = _build_tool_registry(local_tools, tool_timeout)
+        self.max_tool_workers = max_tool_workers
+
+    def register_tool(self, name, tool, timeout: float = None):
+        """
+        注册本地工具。
+
+        Args:
+            name (str): 工具名，与应用中配置的工具名称一致。
+            tool (callable | Component): 工具函数、协程函数或组件，函数以工具调用参数作为关键字参数调用，组件调用atool_eval。
+            timeout (float, optional): 该工具的超时时间，单位秒，默认为None，不限制。
+
+        Returns:
+            None
+
+        """
+        self._tool_registry = dict(self._tool_registry)
+        self._tool_registry[name] = (tool, timeout)
+
+    async def run_tool_calls(self, tool_calls) -> list:
+        """
+        使用asyncio.gather并发执行一次中断中的所有工具调用。
+
+        协程函数与组件的atool_eval直接在事件循环中执行，同步函数在线程池中执行。工具执行出错、超时或未注册时，
+        对应的ToolOutput为错误信息，由应用继续处理。
+
+        Args:
+            tool_calls (list[ToolCall]): 中断事件中的工具调用列表，即run_context.current_tool_calls。
+
+        Returns:
+            list[ToolOutput]: 与tool_calls顺序一致的工具输出列表，可直接作为interrupt的返回值一次性提交。
+
+        """
+        if not tool_calls:
+            return []
+        semaphore = asyncio.Semaphore(self.max_tool_workers) if self.max_tool_workers else None
+
+        async def run_one(tool_call):
+            name = tool_call.function.name
+            if name not in self._tool_registry:
+                return _tool_error_output(tool_call, "tool {} is not registered".format(name))
+            tool, timeout = self._tool_registry[name]
+            try:
+                if semaphore is None:
+                    result = await asyncio.wait_for(_acall_tool(tool, tool_call.function.arguments), timeout)
+                else:
+                    async with semaphore:
+                        result = await asyncio.wait_for(_acall_tool(tool, tool_call.function.arguments), timeout)
+                return data_class.ToolOutput(tool_call_id=tool_call.id, output=_tool_output_text(result))
+            except asyncio.TimeoutError:
+                return _tool_error_output(tool_call, "tool {} timed out after {}s".format(name, timeout))
+            except Exception as e:
+                return _tool_error_output(tool_call, "tool {} failed: {}".format(name, e))
+
+        return list(await asyncio.gather(*(run_one(tool_call) for tool_call in tool_calls)))
 
     async def init(
         self,
@@ -435,8 +529,9 @@ class AsyncAppBuilderEventHandler(object):
         pass
 
     async def interrupt(self, run_context, run_response):
-        # 用户可重载该方法，当event_status为interrupt时，会调用该方法
-        pass
+        # 用户可重载该方法，当event_status为interrupt时，会调用该方法；注册了本地工具时默认并发执行所有工具调用
+        if self._tool_registry:
+            return await self.run_tool_calls(run_context.current_tool_calls)
 
     async def preparing(self, run_context, run_response):
         # 用户可重载该方法，当event_status为preparing时，会调用该方法
@@ -0,0 +1,214 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch runner behind AppBuilderClient.batch_run and AsyncAppBuilderClient.batch_run"""
+
+import os
+import time
+import asyncio
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Iterable, List, Optional
+
+from appbuilder.core._rate_limiter import RateLimiter
+from appbuilder.utils import json_util
+from appbuilder.utils.logger_util import logger
+
+STATUS_SUCCESS = "success"
+STATUS_ERROR = "error"
+
+
+def _normalize_item(index: int, item) -> dict:
+    r"""将一个输入统一为{"id", "query", "file_paths"}，未指定id时使用其在输入中的序号"""
+    if isinstance(item, str):
+        return {"id": index, "query": item, "file_paths": []}
+    if isinstance(item, dict):
+        if "query" not in item:
+            raise ValueError("batch_run item must contain query, got {}".format(item))
+        file_paths = item.get("file_paths") or []
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+        return {"id": item.get("id", index), "query": item["query"], "file_paths": list(file_paths)}
+    raise TypeError("batch_run item must be a str or dict, got {}".format(type(item).__name__))
+
+
+def load_checkpoint(output_path: str) -> set:
+    r"""读取已有的结果文件，返回已成功完成的输入id集合.
+
+    进程崩溃时最后一行可能不完整，无法解析的行被忽略，对应的输入会重新运行。
+
+    参数:
+        output_path(str): batch_run写出的JSONL结果文件。
+    返回：
+        set: 状态为success的输入id。
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, "rb") as f:
+        for line in f:
+            try:
+                record = json_util.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get("status") == STATUS_SUCCESS:
+                done.add(record.get("id"))
+    return done
+
+
+class _JsonlSink:
+    r"""逐条追加写出结果，每条写完即flush，保证崩溃时已完成的结果落盘"""
+
+    def __init__(self, output_path: Optional[str], resume: bool):
+        self._file = None
+        self._lock = threading.Lock()
+        if output_path is not None:
+            self._file = open(output_path, "ab" if resume else "wb")
+
+    def write(self, record: dict):
+        if self._file is None:
+            return
+        line = json_util.dumps_bytes(record) + b"\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def _check_run_kwargs(kwargs: dict):
+    r"""batch_run总是以非流式方式运行，stream=True时报错，stream=False等价于不传"""
+    if kwargs.pop("stream", False):
+        raise ValueError("batch_run does not support stream=True, each item always runs with stream=False")
+
+
+class _BatchState:
+    r"""batch_run的输入、断点与结果统计，同步与异步版本共用"""
+
+    def __init__(self, items: Iterable, output_path: Optional[str], resume: bool, rate_limit: Optional[float]):
+        self.done = load_checkpoint(output_path) if resume and output_path is not None else set()
+        self.sink = _JsonlSink(output_path, resume)
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.items = self._pending(items)
+        self.results = []
+        self.skipped = 0
+
+    def _pending(self, items: Iterable):
+        for index, item in enumerate(items):
+            item = _normalize_item(index, item)
+            if item["id"] in self.done:
+                self.skipped += 1
+                continue
+            yield item
+
+    def finish(self, item: dict, start: float, conversation_id: str = "", file_ids: Optional[list] = None,
+               answer=None, error: Optional[Exception] = None) -> dict:
+        record = {
+            "id": item["id"],
+            "query": item["query"],
+            "status": STATUS_SUCCESS if error is None else STATUS_ERROR,
+            "conversation_id": conversation_id,
+            "file_ids": file_ids or [],
+            "answer": answer.answer if answer is not None else "",
+            "message_id": answer.message_id if answer is not None else "",
+            "error": "{}: {}".format(type(error).__name__, error) if error is not None else "",
+            "elapsed": round(time.monotonic() - start, 3),
+        }
+        if error is not None:
+            logger.warning("batch_run item %s failed: %s", item["id"], record["error"])
+        self.sink.write(record)
+        self.results.append(record)
+        return record
+
+    def close(self) -> List[dict]:
+        self.sink.close()
+        failed = sum(1 for record in self.results if record["status"] == STATUS_ERROR)
+        logger.info("batch_run finished: %s succeeded, %s failed, %s skipped",
+                    len(self.results) - failed, failed, self.skipped)
+        return self.results
+
+
+def run_batch(client, items: Iterable, max_concurrency: int = 4, rate_limit: Optional[float] = None,
+              output_path: Optional[str] = None, resume: bool = False, **kwargs) -> List[dict]:
+    r"""AppBuilderClient.batch_run的实现，参数含义见AppBuilderClient.batch_run"""
+    _check_run_kwargs(kwargs)
+    state = _BatchState(items, output_path, resume, rate_limit)
+
+    def call(item):
+        start = time.monotonic()
+        conversation_id, file_ids = "", []
+        try:
+            if state.limiter is not None:
+                state.limiter.acquire()
+            conversation_id = client.create_conversation()
+            for file_path in item["file_paths"]:
+                file_ids.append(client.upload_local_file(conversation_id, file_path))
+            message = client.run(conversation_id, item["query"], file_ids=file_ids, stream=False, **kwargs)
+        except Exception as e:
+            return state.finish(item, start, conversation_id, file_ids, error=e)
+        return state.finish(item, start, conversation_id, file_ids, answer=message.content)
+
+    max_concurrency = max(max_concurrency, 1)
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        # 按需从输入中取出任务，同时在途的任务不超过2倍并发数，输入可以是任意长的生成器
+        pending = set()
+        for item in state.items:
+            if len(pending) >= 2 * max_concurrency:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+            pending.add(executor.submit(contextvars.copy_context().run, call, item))
+        wait(pending)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        results = state.close()
+    return results
+
+
+async def arun_batch(client, items: Iterable, max_concurrency: int = 4, rate_limit: Optional[float] = None,
+                     output_path: Optional[str] = None, resume: bool = False, **kwargs) -> List[dict]:
+    r"""AsyncAppBuilderClient.batch_run的实现，参数含义见AppBuilderClient.batch_run"""
+    _check_run_kwargs(kwargs)
+    state = _BatchState(items, output_path, resume, rate_limit)
+
+    async def call(item):
+        start = time.monotonic()
+        conversation_id, file_ids = "", []
+        try:
+            if state.limiter is not None:
+                await state.limiter.aacquire()
+            conversation_id = await client.create_conversation()
+            for file_path in item["file_paths"]:
+                file_ids.append(await client.upload_local_file(conversation_id, file_path))
+            message = await client.run(conversation_id, item["query"], file_ids=file_ids, stream=False, **kwargs)
+        except Exception as e:
+            return state.finish(item, start, conversation_id, file_ids, error=e)
+        return state.finish(item, start, conversation_id, file_ids, answer=message.content)
+
+    max_concurrency = max(max_concurrency, 1)
+    pending = set()
+    try:
+        for item in state.items:
+            if len(pending) >= max_concurrency:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.add(asyncio.ensure_future(call(item)))
+        if pending:
+            await asyncio.wait(pending)
+    finally:
+        for task in pending:
+            task.cancel()
+        results = state.close()
+    return results
@@ -0,0 +1,277 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pre-created conversation pool for AppBuilderClient and AsyncAppBuilderClient"""
+
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from appbuilder.utils.logger_util import logger
+
+# 预创建的会话在服务端的默认有效期，单位秒；超过有效期的会话不再发放
+DEFAULT_CONVERSATION_TTL = 24 * 3600
+# 创建会话失败后首次重试前的等待时间，单位秒；连续失败时按指数增长
+REFILL_RETRY_INTERVAL = 1.0
+# 重试等待时间的上限，单位秒
+REFILL_MAX_RETRY_INTERVAL = 30.0
+# 连续失败达到该次数后暂停后台补充，直到下一次acquire
+REFILL_MAX_FAILURES = 5
+
+
+def _retry_interval(failures: int) -> float:
+    return min(REFILL_RETRY_INTERVAL * 2 ** (failures - 1), REFILL_MAX_RETRY_INTERVAL)
+
+
+class _PoolStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.created = 0
+        self.errors = 0
+
+    def to_dict(self, size: int) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "expired": self.expired,
+                "created": self.created, "errors": self.errors, "size": size}
+
+
+class ConversationPool:
+    r"""会话池，在后台线程中预先创建会话，create_conversation时直接取出，省去一次网络往返。
+
+    池中会话数低于size时在后台补充；会话只发放一次，超过ttl的会话被丢弃；池为空时同步创建并计为未命中。
+    后台创建失败时按指数退避重试，连续失败REFILL_MAX_FAILURES次后暂停补充，下一次acquire时恢复。
+    通常通过AppBuilderClient.enable_conversation_pool使用。
+    """
+
+    def __init__(self, create: Callable[[], str], size: int = 4, ttl: Optional[float] = DEFAULT_CONVERSATION_TTL):
+        r"""ConversationPool初始化方法.
+
+        参数:
+            create(Callable[[], str]): 创建一个会话并返回会话ID的函数。
+            size(int, 可选): 池中保持的会话数，默认为4。
+            ttl(float, 可选): 会话从创建起可发放的时长，单位秒，默认为24小时，None表示不过期。
+        返回：
+            无
+        """
+        if size <= 0:
+            raise ValueError("conversation pool size must be positive, got {}".format(size))
+        self.size = size
+        self.ttl = ttl
+        self._create = create
+        self._conversations = deque()
+        self._lock = threading.Lock()
+        self._refill = threading.Event()
+        self._closed = threading.Event()
+        self._suspended = False
+        self._stats = _PoolStats()
+        self._thread = threading.Thread(target=self._run, name="appbuilder_conversation_pool", daemon=True)
+        # 创建后立即开始预创建会话
+        self._refill.set()
+        self._thread.start()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at >= self.ttl
+
+    def acquire(self) -> str:
+        r"""取出一个会话ID，池为空时同步创建"""
+        now = time.monotonic()
+        with self._lock:
+            while self._conversations:
+                conversation_id, created_at = self._conversations.popleft()
+                if not self._expired(created_at, now):
+                    self._stats.hits += 1
+                    self._resume()
+                    return conversation_id
+                self._stats.expired += 1
+            self._stats.misses += 1
+        self._resume()
+        return self._create()
+
+    def _resume(self):
+        self._suspended = False
+        self._refill.set()
+
+    def _run(self):
+        while not self._closed.is_set():
+            # 暂停期间只等待acquire或close唤醒
+            self._refill.wait(timeout=None if self._suspended else self._next_expiry())
+            self._refill.clear()
+            failures = 0
+            while not self._closed.is_set() and not self._suspended:
+                with self._lock:
+                    self._purge(time.monotonic())
+                    if len(self._conversations) >= self.size:
+                        break
+                try:
+                    conversation_id = self._create()
+                except Exception as e:
+                    failures += 1
+                    with self._lock:
+                        self._stats.errors += 1
+                    if failures >= REFILL_MAX_FAILURES:
+                        logger.warning("Failed to prewarm conversation %s times in a row, "
+                                       "pause refilling until next acquire: %s", failures, e)
+                        self._suspended = True
+                        break
+                    logger.warning("Failed to prewarm conversation: %s", e)
+                    self._closed.wait(_retry_interval(failures))
+                    continue
+                failures = 0
+                with self._lock:
+                    self._conversations.append((conversation_id, time.monotonic()))
+                    self._stats.created += 1
+
+    def _purge(self, now: float):
+        while self._conversations and self._expired(self._conversations[0][1], now):
+            self._conversations.popleft()
+            self._stats.expired += 1
+
+    def _next_expiry(self) -> Optional[float]:
+        # 到最早的会话过期时醒来补充
+        with self._lock:
+            if self.ttl is None or not self._conversations:
+                return None
+            return max(0.0, self._conversations[0][1] + self.ttl - time.monotonic())
+
+    def stats(self) -> dict:
+        r"""返回命中(hits)、未命中(misses)、过期丢弃(expired)、后台创建(created)、创建失败(errors)次数与当前池大小(size)"""
+        with self._lock:
+            return self._stats.to_dict(len(self._conversations))
+
+    def close(self):
+        r"""停止后台补充，池中未发放的会话被丢弃"""
+        self._closed.set()
+        self._refill.set()
+        with self._lock:
+            self._conversations.clear()
+
+
+class AsyncConversationPool:
+    r"""ConversationPool的异步版本，在事件循环中以后台任务补充会话。
+
+    后台任务在首次acquire时于当前事件循环中启动，创建失败时的退避与暂停规则与ConversationPool一致。
+    通常通过AsyncAppBuilderClient.enable_conversation_pool使用。
+    """
+
+    def __init__(self, create: Callable[[], Awaitable[str]], size: int = 4,
+                 ttl: Optional[float] = DEFAULT_CONVERSATION_TTL):
+        r"""AsyncConversationPool初始化方法.
+
+        参数:
+            create(Callable[[], Awaitable[str]]): 创建一个会话并返回会话ID的协程函数。
+            size(int, 可选): 池中保持的会话数，默认为4。
+            ttl(float, 可选): 会话从创建起可发放的时长，单位秒，默认为24小时，None表示不过期。
+        返回：
+            无
+        """
+        if size <= 0:
+            raise ValueError("conversation pool size must be positive, got {}".format(size))
+        self.size = size
+        self.ttl = ttl
+        self._create = create
+        self._conversations = deque()
+        self._refill = None
+        self._task = None
+        self._suspended = False
+        self._stats = _PoolStats()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at >= self.ttl
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._refill = asyncio.Event()
+            self._refill.set()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def prewarm(self):
+        r"""启动后台补充任务，服务启动时调用可使首批会话提前就绪"""
+        self._ensure_started()
+
+    async def acquire(self) -> str:
+        r"""取出一个会话ID，池为空时创建"""
+        self._ensure_started()
+        now = time.monotonic()
+        while self._conversations:
+            conversation_id, created_at = self._conversations.popleft()
+            if not self._expired(created_at, now):
+                self._stats.hits += 1
+                self._suspended = False
+                self._refill.set()
+                return conversation_id
+            self._stats.expired += 1
+        self._stats.misses += 1
+        self._suspended = False
+        self._refill.set()
+        return await self._create()
+
+    async def _run(self):
+        while True:
+            timeout = None
+            # 暂停期间只等待acquire唤醒
+            if self.ttl is not None and self._conversations and not self._suspended:
+                timeout = max(0.0, self._conversations[0][1] + self.ttl - time.monotonic())
+            try:
+                await asyncio.wait_for(self._refill.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._refill.clear()
+            failures = 0
+            while not self._suspended:
+                now = time.monotonic()
+                while self._conversations and self._expired(self._conversations[0][1], now):
+                    self._conversations.popleft()
+                    self._stats.expired += 1
+                if len(self._conversations) >= self.size:
+                    break
+                try:
+                    conversation_id = await self._create()
+                except Exception as e:
+                    failures += 1
+                    self._stats.errors += 1
+                    if failures >= REFILL_MAX_FAILURES:
+                        logger.warning("Failed to prewarm conversation %s times in a row, "
+                                       "pause refilling until next acquire: %s", failures, e)
+                        self._suspended = True
+                        break
+                    logger.warning("Failed to prewarm conversation: %s", e)
+                    await asyncio.sleep(_retry_interval(failures))
+                    continue
+                failures = 0
+                self._conversations.append((conversation_id, time.monotonic()))
+                self._stats.created += 1
+
+    def stats(self) -> dict:
+        r"""返回命中(hits)、未命中(misses)、过期丢弃(expired)、后台创建(created)、创建失败(errors)次数与当前池大小(size)"""
+        return self._stats.to_dict(len(self._conversations))
+
+    def close(self):
+        r"""取消后台补充任务，不等待任务结束，池中未发放的会话被丢弃"""
+        if self._task is not None:
+            self._task.cancel()
+        self._conversations.clear()
+
+    async def aclose(self):
+        r"""停止后台补充任务并等待其结束，池中未发放的会话被丢弃"""
+        task, self._task = self._task, None
+        self._conversations.clear()
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -311,6 +311,76 @@ class AppBuilderClientAnswer(BaseModel):
     events: list[Event] = []
 
 
+class LiteEvent:
+    """轻量事件，属性名与Event一致，用于AppBuilderClient.run(lite=True)
+
+    直接由服务端返回的content字典构造，不做pydantic校验；usage与tool_calls在首次访问时才转换为Usage与ToolCall。
+    """
+    __slots__ = ("code", "message", "status", "event_type", "content_type", "detail", "_usage", "_tool_calls")
+
+    def __init__(self, ev: dict):
+        self.code = ev.get("event_code") or 0
+        self.message = ev.get("event_message", "")
+        self.status = ev.get("event_status", "")
+        self.event_type = ev.get("event_type", "")
+        self.content_type = ev.get("content_type", "")
+        self.detail = ev.get("outputs") or {}
+        self._usage = ev.get("usage")
+        self._tool_calls = ev.get("tool_calls")
+
+    @property
+    def usage(self) -> Optional[Usage]:
+        if isinstance(self._usage, dict):
+            self._usage = Usage(**self._usage)
+        return self._usage
+
+    @property
+    def tool_calls(self) -> Optional[list[ToolCall]]:
+        if self._tool_calls and isinstance(self._tool_calls[0], dict):
+            self._tool_calls = [ToolCall(**tool_call) for tool_call in self._tool_calls]
+        return self._tool_calls
+
+    def to_model(self) -> Event:
+        r"""转换为pydantic的Event"""
+        return Event(code=self.code, message=self.message, status=self.status, event_type=self.event_type,
+                     content_type=self.content_type, detail=self.detail, usage=self.usage,
+                     tool_calls=self.tool_calls)
+
+    def __repr__(self):
+        return "LiteEvent(code={!r}, status={!r}, event_type={!r}, content_type={!r}, detail={!r})".format(
+            self.code, self.status, self.event_type, self.content_type, self.detail)
+
+
+class LiteAnswer:
+    """轻量回答，属性名与AppBuilderClientAnswer一致，用于AppBuilderClient.run(lite=True)
+        属性:
+            answer(str): query回答内容
+            message_id(str): 消息ID
+            events(list[LiteEvent]): 事件列表
+    """
+    __slots__ = ("answer", "message_id", "events")
+
+    def __init__(self, answer: str = "", message_id: str = "", events: list = None):
+        self.answer = answer
+        self.message_id = message_id
+        self.events = events if events is not None else []
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LiteAnswer":
+        r"""由服务端返回的AppBuilderClientResponse字典构造"""
+        return cls(data.get("answer") or "", data.get("message_id") or "",
+                   [LiteEvent(ev) for ev in data.get("content") or ()])
+
+    def to_model(self) -> AppBuilderClientAnswer:
+        r"""转换为pydantic的AppBuilderClientAnswer"""
+        return AppBuilderClientAnswer(answer=self.answer, message_id=self.message_id,
+                                      events=[event.to_model() for event in self.events])
+
+    def __repr__(self):
+        return "LiteAnswer(answer={!r}, message_id={!r}, events={!r})".format(
+            self.answer, self.message_id, self.events)
+
+
 class FileUploadResponse(BaseModel):
     """文档上传结果
            属性:
@@ -363,7 +433,7 @@ class AppBuilderClientAppListResponse(BaseModel):
 class DescribeAppsRequest(BaseModel):
     maxKeys: int = Field(
         default=10, description="当次查询的数据大小，默认10，最大值100", le=100, ge=1)
-    marker: str = Field(
+    marker: Optional[str] = Field(
         default=None, description="用于分页的游标。marker 是应用的id，它定义了在列表中的位置。例如，如果你发出一个列表请求并收到 10个对象，以 app_id_123 开始，那么可以使用 marker=app_id_123 来获取列表的下一页数据")
 
 
@@ -12,11 +12,100 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import time
+import inspect
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from pydantic import BaseModel
+from appbuilder.core.component import Component, ComponentOutput
 from appbuilder.utils.sse_util import SSEClient
 from appbuilder.utils.logger_util import logger
+from appbuilder.utils import json_util
 from appbuilder.core.console.appbuilder_client import data_class
 
 
+def _tool_name(tool):
+    if isinstance(tool, Component):
+        if tool.manifests:
+            return tool.manifests[0]["name"]
+        return tool.__class__.__name__
+    return tool.__name__
+
+
+def _build_tool_registry(local_tools, tool_timeout=None):
+    # 统一为 工具名 -> (工具, 超时时间) 的映射
+    if not local_tools:
+        return {}
+    if not isinstance(local_tools, dict):
+        local_tools = {_tool_name(tool): tool for tool in local_tools}
+    return {name: (tool, tool_timeout) for name, tool in local_tools.items()}
+
+
+# visible_scope为llm或all的输出对模型可见，提交给应用；user只面向终端用户展示
+_LLM_VISIBLE_SCOPES = ("llm", "all")
+
+
+def _dumps_or_str(obj) -> str:
+    # 含bytes等无法JSON序列化的字段(如Image、Audio)时退化为str
+    try:
+        return json_util.dumps(obj)
+    except (TypeError, ValueError):
+        return str(obj)
+
+
+def _tool_output_text(result) -> str:
+    # 将本地工具的返回值转换为提交给应用的ToolOutput.output字符串
+    if isinstance(result, str):
+        return result
+    if isinstance(result, ComponentOutput):
+        texts = []
+        for content in result.content:
+            if content.visible_scope not in _LLM_VISIBLE_SCOPES:
+                continue
+            info = getattr(content.text, "info", None)
+            texts.append(info if isinstance(info, str) else _dumps_or_str(content.text.model_dump()))
+        return "\n".join(texts)
+    if isinstance(result, BaseModel):
+        result = result.model_dump()
+    return _dumps_or_str(result)
+
+
+def _tool_eval_arguments(tool, arguments):
+    # v1组件的tool_eval需要name与streaming参数，非流式的同步tool_eval通过return返回结果，迭代时取不到，
+    # 因此统一以流式调用，输出为带visible_scope的dict
+    if "streaming" not in inspect.signature(tool.tool_eval).parameters:
+        return arguments
+    arguments = dict(arguments)
+    arguments.setdefault("name", _tool_name(tool))
+    arguments["streaming"] = True
+    return arguments
+
+
+def _tool_eval_output_text(outputs) -> str:
+    # 合并组件tool_eval/atool_eval的全部输出：v2组件为ComponentOutput，v1组件为dict或str
+    texts = []
+    for output in outputs:
+        if isinstance(output, dict) and "visible_scope" in output:
+            if output["visible_scope"] not in _LLM_VISIBLE_SCOPES:
+                continue
+            output = output.get("text", "")
+        text = _tool_output_text(output)
+        if text:
+            texts.append(text)
+    return "\n".join(texts)
+
+
+def _call_tool(tool, arguments):
+    if isinstance(tool, Component):
+        return _tool_eval_output_text(tool.tool_eval(**_tool_eval_arguments(tool, arguments)))
+    return tool(**arguments)
+
+
+def _tool_error_output(tool_call, message):
+    logger.warning("Local tool %s failed, tool_call_id=%s: %s", tool_call.function.name, tool_call.id, message)
+    return data_class.ToolOutput(tool_call_id=tool_call.id, output=message)
+
+
 class AppBuilderClientRunContext(object):
     def __init__(self) -> None:
         """
@@ -38,8 +127,97 @@ class AppBuilderClientRunContext(object):
 
 
 class AppBuilderEventHandler(object):
-    def __init__(self):
-        pass
+    # 子类未调用父类__init__时使用的默认值
+    _tool_registry = {}
+    max_tool_workers = None
+
+    def __init__(self, local_tools=None, tool_timeout: float = None, max_tool_workers: int = None):
+        """
+        初始化事件处理器。
+
+        Args:
+            local_tools (dict | list, optional): 本地工具，工具名到函数或Component的映射，也可以是函数或Component的列表，
+                此时函数使用函数名、Component使用manifests中的name作为工具名。注册后，interrupt默认并发执行所有工具调用。
+            tool_timeout (float, optional): 每个工具调用的超时时间，单位秒，默认为None，不限制。
+            max_tool_workers (int, optional): 并发执行工具调用的最大线程数，默认为None，即一次中断内的所有工具调用同时执行。
+
+        Returns:
+            None
+
+        """
+        self._tool_registry = _build_tool_registry(local_tools, tool_timeout)
+        self.max_tool_workers = max_tool_workers
+
+    def register_tool(self, name, tool, timeout: float = None):
+        """
+        注册本地工具。
+
+        Args:
+            name (str): 工具名，与应用中配置的工具名称一致。
+            tool (callable | Component): 工具函数或组件，函数以工具调用参数作为关键字参数调用，组件调用tool_eval。
+            timeout (float, optional): 该工具的超时时间，单位秒，默认为None，不限制。
+
+        Returns:
+            None
+
+        """
+        self._tool_registry = dict(self._tool_registry)
+        self._tool_registry[name] = (tool, timeout)
+
+    def run_tool_calls(self, tool_calls) -> list:
+        """
+        在线程池中并发执行一次中断中的所有工具调用。
+
+        工具执行出错、超时或未注册时，对应的ToolOutput为错误信息，由应用继续处理。超时从所有工具调用开始执行时计时，
+        超时的工具不会被强制终止，但不再等待其结果。
+
+        Args:
+            tool_calls (list[ToolCall]): 中断事件中的工具调用列表，即run_context.current_tool_calls。
+
+        Returns:
+            list[ToolOutput]: 与tool_calls顺序一致的工具输出列表，可直接作为interrupt的返回值一次性提交。
+
+        """
+        if not tool_calls:
+            return []
+        outputs = [None] * len(tool_calls)
+        pending = []
+        for index, tool_call in enumerate(tool_calls):
+            if tool_call.function.name not in self._tool_registry:
+                outputs[index] = _tool_error_output(
+                    tool_call, "tool {} is not registered".format(tool_call.function.name))
+            else:
+                pending.append(index)
+        if not pending:
+            return outputs
+
+        workers = min(len(pending), self.max_tool_workers or len(pending))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="appbuilder_tool")
+        try:
+            start = time.monotonic()
+            futures = {}
+            for index in pending:
+                tool_call = tool_calls[index]
+                tool, _ = self._tool_registry[tool_call.function.name]
+                # 每个任务复制调用方的上下文，保证trace等上下文变量在工作线程中可见
+                futures[index] = executor.submit(
+                    contextvars.copy_context().run, _call_tool, tool, tool_call.function.arguments)
+            for index in pending:
+                tool_call = tool_calls[index]
+                _, timeout = self._tool_registry[tool_call.function.name]
+                remaining = None if timeout is None else max(0, start + timeout - time.monotonic())
+                try:
+                    result = futures[index].result(timeout=remaining)
+                    outputs[index] = data_class.ToolOutput(tool_call_id=tool_call.id, output=_tool_output_text(result))
+                except FutureTimeoutError:
+                    outputs[index] = _tool_error_output(
+                        tool_call, "tool {} timed out after {}s".format(tool_call.function.name, timeout))
+                except Exception as e:
+                    outputs[index] = _tool_error_output(
+                        tool_call, "tool {} failed: {}".format(tool_call.function.name, e))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return outputs
 
     def init(
         self,
@@ -407,8 +585,9 @@ class AppBuilderEventHandler(object):
         pass
 
     def interrupt(self, run_context, run_response):
-        # 用户可重载该方法，当event_status为interrupt时，会调用该方法
-        pass
+        # 用户可重载该方法，当event_status为interrupt时，会调用该方法；注册了本地工具时默认并发执行所有工具调用
+        if self._tool_registry:
+            return self.run_tool_calls(run_context.current_tool_calls)
 
     def preparing(self, run_context, run_response):
         # 用户可重载该方法，当event_status为preparing时，会调用该方法
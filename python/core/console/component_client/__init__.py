@@ -12,4 +12,5 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .component_client import ComponentClient
\ No newline at end of file
+from .component_client import ComponentClient
+from .async_component_client import AsyncComponentClient
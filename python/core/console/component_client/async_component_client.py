@@ -0,0 +1,79 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""异步组件"""
+from appbuilder.core.component import Component, Message
+from appbuilder.core.console.component_client.component_client import ComponentClient
+from appbuilder.utils.sse_util import AsyncSSEClient
+
+
+class AsyncComponentClient(Component):
+    def __init__(self, **kwargs):
+        r"""初始化
+
+        Returns:
+            response (obj: `AsyncComponentClient`): 组件实例
+        """
+        super().__init__(is_aysnc=True, **kwargs)
+
+    async def run(
+        self,
+        component_id: str,
+        sys_origin_query: str,
+        version: str = None,
+        action: str = None,
+        stream: bool = False,
+        sys_file_urls: dict = None,
+        sys_conversation_id: str = None,
+        sys_end_user_id: str = None,
+        sys_chat_history: list = None,
+        **kwargs,
+    ) -> Message:
+        """ 异步运行组件
+        Args:
+            component_id (str): 组件ID
+            sys_origin_query (str): 用户输入的原始查询语句
+            version (str): 组件版本号
+            action (str): 组件动作
+            stream (bool): 是否流式返回，为True时message.content为异步生成器，使用async for逐个获取RunResponse
+            sys_file_urls (dict): 文件地址
+            sys_conversation_id (str): 会话ID
+            sys_end_user_id (str): 用户ID
+            sys_chat_history (list): 聊天
+            kwargs: 其他参数
+        Returns:
+            message (Message): 对话结果，一个Message对象，使用message.content获取内容。
+        """
+        url, headers, body = ComponentClient._build_run_request(
+            self.http_client, component_id, sys_origin_query, version, action, stream,
+            sys_file_urls, sys_conversation_id, sys_end_user_id, sys_chat_history, **kwargs
+        )
+        response = await self.http_client.session.post(
+            url, headers=headers, json=body, timeout=None
+        )
+        await self.http_client.check_response_header(response)
+        request_id = await self.http_client.response_request_id(response)
+
+        if stream:
+            client = AsyncSSEClient(response)
+            return Message(content=self._iterate_events(request_id, client.events()))
+        else:
+            data = await response.json()
+            resp = ComponentClient._to_response(request_id, data)
+            return Message(content=resp)
+
+    @staticmethod
+    async def _iterate_events(request_id, events):
+        async for event in events:
+            yield ComponentClient._parse_event(request_id, event)
@@ -20,6 +20,7 @@ from appbuilder.core._exception import AppBuilderServerException
 from appbuilder.utils.logger_util import logger
 from appbuilder.utils.trace.tracer_wrapper import client_run_trace
 from appbuilder.utils.sse_util import SSEClient
+from appbuilder.utils import json_util
 
 
 class ComponentClient(Component):
@@ -60,7 +61,44 @@ class ComponentClient(Component):
         Returns:
             message (Message): 对话结果，一个Message对象，使用message.content获取内容。
         """
-        headers = self.http_client.auth_header_v2()
+        url, headers, body = self._build_run_request(
+            self.http_client, component_id, sys_origin_query, version, action, stream,
+            sys_file_urls, sys_conversation_id, sys_end_user_id, sys_chat_history, **kwargs
+        )
+        # 始终以stream=True发送请求，流式返回时逐个事件解析，而不是等待服务端返回全部内容
+        response = self.http_client.session.post(
+            url,
+            headers=headers,
+            json=body,
+            timeout=None,
+            stream=True,
+        )
+        self.http_client.check_response_header(response)
+        request_id = self.http_client.response_request_id(response)
+
+        if stream:
+            client = SSEClient(response)
+            return Message(content=self._iterate_events(request_id, client.events()))
+        else:
+            data = response.json()
+            resp = self._to_response(request_id, data)
+            return Message(content=resp)
+
+    @staticmethod
+    def _build_run_request(
+        http_client,
+        component_id: str,
+        sys_origin_query: str,
+        version: str = None,
+        action: str = None,
+        stream: bool = False,
+        sys_file_urls: dict = None,
+        sys_conversation_id: str = None,
+        sys_end_user_id: str = None,
+        sys_chat_history: list = None,
+        **kwargs,
+    ):
+        headers = http_client.auth_header_v2()
         headers["Content-Type"] = "application/json"
 
         url_suffix = f"/components/{component_id}"
@@ -68,7 +106,7 @@ class ComponentClient(Component):
             url_suffix += f"/version/{version}"
         if action is not None:
             url_suffix += f"?action={action}"
-        url = self.http_client.service_url_v2(url_suffix)
+        url = http_client.service_url_v2(url_suffix)
 
         all_params = {
             '_sys_origin_query': sys_origin_query,
@@ -83,35 +121,30 @@ class ComponentClient(Component):
             stream=stream,
             parameters=parameters,
         )
+        return url, headers, request.model_dump(exclude_none=True, by_alias=True)
 
-        response = self.http_client.session.post(
-            url,
-            headers=headers,
-            json=request.model_dump(exclude_none=True, by_alias=True),
-            timeout=None,
-        )
-        request_id = self.http_client.check_response_header(response)
+    @staticmethod
+    def _to_response(request_id, data) -> data_class.RunResponse:
+        resp = data_class.RunResponse(**data)
+        if not resp.request_id:
+            resp.request_id = request_id
+        return resp
 
-        if stream:
-            client = SSEClient(response)
-            return Message(content=self._iterate_events(request_id, client.events()))
-        else:
-            data = response.json()
-            resp = data_class.RunResponse(**data)
-            return Message(content=resp)
+    @staticmethod
+    def _parse_event(request_id, event) -> data_class.RunResponse:
+        try:
+            data = event.data
+            if len(data) == 0:
+                data = event.raw
+            data = json_util.loads(data)
+        except json.JSONDecodeError as e:
+            raise AppBuilderServerException(
+                request_id=request_id,
+                message="json decoder failed {}".format(str(e)),
+            )
+        return ComponentClient._to_response(request_id, data)
 
     @staticmethod
     def _iterate_events(request_id, events):
         for event in events:
-            try:
-                data = event.data
-                if len(data) == 0:
-                    data = event.raw
-                data = json.loads(data)
-            except json.JSONDecodeError as e:
-                raise AppBuilderServerException(
-                    request_id=request_id,
-                    message="json decoder failed {}".format(str(e)),
-                )
-            resp = data_class.RunResponse(**data)
-            yield resp
+            yield ComponentClient._parse_event(request_id, event)
@@ -1,5 +1,6 @@
 from typing import List, Dict
 from appbuilder.core._client import HTTPClient
+from appbuilder.core._multipart import MultipartEncoder
 from appbuilder.core.console.dataset.model import DocumentListResponse, AddDocumentsResponse
 from appbuilder.core.constants import MAX_DOCUMENTS_NUM, SUPPORTED_FILE_TYPE
 import json
@@ -145,13 +146,13 @@ class Dataset:
             上传文档的信息
         """
         headers = self.http_client.auth_header()
-        with open(file_path, 'rb') as file:
-            files = {'file': (os.path.basename(file_path), file)}
-            response = self.http_client.session.post(url=self.http_client.service_url(self.upload_file_url),
-                                                     files=files, headers=headers)
-            self.http_client.check_response_header(response)
-            self.http_client.check_console_response(response)
-            res = response.json()["result"]
+        files = MultipartEncoder(fields=[('file', (os.path.basename(file_path), file_path))])
+        headers.update(files.headers)
+        response = self.http_client.session.post(url=self.http_client.service_url(self.upload_file_url),
+                                                 data=files, headers=headers)
+        self.http_client.check_response_header(response)
+        self.http_client.check_console_response(response)
+        res = response.json()["result"]
         return res
 
     @deprecated()
@@ -15,8 +15,10 @@
 import os
 import json
 import uuid
-from typing import Optional
+from typing import Iterator, Optional
 from appbuilder.core._client import HTTPClient
+from appbuilder.core._multipart import MultipartEncoder
+from appbuilder.core._paginator import Paginator
 from appbuilder.core.console.knowledge_base import data_class
 from appbuilder.core.component import Message, Component
 from appbuilder.utils.func_utils import deprecated
@@ -90,7 +92,7 @@ class KnowledgeBase(Component):
 
     @deprecated()
     def upload_file(
-        self, file_path: str, client_token: str = None
+        self, file_path: str, client_token: str = None, progress_callback=None
     ) -> data_class.KnowledgeBaseUploadFileResponse:
         r"""
         上传文件到知识库
@@ -98,6 +100,7 @@ class KnowledgeBase(Component):
         Args:
             file_path (str): 文件路径
             client_token (str, optional): 客户端令牌。默认为None，此时会自动生成一个随机UUID作为客户端令牌。
+            progress_callback (Callable[[int, int], None], optional): 上传进度回调，参数为已上传字节数与总字节数。默认为None。
 
         Returns:
             KnowledgeBaseUploadFileResponse: 返回一个KnowledgeBaseUploadFileResponse对象，包含以下属性：
@@ -113,19 +116,21 @@ class KnowledgeBase(Component):
             client_token = str(uuid.uuid4())
         url = self.http_client.service_url_v2("/file", client_token=client_token)
 
-        with open(file_path, "rb") as f:
-            multipart_form_data = {"file": (os.path.basename(file_path), f)}
-
-            response = self.http_client.session.post(
-                url=url,
-                headers=headers,
-                files=multipart_form_data,
-            )
+        multipart_form_data = MultipartEncoder(
+            fields=[("file", (os.path.basename(file_path), file_path))],
+            progress_callback=progress_callback,
+        )
+        headers.update(multipart_form_data.headers)
+        response = self.http_client.session.post(
+            url=url,
+            headers=headers,
+            data=multipart_form_data,
+        )
 
-            self.http_client.check_response_header(response)
-            self.http_client.check_console_response(response)
-            data = response.json()
-            resp = data_class.KnowledgeBaseUploadFileResponse(**data)
+        self.http_client.check_response_header(response)
+        self.http_client.check_console_response(response)
+        data = response.json()
+        resp = data_class.KnowledgeBaseUploadFileResponse(**data)
 
         return resp
 
@@ -591,6 +596,7 @@ class KnowledgeBase(Component):
         id: Optional[str] = None,
         processOption: data_class.DocumentProcessOption = None,
         client_token: str = None,
+        progress_callback=None,
     ) -> data_class.KnowledgeBaseUploadDocumentsResponse:
         r"""
         上传文档
@@ -601,6 +607,7 @@ class KnowledgeBase(Component):
             id (Optional[str], optional): 知识库ID，如果不指定则使用当前实例的knowledge_id属性。默认值为None。
             processOption (data_class.DocumentProcessOption, optional): 文档处理选项。默认值为None。
             client_token (str, optional): 客户端令牌。默认为None，此时会自动生成一个随机UUID作为客户端令牌。
+            progress_callback (Callable[[int, int], None], optional): 上传进度回调，参数为已上传字节数与总字节数。默认为None。
 
         Returns:
             KnowledgeBaseUploadDocumentsResponse: 创建知识库文档的响应消息，返回一个KnowledgeBaseUploadDocumentsResponse对象，包含以下属性：
@@ -617,31 +624,31 @@ class KnowledgeBase(Component):
             "/knowledgeBase?Action=UploadDocuments", client_token=client_token
         )
 
-        with open(file_path, "rb") as f:
-            multipart_form_data = {"file": (os.path.basename(file_path), f)}
-
-            request = data_class.KnowledgeBaseCreateDocumentsRequest(
-                id=id or self.knowledge_id,
-                source=data_class.DocumentSource(type="file"),
-                contentFormat=content_format,
-                processOption=processOption,
-            )
-
-            data = {
-                "payload": request.model_dump_json(exclude_none=True),
-            }
+        request = data_class.KnowledgeBaseCreateDocumentsRequest(
+            id=id or self.knowledge_id,
+            source=data_class.DocumentSource(type="file"),
+            contentFormat=content_format,
+            processOption=processOption,
+        )
 
-            response = self.http_client.session.post(
-                url=url,
-                headers=headers,
-                data=data,
-                files=multipart_form_data,
-            )
+        multipart_form_data = MultipartEncoder(
+            fields=[
+                ("payload", request.model_dump_json(exclude_none=True)),
+                ("file", (os.path.basename(file_path), file_path)),
+            ],
+            progress_callback=progress_callback,
+        )
+        headers.update(multipart_form_data.headers)
+        response = self.http_client.session.post(
+            url=url,
+            headers=headers,
+            data=multipart_form_data,
+        )
 
-            self.http_client.check_response_header(response)
-            self.http_client.check_console_response(response)
-            data = response.json()
-            resp = data_class.KnowledgeBaseUploadDocumentsResponse(**data)
+        self.http_client.check_response_header(response)
+        self.http_client.check_console_response(response)
+        data = response.json()
+        resp = data_class.KnowledgeBaseUploadDocumentsResponse(**data)
 
         return resp
 
@@ -872,15 +879,19 @@ class KnowledgeBase(Component):
         resp = data_class.DescribeChunksResponse(**data)
         return resp
 
-    def get_all_documents(self, knowledge_base_id: Optional[str] = None) -> list:
+    def iter_documents(
+        self, knowledge_base_id: Optional[str] = None, page_size: int = 100, prefetch: bool = True
+    ) -> Iterator[data_class.Document]:
         """
-        获取知识库中所有文档。
+        惰性遍历知识库中的文档，逐页调用get_documents_list，并在后台预取下一页。
 
         Args:
             knowledge_base_id (Optional[str], optional): 知识库的ID。如果为None，则使用当前实例的knowledge_id。默认为None。
+            page_size (int, optional): 每页请求的文档数，默认为100。
+            prefetch (bool, optional): 是否在后台预取下一页，默认为True。
 
         Returns:
-            list: 包含所有文档的列表。
+            Iterator[Document]: 逐个产出文档的生成器。
 
         Raises:
             ValueError: 如果knowledge_base_id为空，且当前实例没有已创建的knowledge_id时抛出。
@@ -891,23 +902,28 @@ class KnowledgeBase(Component):
                 "knowledge_base_id cannot be empty, please call `create` first or use existing one"
             )
         knowledge_base_id = knowledge_base_id or self.knowledge_id
-        doc_list = []
-        response_per_time = self.get_documents_list(
-            knowledge_base_id=knowledge_base_id, limit=100
-        )
-        list_len_per_time = len(response_per_time.data)
-        if list_len_per_time != 0:
-            doc_list.extend(response_per_time.data)
-        while list_len_per_time == 100:
-            after_id = response_per_time.data[-1].id
-            response_per_time = self.get_documents_list(
-                knowledge_base_id=knowledge_base_id, after=after_id, limit=100
-            )
-            list_len_per_time = len(response_per_time.data)
-            if list_len_per_time != 0:
-                doc_list.extend(response_per_time.data)
 
-        return doc_list
+        def fetch(after):
+            return self.get_documents_list(
+                knowledge_base_id=knowledge_base_id, after=after or "", limit=page_size
+            ).data
+
+        return iter(Paginator(fetch, page_size=page_size, prefetch=prefetch))
+
+    def get_all_documents(self, knowledge_base_id: Optional[str] = None) -> list:
+        """
+        获取知识库中所有文档。
+
+        Args:
+            knowledge_base_id (Optional[str], optional): 知识库的ID。如果为None，则使用当前实例的knowledge_id。默认为None。
+
+        Returns:
+            list: 包含所有文档的列表。
+
+        Raises:
+            ValueError: 如果knowledge_base_id为空，且当前实例没有已创建的knowledge_id时抛出。
+        """
+        return list(self.iter_documents(knowledge_base_id))
 
     def query_knowledge_base(
         self,
@@ -21,5 +21,21 @@ GATEWAY_URL_V2 = "https://qianfan.baidubce.com"
 CONSOLE_OPENAPI_VERSION = "/v2"
 CONSOLE_OPENAPI_PREFIX = ""
 
+# 进程级共享HTTP连接池的默认配置
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 32
+HTTP_POOL_BLOCK = False
+
+# 异步客户端共享TCPConnector的默认配置
+HTTP_ASYNC_LIMIT = 100
+HTTP_ASYNC_LIMIT_PER_HOST = 0
+HTTP_KEEPALIVE_TIMEOUT = 15
+HTTP_DNS_CACHE_TTL = 60
+
+# HTTP传输层实现，可选 requests(默认) / httpx(支持HTTP/2多路复用，需安装httpx[http2])
+HTTP_TRANSPORT_REQUESTS = "requests"
+HTTP_TRANSPORT_HTTPX = "httpx"
+HTTP_TRANSPORT = HTTP_TRANSPORT_REQUESTS
+
 MAX_DOCUMENTS_NUM = 800
 SUPPORTED_FILE_TYPE = ["txt", "pdf", "doc", "docx"]
@@ -0,0 +1,355 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Small DAG executor for chaining component calls with concurrency and speculation"""
+
+import time
+import asyncio
+import inspect
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Sequence
+
+from appbuilder.utils.logger_util import logger
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_SKIPPED = "skipped"
+STATUS_CANCELLED = "cancelled"
+
+_SETTLED = (STATUS_DONE, STATUS_SKIPPED, STATUS_CANCELLED)
+
+
+class Stage:
+    r"""流水线中的一个阶段，由Pipeline.add_stage创建"""
+
+    def __init__(self, name: str, func: Callable, inputs: Sequence[str] = (),
+                 when: Optional[Callable[[dict], bool]] = None, when_inputs: Sequence[str] = (),
+                 speculative: bool = False):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.when = when
+        self.when_inputs = tuple(when_inputs)
+        self.speculative = speculative
+
+
+class StageRecord:
+    r"""一个阶段的执行记录，start与end为相对流水线开始的秒数，未启动的阶段为None"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.status = STATUS_PENDING
+        self.start = None
+        self.end = None
+
+    @property
+    def latency(self) -> Optional[float]:
+        r"""阶段耗时(秒)，未启动的阶段为None"""
+        if self.start is None or self.end is None:
+            return None
+        return self.end - self.start
+
+    def __repr__(self):
+        return "StageRecord(name={!r}, status={!r}, start={!r}, end={!r})".format(
+            self.name, self.status, self.start, self.end)
+
+
+class PipelineResult:
+    r"""流水线的运行结果.
+
+    属性:
+        outputs(dict): run传入的初始输入与所有完成阶段的输出，被跳过或取消的阶段不在其中。
+        records(Dict[str, StageRecord]): 各阶段的执行记录，按添加顺序排列。
+        elapsed(float): 流水线总耗时(秒)。
+    """
+
+    def __init__(self, outputs: dict, records: Dict[str, StageRecord], elapsed: float):
+        self.outputs = outputs
+        self.records = records
+        self.elapsed = elapsed
+
+    @property
+    def latency(self) -> Dict[str, float]:
+        r"""已完成阶段的耗时(秒)"""
+        return {name: record.latency for name, record in self.records.items() if record.status == STATUS_DONE}
+
+    def __getitem__(self, name: str):
+        return self.outputs[name]
+
+    def __repr__(self):
+        return "PipelineResult(elapsed={:.3f}, stages={})".format(
+            self.elapsed, {name: record.status for name, record in self.records.items()})
+
+
+class _PipelineRun:
+    r"""一次运行的调度状态，同步与异步驱动共用，只在驱动所在的线程中访问"""
+
+    def __init__(self, stages: List[Stage], inputs: dict):
+        self.stages = stages
+        self.outputs = dict(inputs)
+        self.records = {stage.name: StageRecord(stage.name) for stage in stages}
+        # 已判定when为真的阶段
+        self.confirmed = set()
+        # 提前完成、等待when判定的推测阶段: name -> (output, exception)
+        self.held = {}
+        self.started = time.monotonic()
+
+    def _now(self) -> float:
+        return time.monotonic() - self.started
+
+    def _settled(self, name: str) -> bool:
+        record = self.records.get(name)
+        return record is None or record.status in _SETTLED
+
+    def _finish(self, stage: Stage, status: str, output=None):
+        record = self.records[stage.name]
+        record.status = status
+        if record.end is None:
+            record.end = self._now()
+        if status == STATUS_DONE:
+            self.outputs[stage.name] = output
+        logger.debug("pipeline stage %s %s, latency=%s", stage.name, status, record.latency)
+
+    def advance(self):
+        r"""推进调度直到状态不再变化，返回需要启动与需要取消的阶段"""
+        launch, cancel = [], []
+        changed = True
+        while changed:
+            changed = False
+            for stage in self.stages:
+                record = self.records[stage.name]
+                if record.status in _SETTLED:
+                    continue
+                if (stage.when is not None and stage.name not in self.confirmed
+                        and all(self._settled(name) for name in stage.when_inputs)):
+                    if stage.when(dict(self.outputs)):
+                        self.confirmed.add(stage.name)
+                        if stage.name in self.held:
+                            output, exc = self.held.pop(stage.name)
+                            if exc is not None:
+                                raise exc
+                            self._finish(stage, STATUS_DONE, output)
+                    elif record.status == STATUS_PENDING:
+                        self._finish(stage, STATUS_SKIPPED)
+                    else:
+                        # 推测执行的阶段未被选中，丢弃其结果
+                        self.held.pop(stage.name, None)
+                        self._finish(stage, STATUS_CANCELLED)
+                        cancel.append(stage)
+                    changed = True
+                    continue
+                if record.status == STATUS_PENDING and all(self._settled(name) for name in stage.inputs) and (
+                        stage.when is None or stage.speculative or stage.name in self.confirmed):
+                    record.status = STATUS_RUNNING
+                    record.start = self._now()
+                    launch.append(stage)
+                    changed = True
+        return launch, cancel
+
+    def complete(self, stage: Stage, output=None, exc: Optional[BaseException] = None):
+        r"""记录阶段运行结束，推测阶段在when判定前暂存结果"""
+        record = self.records[stage.name]
+        if record.status != STATUS_RUNNING:
+            return
+        if stage.when is not None and stage.name not in self.confirmed:
+            record.end = self._now()
+            self.held[stage.name] = (output, exc)
+            return
+        if exc is not None:
+            raise exc
+        self._finish(stage, STATUS_DONE, output)
+
+    def snapshot(self) -> dict:
+        return dict(self.outputs)
+
+    def result(self) -> PipelineResult:
+        return PipelineResult(self.outputs, self.records, self._now())
+
+
+class Pipeline:
+    r"""组件调用的DAG执行器：互不依赖的阶段并发执行，可推测执行的阶段提前启动，未被选中时取消.
+
+    每个阶段是一个接收当前已完成输出(dict)的函数，返回值以阶段名记入输出。阶段在inputs列出的阶段全部
+    结束(完成、跳过或取消)后启动；设置when时，when在when_inputs全部结束后以当前输出为参数判定是否需要该阶段。
+    speculative为False时等待判定为真再启动，为True时不等判定即与when_inputs并行启动，判定为假则取消，
+    判定为真则其结果生效。端到端耗时由此接近最慢的一条依赖链，而不是各阶段耗时之和。
+
+    同步run在线程池中执行阶段，无法中断已在运行的线程，取消的阶段不再等待其结束并丢弃结果；
+    异步arun中async def阶段以Task运行，取消时会中断其网络请求。
+    阶段只能依赖先添加的阶段或run的初始输入，因此不会成环。任一生效阶段抛出的异常会取消其余阶段并向上抛出。
+
+    Examples:
+
+    .. code-block:: python
+
+        import appbuilder
+
+        is_complex = appbuilder.IsComplexQuery(model="Qianfan-Agent-Speed-8k")
+        decomposition = appbuilder.QueryDecomposition(model="Qianfan-Agent-Speed-8k")
+        rewrite = appbuilder.QueryRewrite(model="Qianfan-Agent-Speed-8k")
+
+        pipeline = appbuilder.Pipeline()
+        pipeline.add_stage("complex", lambda o: is_complex.run(appbuilder.Message(o["query"])).content,
+                           inputs=["query"])
+        # 与复杂度判断并行启动，判定结果出来后只保留其中一个
+        pipeline.add_stage("decompose", lambda o: decomposition.run(appbuilder.Message(o["query"])).content,
+                           inputs=["query"], when=lambda o: "类型：复杂问题" in o["complex"], when_inputs=["complex"],
+                           speculative=True)
+        pipeline.add_stage("rewrite", lambda o: rewrite.run(appbuilder.Message([o["query"]])).content,
+                           inputs=["query"], when=lambda o: "类型：复杂问题" not in o["complex"], when_inputs=["complex"],
+                           speculative=True)
+        result = pipeline.run(query="吸塑包装盒在工业化生产和物流运输中分别有什么重要性？")
+        print(result.outputs, result.latency)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        r"""Pipeline初始化方法.
+
+        参数:
+            max_workers(int, 可选): 同步阶段使用的线程数上限，默认为阶段数。
+        返回：
+            无
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be positive, got {}".format(max_workers))
+        self.max_workers = max_workers
+        self._stages = []
+        # 每个阶段添加时已存在的阶段名，用于检查依赖只指向先添加的阶段
+        self._known = []
+
+    @property
+    def stages(self) -> List[Stage]:
+        return list(self._stages)
+
+    def add_stage(self, name: str, func: Callable[[dict], object], inputs: Sequence[str] = (),
+                  when: Optional[Callable[[dict], bool]] = None, when_inputs: Sequence[str] = (),
+                  speculative: bool = False) -> "Pipeline":
+        r"""添加一个阶段.
+
+        参数:
+            name(str): 阶段名，其输出以此为键，不能与其他阶段或初始输入重名。
+            func(Callable[[dict], object]): 阶段函数，参数为启动时已完成输出的副本；arun中可以是async def函数。
+            inputs(Sequence[str], 可选): 启动前需要结束的阶段或初始输入。
+            when(Callable[[dict], bool], 可选): 判定是否需要该阶段，为假时跳过或取消该阶段。
+            when_inputs(Sequence[str], 可选): when判定前需要结束的阶段。
+            speculative(bool, 可选): 是否不等when判定即启动，默认为False。
+        返回：
+            Pipeline: 当前实例，便于链式调用。
+        """
+        if any(stage.name == name for stage in self._stages):
+            raise ValueError("duplicate pipeline stage: {}".format(name))
+        if when is None and (when_inputs or speculative):
+            raise ValueError("stage {} sets when_inputs or speculative without when".format(name))
+        self._stages.append(Stage(name, func, inputs, when, when_inputs, speculative))
+        self._known.append(frozenset(stage.name for stage in self._stages[:-1]))
+        return self
+
+    def _start(self, inputs: dict) -> _PipelineRun:
+        names = {stage.name for stage in self._stages}
+        for stage, known in zip(self._stages, self._known):
+            for name in stage.inputs + stage.when_inputs:
+                if name in names and name not in known:
+                    raise ValueError("stage {} depends on later stage {}".format(stage.name, name))
+                if name not in names and name not in inputs:
+                    raise ValueError("stage {} depends on unknown input {}".format(stage.name, name))
+        conflict = names.intersection(inputs)
+        if conflict:
+            raise ValueError("pipeline inputs conflict with stage names: {}".format(sorted(conflict)))
+        return _PipelineRun(self._stages, inputs)
+
+    def run(self, **inputs) -> PipelineResult:
+        r"""在线程池中运行流水线.
+
+        参数:
+            **inputs: 初始输入，阶段通过inputs引用。
+        返回：
+            PipelineResult: 各阶段输出与耗时。
+        """
+        state = self._start(inputs)
+        for stage in self._stages:
+            if inspect.iscoroutinefunction(stage.func):
+                raise TypeError("stage {} is a coroutine function, use arun instead".format(stage.name))
+        executor = ThreadPoolExecutor(max_workers=self.max_workers or max(len(self._stages), 1))
+        running = {}
+        try:
+            while True:
+                launch, cancel = state.advance()
+                for stage in cancel:
+                    for future, running_stage in list(running.items()):
+                        if running_stage is stage:
+                            future.cancel()
+                            del running[future]
+                for stage in launch:
+                    # 复制调用方的上下文，保证trace等上下文变量在工作线程中可见
+                    future = executor.submit(contextvars.copy_context().run, stage.func, state.snapshot())
+                    running[future] = stage
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    exc = future.exception()
+                    state.complete(stage, None if exc is not None else future.result(), exc)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return state.result()
+
+    async def arun(self, **inputs) -> PipelineResult:
+        r"""在当前事件循环中运行流水线，async def阶段以Task运行，其余阶段在线程池中运行.
+
+        参数:
+            **inputs: 初始输入，阶段通过inputs引用。
+        返回：
+            PipelineResult: 各阶段输出与耗时。
+        """
+        state = self._start(inputs)
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers or max(len(self._stages), 1))
+
+        async def call(stage, outputs):
+            if inspect.iscoroutinefunction(stage.func):
+                return await stage.func(outputs)
+            output = await loop.run_in_executor(executor, contextvars.copy_context().run, stage.func, outputs)
+            if inspect.isawaitable(output):
+                output = await output
+            return output
+
+        running, cancelled = {}, []
+        try:
+            while True:
+                launch, cancel = state.advance()
+                for stage in cancel:
+                    for task, running_stage in list(running.items()):
+                        if running_stage is stage:
+                            task.cancel()
+                            cancelled.append(task)
+                            del running[task]
+                for stage in launch:
+                    running[asyncio.ensure_future(call(stage, state.snapshot()))] = stage
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    stage = running.pop(task)
+                    exc = task.exception()
+                    state.complete(stage, None if exc is not None else task.result(), exc)
+        finally:
+            for task in running:
+                task.cancel()
+            # 等待取消完成，避免事件循环关闭时仍有未结束的Task
+            await asyncio.gather(*cancelled, *running, return_exceptions=True)
+            executor.shutdown(wait=False, cancel_futures=True)
+        return state.result()
@@ -13,13 +13,18 @@
 # limitations under the License.
 import time
 import itertools
-from typing import List
+import threading
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse, unquote
 from appbuilder.core._client import HTTPClient
 from appbuilder.core._exception import TypeNotSupportedException, ModelNotSupportedException
 from appbuilder.utils.model_util import GetModelListRequest, Models, RemoteModelCollector
+from appbuilder.utils.logger_util import logger
 from functools import lru_cache
 
+# 模型目录的默认有效期，单位秒
+DEFAULT_MODEL_CATALOG_TTL = 3600
+
 
 def utils_get_user_agent():
     return 'appbuilder-sdk-python/{}'.format("__version__")
@@ -105,34 +110,149 @@ def ttl_lru_cache(seconds_to_live: int, maxsize: int = 128):
 class ModelInfo:
     """ 模型信息类 """
 
-    def __init__(self, client: HTTPClient):
-        """根据模型名称获取并初始化模型信息"""
+    def __init__(self, client: HTTPClient, model_list: Optional[list] = None):
+        """根据模型名称获取并初始化模型信息
+
+        参数:
+            client(HTTPClient): 用于拉取模型列表与转换模型url的客户端。
+            model_list(list, 可选): 模型列表，为None时通过client拉取。
+        """
         self.client = client
-        response = Models(client).list()
-        self.model_list = [*response.result.common, *response.result.custom]
+        if model_list is None:
+            response = Models(client).list()
+            model_list = [*response.result.common, *response.result.custom]
+        self.model_list = model_list
+        # 同名模型以列表中第一个为准，与线性查找的结果一致
+        self._models = {}
+        for model in self.model_list:
+            self._models.setdefault(model.name, model)
+        self._urls = {}
+
+    def _get_model(self, model_name: str):
+        origin_name = RemoteModelCollector().get_remote_name_by_short_name(model_name) or model_name
+        model = self._models.get(origin_name)
+        if model is None:
+            raise ModelNotSupportedException(f"Model[{model_name}] not available! "
+                                             f"You can query available models through: appbuilder.get_model_list()")
+        return model
 
     def get_model_url(self, model_name: str) -> str:
         """获取模型在工作台网关的请求url"""
-        short_name = model_name
-        remote_model_name_collector = RemoteModelCollector()
-        origin_name = remote_model_name_collector.get_remote_name_by_short_name(short_name)
-        if not origin_name:
-            origin_name = short_name
-        for model in self.model_list:
-            if model.name == origin_name:
-                return convert_cloudhub_url(self.client, model.url)
-        raise ModelNotSupportedException(f"Model[{model_name}] not available! "
-                                         f"You can query available models through: appbuilder.get_model_list()")
+        model = self._get_model(model_name)
+        url = self._urls.get(model.name)
+        if url is None:
+            url = self._urls[model.name] = convert_cloudhub_url(self.client, model.url)
+        return url
 
     def get_model_type(self, model_name: str) -> str:
         """获取模型类型"""
-        short_name = model_name
-        remote_model_name_collector = RemoteModelCollector()
-        origin_name = remote_model_name_collector.get_remote_name_by_short_name(short_name)
-        if not origin_name:
-            origin_name = short_name
-        for model in self.model_list:
-            if model.name == origin_name:
-                return model.apiType
-        raise ModelNotSupportedException(f"Model[{model_name}] not available! "
-                                         f"You can query available models through: appbuilder.get_model_list()")
+        return self._get_model(model_name).apiType
+
+
+class ModelCatalog:
+    r"""进程级模型目录，按(secret_key, gateway)缓存ModelInfo，供所有组件实例共享。
+
+    同一密钥与网关只拉取一次模型列表；缓存超过ttl的refresh_ratio后，下一次读取在后台线程中刷新并继续返回当前目录，
+    刷新失败时保留旧目录；超过ttl未刷新的目录在读取时同步重新拉取。目录只保存密钥、网关与模型列表，不引用组件实例。
+
+    Examples:
+
+    .. code-block:: python
+
+        from appbuilder.core.utils import model_catalog
+
+        model_info = model_catalog.get(component.http_client)
+        print(model_info.get_model_url("ERNIE-4.0-8K"))
+    """
+
+    def __init__(self, ttl: float = DEFAULT_MODEL_CATALOG_TTL, refresh_ratio: float = 0.8):
+        r"""ModelCatalog初始化方法.
+
+        参数:
+            ttl(float, 可选): 模型目录有效期，单位秒，默认为1小时。
+            refresh_ratio(float, 可选): 缓存时间达到ttl的该比例后在后台刷新，默认为0.8。
+        返回：
+            无
+        """
+        self.ttl = ttl
+        self.refresh_ratio = refresh_ratio
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._fetch_locks = {}
+        self._refreshing = set()
+
+    @staticmethod
+    def _key(client) -> Tuple[str, str]:
+        return client.secret_key, client.gateway
+
+    def _fetch(self, key: Tuple[str, str]) -> ModelInfo:
+        secret_key, gateway = key
+        model_info = ModelInfo(HTTPClient(secret_key=secret_key, gateway=gateway))
+        with self._lock:
+            self._entries[key] = (time.monotonic(), model_info)
+        return model_info
+
+    def _refresh(self, key: Tuple[str, str]):
+        try:
+            self._fetch(key)
+        except Exception as e:
+            logger.warning("Failed to refresh model catalog, keep the cached one: %s", e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get(self, client) -> ModelInfo:
+        r"""返回client所用密钥与网关对应的模型目录.
+
+        参数:
+            client(HTTPClient | AsyncHTTPClient): 提供secret_key与gateway的客户端。
+        返回：
+            ModelInfo: 模型目录，支持按模型名查询url与类型。
+        """
+        key = self._key(client)
+        model_info = self._cached(key)
+        if model_info is not None:
+            return model_info
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+        # 同一密钥与网关的并发首次读取只拉取一次
+        with fetch_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+            return self._fetch(key)
+
+    def peek(self, client) -> Optional[ModelInfo]:
+        r"""返回client对应的未过期模型目录，不存在或已过期时返回None，不会拉取模型列表，可以在事件循环中调用.
+
+        参数:
+            client(HTTPClient | AsyncHTTPClient): 提供secret_key与gateway的客户端。
+        返回：
+            ModelInfo: 模型目录，不存在或已过期时为None。
+        """
+        return self._cached(self._key(client))
+
+    def _cached(self, key: Tuple[str, str]) -> Optional[ModelInfo]:
+        # 返回未过期的目录，需要时在后台线程中刷新；目录不存在或已过期时返回None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] >= self.ttl:
+                return None
+            if now - entry[0] >= self.ttl * self.refresh_ratio and key not in self._refreshing:
+                self._refreshing.add(key)
+                threading.Thread(target=self._refresh, args=(key,), name="appbuilder_model_catalog",
+                                 daemon=True).start()
+            return entry[1]
+
+    def clear(self):
+        r"""清空所有模型目录，下一次读取时重新拉取"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+model_catalog = ModelCatalog()
@@ -0,0 +1,81 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+AppBuilderClient流式事件处理吞吐（不访问网络）。
+
+将合成的逐token流式响应交给SSEClient与AppBuilderClient._iterate_events，对比默认模式
+（AppBuilderClientResponse -> AppBuilderClientAnswer -> Event的pydantic构造）与lite模式（LiteAnswer/LiteEvent）
+每秒处理的事件数。--access-usage时每个事件都读取usage，用于观察按需转换的开销。
+
+用法:
+    python bench_appbuilder_client_lite.py [--events 20000] [--repeat 3] [--access-usage]
+"""
+import json
+import time
+import argparse
+
+from appbuilder.utils.sse_util import SSEClient
+from appbuilder.core.console.appbuilder_client.appbuilder_client import AppBuilderClient
+
+
+def make_stream(count):
+    events = []
+    for i in range(count):
+        event = {
+            "request_id": "a5a5a5a5-0000-4000-8000-000000000000", "date": "2024-07-01T00:00:00Z",
+            "answer": "第{}个token ".format(i), "conversation_id": "c" * 36, "message_id": "m" * 36,
+            "is_completion": False,
+            "content": [{
+                "event_code": 0, "event_message": "", "event_type": "ChatAgent", "event_id": str(i),
+                "event_status": "running", "content_type": "text",
+                "outputs": {"text": "第{}个token ".format(i)},
+                "usage": {"prompt_tokens": 1024, "completion_tokens": i, "total_tokens": 1024 + i, "name": "ERNIE"},
+            }],
+        }
+        events.append("data: {}\n\n".format(json.dumps(event, ensure_ascii=False)).encode("utf-8"))
+    # 按4KB切块，模拟网络读取
+    stream = b"".join(events)
+    return [stream[i:i + 4096] for i in range(0, len(stream), 4096)]
+
+
+def bench(chunks, lite, access_usage, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = 0
+        for answer in AppBuilderClient._iterate_events("rid", SSEClient(iter(chunks)).events(), lite):
+            if access_usage:
+                answer.events[0].usage.total_tokens
+            count += 1
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--access-usage", action="store_true")
+    args = parser.parse_args()
+
+    chunks = make_stream(args.events)
+    default = bench(chunks, False, args.access_usage, args.repeat)
+    lite = bench(chunks, True, args.access_usage, args.repeat)
+    print("{} events".format(args.events))
+    print("  default {:10.0f} events/s".format(default))
+    print("  lite    {:10.0f} events/s  ({:.1f}x)".format(lite, lite / default))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+requests(HTTP/1.1连接池) 与 httpx(HTTP/2多路复用) 传输层在高并发下的吞吐对比（不访问网络）。
+
+本地启动一个同时支持HTTP/1.1与HTTP/2(h2c)的hypercorn服务，每个请求模拟固定的服务端耗时，
+分别在64/256并发下统计吞吐、P99延迟以及建立的TCP连接数。
+
+依赖: pip install 'httpx[http2]' hypercorn
+
+用法:
+    python bench_http2_transport.py [--concurrency 64 256] [--requests 2048] [--latency-ms 20]
+"""
+import time
+import json
+import asyncio
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from hypercorn.config import Config
+from hypercorn.asyncio import serve
+
+from appbuilder.core._client import HTTPClient, connection_pool_registry
+
+
+class App:
+    def __init__(self, latency):
+        self.latency = latency
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        more_body = True
+        while more_body:
+            message = await receive()
+            more_body = message.get("more_body", False)
+        await asyncio.sleep(self.latency)
+        body = json.dumps({"result": "ok", "http_version": scope["http_version"]}).encode()
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": body})
+
+
+def start_server(app, port):
+    config = Config()
+    config.bind = ["127.0.0.1:{}".format(port)]
+    config.loglevel = "ERROR"
+    config.keep_alive_timeout = 60
+    config.keep_alive_max_requests = 10 ** 9
+    config.h2_max_concurrent_streams = 1024
+    loop = asyncio.new_event_loop()
+    stop = asyncio.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(serve(app, config, shutdown_trigger=stop.wait))
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    time.sleep(1)
+    return lambda: loop.call_soon_threadsafe(stop.set)
+
+
+def bench(client, concurrency, total):
+    url = client.service_url("/bench")
+    latencies = []
+
+    def call(_):
+        start = time.perf_counter()
+        response = client.session.post(url, json={"query": "hello"}, timeout=30.0)
+        response.json()
+        latencies.append(time.perf_counter() - start)
+        return response.status_code
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(call, range(concurrency)))
+        latencies.clear()
+        start = time.perf_counter()
+        codes = list(executor.map(call, range(total)))
+        elapsed = time.perf_counter() - start
+    assert codes == [200] * total
+    latencies.sort()
+    return total / elapsed, latencies[int(len(latencies) * 0.99) - 1] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[64, 256])
+    parser.add_argument("--requests", type=int, default=2048)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--port", type=int, default=18443)
+    args = parser.parse_args()
+
+    stop = start_server(App(args.latency_ms / 1000), args.port)
+    gateway = "http://127.0.0.1:{}".format(args.port)
+    try:
+        for concurrency in args.concurrency:
+            connection_pool_registry.clear()
+            connection_pool_registry.configure(pool_maxsize=concurrency)
+            client = HTTPClient(secret_key="bench", gateway=gateway)
+            qps, p99 = bench(client, concurrency, args.requests)
+            opened = connection_pool_registry.stats(gateway)["connections_opened"]
+            print("concurrency={:<4} requests/HTTP1.1: {:8.1f} req/s  p99 {:7.1f} ms  connections {}".format(
+                concurrency, qps, p99, opened))
+
+            # 本地服务没有TLS，使用h2c(prior knowledge)建立HTTP/2连接
+            h2_client = httpx.Client(http1=False, http2=True, timeout=None,
+                                     limits=httpx.Limits(max_connections=4))
+            client = HTTPClient(secret_key="bench", gateway=gateway, transport="httpx")
+            client.session.mount(gateway, h2_client)
+            qps, p99 = bench(client, concurrency, args.requests)
+            opened = len(h2_client._transport._pool.connections)
+            print("concurrency={:<4} httpx/HTTP2    : {:8.1f} req/s  p99 {:7.1f} ms  connections {}".format(
+                concurrency, qps, p99, opened))
+            h2_client.close()
+    finally:
+        connection_pool_registry.clear()
+        stop()
+
+
+if __name__ == "__main__":
+    main()
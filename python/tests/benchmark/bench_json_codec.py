@@ -0,0 +1,100 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+不同JSON实现解析AppBuilderClient流式事件的耗时（不访问网络）。
+
+生成合成的AppBuilderClient流式事件（逐token的文本事件与带检索结果的大事件），对已安装的每个JSON实现分别测量:
+仅解析事件的data字段，以及解析后再构造AppBuilderClientResponse（即AppBuilderClient.run(stream=True)每个事件的处理）。
+也可以通过--events-file传入录制的事件，每行一个data字段的JSON。
+
+用法:
+    python bench_json_codec.py [--events 20000] [--repeat 3] [--events-file events.jsonl]
+"""
+import json
+import time
+import argparse
+
+from appbuilder.utils import json_util
+from appbuilder.core.console.appbuilder_client import data_class
+
+
+def make_events(count):
+    events = []
+    for i in range(count):
+        content = [{
+            "event_code": 0, "event_message": "", "event_type": "ChatAgent", "event_id": str(i),
+            "event_status": "running", "content_type": "text",
+            "outputs": {"text": "第{}个token ".format(i)},
+            "usage": {"prompt_tokens": 1024, "completion_tokens": i, "total_tokens": 1024 + i, "name": "ERNIE"},
+        }]
+        if i % 50 == 0:
+            # 每50个事件附带一次检索结果，模拟RAG返回的大事件
+            content.append({
+                "event_code": 0, "event_type": "RAGAgent", "event_status": "done", "content_type": "rag",
+                "outputs": {"references": [
+                    {"id": str(j), "content": "参考文档片段" * 40, "from": "search_baidu",
+                     "title": "标题{}".format(j), "url": "https://example.com/{}".format(j)}
+                    for j in range(5)
+                ]},
+            })
+        events.append(json.dumps({
+            "request_id": "a5a5a5a5-0000-4000-8000-000000000000", "date": "2024-07-01T00:00:00Z",
+            "answer": "第{}个token ".format(i), "conversation_id": "c" * 36, "message_id": "m" * 36,
+            "is_completion": False, "content": content,
+        }, ensure_ascii=False))
+    return events
+
+
+def bench(events, with_model, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for event in events:
+            data = json_util.loads(event)
+            if with_model:
+                data_class.AppBuilderClientResponse(**data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--events-file", default=None)
+    args = parser.parse_args()
+
+    if args.events_file:
+        with open(args.events_file, encoding="utf-8") as f:
+            events = [line.strip() for line in f if line.strip()]
+    else:
+        events = make_events(args.events)
+    size_mb = sum(len(event.encode("utf-8")) for event in events) / 1024 / 1024
+    print("{} events, {:.1f} MB".format(len(events), size_mb))
+
+    for backend in json_util.JSON_BACKENDS:
+        try:
+            json_util.set_backend(backend)
+        except ImportError:
+            print("  {:<7} not installed".format(backend))
+            continue
+        loads_only = bench(events, False, args.repeat)
+        with_model = bench(events, True, args.repeat)
+        print("  {:<7} loads {:7.3f} s ({:6.1f} MB/s)  loads+AppBuilderClientResponse {:7.3f} s".format(
+            backend, loads_only, size_mb / loads_only, with_model))
+    json_util.set_backend("json")
+
+
+if __name__ == "__main__":
+    main()
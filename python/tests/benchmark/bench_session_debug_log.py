@@ -0,0 +1,77 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+InnerSession 单次请求的本地开销基准测试（不访问网络）。
+
+对比旧实现（无论日志级别都渲染curl命令）与当前实现（仅DEBUG级别渲染）在大请求体下的耗时。
+
+用法:
+    python bench_session_debug_log.py [--size-mb 4] [--rounds 20]
+"""
+import time
+import base64
+import argparse
+
+import requests
+
+import appbuilder
+from appbuilder.core._session import InnerSession
+from appbuilder.utils.logger_util import logger
+
+
+class StaticAdapter(requests.adapters.HTTPAdapter):
+    def send(self, request, **kwargs):
+        response = requests.models.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        response.request = request
+        return response
+
+
+class LegacyInnerSession(InnerSession):
+    def send(self, request, **kwargs):
+        # 旧实现: 先渲染curl命令，再由logger根据级别丢弃
+        logger.debug("Curl Command:\n" + self.build_curl(request) + "\n")
+        return requests.sessions.Session.send(self, request, **kwargs)
+
+
+def bench(session_cls, payload, rounds):
+    session = session_cls()
+    session.mount("http://", StaticAdapter())
+    session.post("http://bench.local/ocr", json=payload)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        session.post("http://bench.local/ocr", json=payload)
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=float, default=4)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    appbuilder.logger.setLoglevel("INFO")
+    raw = b"\x00" * int(args.size_mb * 1024 * 1024 * 3 / 4)
+    payload = {"image": base64.b64encode(raw).decode()}
+
+    legacy = bench(LegacyInnerSession, payload, args.rounds)
+    current = bench(InnerSession, payload, args.rounds)
+    print("body size: {:.1f} MB, rounds: {}".format(args.size_mb, args.rounds))
+    print("before (always build curl): {:.2f} ms/request".format(legacy))
+    print("after  (debug guarded)    : {:.2f} ms/request".format(current))
+
+
+if __name__ == "__main__":
+    main()
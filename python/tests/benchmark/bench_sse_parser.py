@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+SSE分块解析耗时随数据量的变化（不访问网络）。
+
+生成若干MB的合成SSE流，分别模拟单个超大事件（如一次性返回的长回答、大体积工具调用参数）与大量小事件，
+按固定大小切块后交给SSEClient._read，对比逐行拼接bytes的旧实现与基于bytearray缓冲区的SSEParser。
+旧实现耗时随数据量平方增长，SSEParser保持线性。
+
+用法:
+    python bench_sse_parser.py [--sizes-mb 1 2 4 8] [--chunk-size 256]
+"""
+import time
+import argparse
+
+from appbuilder.utils.sse_util import SSEClient
+
+
+def legacy_read(event_source):
+    # 重写前SSEClient._read的实现，作为对照
+    data = b""
+    for chunk in event_source:
+        for line in chunk.splitlines(True):
+            data += line
+            if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
+                yield data
+                data = b""
+    if data:
+        yield data
+
+
+def make_stream(size, kind):
+    if kind == "one large event":
+        # 多行data字段组成的单个事件
+        line = b"data: " + b"x" * 58 + b"\n"
+        return line * (size // len(line)) + b"\n"
+    event = b'data: {"answer": "token"}\n\n'
+    return event * (size // len(event))
+
+
+def bench(read, stream, chunk_size):
+    chunks = [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+    start = time.perf_counter()
+    total = sum(len(block) for block in read(iter(chunks)))
+    elapsed = time.perf_counter() - start
+    assert total == len(stream)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args()
+
+    for kind in ("one large event", "many small events"):
+        print(kind)
+        for size_mb in args.sizes_mb:
+            stream = make_stream(int(size_mb * 1024 * 1024), kind)
+            legacy = bench(legacy_read, stream, args.chunk_size)
+            current = bench(lambda chunks: SSEClient(chunks)._read(), stream, args.chunk_size)
+            print("  {:>5.1f} MB  legacy {:8.3f} s  SSEParser {:8.3f} s  ({:6.1f} MB/s)".format(
+                size_mb, legacy, current, size_mb / current))
+
+
+if __name__ == "__main__":
+    main()
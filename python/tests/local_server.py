@@ -0,0 +1,130 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+本地HTTP服务测试工具
+
+在本地端口上启动模拟后端服务的测试共用的请求处理基类、测试基类与辅助函数。
+"""
+import os
+import json
+import time
+import asyncio
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from appbuilder.core._client import connection_pool_registry
+from appbuilder.core.components.llms.base import CompletionBaseComponent
+
+
+class LocalHandler(BaseHTTPRequestHandler):
+    """
+    模拟后端服务的请求处理基类，使用HTTP/1.1长连接，不打印访问日志
+    """
+    protocol_version = "HTTP/1.1"
+
+    def read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def read_json(self):
+        return json.loads(self.read_body() or b"{}")
+
+    def reply(self, status, body: bytes, content_type="application/json", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def reply_json(self, data, status=200, headers=None):
+        self.reply(status, json.dumps(data).encode(), headers=headers)
+
+    def start_chunked(self, content_type="text/event-stream", headers=None):
+        """以chunked编码开始流式响应，之后用write_chunk逐块发送"""
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def write_chunk(self, data: bytes):
+        """发送一块数据，data为空时结束响应"""
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalServerTestCase(unittest.TestCase):
+    """
+    每个用例启动handler_class对应的本地服务，self.gateway为服务地址，用例前后清空共享连接池
+    """
+    handler_class = LocalHandler
+    # 为True时APPBUILDER_TOKEN与GATEWAY_URL、GATEWAY_URL_V2指向本地服务
+    patch_env = False
+    # 为True时大模型组件不查询模型列表，直接使用fake_model_url
+    patch_model_url = False
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler_class)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.gateway = "http://127.0.0.1:{}".format(self.server.server_address[1])
+        if self.patch_env:
+            self.start_patch(patch.dict(os.environ, {
+                "APPBUILDER_TOKEN": "test", "GATEWAY_URL": self.gateway, "GATEWAY_URL_V2": self.gateway}))
+        if self.patch_model_url:
+            self.start_patch(patch.object(CompletionBaseComponent, "_check_model_and_get_model_url", fake_model_url))
+        connection_pool_registry.clear()
+        self.addCleanup(connection_pool_registry.clear)
+
+    def start_patch(self, patcher):
+        """启动patcher，并在用例结束时停止"""
+        result = patcher.start()
+        self.addCleanup(patcher.stop)
+        return result
+
+
+def closed_port() -> int:
+    """返回一个刚释放、当前无服务监听的本地端口，用于模拟连接失败"""
+    with ThreadingHTTPServer(("127.0.0.1", 0), LocalHandler) as server:
+        return server.server_address[1]
+
+
+def fake_model_url(self, model, model_type):
+    return "https://model/" + model
+
+
+def run_in_new_loop(coro):
+    """在新的事件循环中运行coro并关闭事件循环，不影响当前线程的默认事件循环"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in {}s".format(timeout))
+        time.sleep(0.01)
@@ -0,0 +1,100 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import unittest
+
+import appbuilder
+from appbuilder.core.console.appbuilder_client import data_class
+from tests.local_server import run_in_new_loop
+
+
+def make_answer(text, event_type="ChatAgent", completion_tokens=None):
+    usage = None
+    if completion_tokens is not None:
+        usage = {"prompt_tokens": 10, "completion_tokens": completion_tokens,
+                 "total_tokens": 10 + completion_tokens, "name": "ERNIE"}
+    return {"answer": text, "message_id": "m", "content": [{
+        "event_code": 0, "event_type": event_type, "event_status": "running", "content_type": "text",
+        "outputs": {"text": text}, "usage": usage,
+    }]}
+
+
+STREAM = [
+    make_answer("你", completion_tokens=1),
+    make_answer("好", completion_tokens=2),
+    make_answer("", event_type="RAGAgent", completion_tokens=5),
+    make_answer("！", completion_tokens=3),
+]
+
+
+def full_answers():
+    answers = []
+    for data in STREAM:
+        out = data_class.AppBuilderClientAnswer()
+        appbuilder.AppBuilderClient._transform(data_class.AppBuilderClientResponse(**data), out)
+        answers.append(out)
+    return answers
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreAnswerAccumulator(unittest.TestCase):
+    def test_wrap(self):
+        answers = full_answers()
+        accumulator = appbuilder.AnswerAccumulator()
+        forwarded = []
+        running = []
+        for answer in accumulator.wrap(appbuilder.Message(content=iter(answers))):
+            forwarded.append(answer)
+            running.append(accumulator.answer)
+        self.assertEqual([id(answer) for answer in forwarded], [id(answer) for answer in answers])
+        self.assertEqual(running, ["你", "你好", "你好", "你好！"])
+        self.assertEqual(len(accumulator), 3)
+        self.assertEqual(len(accumulator.events), 4)
+        # ChatAgent最新用量与RAGAgent用量之和
+        self.assertEqual(accumulator.usage.completion_tokens, 3 + 5)
+        self.assertEqual(accumulator.usage.total_tokens, 13 + 15)
+
+        result = accumulator.result()
+        self.assertIsInstance(result, data_class.AppBuilderClientAnswer)
+        self.assertEqual(result.answer, "你好！")
+        self.assertEqual(result.message_id, "m")
+        self.assertEqual(result.events, [event for answer in answers for event in answer.events])
+
+    def test_lite_and_async(self):
+        async def stream():
+            for data in STREAM:
+                yield data_class.LiteAnswer.from_dict(data)
+
+        async def run():
+            accumulator = appbuilder.AnswerAccumulator()
+            count = 0
+            async for _ in accumulator.awrap(stream()):
+                count += 1
+            return count, accumulator
+
+        count, accumulator = run_in_new_loop(run())
+        self.assertEqual(count, 4)
+        expected = appbuilder.AnswerAccumulator()
+        for answer in full_answers():
+            expected.add(answer)
+        self.assertEqual(accumulator.result(), expected.result())
+        self.assertEqual(accumulator.usage, expected.usage)
+
+        empty = appbuilder.AnswerAccumulator()
+        self.assertEqual(empty.answer, "")
+        self.assertIsNone(empty.usage)
+
+
+if __name__ == '__main__':
+    unittest.main()
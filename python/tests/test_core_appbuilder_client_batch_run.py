@@ -0,0 +1,145 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import time
+import tempfile
+import itertools
+import unittest
+import threading
+
+import appbuilder
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+RUN_DELAY = 0.2
+
+
+class BatchHandler(LocalHandler):
+    counter = itertools.count()
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+    queries = []
+    fail = set()
+
+    def do_POST(self):
+        body = self.read_body()
+        status = 200
+        if self.path.endswith("/file/upload"):
+            data = {"request_id": "rid", "id": "file-{}".format(next(self.counter)), "conversation_id": "c"}
+        elif self.path.endswith("/runs"):
+            query = json.loads(body)["query"]
+            cls = type(self)
+            with cls.lock:
+                cls.queries.append(query)
+                cls.running += 1
+                cls.max_running = max(cls.max_running, cls.running)
+            time.sleep(RUN_DELAY)
+            with cls.lock:
+                cls.running -= 1
+            if query in cls.fail:
+                status = 500
+                data = {"code": 500, "message": "internal error"}
+            else:
+                data = {"request_id": "rid", "answer": "answer " + query, "conversation_id": "c",
+                        "message_id": "m", "content": []}
+        else:
+            data = {"request_id": "rid", "conversation_id": "conv-{}".format(next(self.counter))}
+        self.reply_json(data, status)
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreAppBuilderClientBatchRun(LocalServerTestCase):
+    handler_class = BatchHandler
+    patch_env = True
+
+    def setUp(self):
+        BatchHandler.queries = []
+        BatchHandler.max_running = 0
+        BatchHandler.fail = set()
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.output_path = os.path.join(self.tmpdir.name, "results.jsonl")
+        self.file_path = os.path.join(self.tmpdir.name, "doc.txt")
+        with open(self.file_path, "w") as f:
+            f.write("content")
+
+    def test_batch_run_and_resume(self):
+        client = appbuilder.AppBuilderClient("app")
+        items = ["q{}".format(i) for i in range(7)] + [{"id": "doc", "query": "q_doc", "file_paths": self.file_path}]
+        BatchHandler.fail = {"q3"}
+        start = time.monotonic()
+        results = client.batch_run(items, max_concurrency=4, output_path=self.output_path)
+        elapsed = time.monotonic() - start
+        # 8个输入以4并发运行，约为两轮
+        self.assertLess(elapsed, RUN_DELAY * 4)
+        self.assertEqual(BatchHandler.max_running, 4)
+        self.assertEqual(read_jsonl(self.output_path), results)
+
+        by_id = {result["id"]: result for result in results}
+        self.assertEqual(len(by_id), 8)
+        self.assertEqual(by_id[0]["answer"], "answer q0")
+        self.assertEqual(by_id[3]["status"], "error")
+        self.assertIn("InternalServerErrorException", by_id[3]["error"])
+        self.assertEqual(by_id["doc"]["status"], "success")
+        self.assertEqual(len(by_id["doc"]["file_ids"]), 1)
+        self.assertEqual(len({result["conversation_id"] for result in results}), 8)
+
+        # 模拟崩溃时写了一半的行
+        with open(self.output_path, "a") as f:
+            f.write('{"id": 5, "sta')
+        BatchHandler.fail = set()
+        BatchHandler.queries = []
+        resumed = client.batch_run(items, max_concurrency=4, output_path=self.output_path, resume=True)
+        self.assertEqual(BatchHandler.queries, ["q3"])
+        self.assertEqual([(result["id"], result["status"]) for result in resumed], [(3, "success")])
+
+        # batch_run总是非流式运行，stream=True在开始前报错，stream=False可以照常传入
+        with self.assertRaises(ValueError):
+            client.batch_run(["q"], output_path=self.output_path, stream=True)
+        self.assertEqual(client.batch_run(["q"], stream=False)[0]["answer"], "answer q")
+
+    def test_async_batch_run(self):
+        def items():
+            for i in range(6):
+                yield {"id": "item-{}".format(i), "query": "q{}".format(i)}
+
+        async def run():
+            client = appbuilder.AsyncAppBuilderClient("app")
+            start = time.monotonic()
+            results = await client.batch_run(items(), max_concurrency=3, output_path=self.output_path)
+            elapsed = time.monotonic() - start
+            resumed = await client.batch_run(items(), output_path=self.output_path, resume=True)
+            with self.assertRaises(ValueError):
+                await client.batch_run(items(), stream=True)
+            await client.aclose()
+            return results, elapsed, resumed
+
+        results, elapsed, resumed = run_in_new_loop(run())
+        self.assertLess(elapsed, RUN_DELAY * 3)
+        self.assertEqual(BatchHandler.max_running, 3)
+        self.assertEqual(sorted(result["id"] for result in results), ["item-{}".format(i) for i in range(6)])
+        self.assertTrue(all(result["status"] == "success" for result in results))
+        self.assertEqual(read_jsonl(self.output_path), results)
+        self.assertEqual(resumed, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
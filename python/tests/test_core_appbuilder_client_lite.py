@@ -0,0 +1,102 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import unittest
+
+import appbuilder
+from appbuilder.core.console.appbuilder_client import data_class
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+EVENTS = [
+    {"request_id": "rid", "answer": "你好", "conversation_id": "c", "message_id": "m", "content": [{
+        "event_code": 0, "event_type": "ChatAgent", "event_status": "running", "content_type": "text",
+        "outputs": {"text": "你好"},
+        "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4, "name": "ERNIE"},
+    }]},
+    {"request_id": "rid", "answer": "", "conversation_id": "c", "message_id": "m", "content": [{
+        "event_code": 0, "event_type": "Interrupt", "event_status": "interrupt", "content_type": "contexts",
+        "outputs": {"text": {}},
+        "tool_calls": [{"id": "call", "type": "function",
+                        "function": {"name": "get_weather", "arguments": {"city": "北京"}}}],
+    }, {
+        "event_code": 0, "event_type": "RAGAgent", "event_status": "done", "content_type": "rag",
+        "outputs": {"references": [{"id": "1", "from": "search_baidu", "content": "参考"}]},
+    }]},
+    {"request_id": "rid", "answer": "！", "conversation_id": "c", "message_id": "m", "is_completion": True,
+     "content": []},
+]
+
+
+class RunHandler(LocalHandler):
+    def do_POST(self):
+        body = json.loads(self.read_body())
+        if body["stream"]:
+            data = "".join("data: {}\n\n".format(json.dumps(event)) for event in EVENTS).encode()
+            content_type = "text/event-stream"
+        else:
+            data = json.dumps(EVENTS[1]).encode()
+            content_type = "application/json"
+        self.reply(200, data, content_type)
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreAppBuilderClientLite(LocalServerTestCase):
+    handler_class = RunHandler
+    patch_env = True
+
+    def assert_same_answer(self, lite, full):
+        self.assertIsInstance(lite, data_class.LiteAnswer)
+        self.assertIsInstance(full, data_class.AppBuilderClientAnswer)
+        self.assertEqual((lite.answer, lite.message_id), (full.answer, full.message_id))
+        self.assertEqual(len(lite.events), len(full.events))
+        for lite_event, event in zip(lite.events, full.events):
+            for name in ("code", "message", "status", "event_type", "content_type", "detail", "usage", "tool_calls"):
+                self.assertEqual(getattr(lite_event, name), getattr(event, name))
+        self.assertEqual(lite.to_model(), full)
+
+    def test_run_lite(self):
+        client = appbuilder.AppBuilderClient("app")
+        full = list(client.run("conversation", "query", stream=True).content)
+        lite = list(client.run("conversation", "query", stream=True, lite=True).content)
+        self.assertEqual(len(lite), len(EVENTS))
+        for lite_answer, answer in zip(lite, full):
+            self.assert_same_answer(lite_answer, answer)
+        self.assertEqual(lite[1].events[0].tool_calls[0].function.arguments, {"city": "北京"})
+        self.assertEqual(lite[0].events[0].usage.total_tokens, 4)
+        with self.assertRaises(AttributeError):
+            lite[0].extra = 1
+
+        self.assert_same_answer(client.run("conversation", "query", lite=True).content,
+                                client.run("conversation", "query").content)
+
+    def test_async_run_lite(self):
+        async def run():
+            client = appbuilder.AsyncAppBuilderClient("app")
+            full = await client.run("conversation", "query", stream=True)
+            full = [answer async for answer in full.content]
+            lite = await client.run("conversation", "query", stream=True, lite=True)
+            lite = [answer async for answer in lite.content]
+            single = await client.run("conversation", "query", lite=True)
+            await client.http_client.aclose()
+            return full, lite, single.content
+
+        full, lite, single = run_in_new_loop(run())
+        for lite_answer, answer in zip(lite, full):
+            self.assert_same_answer(lite_answer, answer)
+        self.assert_same_answer(single, full[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
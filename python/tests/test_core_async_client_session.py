@@ -0,0 +1,158 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gc
+import os
+import asyncio
+import unittest
+import threading
+
+import appbuilder
+from appbuilder.core._client import AsyncHTTPClient, connection_pool_registry
+from appbuilder.core._retry import RetryPolicy
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+
+class JsonHandler(LocalHandler):
+    attempts = 0
+
+    def do_POST(self):
+        self.read_body()
+        code = 200
+        if self.path.endswith("/flaky"):
+            JsonHandler.attempts += 1
+            code = 503 if JsonHandler.attempts == 1 else 200
+        self.reply_json({"path": self.path}, code)
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreAsyncClientSession(LocalServerTestCase):
+    handler_class = JsonHandler
+
+    def test_session_created_lazily_in_loop(self):
+        client = AsyncHTTPClient(secret_key="test", gateway=self.gateway)
+        self.assertEqual(len(client._sessions), 0)
+        with self.assertRaises(RuntimeError):
+            client.session
+
+        async def run():
+            session = client.session
+            self.assertIs(client.session, session)
+            response = await session.post(client.service_url("/ping"), json={})
+            await client.check_response_header(response)
+            data = await response.json()
+            await client.aclose()
+            self.assertTrue(session.closed)
+            return data
+
+        self.assertEqual(run_in_new_loop(run())["path"], "/rpc/2.0/cloud_hub/ping")
+
+    def test_clients_share_connector(self):
+        async def run():
+            client_a = AsyncHTTPClient(secret_key="test", gateway=self.gateway)
+            client_b = AsyncHTTPClient(secret_key="test", gateway=self.gateway)
+            connector = connection_pool_registry.get_connector()
+            self.assertIs(client_a.session.connector, connector)
+            self.assertIs(client_b.session.connector, connector)
+            for client in (client_a, client_b):
+                response = await client.session.post(client.service_url("/ping"), json={})
+                await response.json()
+            await client_a.aclose()
+            # 关闭单个client不影响共享连接器
+            self.assertFalse(connector.closed)
+            response = await client_b.session.post(client_b.service_url("/ping"), json={})
+            await response.json()
+            await client_b.aclose()
+            await connection_pool_registry.aclose_connector()
+            self.assertTrue(connector.closed)
+
+        run_in_new_loop(run())
+
+    def test_session_per_loop(self):
+        client = AsyncHTTPClient(secret_key="test", gateway=self.gateway)
+        sessions = []
+
+        async def run():
+            sessions.append(client.session)
+            response = await client.session.post(client.service_url("/ping"), json={})
+            await response.json()
+            await client.aclose()
+
+        threads = [threading.Thread(target=run_in_new_loop, args=(run(),)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(sessions), 4)
+        self.assertEqual(len(set(map(id, sessions))), 4)
+
+    def test_released_after_loop_closed(self):
+        client = AsyncHTTPClient(secret_key="test", gateway=self.gateway)
+        sessions = []
+
+        async def run():
+            connector = connection_pool_registry.get_connector()
+            sessions.append(client.session)
+            self.assertIs(client.session.connector, connector)
+            response = await client.session.post(client.service_url("/ping"), json={})
+            await response.json()
+
+        def asyncio_run():
+            # asyncio.run结束时会清除当前线程的事件循环，在独立线程中运行以免影响其他测试
+            thread = threading.Thread(target=lambda: asyncio.run(run()))
+            thread.start()
+            thread.join()
+
+        # 未调用aclose时，asyncio.run关闭事件循环前关闭并释放该事件循环的session与连接器
+        for _ in range(5):
+            asyncio_run()
+        gc.collect()
+        self.assertEqual(len(connection_pool_registry._connectors), 0)
+        self.assertEqual(len(client._sessions), 0)
+        self.assertTrue(all(session.closed for session in sessions))
+
+        # 直接关闭的事件循环在下次创建时释放
+        run_in_new_loop(run())
+        run_in_new_loop(run())
+        self.assertEqual(len(client._sessions), 1)
+        asyncio_run()
+        self.assertEqual(len(connection_pool_registry._connectors), 0)
+        self.assertEqual(len(client._sessions), 0)
+
+    def test_retry(self):
+        JsonHandler.attempts = 0
+        client = AsyncHTTPClient(secret_key="test", gateway=self.gateway)
+        policy = RetryPolicy(total=1, backoff_factor=0, backoff_jitter=0, idempotent=True)
+
+        async def run():
+            response = await client.session.post(client.service_url("/flaky"), json={}, retry=policy)
+            status = response.status
+            await response.json()
+            await client.aclose()
+            return status
+
+        self.assertEqual(run_in_new_loop(run()), 200)
+        self.assertEqual(JsonHandler.attempts, 2)
+
+    def test_async_with_component(self):
+        async def run():
+            async with appbuilder.AsyncAppBuilderClient("app_id", secret_key="test") as client:
+                session = client.http_client.session
+            return session
+
+        session = run_in_new_loop(run())
+        self.assertTrue(session.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
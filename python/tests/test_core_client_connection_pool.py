@@ -0,0 +1,97 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from appbuilder.core._client import HTTPClient, connection_pool_registry
+from tests.local_server import LocalHandler, LocalServerTestCase
+
+
+class KeepAliveHandler(LocalHandler):
+    def _reply(self):
+        self.read_body()
+        self.reply_json({"path": self.path})
+
+    def do_GET(self):
+        self._reply()
+
+    def do_POST(self):
+        self._reply()
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreClientConnectionPool(LocalServerTestCase):
+    handler_class = KeepAliveHandler
+
+    def test_registry_is_singleton(self):
+        from appbuilder.core._client import HTTPConnectionPoolRegistry
+        self.assertIs(HTTPConnectionPoolRegistry(), connection_pool_registry)
+
+    def test_clients_share_pool_manager(self):
+        client_a = HTTPClient(secret_key="test", gateway=self.gateway)
+        client_b = HTTPClient(secret_key="test", gateway=self.gateway)
+        adapter_a = client_a.session.get_adapter(self.gateway)
+        adapter_b = client_b.session.get_adapter(self.gateway)
+        self.assertIsNot(adapter_a, adapter_b)
+        self.assertIs(adapter_a.poolmanager, adapter_b.poolmanager)
+        # 各自保留独立的重试策略
+        self.assertIsNot(adapter_a.max_retries, adapter_b.max_retries)
+        self.assertIs(connection_pool_registry.get(self.gateway),
+                      connection_pool_registry.get(self.gateway + "/"))
+
+    def test_connections_reused_across_clients(self):
+        for _ in range(5):
+            client = HTTPClient(secret_key="test", gateway=self.gateway)
+            response = client.session.get(client.service_url("/ping"))
+            client.check_response_header(response)
+        stats = connection_pool_registry.stats(self.gateway)
+        self.assertEqual(stats["connections_opened"], 1)
+        self.assertEqual(stats["connections_reused"], 4)
+
+    def test_connections_reused_under_concurrency(self):
+        origin_maxsize = connection_pool_registry.pool_maxsize
+        origin_block = connection_pool_registry.pool_block
+        connection_pool_registry.configure(pool_maxsize=4, pool_block=True)
+        try:
+            def call(_):
+                client = HTTPClient(secret_key="test", gateway=self.gateway)
+                return client.session.post(
+                    client.service_url("/ping"), json={"a": 1}).status_code
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                codes = list(executor.map(call, range(64)))
+        finally:
+            connection_pool_registry.configure(pool_maxsize=origin_maxsize, pool_block=origin_block)
+        self.assertEqual(codes, [200] * 64)
+        stats = connection_pool_registry.stats(self.gateway)
+        self.assertLessEqual(stats["connections_opened"], 4)
+        self.assertEqual(stats["connections_acquired"], 64)
+
+    def test_session_close_keeps_shared_pool(self):
+        client = HTTPClient(secret_key="test", gateway=self.gateway)
+        client.session.get(client.service_url("/ping"))
+        client.session.close()
+        other = HTTPClient(secret_key="test", gateway=self.gateway)
+        other.session.get(other.service_url("/ping"))
+        self.assertEqual(connection_pool_registry.stats(self.gateway)["connections_opened"], 1)
+
+    def test_stats_unknown_gateway(self):
+        self.assertEqual(connection_pool_registry.stats("http://unknown")["connections_opened"], 0)
+        HTTPClient(secret_key="test", gateway=self.gateway)
+        self.assertIn(self.gateway, connection_pool_registry.stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import unittest
+import importlib.util
+from collections import defaultdict
+from unittest.mock import patch
+
+import aiohttp
+import requests
+
+from appbuilder.core._client import HTTPClient, AsyncHTTPClient
+from appbuilder.core._retry import RetryPolicy
+from appbuilder.utils.sse_util import SSEClient, AsyncSSEClient
+from tests.local_server import LocalHandler, LocalServerTestCase, closed_port, run_in_new_loop
+
+HTTPX_INSTALLED = importlib.util.find_spec("httpx") is not None and importlib.util.find_spec("h2") is not None
+
+
+class EchoHandler(LocalHandler):
+    attempts = defaultdict(int)
+
+    def _reply(self):
+        body = self.read_body()
+        if self.path.endswith("/flaky"):
+            self.attempts[self.path] += 1
+            if self.attempts[self.path] == 1:
+                return self._send(503, b"{}")
+        if self.path.endswith("/sse"):
+            payload = b"".join(b"data: %d\n\n" % i for i in range(3))
+            return self._send(200, payload, "text/event-stream")
+        result = {
+            "method": self.command,
+            "path": self.path,
+            "content_type": self.headers.get("Content-Type", ""),
+            "body": body.decode("utf-8", errors="replace"),
+        }
+        self._send(200, json.dumps(result).encode())
+
+    def _send(self, code, body, content_type="application/json"):
+        self.reply(code, body, content_type, {"X-Appbuilder-Request-Id": "rid"})
+
+    do_GET = _reply
+    do_POST = _reply
+    do_PUT = _reply
+    do_DELETE = _reply
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL" and HTTPX_INSTALLED, "")
+class TestCoreClientHTTPXTransport(LocalServerTestCase):
+    handler_class = EchoHandler
+
+    def setUp(self):
+        EchoHandler.attempts.clear()
+        super().setUp()
+
+    def test_select_transport(self):
+        from appbuilder.core._session import InnerSession, HTTPXInnerSession
+        self.assertIsInstance(HTTPClient(secret_key="test", gateway=self.gateway).session, InnerSession)
+        client = HTTPClient(secret_key="test", gateway=self.gateway, transport="httpx")
+        self.assertIsInstance(client.session, HTTPXInnerSession)
+        with patch.dict(os.environ, {"APPBUILDER_HTTP_TRANSPORT": "httpx"}):
+            self.assertEqual(HTTPClient(secret_key="test", gateway=self.gateway).transport, "httpx")
+        with self.assertRaises(ValueError):
+            HTTPClient(secret_key="test", gateway=self.gateway, transport="curl")
+
+    def test_clients_share_httpx_client(self):
+        client_a = HTTPClient(secret_key="test", gateway=self.gateway, transport="httpx")
+        client_b = HTTPClient(secret_key="test", gateway=self.gateway, transport="httpx")
+        url = client_a.service_url("/ping")
+        self.assertIs(client_a.session.get_client(url), client_b.session.get_client(url))
+        client_a.session.close()
+        self.assertEqual(client_b.session.get(url).status_code, 200)
+
+    def test_requests_compatible_response(self):
+        client = HTTPClient(secret_key="test", gateway=self.gateway, transport="httpx")
+        response = client.session.post(client.service_url("/echo"), json={"a": 1},
+                                       headers=client.auth_header(), timeout=(3.0, 5.0))
+        client.check_response_header(response)
+        data = response.json()
+        self.assertEqual(data["method"], "POST")
+        self.assertEqual(json.loads(data["body"]), {"a": 1})
+        self.assertEqual(client.response_request_id(response), "rid")
+        self.assertEqual(json.loads(response.text), data)
+
+        response = client.session.get(client.service_url("/echo"), params={"q": "x"})
+        self.assertEqual(response.json()["path"], "/rpc/2.0/cloud_hub/echo?q=x")
+
+        response = client.session.post(
+            client.service_url("/upload"),
+            files={"file": ("a.txt", b"abc"), "app_id": (None, "app")},
+        )
+        body = response.json()
+        self.assertTrue(body["content_type"].startswith("multipart/form-data"))
+        self.assertIn('name="app_id"', body["body"])
+
+    def test_stream_response(self):
+        client = HTTPClient(secret_key="test", gateway=self.gateway, transport="httpx")
+        response = client.session.post(client.service_url("/sse"), json={}, stream=True)
+        events = [event.data for event in SSEClient(response).events()]
+        self.assertEqual(events, ["0", "1", "2"])
+
+        response = client.session.post(client.service_url("/sse"), json={}, stream=True)
+        self.assertEqual(list(response.iter_lines()), [b"data: 0", b"", b"data: 1", b"", b"data: 2", b""])
+
+    def test_retry_and_errors(self):
+        client = HTTPClient(secret_key="test", gateway=self.gateway, transport="httpx")
+        policy = RetryPolicy(total=1, backoff_factor=0, backoff_jitter=0)
+        response = client.session.get(client.service_url("/flaky"), retry=policy)
+        self.assertEqual(response.status_code, 200)
+
+        port = closed_port()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            client.session.post("http://127.0.0.1:{}/x".format(port), json={}, retry=policy)
+
+    def test_async_transport(self):
+        from appbuilder.core._session import AsyncHTTPXInnerSession
+
+        async def run():
+            client = AsyncHTTPClient(secret_key="test", gateway=self.gateway, transport="httpx")
+            self.assertIsInstance(client.session, AsyncHTTPXInnerSession)
+            response = await client.session.post(client.service_url("/echo"), json={"a": 1})
+            await client.check_response_header(response)
+            data = await response.json()
+
+            form = aiohttp.FormData()
+            form.add_field(name="file", value=b"abc", filename="a.txt")
+            form.add_field(name="app_id", value="app")
+            response = await client.session.post(client.service_url("/upload"), data=form)
+            form_body = (await response.json())["body"]
+
+            response = await client.session.post(client.service_url("/sse"), json={})
+            events = [event.data async for event in AsyncSSEClient(response).events()]
+            await client.session.close()
+            return data, form_body, events
+
+        data, form_body, events = run_in_new_loop(run())
+        self.assertEqual(json.loads(data["body"]), {"a": 1})
+        self.assertIn('filename="a.txt"', form_body)
+        self.assertIn('name="app_id"', form_body)
+        self.assertEqual(events, ["0", "1", "2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import time
+import asyncio
+import unittest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import appbuilder
+from appbuilder.core._coalesce import RequestCoalescer
+from appbuilder.core._exception import AppBuilderServerException
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+DELAY = 0.3
+CHUNKS = ["你", "好", "！"]
+
+
+class LLMHandler(LocalHandler):
+    queries = []
+    fail = False
+
+    def do_POST(self):
+        body = json.loads(self.read_body())
+        self.queries.append(body["query"])
+        if self.fail:
+            time.sleep(DELAY)
+            self.reply(500, b'{"code": 500, "message": "busy"}')
+            return
+        if body["response_mode"] == "streaming":
+            self.start_chunked()
+            for chunk in CHUNKS:
+                time.sleep(DELAY / len(CHUNKS))
+                self.write_chunk("data: {}\n\n".format(json.dumps({"answer": chunk})).encode())
+            self.write_chunk(b"")
+            return
+        time.sleep(DELAY)
+        self.reply_json({"answer": "echo {} #{}".format(body["query"], len(self.queries))})
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreCoalesce(LocalServerTestCase):
+    handler_class = LLMHandler
+    patch_env = True
+    patch_model_url = True
+
+    def setUp(self):
+        LLMHandler.queries = []
+        LLMHandler.fail = False
+        super().setUp()
+        self.playground = appbuilder.Playground(prompt_template="{query}", model="ERNIE", lazy_certification=True)
+        self.playground.enable_coalescing()
+
+    def run_concurrently(self, func, n=8):
+        barrier = threading.Barrier(n)
+
+        def call(i):
+            barrier.wait()
+            return func(i)
+
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            return list(executor.map(call, range(n)))
+
+    def test_blocking_calls(self):
+        answers = self.run_concurrently(lambda i: self.playground.run(appbuilder.Message("q")).content)
+        self.assertEqual(answers, ["echo q #1"] * 8)
+        self.assertEqual(LLMHandler.queries, ["q"])
+        self.assertEqual(self.playground.coalescing_stats(), {"upstream": 1, "coalesced": 7})
+
+        # 请求完成后不保留响应，不同输入不合并
+        answers = self.run_concurrently(lambda i: self.playground.run(appbuilder.Message("q{}".format(i % 2))).content,
+                                        n=4)
+        self.assertEqual(sorted(LLMHandler.queries), ["q", "q0", "q1"])
+        self.assertEqual(answers[0], answers[2])
+
+        self.playground.disable_coalescing()
+        self.run_concurrently(lambda i: self.playground.run(appbuilder.Message("q")), n=3)
+        self.assertEqual(len(LLMHandler.queries), 6)
+
+    def test_stream_tee(self):
+        def call(i):
+            if i == 3:
+                # 上游数据流进行中到达的请求同样从第一个数据块开始读取
+                time.sleep(DELAY / 2)
+            message = self.playground.run(appbuilder.Message("q"), stream=True)
+            return list(message.content)
+
+        self.assertEqual(self.run_concurrently(call, n=4), [CHUNKS] * 4)
+        self.assertEqual(LLMHandler.queries, ["q"])
+
+        # 上游出错时所有调用方收到同一异常
+        LLMHandler.fail = True
+
+        def fail(i):
+            with self.assertRaises(AppBuilderServerException):
+                self.playground.run(appbuilder.Message("q"))
+            return i
+
+        self.run_concurrently(fail, n=4)
+        self.assertEqual(LLMHandler.queries, ["q", "q"])
+
+    def test_async_stream(self):
+        async def collect(i):
+            message = await self.playground.arun(appbuilder.Message("q"), stream=True)
+            return [chunk async for chunk in message.content], message.content
+
+        async def run():
+            results = await asyncio.gather(*[collect(i) for i in range(6)])
+            blocking = await asyncio.gather(*[self.playground.arun(appbuilder.Message("b")) for _ in range(3)])
+            await self.playground.aclose()
+            return results, blocking
+
+        results, blocking = run_in_new_loop(run())
+        self.assertEqual(results, [(CHUNKS, "你好！")] * 6)
+        self.assertEqual([message.content for message in blocking], ["echo b #2"] * 3)
+        self.assertEqual(LLMHandler.queries, ["q", "b"])
+        self.assertEqual(self.playground.coalescing_stats(), {"upstream": 2, "coalesced": 7})
+
+    def test_async_leader_cancelled(self):
+        coalescer = RequestCoalescer("test")
+        calls = []
+
+        class Response:
+            status = 200
+            headers = {"Content-Type": "application/json"}
+
+            async def read(self):
+                return b"ok"
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return Response()
+
+        async def run():
+            leader = asyncio.ensure_future(coalescer.arequest("k", fetch))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(coalescer.arequest("k", fetch))
+            await asyncio.sleep(0.05)
+            leader.cancel()
+            # 发起请求的调用方被取消后，等待的调用方重新发起请求
+            response = await follower
+            return await response.read()
+
+        self.assertEqual(run_in_new_loop(run()), b"ok")
+        self.assertEqual(len(calls), 2)
+        ignoring = RequestCoalescer("test", ["user"])
+        self.assertEqual(ignoring.make_key("POST", "/a", json_body={"q": 1, "user": "x"}),
+                         ignoring.make_key("POST", "/a", json_body={"q": 1, "user": "y"}))
+        self.assertNotEqual(coalescer.make_key("POST", "/a", json_body={"q": 1, "user": "x"}),
+                            coalescer.make_key("POST", "/a", json_body={"q": 1, "user": "y"}))
+        self.assertIsNone(coalescer.make_key("POST", "/a", data=object()))
+
+
+if __name__ == '__main__':
+    unittest.main()
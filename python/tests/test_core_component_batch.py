@@ -0,0 +1,145 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+import random
+import asyncio
+import unittest
+import threading
+
+from appbuilder.core.component import Component
+from appbuilder.core.message import Message
+from appbuilder.core._rate_limiter import RateLimiter
+from tests.local_server import run_in_new_loop
+
+
+class SleepComponent(Component):
+    latency = 0.1
+
+    def __init__(self):
+        super().__init__(lazy_certification=True)
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _enter(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def _exit(self):
+        with self.lock:
+            self.active -= 1
+
+    def run(self, message, suffix=""):
+        self._enter()
+        try:
+            # 随机耗时，验证结果顺序与完成顺序无关
+            time.sleep(self.latency * random.uniform(0.5, 1.0))
+            if message.content == "bad":
+                raise ValueError("bad input")
+            return Message(message.content + suffix)
+        finally:
+            self._exit()
+
+    async def arun(self, message, suffix=""):
+        self._enter()
+        try:
+            await asyncio.sleep(self.latency * random.uniform(0.5, 1.0))
+            if message.content == "bad":
+                raise ValueError("bad input")
+            return Message(message.content + suffix)
+        finally:
+            self._exit()
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreComponentBatch(unittest.TestCase):
+    def setUp(self):
+        self.component = SleepComponent()
+        self.inputs = [Message(str(i)) for i in range(16)]
+
+    def test_batch_sequential_by_default(self):
+        results = self.component.batch(*self.inputs[:3], suffix="!")
+        self.assertEqual([r.content for r in results], ["0!", "1!", "2!"])
+        self.assertEqual(self.component.peak, 1)
+
+    def test_batch_concurrent_preserves_order(self):
+        start = time.perf_counter()
+        results = self.component.batch(*self.inputs, max_concurrency=8)
+        elapsed = time.perf_counter() - start
+        self.assertEqual([r.content for r in results], [str(i) for i in range(16)])
+        self.assertLessEqual(self.component.peak, 8)
+        self.assertGreater(self.component.peak, 1)
+        self.assertLess(elapsed, 16 * SleepComponent.latency / 2)
+
+    def test_batch_exceptions(self):
+        inputs = [Message("a"), Message("bad"), Message("c")]
+        results = self.component.batch(*inputs, max_concurrency=3, return_exceptions=True)
+        self.assertEqual(results[0].content, "a")
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2].content, "c")
+        with self.assertRaises(ValueError):
+            self.component.batch(*inputs, max_concurrency=3)
+        with self.assertRaises(ValueError):
+            self.component.batch(*inputs)
+
+    def test_batch_rate_limit(self):
+        SleepComponent.latency = 0
+        try:
+            start = time.perf_counter()
+            self.component.batch(*self.inputs[:6], max_concurrency=6, rate_limit=20)
+            elapsed = time.perf_counter() - start
+        finally:
+            SleepComponent.latency = 0.1
+        # 首个请求立即放行，其余5个请求间隔1/20秒
+        self.assertGreaterEqual(elapsed, 5 / 20 * 0.9)
+
+    def test_abatch(self):
+        async def run():
+            start = time.perf_counter()
+            results = await self.component.abatch(*self.inputs, max_concurrency=4, suffix="!")
+            elapsed = time.perf_counter() - start
+            errors = await self.component.abatch(Message("a"), Message("bad"), max_concurrency=2,
+                                                 return_exceptions=True)
+            with self.assertRaises(ValueError):
+                await self.component.abatch(Message("a"), Message("bad"), max_concurrency=2)
+            return results, elapsed, errors
+
+        results, elapsed, errors = run_in_new_loop(run())
+        self.assertEqual([r.content for r in results], ["{}!".format(i) for i in range(16)])
+        self.assertLessEqual(self.component.peak, 4)
+        self.assertLess(elapsed, 16 * SleepComponent.latency / 2)
+        self.assertEqual(errors[0].content, "a")
+        self.assertIsInstance(errors[1], ValueError)
+
+    def test_rate_limiter(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+        limiter = RateLimiter(rate=50, burst=2)
+        waits = [limiter.acquire() for _ in range(4)]
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertGreater(waits[2], 0)
+
+        async def run():
+            limiter = RateLimiter(rate=50)
+            start = time.perf_counter()
+            await asyncio.gather(*[limiter.aacquire() for _ in range(5)])
+            return time.perf_counter() - start
+
+        self.assertGreaterEqual(run_in_new_loop(run()), 4 / 50 * 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import unittest
+import threading
+
+import appbuilder
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+
+def make_event(text, status="running"):
+    return {
+        "conversation_id": "conversation", "message_id": "message", "status": status, "role": "tool",
+        "content": [{"type": "text", "text": {"info": text},
+                     "event": {"id": "1", "status": status, "name": "/", "created_time": "now"}}],
+    }
+
+
+class ComponentHandler(LocalHandler):
+    # 客户端收到首个事件后set，服务端在此之前不发送后续事件
+    first_event_received = threading.Event()
+    waited = []
+
+    def do_POST(self):
+        body = json.loads(self.read_body())
+        assert self.path.endswith("/components/component/version/latest")
+        assert body["parameters"]["_sys_origin_query"] == "query"
+        if not body["stream"]:
+            self.reply_json(make_event("answer", "done"), headers={"X-Appbuilder-Request-Id": "rid"})
+            return
+
+        self.start_chunked(headers={"X-Appbuilder-Request-Id": "rid"})
+        self.write_chunk("data: {}\n\n".format(json.dumps(make_event("first"))).encode())
+        self.waited.append(self.first_event_received.wait(timeout=5))
+        self.write_chunk("data: {}\n\n".format(json.dumps(make_event("second", "done"))).encode())
+        self.write_chunk(b"")
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreComponentClientStream(LocalServerTestCase):
+    handler_class = ComponentHandler
+    patch_env = True
+
+    def setUp(self):
+        ComponentHandler.first_event_received.clear()
+        ComponentHandler.waited.clear()
+        super().setUp()
+
+    def test_stream(self):
+        client = appbuilder.ComponentClient()
+        message = client.run(component_id="component", version="latest", sys_origin_query="query", stream=True)
+        texts = []
+        for resp in message.content:
+            # 首个事件在服务端发送后续事件之前就已到达客户端
+            ComponentHandler.first_event_received.set()
+            self.assertEqual(resp.request_id, "rid")
+            texts.append(resp.content[0].text.info)
+        self.assertEqual(texts, ["first", "second"])
+        self.assertEqual(ComponentHandler.waited, [True])
+
+        message = client.run(component_id="component", version="latest", sys_origin_query="query")
+        self.assertEqual(message.content.request_id, "rid")
+        self.assertEqual(message.content.status, "done")
+
+    def test_async_stream(self):
+        async def run():
+            client = appbuilder.AsyncComponentClient()
+            texts = []
+            message = await client.run(
+                component_id="component", version="latest", sys_origin_query="query", stream=True)
+            async for resp in message.content:
+                ComponentHandler.first_event_received.set()
+                self.assertEqual(resp.request_id, "rid")
+                texts.append(resp.content[0].text.info)
+            message = await client.run(component_id="component", version="latest", sys_origin_query="query")
+            await client.http_client.aclose()
+            return texts, message.content
+
+        texts, resp = run_in_new_loop(run())
+        self.assertEqual(texts, ["first", "second"])
+        self.assertEqual(ComponentHandler.waited, [True])
+        self.assertEqual(resp.request_id, "rid")
+        self.assertEqual(resp.status, "done")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import time
+import asyncio
+import unittest
+import contextvars
+
+import appbuilder
+from appbuilder.core.component import Component
+from appbuilder.core.components.v2 import AnimalRecognition
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+
+class FakeServiceHandler(LocalHandler):
+    latency = 0.2
+    content_types = []
+
+    def do_POST(self):
+        body = self.read_body()
+        self.content_types.append(self.headers.get("Content-Type", ""))
+        if self.path.endswith("/accurate_basic"):
+            time.sleep(self.latency)
+            result = {"log_id": 1, "direction": 0, "words_result_num": 1,
+                      "words_result": [{"words": "hello"}]}
+        elif self.path.endswith("/animal"):
+            result = {"log_id": 1, "result": [{"name": "熊猫", "score": "0.99"}]}
+        elif self.path.endswith("/embedding-v1"):
+            texts = json.loads(body)["input"]
+            result = {"data": [{"embedding": [0.1, 0.2]} for _ in texts]}
+        else:
+            result = {"code": 404, "message": "not found"}
+        self.reply_json(result, headers={"X-Appbuilder-Request-Id": "rid"})
+
+
+request_tag = contextvars.ContextVar("request_tag", default="")
+
+
+class EchoComponent(Component):
+    def run(self, message):
+        return appbuilder.Message("echo{}: {}".format(request_tag.get(), message.content))
+
+    def tool_eval(self, text, **kwargs):
+        yield "echo{}: {}".format(request_tag.get(), text)
+        yield "done{}".format(request_tag.get())
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreComponentsAsync(LocalServerTestCase):
+    handler_class = FakeServiceHandler
+    patch_env = True
+
+    def setUp(self):
+        FakeServiceHandler.content_types = []
+        super().setUp()
+
+    def test_concurrent_arun(self):
+        ocr = appbuilder.GeneralOCR()
+        message = appbuilder.Message(content={"url": "http://example.com/a.png"})
+        concurrency = 20
+
+        async def run():
+            async with ocr:
+                start = time.perf_counter()
+                results = await asyncio.gather(*[ocr.arun(message) for _ in range(concurrency)])
+                return results, time.perf_counter() - start
+
+        results, elapsed = run_in_new_loop(run())
+        self.assertEqual(len(results), concurrency)
+        self.assertEqual(results[0].content["words_result"][0]["words"], "hello")
+        self.assertEqual(results[0].content, ocr.run(message).content)
+        # 并发请求不应串行执行
+        self.assertLess(elapsed, concurrency * FakeServiceHandler.latency / 2)
+        self.assertTrue(all(ct.startswith("application/x-www-form-urlencoded")
+                            for ct in FakeServiceHandler.content_types))
+
+    def test_atool_eval(self):
+        animal = AnimalRecognition()
+
+        async def run():
+            async with animal:
+                return [output async for output in animal.atool_eval(img_url="http://example.com/a.png")]
+
+        outputs = run_in_new_loop(run())
+        self.assertEqual(len(outputs), 1)
+        self.assertIn("熊猫", outputs[0].content[0].text.info)
+
+    def test_embedding_arun(self):
+        embedding = appbuilder.Embedding()
+
+        async def run():
+            async with embedding:
+                return await embedding.arun("hello")
+
+        self.assertEqual(run_in_new_loop(run()).content, [0.1, 0.2])
+
+    def test_default_async_fallback(self):
+        component = EchoComponent()
+
+        async def run():
+            result = await component.arun(appbuilder.Message("hi"))
+            outputs = [output async for output in component.atool_eval(text="hi")]
+            return result, outputs
+
+        result, outputs = run_in_new_loop(run())
+        self.assertEqual(result.content, "echo: hi")
+        self.assertEqual(outputs, ["echo: hi", "done"])
+
+        # 线程池中执行时保留调用方的contextvars
+        async def tagged():
+            request_tag.set("#1")
+            result = await component.arun(appbuilder.Message("hi"))
+            outputs = [output async for output in component.atool_eval(text="hi")]
+            return result, outputs
+
+        result, outputs = run_in_new_loop(tagged())
+        self.assertEqual(result.content, "echo#1: hi")
+        self.assertEqual(outputs, ["echo#1: hi", "done#1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
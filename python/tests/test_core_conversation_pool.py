@@ -0,0 +1,164 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+import asyncio
+import itertools
+import unittest
+from unittest.mock import patch
+
+import appbuilder
+from appbuilder.core.console.appbuilder_client import conversation_pool
+from appbuilder.core.console.appbuilder_client.conversation_pool import ConversationPool, AsyncConversationPool
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop, wait_until
+
+CREATE_DELAY = 0.2
+
+
+class ConversationHandler(LocalHandler):
+    counter = itertools.count()
+
+    def do_POST(self):
+        self.read_body()
+        time.sleep(CREATE_DELAY)
+        self.reply_json({"request_id": "rid", "conversation_id": "conv-{}".format(next(self.counter))})
+
+
+class FlakyCreate:
+    def __init__(self):
+        self.fail = True
+        self.calls = []
+        self.counter = itertools.count()
+
+    def __call__(self):
+        self.calls.append(time.monotonic())
+        if self.fail:
+            raise appbuilder.AppBuilderServerException(service_err_message="unavailable")
+        return "conv-{}".format(next(self.counter))
+
+    def intervals(self):
+        return [b - a for a, b in zip(self.calls, self.calls[1:])]
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreConversationPool(LocalServerTestCase):
+    handler_class = ConversationHandler
+    patch_env = True
+
+    def test_pool(self):
+        client = appbuilder.AppBuilderClient("app")
+        self.assertEqual(client.conversation_pool_stats(), {})
+        client.enable_conversation_pool(size=2)
+        wait_until(lambda: client.conversation_pool_stats()["size"] == 2)
+
+        start = time.monotonic()
+        ids = [client.create_conversation(), client.create_conversation()]
+        # 命中时不访问网络
+        self.assertLess(time.monotonic() - start, CREATE_DELAY)
+        ids.append(client.create_conversation())
+        self.assertEqual(len(set(ids)), 3)
+        stats = client.conversation_pool_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+        # 后台补充
+        wait_until(lambda: client.conversation_pool_stats()["size"] == 2)
+        self.assertNotIn(client.create_conversation(), ids)
+        client.disable_conversation_pool()
+        self.assertEqual(client.conversation_pool_stats(), {})
+
+    def test_ttl(self):
+        client = appbuilder.AppBuilderClient("app")
+        client.enable_conversation_pool(size=1, ttl=0.5)
+        wait_until(lambda: client.conversation_pool_stats()["created"] == 1)
+        first = client._conversation_pool._conversations[0][0]
+        # 过期的会话被丢弃并补充新的会话
+        wait_until(lambda: client.conversation_pool_stats()["expired"] >= 1)
+        wait_until(lambda: client.conversation_pool_stats()["size"] == 1)
+        self.assertNotEqual(client.create_conversation(), first)
+        client.disable_conversation_pool()
+
+    def test_async_pool(self):
+        async def run():
+            client = appbuilder.AsyncAppBuilderClient("app")
+            client.enable_conversation_pool(size=2)
+            await client.prewarm_conversation_pool()
+            while client.conversation_pool_stats()["size"] < 2:
+                await asyncio.sleep(0.01)
+            start = time.monotonic()
+            ids = await asyncio.gather(client.create_conversation(), client.create_conversation())
+            elapsed = time.monotonic() - start
+            ids.append(await client.create_conversation())
+            stats = client.conversation_pool_stats()
+            await client.aclose()
+            return ids, elapsed, stats, client.conversation_pool_stats()
+
+        ids, elapsed, stats, closed_stats = run_in_new_loop(run())
+        self.assertLess(elapsed, CREATE_DELAY)
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertEqual(closed_stats, {})
+
+    @patch.multiple(conversation_pool, REFILL_RETRY_INTERVAL=0.05, REFILL_MAX_RETRY_INTERVAL=0.1,
+                    REFILL_MAX_FAILURES=4)
+    def test_refill_backoff(self):
+        create = FlakyCreate()
+        pool = ConversationPool(create, size=2)
+        wait_until(lambda: pool.stats()["errors"] == 4)
+        time.sleep(0.3)
+        # 连续失败后暂停补充，重试间隔按指数增长且不超过上限
+        self.assertEqual(len(create.calls), 4)
+        intervals = create.intervals()
+        self.assertGreaterEqual(intervals[0], 0.05 * 0.9)
+        self.assertGreaterEqual(intervals[1], 0.1 * 0.9)
+        self.assertLess(intervals[2], 0.2 * 0.9)
+
+        # 下一次acquire恢复补充
+        create.fail = False
+        self.assertEqual(pool.acquire(), "conv-0")
+        wait_until(lambda: pool.stats()["size"] == 2)
+        self.assertEqual(pool.stats()["created"], 2)
+        pool.close()
+
+    @patch.multiple(conversation_pool, REFILL_RETRY_INTERVAL=0.05, REFILL_MAX_RETRY_INTERVAL=0.1,
+                    REFILL_MAX_FAILURES=4)
+    def test_async_refill_backoff(self):
+        create = FlakyCreate()
+
+        async def acreate():
+            return create()
+
+        async def run():
+            pool = AsyncConversationPool(acreate, size=2)
+            await pool.prewarm()
+            while pool.stats()["errors"] < 4:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.3)
+            suspended_calls = len(create.calls)
+            create.fail = False
+            first = await pool.acquire()
+            while pool.stats()["size"] < 2:
+                await asyncio.sleep(0.01)
+            stats = pool.stats()
+            await pool.aclose()
+            return suspended_calls, first, stats
+
+        suspended_calls, first, stats = run_in_new_loop(run())
+        self.assertEqual(suspended_calls, 4)
+        self.assertGreaterEqual(create.intervals()[1], 0.1 * 0.9)
+        self.assertEqual(first, "conv-0")
+        self.assertEqual((stats["errors"], stats["created"]), (4, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
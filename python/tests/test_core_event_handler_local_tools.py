@@ -0,0 +1,199 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import time
+import asyncio
+import unittest
+
+import appbuilder
+from appbuilder.core.component import Component, ComponentOutput, Content
+from appbuilder.core.console.appbuilder_client.event_handler import (
+    AppBuilderEventHandler,
+    _call_tool,
+    _tool_output_text,
+)
+from appbuilder.core.console.appbuilder_client.async_event_handler import AsyncAppBuilderEventHandler, _acall_tool
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+TOOL_CALLS = [
+    {"id": "call_weather", "type": "function", "function": {"name": "get_weather", "arguments": {"city": "北京"}}},
+    {"id": "call_news", "type": "function", "function": {"name": "get_news", "arguments": {"topic": "AI"}}},
+    {"id": "call_echo", "type": "function", "function": {"name": "echo_component", "arguments": {"text": "hi"}}},
+    {"id": "call_slow", "type": "function", "function": {"name": "slow_tool", "arguments": {}}},
+    {"id": "call_missing", "type": "function", "function": {"name": "missing_tool", "arguments": {}}},
+]
+
+
+def make_response(status, tool_calls=None):
+    return {"request_id": "rid", "answer": "done" if status == "success" else "", "conversation_id": "c",
+            "message_id": "m", "content": [{
+                "event_code": 0, "event_type": "Interrupt" if tool_calls else "ChatAgent",
+                "event_status": status, "content_type": "contexts" if tool_calls else "text",
+                "outputs": {}, "tool_calls": tool_calls}]}
+
+
+class RunHandler(LocalHandler):
+    tool_outputs = []
+
+    def do_POST(self):
+        body = json.loads(self.read_body())
+        if body.get("tool_outputs"):
+            self.tool_outputs.append(body["tool_outputs"])
+            data = make_response("success")
+        else:
+            data = make_response("interrupt", TOOL_CALLS)
+        if body["stream"]:
+            result = "data: {}\n\n".format(json.dumps(data)).encode()
+            content_type = "text/event-stream"
+        else:
+            result = json.dumps(data).encode()
+            content_type = "application/json"
+        self.reply(200, result, content_type)
+
+
+class EchoComponent(Component):
+    manifests = [{"name": "echo_component", "description": "echo", "parameters": {}}]
+
+    def tool_eval(self, text, **kwargs):
+        yield self.create_output(type="text", text="echo " + text)
+
+
+class V1EchoComponent(Component):
+    manifests = [{"name": "v1_echo", "description": "echo", "parameters": {}}]
+
+    def tool_eval(self, name, streaming, **kwargs):
+        res = "{} {}".format(name, kwargs["text"])
+        if streaming:
+            yield {"type": "text", "text": res, "visible_scope": "llm"}
+            yield {"type": "text", "text": "展示给用户", "visible_scope": "user"}
+        else:
+            return res
+
+    async def atool_eval(self, name, streaming, **kwargs):
+        res = "{} {}".format(name, kwargs["text"])
+        if streaming:
+            yield {"type": "text", "text": res, "visible_scope": "llm"}
+            yield {"type": "text", "text": "展示给用户", "visible_scope": "user"}
+        else:
+            yield res
+
+
+def get_weather(city):
+    time.sleep(0.3)
+    return "{}晴".format(city)
+
+
+def get_news(topic):
+    time.sleep(0.3)
+    return {"topic": topic, "news": ["新闻"]}
+
+
+def slow_tool():
+    time.sleep(2)
+    return "slow"
+
+
+async def aget_weather(city):
+    await asyncio.sleep(0.3)
+    return "{}晴".format(city)
+
+
+async def aslow_tool():
+    await asyncio.sleep(2)
+    return "slow"
+
+
+EXPECTED_OUTPUTS = [
+    {"tool_call_id": "call_weather", "output": "北京晴"},
+    {"tool_call_id": "call_news", "output": '{"topic":"AI","news":["新闻"]}'},
+    {"tool_call_id": "call_echo", "output": "echo hi"},
+    {"tool_call_id": "call_slow", "output": "tool slow_tool timed out after 0.5s"},
+    {"tool_call_id": "call_missing", "output": "tool missing_tool is not registered"},
+]
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreEventHandlerLocalTools(LocalServerTestCase):
+    handler_class = RunHandler
+    patch_env = True
+
+    def setUp(self):
+        RunHandler.tool_outputs.clear()
+        super().setUp()
+
+    def test_parallel_tool_calls(self):
+        client = appbuilder.AppBuilderClient("app")
+        event_handler = AppBuilderEventHandler(
+            local_tools=[get_weather, get_news, EchoComponent()], tool_timeout=1)
+        event_handler.register_tool("slow_tool", slow_tool, timeout=0.5)
+        start = time.monotonic()
+        with client.run_with_handler("conversation", query="query", event_handler=event_handler) as run:
+            run.until_done()
+        elapsed = time.monotonic() - start
+        # 所有工具调用并发执行，并在一次请求中提交
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(RunHandler.tool_outputs, [EXPECTED_OUTPUTS])
+
+    def test_async_parallel_tool_calls(self):
+        async def run():
+            client = appbuilder.AsyncAppBuilderClient("app")
+            event_handler = AsyncAppBuilderEventHandler(
+                local_tools={"get_weather": aget_weather, "get_news": get_news,
+                             "echo_component": EchoComponent()})
+            event_handler.register_tool("slow_tool", aslow_tool, timeout=0.5)
+            start = time.monotonic()
+            event_handler = await client.run_with_handler(
+                "conversation", query="query", event_handler=event_handler, stream=True)
+            async for _ in event_handler:
+                pass
+            elapsed = time.monotonic() - start
+            await client.http_client.aclose()
+            return elapsed
+
+        elapsed = run_in_new_loop(run())
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(RunHandler.tool_outputs, [EXPECTED_OUTPUTS])
+
+    def test_tool_output_text(self):
+        output = ComponentOutput(content=[
+            Content(type="text", text={"info": "给模型"}, visible_scope="llm"),
+            Content(type="text", text={"info": "给用户"}, visible_scope="user"),
+            Content(type="image", text={"filename": "a.png", "byte": b"\x89PNG"}),
+        ])
+        text = _tool_output_text(output)
+        lines = text.split("\n")
+        self.assertEqual(lines[0], "给模型")
+        self.assertNotIn("给用户", text)
+        # bytes字段无法序列化为JSON时退化为str
+        self.assertEqual(len(lines), 2)
+        self.assertIn("a.png", lines[1])
+        self.assertEqual(_tool_output_text({"raw": b"\x00"}), str({"raw": b"\x00"}))
+
+    def test_v1_component_tool(self):
+        component = V1EchoComponent()
+        self.assertEqual(_call_tool(component, {"text": "hi"}), "v1_echo hi")
+        self.assertEqual(_call_tool(component, {"text": "hi", "streaming": False}), "v1_echo hi")
+        self.assertEqual(_call_tool(EchoComponent(), {"text": "hi"}), "echo hi")
+
+        async def run():
+            return [await _acall_tool(component, {"text": "hi"}),
+                    await _acall_tool(component, {"name": "tool", "text": "hi"}),
+                    await _acall_tool(EchoComponent(), {"text": "hi"})]
+
+        self.assertEqual(run_in_new_loop(run()), ["v1_echo hi", "tool hi", "echo hi"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import unittest
+import importlib.util
+
+import requests
+
+from appbuilder.utils import json_util
+from appbuilder.core._client import HTTPClient, AsyncHTTPClient
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+INSTALLED_BACKENDS = [name for name in ("orjson", "ujson") if importlib.util.find_spec(name)] + ["json"]
+
+
+class EchoHandler(LocalHandler):
+    def do_POST(self):
+        body = self.read_body()
+        if self.path.endswith("/invalid"):
+            body = b"not json"
+        self.reply(200, body, self.headers.get("Content-Type", ""))
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreJsonCodec(LocalServerTestCase):
+    handler_class = EchoHandler
+
+    def setUp(self):
+        self.backend = json_util.get_backend()
+        super().setUp()
+
+    def tearDown(self):
+        json_util.set_backend(self.backend)
+
+    def test_default_backend(self):
+        if "APPBUILDER_JSON_BACKEND" not in os.environ:
+            self.assertEqual(self.backend, "json")
+        json_util.set_backend("json")
+        # 默认实现与标准库行为一致：大整数保持精确，NaN按标准库序列化
+        self.assertEqual(json_util.loads('{"a": 123456789012345678901234567890}')["a"],
+                         123456789012345678901234567890)
+        self.assertEqual(json_util.dumps({"x": float("nan")}), '{"x":NaN}')
+
+    def test_backends(self):
+        self.assertEqual(json_util.set_backend("auto"), INSTALLED_BACKENDS[0])
+        with self.assertRaises(ValueError):
+            json_util.set_backend("simplejson")
+        obj = {"answer": "你好/\n", "ids": [1, 2 ** 70], 3: None, "score": 0.5}
+        for backend in INSTALLED_BACKENDS:
+            json_util.set_backend(backend)
+            body = json_util.dumps_bytes(obj)
+            self.assertIsInstance(body, bytes)
+            self.assertEqual(json.loads(body), json.loads(json.dumps(obj)))
+            self.assertIn("你好", json_util.dumps(obj))
+            self.assertEqual(json_util.loads(body.decode()), json_util.loads(body))
+            self.assertEqual(json_util.loads('{"a": NaN}')["a"] != 0, True)
+            with self.assertRaises(json.JSONDecodeError):
+                json_util.loads(b'{"a": ')
+
+    def test_sessions(self):
+        payload = {"query": "中文", "stream": False, "ids": [1, 2]}
+        for transport in ("requests", "httpx"):
+            client = HTTPClient(secret_key="test", gateway=self.gateway, transport=transport)
+            response = client.session.post(client.service_url("/echo"), json=payload)
+            # 请求体由json_util序列化：紧凑格式，非ASCII字符不转义
+            self.assertEqual(response.content, json_util.dumps_bytes(payload))
+            self.assertEqual(response.headers["Content-Type"], "application/json")
+            self.assertEqual(response.json(), payload)
+            response = client.session.post(client.service_url("/invalid"), json=payload)
+            # 与各传输库原有行为一致：requests抛出requests.exceptions.JSONDecodeError，httpx抛出json.JSONDecodeError
+            expected = requests.exceptions.JSONDecodeError if transport == "requests" else json.JSONDecodeError
+            with self.assertRaises(expected):
+                response.json()
+
+        async def run():
+            results = []
+            for transport in ("requests", "httpx"):
+                client = AsyncHTTPClient(secret_key="test", gateway=self.gateway, transport=transport)
+                response = await client.session.post(client.service_url("/echo"), json=payload)
+                results.append((await response.read(), await response.json()))
+                await client.aclose()
+            return results
+
+        results = run_in_new_loop(run())
+        for body, data in results:
+            self.assertEqual(body, json_util.dumps_bytes(payload))
+            self.assertEqual(data, payload)
+
+
+if __name__ == '__main__':
+    unittest.main()
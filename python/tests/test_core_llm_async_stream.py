@@ -0,0 +1,130 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import time
+import asyncio
+import unittest
+
+import appbuilder
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+CHUNK_DELAY = 0.2
+CHUNKS = [
+    {"answer": "你"},
+    {"answer": "好", "tool": "search_db", "result": [{"content": "c"}]},
+    {"answer": "！", "usage": {"prompt_tokens": 3, "completion_tokens": 3, "total_tokens": 6}},
+]
+
+
+class LLMHandler(LocalHandler):
+    paths = []
+
+    def do_POST(self):
+        body = json.loads(self.read_body())
+        self.paths.append(self.path)
+        if body["response_mode"] == "streaming":
+            self.start_chunked()
+            for i, chunk in enumerate(CHUNKS):
+                if i:
+                    time.sleep(CHUNK_DELAY)
+                self.write_chunk("data: {}\n\n".format(json.dumps(chunk)).encode())
+            self.write_chunk(b"")
+            return
+        self.reply_json({"answer": "echo " + body["query"], "usage": {"total_tokens": 1}})
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreLLMAsyncStream(LocalServerTestCase):
+    handler_class = LLMHandler
+    patch_env = True
+    patch_model_url = True
+
+    def setUp(self):
+        LLMHandler.paths = []
+        super().setUp()
+
+    def test_arun_stream(self):
+        playground = appbuilder.Playground(prompt_template="{query}", model="ERNIE", lazy_certification=True)
+
+        async def consume():
+            start = time.monotonic()
+            message = await playground.arun(appbuilder.Message("你好"), stream=True)
+            chunks, times, extras = [], [], []
+            async for chunk in message.content:
+                chunks.append(chunk)
+                times.append(time.monotonic() - start)
+                extras.append(message.extra)
+            await playground.aclose()
+            return message, chunks, times, extras
+
+        message, chunks, times, extras = run_in_new_loop(consume())
+        self.assertEqual(chunks, ["你", "好", "！"])
+        # 首个片段在后续片段生成前到达
+        self.assertLess(times[0], CHUNK_DELAY)
+        self.assertEqual(extras, [{}, {"search_db": [{"content": "c"}]}, {}])
+        # 迭代结束后content更新为完整回答
+        self.assertEqual(message.content, "你好！")
+        self.assertEqual(message.token_usage["total_tokens"], 6)
+        self.assertTrue(LLMHandler.paths[0].endswith("/api/llm/playground"))
+
+    def test_concurrent_streams_in_one_loop(self):
+        playground = appbuilder.Playground(prompt_template="{query}", model="ERNIE", lazy_certification=True)
+        summary = appbuilder.DialogSummary(model="ERNIE", lazy_certification=True)
+        detection = appbuilder.HallucinationDetection(model="ERNIE", lazy_certification=True)
+        rewrite = appbuilder.QueryRewrite(model="ERNIE", lazy_certification=True)
+
+        async def collect(coro):
+            message = await coro
+            return "".join([chunk async for chunk in message.content])
+
+        async def run():
+            calls = [playground.arun(appbuilder.Message("q{}".format(i)), stream=True) for i in range(6)]
+            calls.append(summary.arun(appbuilder.Message("对话"), stream=True))
+            calls.append(detection.arun(appbuilder.Message(
+                {"query": "q", "context": "c", "answer": "a"}), stream=True))
+            calls.append(rewrite.arun(appbuilder.Message(["你好", "有什么可以帮您", "天气"]), stream=True))
+            start = time.monotonic()
+            answers = await asyncio.gather(*[collect(call) for call in calls])
+            elapsed = time.monotonic() - start
+            for component in (playground, summary, detection, rewrite):
+                await component.aclose()
+            return answers, elapsed
+
+        answers, elapsed = run_in_new_loop(run())
+        self.assertEqual(answers, ["你好！"] * 9)
+        # 9个流在同一事件循环中并发读取，总耗时约为单个流的耗时
+        self.assertLess(elapsed, CHUNK_DELAY * len(CHUNKS))
+        self.assertTrue(any(path.endswith("/app/hallucination_detection") for path in LLMHandler.paths))
+        self.assertTrue(any(path.endswith("/api/llm/query_rewrite") for path in LLMHandler.paths))
+
+    def test_arun_blocking_and_fallback(self):
+        playground = appbuilder.Playground(prompt_template="{query}", model="ERNIE", lazy_certification=True)
+        # StyleWriting只重写了run，arun在线程池中执行run
+        writer = appbuilder.StyleWriting(model="ERNIE", lazy_certification=True)
+
+        async def run():
+            first = await playground.arun(appbuilder.Message("hi"))
+            second = await writer.arun(appbuilder.Message("文案"))
+            await playground.aclose()
+            return first, second
+
+        first, second = run_in_new_loop(run())
+        self.assertEqual(first.content, "echo hi")
+        self.assertEqual(first.token_usage, {"total_tokens": 1})
+        self.assertEqual(second.content, "echo 文案")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import copy
+import json
+import time
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import appbuilder
+from appbuilder.core.components.llms.base import CompletionBaseComponent
+from tests.local_server import LocalHandler, LocalServerTestCase
+
+
+class EchoConfigHandler(LocalHandler):
+    def do_POST(self):
+        body = json.loads(self.read_body())
+        # 打乱完成顺序，放大并发交错
+        time.sleep(random.random() * 0.01)
+        self.reply_json({"answer": json.dumps(body["model_config"])})
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreLLMModelConfig(LocalServerTestCase):
+    handler_class = EchoConfigHandler
+    patch_env = True
+    patch_model_url = True
+
+    def setUp(self):
+        super().setUp()
+        self.template = copy.deepcopy(CompletionBaseComponent.model_config)
+
+    def test_concurrent_calls_are_isolated(self):
+        playground = appbuilder.Playground(prompt_template="{query}", model="ERNIE-A", lazy_certification=True)
+        writer = appbuilder.StyleWriting(model="ERNIE-B", lazy_certification=True)
+
+        def call(i):
+            temperature = round(0.01 * (i % 100) + 0.001, 3)
+            if i % 2:
+                extra = {"penalty_score": i} if i % 4 == 1 else {}
+                message = playground.run(appbuilder.Message("q"), temperature=temperature, top_p=0.5, **extra)
+                return "ERNIE-A", temperature, extra, json.loads(message.content)
+            message = writer.run(appbuilder.Message("q"), temperature=temperature)
+            return "ERNIE-B", temperature, {}, json.loads(message.content)
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(call, range(400)))
+
+        for model, temperature, extra, config in results:
+            self.assertEqual(config["model"]["name"], model)
+            self.assertEqual(config["model"]["url"], "https://model/" + model)
+            params = config["model"]["completion_params"]
+            self.assertEqual(params["temperature"], temperature)
+            # 其他调用的额外参数不会出现在本次请求中
+            self.assertEqual(params.get("penalty_score"), extra.get("penalty_score"))
+        # 类属性模板保持不变
+        self.assertEqual(CompletionBaseComponent.model_config, self.template)
+
+    def test_get_model_config_returns_new_dict(self):
+        writer = appbuilder.StyleWriting(model="ERNIE-B", lazy_certification=True)
+        inputs = appbuilder.core.components.llms.base.ModelArgsConfig(temperature=0.5)
+        first = writer.get_model_config(inputs, {"penalty_score": 1.2})
+        second = writer.get_model_config(inputs)
+        self.assertIsNot(first, second)
+        self.assertEqual(first["model"]["completion_params"]["penalty_score"], 1.2)
+        self.assertNotIn("penalty_score", second["model"]["completion_params"])
+        self.assertEqual(second["model"]["provider"], "baidu")
+        self.assertEqual(CompletionBaseComponent.model_config, self.template)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gc
+import os
+import json
+import time
+import asyncio
+import weakref
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import appbuilder
+from appbuilder.core._client import HTTPClient
+from appbuilder.core._exception import ModelNotSupportedException
+from appbuilder.core.utils import ModelCatalog, model_catalog
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop, wait_until
+
+LIST_DELAY = 0.1
+
+
+def model(name, api_type="chat"):
+    return {"name": name, "apiType": api_type,
+            "url": "https://aip.baidubce.com/rpc/2.0/ai_custom/v1/wenxinworkshop/chat/" + name.lower()}
+
+
+class ModelListHandler(LocalHandler):
+    calls = []
+    fail = False
+
+    def do_POST(self):
+        body = json.loads(self.read_body())
+        if "query" in body:
+            # 大模型组件的请求
+            return self.reply_json({"answer": "echo " + body["query"]})
+        self.calls.append(self.headers["X-Appbuilder-Authorization"])
+        time.sleep(LIST_DELAY)
+        if self.fail:
+            data = {"error_code": 500, "error_msg": "unavailable"}
+        else:
+            data = {"success": True, "result": {
+                "common": [model("ERNIE-A"), model("Embedding-V1", "embeddings")],
+                "custom": [model("Custom-{}".format(len(self.calls)))]}}
+        self.reply_json(data)
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreModelCatalog(LocalServerTestCase):
+    handler_class = ModelListHandler
+    patch_env = True
+
+    def setUp(self):
+        ModelListHandler.calls = []
+        ModelListHandler.fail = False
+        super().setUp()
+        model_catalog.clear()
+
+    def tearDown(self):
+        model_catalog.clear()
+
+    def test_shared_across_instances(self):
+        playgrounds = [appbuilder.Playground(prompt_template="{query}", model="ERNIE-A") for _ in range(10)]
+        self.assertEqual(len(ModelListHandler.calls), 1)
+        model_info = playgrounds[0].model_info
+        self.assertIs(playgrounds[-1].model_info, model_info)
+        self.assertEqual(
+            model_info.get_model_url("ERNIE-A"),
+            self.gateway + "/rpc/2.0/cloud_hub/v1/bce/wenxinworkshop/ai_custom/v1/chat/ernie-a")
+        self.assertEqual(model_info.get_model_type("Embedding-V1"), "embeddings")
+        with self.assertRaises(ModelNotSupportedException):
+            model_info.get_model_type("missing")
+        with self.assertRaises(ModelNotSupportedException):
+            appbuilder.Playground(prompt_template="{query}", model="Embedding-V1")
+
+        # 不同密钥使用各自的模型目录
+        other = appbuilder.Playground(prompt_template="{query}", model="ERNIE-A", secret_key="other")
+        self.assertEqual(len(ModelListHandler.calls), 2)
+        self.assertIsNot(other.model_info, model_info)
+
+        # 模型目录不引用组件实例
+        ref = weakref.ref(playgrounds[0])
+        del playgrounds
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_concurrent_first_get(self):
+        client = HTTPClient()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            infos = list(executor.map(lambda _: model_catalog.get(client), range(8)))
+        self.assertEqual(len(ModelListHandler.calls), 1)
+        self.assertTrue(all(info is infos[0] for info in infos))
+
+    def test_async_cold_catalog_does_not_block_loop(self):
+        playground = appbuilder.Playground(prompt_template="{query}", model="ERNIE-A", lazy_certification=True)
+        gaps = []
+
+        async def ticker(done):
+            last = time.monotonic()
+            while not done.is_set():
+                await asyncio.sleep(0.005)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        async def run():
+            done = asyncio.Event()
+            task = asyncio.ensure_future(ticker(done))
+            await asyncio.sleep(0.01)
+            message = await playground.arun(appbuilder.Message("q"))
+            done.set()
+            await task
+            await playground.aclose()
+            return message
+
+        message = run_in_new_loop(run())
+        self.assertEqual(message.content, "echo q")
+        self.assertEqual(len(ModelListHandler.calls), 1)
+        # 拉取模型列表期间同一事件循环中的其他任务照常运行
+        self.assertLess(max(gaps), LIST_DELAY / 2)
+
+    def test_background_refresh(self):
+        catalog = ModelCatalog(ttl=1, refresh_ratio=0.3)
+        client = HTTPClient()
+        first = catalog.get(client)
+        self.assertEqual(first.get_model_type("Custom-1"), "chat")
+
+        time.sleep(0.4)
+        start = time.monotonic()
+        # 达到刷新阈值后立即返回当前目录，并在后台刷新
+        self.assertIs(catalog.get(client), first)
+        self.assertLess(time.monotonic() - start, LIST_DELAY)
+        wait_until(lambda: catalog.get(client) is not first)
+        second = catalog.get(client)
+        self.assertEqual(second.get_model_type("Custom-2"), "chat")
+
+        # 后台刷新失败时保留旧目录
+        ModelListHandler.fail = True
+        time.sleep(0.4)
+        self.assertIs(catalog.get(client), second)
+        wait_until(lambda: len(ModelListHandler.calls) == 3)
+        wait_until(lambda: not catalog._refreshing)
+        self.assertIs(catalog.get(client), second)
+
+        # 过期后同步重新拉取
+        ModelListHandler.fail = False
+        time.sleep(1)
+        third = catalog.get(client)
+        self.assertIsNot(third, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
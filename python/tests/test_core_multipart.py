@@ -0,0 +1,156 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+import tracemalloc
+from email.parser import BytesParser
+from email.policy import HTTP
+from unittest.mock import patch
+
+import appbuilder
+from appbuilder.core._client import HTTPClient, AsyncHTTPClient
+from appbuilder.core._multipart import MultipartEncoder
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+
+def parse_multipart(content_type, body):
+    message = BytesParser(policy=HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body)
+    return {part.get_param("name", header="content-disposition"): part for part in message.iter_parts()}
+
+
+class UploadHandler(LocalHandler):
+    received = []
+
+    def do_POST(self):
+        body = self.read_body()
+        fields = parse_multipart(self.headers["Content-Type"], body)
+        self.received.append({
+            "path": self.path,
+            "transfer_encoding": self.headers.get("Transfer-Encoding"),
+            "fields": {name: part.get_payload(decode=True) for name, part in fields.items()},
+            "filenames": {name: part.get_filename() for name, part in fields.items()},
+        })
+        self.reply_json({"request_id": "rid", "id": "file_id"})
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreMultipart(LocalServerTestCase):
+    handler_class = UploadHandler
+
+    def setUp(self):
+        UploadHandler.received.clear()
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmpdir.name, "测试.pdf")
+        self.file_content = os.urandom(300 * 1024 + 7)
+        with open(self.file_path, "wb") as f:
+            f.write(self.file_content)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_encoder(self):
+        progress = []
+        encoder = MultipartEncoder(
+            fields=[("payload", '{"a": "中文"}'), ("file", (os.path.basename(self.file_path), self.file_path))],
+            chunk_size=64 * 1024,
+            progress_callback=lambda uploaded, total: progress.append((uploaded, total)),
+        )
+        body = encoder.to_bytes()
+        self.assertEqual(len(body), len(encoder))
+        self.assertEqual(progress[-1], (len(encoder), len(encoder)))
+        self.assertEqual([p[0] for p in progress], sorted(p[0] for p in progress))
+        fields = parse_multipart(encoder.content_type, body)
+        self.assertEqual(fields["payload"].get_payload(decode=True).decode(), '{"a": "中文"}')
+        self.assertEqual(fields["file"].get_payload(decode=True), self.file_content)
+        self.assertEqual(fields["file"].get_content_type(), "application/pdf")
+        # 再次迭代得到相同的请求体，请求重试时可以重新发送
+        self.assertEqual(encoder.to_bytes(), body)
+
+        with self.assertRaises(FileNotFoundError):
+            MultipartEncoder(fields=[("file", ("a.pdf", os.path.join(self.tmpdir.name, "missing.pdf")))])
+
+    def test_constant_memory(self):
+        big_file = os.path.join(self.tmpdir.name, "big.bin")
+        with open(big_file, "wb") as f:
+            for _ in range(16):
+                f.write(os.urandom(1024 * 1024))
+        encoder = MultipartEncoder(fields=[("file", ("big.bin", big_file))])
+        tracemalloc.start()
+        try:
+            size = sum(len(chunk) for chunk in encoder)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(size, len(encoder))
+        self.assertLess(peak, 1024 * 1024)
+
+    def test_sessions(self):
+        encoder = MultipartEncoder(fields=[("file", ("a.pdf", self.file_path)), ("app_id", "app")])
+        for transport in ("requests", "httpx"):
+            client = HTTPClient(secret_key="test", gateway=self.gateway, transport=transport)
+            headers = client.auth_header()
+            headers.update(encoder.headers)
+            response = client.session.post(client.service_url("/upload"), data=encoder, headers=headers)
+            self.assertEqual(response.status_code, 200)
+
+        async def run():
+            for transport in ("aiohttp", "httpx"):
+                client = AsyncHTTPClient(
+                    secret_key="test", gateway=self.gateway,
+                    transport="httpx" if transport == "httpx" else "requests")
+                headers = client.auth_header()
+                headers.update(encoder.headers)
+                response = await client.session.post(client.service_url("/upload"), data=encoder, headers=headers)
+                self.assertEqual(response.status, 200)
+                await response.json()
+                await client.aclose()
+
+        run_in_new_loop(run())
+
+        self.assertEqual(len(UploadHandler.received), 4)
+        for received in UploadHandler.received:
+            self.assertIsNone(received["transfer_encoding"])
+            self.assertEqual(received["fields"]["file"], self.file_content)
+            self.assertEqual(received["fields"]["app_id"], b"app")
+
+    def test_appbuilder_client_upload(self):
+        env = {"APPBUILDER_TOKEN": "test", "GATEWAY_URL": self.gateway, "GATEWAY_URL_V2": self.gateway}
+        progress = []
+        with patch.dict(os.environ, env):
+            client = appbuilder.AppBuilderClient("app")
+            file_id = client.upload_local_file(
+                "conversation", self.file_path, progress_callback=lambda uploaded, total: progress.append(total))
+            self.assertEqual(file_id, "file_id")
+
+            async def run():
+                async_client = appbuilder.AsyncAppBuilderClient("app")
+                file_id = await async_client.upload_local_file("conversation", self.file_path)
+                await async_client.http_client.aclose()
+                return file_id
+
+            self.assertEqual(run_in_new_loop(run()), "file_id")
+
+        self.assertTrue(progress)
+        for received in UploadHandler.received:
+            self.assertTrue(received["path"].endswith("/app/conversation/file/upload"))
+            self.assertEqual(received["fields"]["file"], self.file_content)
+            self.assertEqual(received["filenames"]["file"], "测试.pdf")
+            self.assertEqual(received["fields"]["conversation_id"], b"conversation")
+
+
+if __name__ == '__main__':
+    unittest.main()
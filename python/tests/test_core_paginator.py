@@ -0,0 +1,132 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import time
+import unittest
+from urllib.parse import parse_qs, urlparse
+
+import appbuilder
+from appbuilder.core._paginator import Paginator
+from appbuilder.core.console.appbuilder_client import appbuilder_client
+from tests.local_server import LocalHandler, LocalServerTestCase
+
+PAGE_DELAY = 0.2
+APP_IDS = ["app-{:03d}".format(i) for i in range(250)]
+DOC_IDS = ["doc-{:03d}".format(i) for i in range(120)]
+
+
+def page_after(ids, marker, size):
+    start = ids.index(marker) + 1 if marker else 0
+    return ids[start:start + size]
+
+
+class ListHandler(LocalHandler):
+    requests = []
+
+    def do_POST(self):
+        # DescribeApps
+        body = json.loads(self.read_body())
+        self.requests.append(body.get("marker"))
+        ids = page_after(APP_IDS, body.get("marker"), body["maxKeys"])
+        self.reply_page({"requestId": "rid", "data": [{"id": app_id, "name": app_id} for app_id in ids]})
+
+    def do_GET(self):
+        # 知识库文档列表
+        params = parse_qs(urlparse(self.path).query)
+        after = params.get("after", [""])[0]
+        self.requests.append(after)
+        ids = page_after(DOC_IDS, after, int(params["limit"][0]))
+        self.reply_page({"request_id": "rid", "data": [
+            {"id": doc_id, "name": doc_id, "created_at": 0, "word_count": 1, "meta": None} for doc_id in ids]})
+
+    def reply_page(self, data):
+        time.sleep(PAGE_DELAY)
+        self.reply_json(data)
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCorePaginator(LocalServerTestCase):
+    handler_class = ListHandler
+    patch_env = True
+
+    def setUp(self):
+        ListHandler.requests = []
+        super().setUp()
+        appbuilder_client._app_listing_cache.clear()
+
+    def tearDown(self):
+        appbuilder_client._app_listing_cache.clear()
+
+    def test_iter_apps_prefetch(self):
+        start = time.monotonic()
+        apps = appbuilder.iter_apps()
+        first = next(apps)
+        # 惰性请求，取第一条只需请求首页
+        self.assertLess(time.monotonic() - start, PAGE_DELAY * 2)
+        self.assertEqual(first.id, "app-000")
+
+        ids = [first.id]
+        for app in apps:
+            ids.append(app.id)
+            if app.id.endswith("99"):
+                # 调用方处理每页末条时，下一页已在后台请求
+                time.sleep(PAGE_DELAY)
+        elapsed = time.monotonic() - start
+        self.assertEqual(ids, APP_IDS)
+        self.assertEqual(ListHandler.requests, [None, "app-099", "app-199"])
+        # 三次请求与两次处理重叠，顺序执行约需5个PAGE_DELAY
+        self.assertLess(elapsed, PAGE_DELAY * 4.5)
+
+    def test_get_all_apps_cache(self):
+        apps = appbuilder.get_all_apps(cache_ttl=60)
+        self.assertEqual([app.id for app in apps], APP_IDS)
+        self.assertEqual(len(ListHandler.requests), 3)
+
+        cached = appbuilder.get_all_apps(cache_ttl=60)
+        self.assertEqual(cached, apps)
+        self.assertEqual(len(ListHandler.requests), 3)
+
+        # 未指定cache_ttl时总是请求服务端
+        appbuilder.get_all_apps()
+        self.assertEqual(len(ListHandler.requests), 6)
+        appbuilder.get_all_apps(secret_key="other", cache_ttl=60)
+        self.assertEqual(len(ListHandler.requests), 9)
+
+    def test_iter_documents(self):
+        knowledge = appbuilder.KnowledgeBase(knowledge_id="kb")
+        documents = knowledge.get_all_documents()
+        self.assertEqual([document.id for document in documents], DOC_IDS)
+        self.assertEqual(ListHandler.requests, ["", "doc-099"])
+        self.assertEqual([document.id for document in knowledge.iter_documents(page_size=50)], DOC_IDS)
+
+    def test_paginator_early_stop(self):
+        calls = []
+
+        def fetch(marker):
+            calls.append(marker)
+            start = int(marker) + 1 if marker else 0
+            return [str(i) for i in range(start, start + 10)]
+
+        paginator = Paginator(fetch, page_size=10, cursor=lambda item: item, prefetch=False)
+        items = iter(paginator)
+        self.assertEqual([next(items) for _ in range(15)], [str(i) for i in range(15)])
+        items.close()
+        self.assertEqual(calls, [None, "9"])
+        with self.assertRaises(ValueError):
+            Paginator(fetch, page_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+import asyncio
+import unittest
+import threading
+
+import appbuilder
+from appbuilder.core.pipeline import STATUS_CANCELLED, STATUS_DONE, STATUS_SKIPPED
+from tests.local_server import run_in_new_loop
+
+DELAY = 0.2
+
+
+def slow(value, delay=DELAY):
+    def func(outputs):
+        time.sleep(delay)
+        return value(outputs) if callable(value) else value
+    return func
+
+
+def build(complex_answer):
+    # 复杂度判断与拆解、改写并行执行，检索依赖被选中的一支
+    pipeline = appbuilder.Pipeline()
+    pipeline.add_stage("complex", slow(complex_answer), inputs=["query"])
+    pipeline.add_stage("decompose", slow(lambda o: [o["query"] + "-1", o["query"] + "-2"]), inputs=["query"],
+                       when=lambda o: o["complex"] == "复杂问题", when_inputs=["complex"], speculative=True)
+    pipeline.add_stage("rewrite", slow(lambda o: [o["query"] + "?"]), inputs=["query"],
+                       when=lambda o: o["complex"] == "简单问题", when_inputs=["complex"], speculative=True)
+    pipeline.add_stage("retrieve", slow(lambda o: o.get("decompose") or o.get("rewrite")),
+                       inputs=["decompose", "rewrite"])
+    return pipeline
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCorePipeline(unittest.TestCase):
+    def test_speculative_run(self):
+        result = build("复杂问题").run(query="q")
+        self.assertEqual(result["retrieve"], ["q-1", "q-2"])
+        self.assertEqual(result.records["decompose"].status, STATUS_DONE)
+        self.assertEqual(result.records["rewrite"].status, STATUS_CANCELLED)
+        self.assertNotIn("rewrite", result.outputs)
+        self.assertEqual(set(result.latency), {"complex", "decompose", "retrieve"})
+        for latency in result.latency.values():
+            self.assertGreaterEqual(latency, DELAY * 0.9)
+        # 三个前置阶段并行，端到端约为两个阶段的耗时，顺序执行需要三个
+        self.assertLess(result.elapsed, DELAY * 2.8)
+
+        result = build("简单问题").run(query="q")
+        self.assertEqual(result["retrieve"], ["q?"])
+        self.assertEqual(result.records["decompose"].status, STATUS_CANCELLED)
+
+    def test_non_speculative_and_errors(self):
+        calls = []
+        pipeline = appbuilder.Pipeline()
+        pipeline.add_stage("a", slow(1, 0.05))
+        pipeline.add_stage("b", lambda o: calls.append("b"), when=lambda o: o["a"] > 1, when_inputs=["a"])
+        pipeline.add_stage("c", lambda o: o["a"] + 1, inputs=["a"])
+        result = pipeline.run()
+        self.assertEqual(result.records["b"].status, STATUS_SKIPPED)
+        self.assertIsNone(result.records["b"].latency)
+        self.assertEqual(calls, [])
+        self.assertEqual(result.outputs, {"a": 1, "c": 2})
+
+        # 生效阶段的异常向上抛出
+        pipeline.add_stage("d", lambda o: 1 / 0, inputs=["c"])
+        with self.assertRaises(ZeroDivisionError):
+            pipeline.run()
+
+        # 被取消的推测阶段的异常被丢弃
+        failing = appbuilder.Pipeline()
+        failing.add_stage("a", slow(False, 0.1))
+        failing.add_stage("b", lambda o: 1 / 0, when=lambda o: o["a"], when_inputs=["a"], speculative=True)
+        self.assertEqual(failing.run().records["b"].status, STATUS_CANCELLED)
+
+        with self.assertRaises(ValueError):
+            pipeline.add_stage("a", lambda o: None)
+        with self.assertRaises(ValueError):
+            pipeline.add_stage("e", lambda o: None, speculative=True)
+        with self.assertRaises(ValueError):
+            appbuilder.Pipeline().add_stage("a", lambda o: None, inputs=["query"]).run()
+        with self.assertRaises(ValueError):
+            appbuilder.Pipeline().add_stage("a", lambda o: None).run(a=1)
+
+    def test_arun_cancels_tasks(self):
+        cancelled = threading.Event()
+
+        async def decompose(outputs):
+            try:
+                await asyncio.sleep(DELAY * 5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return ["never"]
+
+        async def classify(outputs):
+            await asyncio.sleep(DELAY)
+            return "简单问题"
+
+        pipeline = appbuilder.Pipeline()
+        pipeline.add_stage("complex", classify, inputs=["query"])
+        pipeline.add_stage("decompose", decompose, inputs=["query"],
+                           when=lambda o: o["complex"] == "复杂问题", when_inputs=["complex"], speculative=True)
+        # 同步阶段在线程池中运行
+        pipeline.add_stage("rewrite", slow(lambda o: [o["query"] + "?"]), inputs=["query"],
+                           when=lambda o: o["complex"] == "简单问题", when_inputs=["complex"], speculative=True)
+
+        result = run_in_new_loop(pipeline.arun(query="q"))
+        self.assertTrue(cancelled.is_set())
+        self.assertEqual(result["rewrite"], ["q?"])
+        self.assertEqual(result.records["decompose"].status, STATUS_CANCELLED)
+        self.assertLess(result.elapsed, DELAY * 2)
+        with self.assertRaises(TypeError):
+            pipeline.run(query="q")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from appbuilder.core._client import HTTPClient, AsyncHTTPClient
+from appbuilder.core._rate_limiter import rate_limiter_registry
+from appbuilder.core.components.image_understand import component as image_understand
+from appbuilder.core.components.image_understand.component import ImageUnderstand
+from appbuilder.core.components.image_understand.model import ImageUnderstandRequest
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+ENDPOINT = "/v1/test/limited"
+
+
+class JsonHandler(LocalHandler):
+    polls = []
+
+    def do_POST(self):
+        self.read_body()
+        if self.path.endswith("/image-understanding/request"):
+            data = {"result": {"task_id": "t"}}
+        elif self.path.endswith("/image-understanding/get-result"):
+            self.polls.append(time.perf_counter())
+            ret_code = 0 if len(self.polls) >= 3 else 1
+            data = {"result": {"ret_code": ret_code, "task_id": "t"}}
+        else:
+            data = {"path": self.path}
+        self.reply_json(data)
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreRateLimiter(LocalServerTestCase):
+    handler_class = JsonHandler
+
+    def setUp(self):
+        JsonHandler.polls = []
+        super().setUp()
+        rate_limiter_registry.clear()
+
+    def tearDown(self):
+        rate_limiter_registry.clear()
+
+    def test_shared_by_secret_key_and_endpoint(self):
+        rate_limiter_registry.configure(ENDPOINT, rate=20)
+        clients = [HTTPClient(secret_key="key_a", gateway=self.gateway) for _ in range(2)]
+
+        def call(i):
+            client = clients[i % 2]
+            client.session.post(client.service_url(ENDPOINT), json={}).json()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(call, range(6)))
+        elapsed = time.perf_counter() - start
+        # 两个client使用同一secret_key，共享每秒20次的配额
+        self.assertGreaterEqual(elapsed, 5 / 20 * 0.9)
+        stats = rate_limiter_registry.stats(ENDPOINT)
+        self.assertEqual(stats["acquired"], 6)
+        self.assertEqual(stats["throttled"], 5)
+        self.assertGreater(stats["total_wait"], 0)
+
+        # 其他secret_key与未配置规则的接口不受影响
+        other = HTTPClient(secret_key="key_b", gateway=self.gateway)
+        other.session.post(other.service_url(ENDPOINT), json={})
+        other.session.post(other.service_url("/v1/test/free"), json={})
+        limiter = rate_limiter_registry.get_limiter("key_b", other.service_url(ENDPOINT))
+        self.assertEqual(limiter.stats()["throttled"], 0)
+        self.assertEqual(rate_limiter_registry.stats(ENDPOINT)["acquired"], 7)
+        self.assertNotIn("/v1/test/free", rate_limiter_registry.stats())
+
+        rate_limiter_registry.configure(ENDPOINT, rate=None)
+        self.assertIsNone(rate_limiter_registry.get_limiter("key_a", clients[0].service_url(ENDPOINT)))
+
+    def test_async_client(self):
+        rate_limiter_registry.configure(ENDPOINT, rate=20, burst=2)
+
+        async def run():
+            client = AsyncHTTPClient(secret_key="key_a", gateway=self.gateway)
+
+            async def call():
+                response = await client.session.post(client.service_url(ENDPOINT), json={})
+                await response.json()
+
+            start = time.perf_counter()
+            await asyncio.gather(*[call() for _ in range(6)])
+            elapsed = time.perf_counter() - start
+            await client.aclose()
+            return elapsed
+
+        elapsed = run_in_new_loop(run())
+        self.assertGreaterEqual(elapsed, 4 / 20 * 0.9)
+        self.assertEqual(rate_limiter_registry.stats(ENDPOINT)["throttled"], 4)
+
+    def test_component_defaults(self):
+        endpoint = "/v1/bce/aip/image-classify/v1/image-understanding/get-result"
+        self.assertIn(endpoint, ImageUnderstand.rate_limits)
+        client = HTTPClient(secret_key="key_a", gateway=self.gateway)
+        limiter = rate_limiter_registry.get_limiter("key_a", client.service_url(endpoint))
+        self.assertAlmostEqual(limiter.rate, 1 / 1.1)
+
+        rate_limiter_registry.configure(endpoint, rate=5)
+        self.assertEqual(rate_limiter_registry.get_limiter("key_a", client.service_url(endpoint)).rate, 5)
+        # clear只移除configure设置的规则，组件声明的默认规则保留
+        rate_limiter_registry.clear()
+        self.assertAlmostEqual(
+            rate_limiter_registry.get_limiter("key_a", client.service_url(endpoint)).rate, 1 / 1.1)
+
+    def test_component_poll_interval(self):
+        endpoint = "/v1/bce/aip/image-classify/v1/image-understanding/get-result"
+        # 关闭全局限流后，单个任务仍按最小间隔轮询
+        rate_limiter_registry.configure(endpoint, rate=None)
+        component = ImageUnderstand(secret_key="key_a", gateway=self.gateway)
+        request = ImageUnderstandRequest()
+        request.url = "http://image"
+        request.question = "q"
+        with patch.object(image_understand, "POLL_INTERVAL", 0.1):
+            component._ImageUnderstand__recognize(request)
+            self.assertEqual(len(JsonHandler.polls), 3)
+            for prev, cur in zip(JsonHandler.polls, JsonHandler.polls[1:]):
+                self.assertGreaterEqual(cur - prev, 0.1 * 0.9)
+
+            async def run():
+                await component._arecognize(request)
+                await component.aclose()
+
+            JsonHandler.polls = []
+            run_in_new_loop(run())
+            self.assertEqual(len(JsonHandler.polls), 3)
+            self.assertGreaterEqual(JsonHandler.polls[-1] - JsonHandler.polls[0], 0.2 * 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
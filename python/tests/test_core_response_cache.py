@@ -0,0 +1,218 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import time
+import tempfile
+import unittest
+from collections import Counter
+
+import appbuilder
+from appbuilder.core._cache import MemoryCache, SQLiteCache, CachedResponse, default_memory_cache
+from appbuilder.core._client import HTTPClient
+from tests.local_server import LocalHandler, LocalServerTestCase, run_in_new_loop
+
+
+class OCRHandler(LocalHandler):
+    requests = Counter()
+
+    def do_POST(self):
+        body = self.read_body()
+        self.requests[self.path] += 1
+        if self.path.endswith("/error"):
+            return self._send(500, b'{"code": 500}')
+        if self.path.endswith("/throttled") and self.requests[self.path] == 1:
+            return self._send(200, b'{"error_code": 18, "error_msg": "Open api qps request limit reached"}')
+        if self.path.endswith("/busy") and self.requests[self.path] == 1:
+            return self._send(200, b'{"code": "ServiceUnavailable", "message": "busy", "requestId": "rid"}')
+        if self.path.endswith("/sse"):
+            return self._send(200, b"data: 1\n\n", "text/event-stream")
+        if self.headers.get("X-Appbuilder-Authorization", "").endswith("invalid"):
+            return self._send(403, b'{"code": 403, "message": "invalid token"}')
+        result = {"log_id": 1, "direction": 0, "words_result_num": 1,
+                  "words_result": [{"words": "len={}".format(len(body))}]}
+        self._send(200, json.dumps(result).encode())
+
+    def _send(self, code, body, content_type="application/json"):
+        self.reply(code, body, content_type, {"X-Appbuilder-Request-Id": "rid"})
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreResponseCache(LocalServerTestCase):
+    handler_class = OCRHandler
+    patch_env = True
+
+    def setUp(self):
+        OCRHandler.requests.clear()
+        default_memory_cache.clear()
+        super().setUp()
+
+    def tearDown(self):
+        default_memory_cache.clear()
+
+    def network_calls(self):
+        return sum(OCRHandler.requests.values())
+
+    def test_component_cache(self):
+        ocr = appbuilder.GeneralOCR()
+        image_a = appbuilder.Message(content={"url": "http://example.com/a.png"})
+        image_b = appbuilder.Message(content={"url": "http://example.com/bb.png"})
+
+        # 未开启缓存时每次调用都访问网络
+        ocr.run(image_a)
+        ocr.run(image_a)
+        self.assertEqual(self.network_calls(), 2)
+
+        ocr.enable_cache()
+        first = ocr.run(image_a)
+        second = ocr.run(image_a)
+        self.assertEqual(first.content, second.content)
+        ocr.run(image_b)
+        self.assertEqual(self.network_calls(), 4)
+        self.assertEqual(ocr.cache_stats(), {"hits": 1, "misses": 2})
+
+        # 其他组件实例开启缓存后共享默认存储
+        other = appbuilder.GeneralOCR()
+        other.enable_cache()
+        other.run(image_b)
+        self.assertEqual(self.network_calls(), 4)
+        self.assertEqual(other.cache_stats(), {"hits": 1, "misses": 0})
+
+        ocr.disable_cache()
+        ocr.run(image_a)
+        self.assertEqual(self.network_calls(), 5)
+        self.assertEqual(ocr.cache_stats(), {"hits": 0, "misses": 0})
+
+    def test_cache_isolated_by_secret_key(self):
+        image = appbuilder.Message(content={"url": "http://example.com/a.png"})
+        tenant_a = appbuilder.GeneralOCR(secret_key="tenant-a")
+        tenant_a.enable_cache()
+        tenant_a.run(image)
+        tenant_a.run(image)
+        self.assertEqual(self.network_calls(), 1)
+
+        # 其他密钥的相同请求不命中缓存，无效密钥得到服务端的鉴权错误
+        tenant_b = appbuilder.GeneralOCR(secret_key="invalid")
+        tenant_b.enable_cache()
+        with self.assertRaises(appbuilder.ForbiddenException):
+            tenant_b.run(image)
+        self.assertEqual(self.network_calls(), 2)
+        self.assertEqual(tenant_b.cache_stats(), {"hits": 0, "misses": 1})
+
+        url = tenant_a.http_client.service_url("/ocr")
+        cache = tenant_a._response_cache
+        key_a = cache.make_key("POST", url, json_body={"a": 1}, credential="Bearer tenant-a")
+        self.assertNotEqual(key_a, cache.make_key("POST", url, json_body={"a": 1}, credential="Bearer tenant-b"))
+        # 密钥不以明文写入缓存key
+        self.assertNotIn("tenant-a", key_a)
+
+    def test_async_component_cache(self):
+        ocr = appbuilder.GeneralOCR()
+        ocr.enable_cache()
+        image = appbuilder.Message(content={"url": "http://example.com/a.png"})
+
+        async def run():
+            async with ocr:
+                first = await ocr.arun(image)
+                second = await ocr.arun(image)
+            return first, second
+
+        first, second = run_in_new_loop(run())
+        self.assertEqual(first.content, second.content)
+        # 同步与异步请求共用缓存
+        self.assertEqual(ocr.run(image).content, first.content)
+        self.assertEqual(self.network_calls(), 1)
+        self.assertEqual(ocr.cache_stats(), {"hits": 2, "misses": 1})
+
+    def test_only_successful_non_stream_responses_cached(self):
+        ocr = appbuilder.GeneralOCR()
+        ocr.enable_cache()
+        client = ocr.http_client
+        for _ in range(2):
+            client.session.post(client.service_url("/error"), json={})
+            client.session.post(client.service_url("/sse"), json={})
+            client.session.post(client.service_url("/stream"), json={}, stream=True).content
+        self.assertEqual(self.network_calls(), 6)
+
+    def test_error_body_not_cached(self):
+        ocr = appbuilder.GeneralOCR()
+        ocr.enable_cache()
+        client = ocr.http_client
+        # HTTP 200的QPS超限等错误响应不缓存，之后的成功响应正常缓存
+        bodies = [client.session.post(client.service_url("/throttled"), json={}).json() for _ in range(3)]
+        self.assertEqual(bodies[0]["error_code"], 18)
+        self.assertEqual(bodies[1], bodies[2])
+        self.assertIn("words_result", bodies[1])
+        self.assertEqual(OCRHandler.requests["/rpc/2.0/cloud_hub/throttled"], 2)
+
+        async def run():
+            result = []
+            async with ocr:
+                for _ in range(3):
+                    response = await ocr.async_http_client.session.post(client.service_url("/busy"), json={})
+                    result.append(await response.json())
+            return result
+
+        bodies = run_in_new_loop(run())
+        self.assertEqual(bodies[0]["message"], "busy")
+        self.assertEqual(bodies[1], bodies[2])
+        self.assertEqual(OCRHandler.requests["/rpc/2.0/cloud_hub/busy"], 2)
+
+    def test_sqlite_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.db")
+            image = appbuilder.Message(content={"url": "http://example.com/a.png"})
+            ocr = appbuilder.GeneralOCR()
+            ocr.enable_cache(SQLiteCache(path))
+            expected = ocr.run(image).content
+
+            # 新的缓存实例读取同一个文件，模拟进程重启
+            backend = SQLiteCache(path)
+            ocr = appbuilder.GeneralOCR()
+            ocr.enable_cache(backend)
+            self.assertEqual(ocr.run(image).content, expected)
+            self.assertEqual(self.network_calls(), 1)
+            self.assertEqual(len(backend), 1)
+            backend.clear()
+            self.assertEqual(len(backend), 0)
+            backend.close()
+
+    def test_memory_cache_lru_and_ttl(self):
+        cache = MemoryCache(maxsize=2, ttl=0.05)
+        value = CachedResponse(200, {}, b"{}")
+        cache.set("a", value)
+        cache.set("b", value)
+        cache.get("a")
+        cache.set("c", value)
+        self.assertIsNone(cache.get("b"))
+        self.assertIs(cache.get("a"), value)
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("a"))
+
+    def test_cache_key(self):
+        ocr = appbuilder.GeneralOCR()
+        ocr.enable_cache()
+        cache = ocr._response_cache
+        url = HTTPClient(secret_key="test", gateway=self.gateway).service_url("/ocr")
+        self.assertEqual(cache.make_key("POST", url, json_body={"a": 1, "b": [1, 2]}),
+                         cache.make_key("post", url, json_body={"b": [1, 2], "a": 1}))
+        self.assertNotEqual(cache.make_key("POST", url, data=b"abc"), cache.make_key("POST", url, data=b"abd"))
+        self.assertTrue(cache.make_key("POST", url, data={}).startswith("general_ocr:"))
+        # 无法稳定哈希的请求体不缓存
+        with tempfile.TemporaryFile() as f:
+            self.assertIsNone(cache.make_key("POST", url, data=f))
+
+
+if __name__ == '__main__':
+    unittest.main()
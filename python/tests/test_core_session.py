@@ -11,12 +11,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
+import logging
 import unittest
 import appbuilder
 import asyncio
 import aiohttp
+import requests
 from unittest.mock import patch, MagicMock
-from appbuilder.core._session import AsyncInnerSession
+from appbuilder.core._session import InnerSession, AsyncInnerSession
+
+
+class StaticAdapter(requests.adapters.HTTPAdapter):
+    def send(self, request, **kwargs):
+        response = requests.models.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        response.request = request
+        return response
 
 class TestCoreSession(unittest.TestCase):
     @patch("aiohttp.ClientSession.put")
@@ -37,5 +49,36 @@ class TestCoreSession(unittest.TestCase):
         loop = asyncio.get_event_loop()
         loop.run_until_complete(get_demo())
 
+    def test_session_skip_curl_when_debug_disabled(self):
+        session = InnerSession()
+        session.mount("http://", StaticAdapter())
+        appbuilder.logger.setLoglevel("INFO")
+        with patch.object(InnerSession, "build_curl") as mock_build_curl:
+            session.post("http://example.com", json={"image": "a" * 1024})
+            mock_build_curl.assert_not_called()
+
+        appbuilder.logger.setLoglevel("DEBUG")
+        try:
+            with patch.object(InnerSession, "build_curl", return_value="curl") as mock_build_curl:
+                session.post("http://example.com", json={"image": "a" * 1024})
+                mock_build_curl.assert_called_once()
+        finally:
+            appbuilder.logger.setLoglevel("INFO")
+
+    def test_async_session_skip_curl_when_debug_disabled(self):
+        async def run():
+            appbuilder.logger.setLoglevel("INFO")
+            session = AsyncInnerSession()
+            with patch("aiohttp.ClientSession.post") as mock_post, \
+                    patch.object(AsyncInnerSession, "build_curl") as mock_build_curl:
+                mock_post.return_value = asyncio.sleep(0)
+                await session.post("http://example.com", json={"image": "a" * 1024})
+                mock_build_curl.assert_not_called()
+            await session.close()
+
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(run())
+
+
 if __name__ == "__main__":
     unittest.main()
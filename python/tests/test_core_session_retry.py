@@ -0,0 +1,150 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+import unittest
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from unittest.mock import MagicMock
+
+import requests
+
+from appbuilder.core._client import HTTPClient
+from appbuilder.core._retry import RetryPolicy
+from appbuilder.core._exception import InvalidRequestArgumentError
+from tests.local_server import LocalHandler, LocalServerTestCase, closed_port
+
+
+class FlakyHandler(LocalHandler):
+    """前N次请求返回指定状态码，之后返回200。路径格式: /<status>/<fail_times>/<key>"""
+    attempts = defaultdict(int)
+    lock = threading.Lock()
+
+    def _reply(self):
+        self.read_body()
+        _, status, fail_times, key = self.path.split("/")
+        with self.lock:
+            self.attempts[key] += 1
+            attempt = self.attempts[key]
+        code = int(status) if attempt <= int(fail_times) else 200
+        self.reply(code, b"{}", headers={"Retry-After": "0"} if code == 429 else None)
+
+    do_GET = _reply
+    do_POST = _reply
+
+
+@unittest.skipUnless(os.getenv("TEST_CASE", "UNKNOWN") == "CPU_PARALLEL", "")
+class TestCoreSessionRetry(LocalServerTestCase):
+    handler_class = FlakyHandler
+
+    def setUp(self):
+        FlakyHandler.attempts.clear()
+        super().setUp()
+        self.client = HTTPClient(secret_key="test", gateway=self.gateway)
+
+    def url(self, status, fail_times, key):
+        return "{}/{}/{}/{}".format(self.gateway, status, fail_times, key)
+
+    def test_no_retry_by_default(self):
+        response = self.client.session.get(self.url(503, 1, "default"))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(FlakyHandler.attempts["default"], 1)
+
+    def test_idempotent_retry_on_status(self):
+        policy = RetryPolicy(total=3, backoff_factor=0, backoff_jitter=0)
+        response = self.client.session.get(self.url(503, 2, "get"), retry=policy)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(FlakyHandler.attempts["get"], 3)
+
+    def test_retry_exhausted_returns_last_response(self):
+        policy = RetryPolicy(total=2, backoff_factor=0, backoff_jitter=0)
+        response = self.client.session.get(self.url(500, 5, "exhausted"), retry=policy)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(FlakyHandler.attempts["exhausted"], 3)
+
+    def test_post_not_retried_on_5xx(self):
+        response = self.client.session.post(self.url(500, 1, "post"), json={}, retry=3)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(FlakyHandler.attempts["post"], 1)
+
+    def test_post_retried_when_declared_idempotent(self):
+        policy = RetryPolicy(total=3, backoff_factor=0, backoff_jitter=0, idempotent=True)
+        response = self.client.session.post(self.url(502, 1, "post_idem"), json={}, retry=policy)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(FlakyHandler.attempts["post_idem"], 2)
+
+    def test_post_retried_on_429_with_retry_after(self):
+        response = self.client.session.post(self.url(429, 2, "throttle"), json={}, retry=2)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(FlakyHandler.attempts["throttle"], 3)
+
+    def test_retry_on_connection_error(self):
+        port = closed_port()
+        policy = RetryPolicy(total=2, backoff_factor=0, backoff_jitter=0)
+        start = time.time()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.client.session.post("http://127.0.0.1:{}/500/0/x".format(port), retry=policy)
+        self.assertLess(time.time() - start, 5)
+
+    def test_concurrent_calls_do_not_share_retry(self):
+        def call(i):
+            # 偶数请求不重试，奇数请求重试一次
+            retry = RetryPolicy(total=i % 2, backoff_factor=0, backoff_jitter=0)
+            return self.client.session.get(self.url(503, 1, "k{}".format(i)), retry=retry).status_code
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            codes = list(executor.map(call, range(32)))
+        self.assertEqual(codes, [503 if i % 2 == 0 else 200 for i in range(32)])
+        self.assertEqual(self.client.retry.total, 0)
+
+    def test_backoff_and_retry_after(self):
+        policy = RetryPolicy(total=5, backoff_factor=0.5, backoff_max=1.5, backoff_jitter=0)
+        self.assertEqual([policy.backoff(i) for i in range(4)], [0.5, 1.0, 1.5, 1.5])
+        jitter_policy = RetryPolicy(backoff_factor=1, backoff_jitter=0.5)
+        self.assertTrue(1 <= jitter_policy.backoff(0) <= 1.5)
+
+        response = MagicMock()
+        response.headers = {"Retry-After": "3"}
+        self.assertEqual(policy.wait_time(0, response), 3.0)
+        response.headers = {"Retry-After": formatdate(time.time() + 1000, usegmt=True)}
+        self.assertEqual(policy.wait_time(0, response), 60.0)
+        response.headers = {"Retry-After": "invalid"}
+        self.assertEqual(policy.wait_time(0, response), 0.5)
+        policy.respect_retry_after = False
+        response.headers = {"Retry-After": "3"}
+        self.assertEqual(policy.wait_time(0, response), 0.5)
+
+    def test_policy_from_value(self):
+        self.assertIsNone(RetryPolicy.from_value(None))
+        self.assertEqual(RetryPolicy.from_value(2).total, 2)
+        policy = RetryPolicy(total=1)
+        self.assertIs(RetryPolicy.from_value(policy), policy)
+        with self.assertRaises(ValueError):
+            RetryPolicy(total=-1)
+
+    def test_check_param_accepts_policy(self):
+        @HTTPClient.check_param
+        def run(retry=0):
+            return retry
+
+        policy = RetryPolicy(total=1)
+        self.assertIs(run(retry=policy), policy)
+        with self.assertRaises(InvalidRequestArgumentError):
+            run(retry=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,8 +15,9 @@ import os
 import unittest
 import asyncio
 
-from unittest.mock import MagicMock
-from appbuilder.utils.sse_util import SSEClient,AsyncSSEClient, Event
+from unittest.mock import MagicMock, patch
+from appbuilder.utils import sse_util
+from appbuilder.utils.sse_util import SSEClient,AsyncSSEClient, Event, SSEParser, sse_metrics
 from appbuilder.utils.model_util import RemoteModel,Models
 from appbuilder.utils.logger_util import LoggerWithLoggerId,_setup_logging,logger
 from threading import current_thread 
@@ -115,6 +116,79 @@ class TestUtils(unittest.TestCase):
         # test_close
         sse_client.close()
 
+    def test_sse_util_SSEParser(self):
+        # 大事件被拆成很多小块，分隔符跨块
+        payload = b"data: " + b"x" * 100000 + b"\r\n\r\n" + b"data: y\n\n" + b"data: tail"
+        parser = SSEParser()
+        blocks = []
+        for i in range(0, len(payload), 7):
+            blocks.extend(parser.feed(payload[i:i + 7]))
+        self.assertEqual(blocks, [b"data: " + b"x" * 100000 + b"\r\n\r\n", b"data: y\n\n"])
+        self.assertEqual(parser.flush(), b"data: tail")
+        self.assertEqual(parser.flush(), b"")
+
+        mock_event_source = MagicMock()
+        mock_event_source.__iter__.return_value = iter([payload[:50000], payload[50000:]])
+        events = list(SSEClient(event_source=mock_event_source).events())
+        self.assertEqual([len(event.data) for event in events], [100000, 1, 4])
+
+        async def read_async():
+            async def iter_any():
+                for i in range(0, len(payload), 4096):
+                    yield payload[i:i + 4096]
+
+            response = MagicMock()
+            response.content.iter_any = iter_any
+            return [event.data async for event in AsyncSSEClient(response).events()]
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(read_async()), [event.data for event in events])
+        finally:
+            loop.close()
+
+    def test_sse_util_metrics(self):
+        chunks = [b"data: %d\n\n" % i for i in range(5)] + [b": ping\n\n"]
+        sse_metrics.reset()
+        logger.setLoglevel("INFO")
+        sse_client = SSEClient(event_source=iter(chunks), collect_metrics=True)
+        with patch.object(sse_util.logger, "info") as info, patch.object(sse_util.logger, "debug") as debug:
+            self.assertEqual([event.data for event in sse_client.events()], ["0", "1", "2", "3", "4"])
+            # 非DEBUG级别下流式解析不输出日志
+            info.assert_not_called()
+            debug.assert_not_called()
+        metrics = sse_client.metrics.to_dict()
+        self.assertEqual(metrics["event_count"], 5)
+        self.assertEqual(metrics["time_to_first_event"]["count"], 1)
+        self.assertEqual(metrics["inter_event_gap"]["count"], 4)
+        self.assertEqual(sum(metrics["inter_event_gap"]["buckets"].values()), 4)
+
+        async def read_async():
+            async def iter_any():
+                for chunk in chunks:
+                    yield chunk
+
+            response = MagicMock()
+            response.content.iter_any = iter_any
+            with patch.dict(os.environ, {"APPBUILDER_SSE_METRICS": "true"}):
+                sse_client = AsyncSSEClient(response)
+            # 提前结束读取时同样汇总统计
+            async for event in sse_client.events():
+                break
+            return sse_client
+
+        loop = asyncio.new_event_loop()
+        try:
+            async_client = loop.run_until_complete(read_async())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+        self.assertEqual(async_client.metrics.event_count, 1)
+        total = sse_metrics.to_dict()
+        self.assertEqual(total["streams"], 2)
+        self.assertEqual(total["event_count"], 6)
+        self.assertIsNone(SSEClient(event_source=iter(chunks)).metrics)
+
     def test_sse_util_Event(self):
         # test_str_
         event_str=str(Event(id='id',retry=10))
@@ -0,0 +1,140 @@
+# Copyright (c) 2024 Baidu, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+JSON codec util
+
+SDK内请求体序列化与响应、流式事件解析统一使用的JSON编解码器。默认使用标准库json，可以通过环境变量
+APPBUILDER_JSON_BACKEND或set_backend选择更快的orjson或ujson，可选值: json, auto, orjson, ujson，
+auto按orjson、ujson、json的顺序选择已安装的实现。
+
+无论使用哪个实现，解析失败时都抛出json.JSONDecodeError，NaN等非标准字面量与orjson/ujson无法序列化的对象
+由标准库处理。orjson与标准库的结果并不完全一致：超出64位的整数被解析为浮点数，NaN与Infinity被序列化为null，
+依赖这些行为时请使用默认的json。
+"""
+import os
+import json
+
+from appbuilder.utils.logger_util import logger
+
+JSON_BACKENDS = ("orjson", "ujson", "json")
+
+_backend = "json"
+_loads = json.loads
+_dumps_bytes = None
+
+
+def _json_loads(s):
+    return json.loads(s)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _init_orjson():
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def loads(s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson不支持NaN等非标准字面量，退回标准库解析；确实非法时由标准库抛出异常
+            return json.loads(s)
+
+    def dumps_bytes(obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            return _json_dumps_bytes(obj)
+
+    return loads, dumps_bytes
+
+
+def _init_ujson():
+    import ujson
+
+    def loads(s):
+        try:
+            return ujson.loads(s)
+        except ValueError:
+            return json.loads(s)
+
+    def dumps_bytes(obj) -> bytes:
+        try:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+        except (TypeError, OverflowError):
+            return _json_dumps_bytes(obj)
+
+    return loads, dumps_bytes
+
+
+def set_backend(name: str = "auto") -> str:
+    r"""设置JSON编解码实现.
+
+    参数:
+        name(str, 可选): auto, orjson, ujson 或 json。auto按orjson、ujson、json的顺序选择已安装的实现，默认为auto。
+            未调用时使用环境变量APPBUILDER_JSON_BACKEND指定的实现，默认为json。
+    返回：
+        str: 实际使用的实现名称。
+    """
+    global _backend, _loads, _dumps_bytes
+    if name not in ("auto",) + JSON_BACKENDS:
+        raise ValueError("json backend must be one of auto, {}, got {}".format(", ".join(JSON_BACKENDS), name))
+    candidates = JSON_BACKENDS if name == "auto" else (name,)
+    for candidate in candidates:
+        try:
+            if candidate == "orjson":
+                loads, dumps_bytes = _init_orjson()
+            elif candidate == "ujson":
+                loads, dumps_bytes = _init_ujson()
+            else:
+                loads, dumps_bytes = _json_loads, _json_dumps_bytes
+        except ImportError:
+            if name != "auto":
+                raise ImportError(
+                    "json backend {0} is not installed, please install it with `pip install {0}`".format(candidate))
+            continue
+        _backend, _loads, _dumps_bytes = candidate, loads, dumps_bytes
+        break
+    logger.debug("Use json backend: %s", _backend)
+    return _backend
+
+
+def get_backend() -> str:
+    r"""返回当前使用的JSON编解码实现名称"""
+    return _backend
+
+
+def loads(s):
+    r"""解析JSON字符串或UTF-8编码的bytes，解析失败时抛出json.JSONDecodeError"""
+    return _loads(s)
+
+
+def dumps_bytes(obj) -> bytes:
+    r"""将对象序列化为紧凑的UTF-8编码JSON，用作HTTP请求体"""
+    return _dumps_bytes(obj)
+
+
+def dumps(obj) -> str:
+    r"""将对象序列化为紧凑的JSON字符串，非ASCII字符不转义"""
+    return _dumps_bytes(obj).decode("utf-8")
+
+
+try:
+    set_backend(os.getenv("APPBUILDER_JSON_BACKEND", "json"))
+except (ValueError, ImportError) as e:
+    logger.warning("Invalid APPBUILDER_JSON_BACKEND: %s, fallback to json", e)
+    set_backend("json")
@@ -318,9 +318,7 @@ class Models:
         data = GetModelListRequest.to_json(request)
         headers = self.http_client.auth_header()
         headers['content-type'] = 'application/json'
-        if retry != self.http_client.retry.total:
-            self.http_client.retry.total = retry
-        response = self.http_client.session.post(url, data=data, headers=headers, timeout=timeout)
+        response = self.http_client.session.post(url, data=data, headers=headers, timeout=timeout, retry=retry)
         self.http_client.check_response_header(response)
         data = response.json()
         self.http_client.check_response_json(data)
@@ -14,25 +14,274 @@
 """
 SSE Client util
 """
+import os
+import re
+import time
+import bisect
+import threading
+from typing import Optional
 from appbuilder.utils.logger_util import logger
 import logging
 import aiohttp
 
 
+_EVENT_DELIMITER = re.compile(rb"\r\n\r\n|\n\n|\r\r")
+
+
+class SSEParser:
+    """
+    增量式SSE分块器，被SSEClient与AsyncSSEClient共用。
+
+    收到的数据追加到同一个bytearray缓冲区，只扫描新到达的数据查找事件分隔符（空行），已完成的事件块整体切出，
+    因此无论单个事件多大、被拆成多少个HTTP块，处理时间都与数据量成线性关系。
+    """
+
+    # 分隔符最长4个字节，新数据到达时从缓冲区末尾回退3个字节开始扫描，以匹配跨块的分隔符
+    _LOOKBEHIND = 3
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._scan = 0
+        # 缓冲区中是否出现过\r，出现过时才需要匹配\r\r与\r\n\r\n分隔符
+        self._has_cr = False
+
+    def feed(self, chunk: bytes) -> list:
+        """
+        追加一个数据块，返回其中已经完整的事件块列表（包含结尾的分隔符）。
+        """
+        if not isinstance(chunk, bytes):
+            chunk = bytes(chunk)
+        buffer = self._buffer
+        if buffer:
+            buffer += chunk
+            data, scan = buffer, self._scan
+        else:
+            # 没有未完成的事件时直接在新数据块上切分，只把剩余的不完整事件放入缓冲区
+            data, scan = chunk, 0
+        has_cr = self._has_cr or b"\r" in chunk
+        if has_cr:
+            blocks = []
+            start = 0
+            for match in _EVENT_DELIMITER.finditer(data, scan):
+                end = match.end()
+                blocks.append(bytes(data[start:end]))
+                start = end
+            if data is buffer:
+                if start:
+                    del buffer[:start]
+            elif start < len(data):
+                buffer += data[start:]
+        else:
+            # 绝大多数服务端只使用\n换行，此时直接按b"\n\n"切分，比正则匹配快
+            if data is buffer:
+                end = buffer.find(b"\n\n", scan)
+                if end < 0:
+                    self._scan = max(len(buffer) - self._LOOKBEHIND, 0)
+                    return []
+                end += 2
+                blocks = [bytes(buffer[:end])]
+                data = bytes(buffer[end:])
+                buffer.clear()
+            else:
+                blocks = []
+            parts = data.split(b"\n\n")
+            blocks.extend([part + b"\n\n" for part in parts[:-1]])
+            buffer += parts[-1]
+        self._has_cr = has_cr and bool(buffer)
+        self._scan = max(len(buffer) - self._LOOKBEHIND, 0)
+        return blocks
+
+    def flush(self) -> bytes:
+        """
+        数据流结束时返回缓冲区中剩余的不完整事件块，并清空缓冲区。
+        """
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        self._scan = 0
+        self._has_cr = False
+        return data
+
+
+def _parse_event(chunk: bytes, char_enc: str, debug: bool = False) -> "Event":
+    """
+    将一个事件块解析为Event对象，data字段由多行组成时按行拼接，每行以换行符结尾。
+    """
+    event = Event()
+    data = []
+    raw = []
+    # Split before decoding so splitlines() only uses \r and \n
+    for line in chunk.splitlines():
+        # Decode the line.
+        line = line.decode(char_enc)
+        # Lines starting with a separator are comments and are to be
+        # ignored.
+        if not line.strip() or line.startswith(":"):
+            continue
+        if debug:
+            logger.debug("raw line: %s", line)
+        fields = line.split(":", 1)
+        field = fields[0]
+        # Ignore unknown fields.
+        if field not in event.__dict__:
+            raw.append(line)
+            if debug:
+                logger.debug("Saw invalid field %s while parsing Server Side Event", field)
+            continue
+
+        if len(fields) > 1:
+            # From the spec:
+            # "If value starts with a single U+0020 SPACE character,
+            # remove it from value."
+            if fields[1].startswith(" "):
+                value = fields[1][1:]
+            else:
+                value = fields[1]
+        else:
+            # If no value is present after the separator,
+            # assume an empty value.
+            value = ""
+        # The data field may come over multiple lines and their values
+        # are concatenated with each other.
+        if field == "data":
+            data.append(value)
+            raw.append(value + "\n")
+        else:
+            event.__dict__[field] = value
+            raw.append(value)
+    event.data = "".join(value + "\n" for value in data)
+    event.raw = "".join(raw)
+    return event
+
+
+class LatencyHistogram:
+    """
+    固定分桶的耗时直方图，单位为秒，分桶上界按毫秒配置。
+    """
+
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, seconds * 1000)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram"):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> dict:
+        buckets = {"<={}ms".format(bound): count for bound, count in zip(self.BUCKETS_MS, self.counts)}
+        buckets[">{}ms".format(self.BUCKETS_MS[-1])] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+            "buckets": buckets,
+        }
+
+
+class SSEMetrics:
+    """
+    SSE事件流的统计信息：事件数、首个事件耗时（time to first event）与相邻事件间隔。
+
+    单个SSEClient/AsyncSSEClient的统计通过client.metrics获取，所有数据流结束后汇总到进程级的sse_metrics。
+    """
+
+    def __init__(self):
+        self.streams = 0
+        self.event_count = 0
+        self.time_to_first_event = LatencyHistogram()
+        self.inter_event_gap = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def merge(self, other: "SSEMetrics"):
+        with self._lock:
+            self.streams += other.streams
+            self.event_count += other.event_count
+            self.time_to_first_event.merge(other.time_to_first_event)
+            self.inter_event_gap.merge(other.inter_event_gap)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "streams": self.streams,
+                "event_count": self.event_count,
+                "time_to_first_event": self.time_to_first_event.to_dict(),
+                "inter_event_gap": self.inter_event_gap.to_dict(),
+            }
+
+    def reset(self):
+        with self._lock:
+            self.streams = 0
+            self.event_count = 0
+            self.time_to_first_event = LatencyHistogram()
+            self.inter_event_gap = LatencyHistogram()
+
+
+# 进程级汇总，仅在开启统计时更新
+sse_metrics = SSEMetrics()
+
+
+def _metrics_enabled(collect_metrics: Optional[bool]) -> bool:
+    if collect_metrics is not None:
+        return collect_metrics
+    return os.getenv("APPBUILDER_SSE_METRICS", "false").lower() in ("true", "1")
+
+
+class _StreamMetrics(SSEMetrics):
+    """
+    单个数据流的统计，从创建客户端（收到响应头）开始计时。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.streams = 1
+        self._start = time.perf_counter()
+        self._last = None
+        self._merged = False
+
+    def on_event(self):
+        now = time.perf_counter()
+        if self._last is None:
+            self.time_to_first_event.observe(now - self._start)
+        else:
+            self.inter_event_gap.observe(now - self._last)
+        self._last = now
+        self.event_count += 1
+
+    def finish(self):
+        if not self._merged:
+            self._merged = True
+            sse_metrics.merge(self)
+
+
 class SSEClient:
     """
     一个简易的SSE Client，用于接收服务端发送的SSE事件。
     """
 
-    def __init__(self, event_source, char_enc="utf-8"):
+    def __init__(self, event_source, char_enc="utf-8", collect_metrics=None):
         """
         通过现有的事件源初始化 SSE 客户端。
         事件源应为二进制流，并具有 close() 方法。
         这通常是实现 io.BinaryIOBase 的东西，比如 httplib 或 urllib3HTTPResponse 对象。
+        collect_metrics为True时统计事件数与事件间隔，默认从环境变量中获取: os.getenv("APPBUILDER_SSE_METRICS", "false")
         """
-        logger.info(f"Initialized SSE client from event source {event_source}")
+        logger.debug("Initialized SSE client from event source %s", event_source)
         self._event_source = event_source
         self._char_enc = char_enc
+        self.metrics = _StreamMetrics() if _metrics_enabled(collect_metrics) else None
 
     def _read(self):
         """
@@ -40,13 +289,10 @@ class SSEClient:
         不幸的是，有些服务器可能会决定在响应中将事件分解为多个HTTP块。
         因此，有必要正确地将连续的响应块缝合在一起，并找到SSE分隔符（空的新行），以生成完整、正确的事件块。
         """
-        data = b""
+        parser = SSEParser()
         for chunk in self._event_source:
-            for line in chunk.splitlines(True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
+            yield from parser.feed(chunk)
+        data = parser.flush()
         if data:
             yield data
 
@@ -60,67 +306,34 @@ class SSEClient:
         Returns:
             generator: 解析后的 Event 对象的生成器。
         """
-        for chunk in self._read():
-            event = Event()
-            # Split before decoding so splitlines() only uses \r and \n
-            for line in chunk.splitlines():
-                # Decode the line.
-                line = line.decode(self._char_enc)
-                # Lines starting with a separator are comments and are to be
-                # ignored.
-                if not line.strip() or line.startswith(":"):
-                    continue
-                logger.debug(f"raw line: {line}")
-                data = line.split(":", 1)
-                field = data[0]
-                # Ignore unknown fields.
-                if field not in event.__dict__:
-                    event.raw += line
-                    logger.info(
-                        f"Saw invalid field {field} while parsing Server Side Event"
-                    )
-                    continue
-
-                if len(data) > 1:
-                    # From the spec:
-                    # "If value starts with a single U+0020 SPACE character,
-                    # remove it from value."
-                    if data[1].startswith(" "):
-                        value = data[1][1:]
+        # 每个数据流只判断一次日志级别，未开启DEBUG时解析过程中不做任何格式化
+        debug = logger.isEnabledFor(logging.DEBUG)
+        metrics = self.metrics
+        try:
+            for chunk in self._read():
+                event = _parse_event(chunk, self._char_enc, debug)
+                # Events with no data are not dispatched.
+                if not event.data:
+                    if event.raw:
+                        # unknown error
+                        pass
                     else:
-                        value = data[1]
-                else:
-                    # If no value is present after the separator,
-                    # assume an empty value.
-                    value = ""
-                # The data field may come over multiple lines and their values
-                # are concatenated with each other.
-                if field == "data":
-                    event.__dict__[field] += value + "\n"
-                    event.raw += value + "\n"
-                else:
-                    event.__dict__[field] = value
-                    event.raw += value
-
-            # Events with no data are not dispatched.
-            if not event.data:
-                if event.raw:
-                    # unknown error
-                    pass
+                        continue
                 else:
-                    continue
-            else:
-                # If the data field ends with a newline, remove it.
-                if event.data.endswith("\n"):
-                    event.data = event.data[0:-1]
-            # Empty event names default to 'message'
-            event.event = event.event or "message"
-            # Dispatch the event
-            if logger.getEffectiveLevel() == logging.DEBUG:
-                logger.debug(f"Dispatching {event.debug_str}...")
-            else:
-                logger.info(f"Dispatching {event}...")
-            yield event
+                    # If the data field ends with a newline, remove it.
+                    if event.data.endswith("\n"):
+                        event.data = event.data[0:-1]
+                # Empty event names default to 'message'
+                event.event = event.event or "message"
+                # Dispatch the event
+                if debug:
+                    logger.debug("Dispatching %s...", event.debug_str)
+                if metrics is not None:
+                    metrics.on_event()
+                yield event
+        finally:
+            if metrics is not None:
+                metrics.finish()
 
     def close(self):
         """
@@ -133,25 +346,25 @@ class AsyncSSEClient:
     """
     一个简易的SSE Client，用于接收服务端发送的SSE事件。
     """
-    def __init__(self, response, char_enc='utf-8'):
+    def __init__(self, response, char_enc='utf-8', collect_metrics=None):
         """
         通过现有的事件源response初始化 SSE 客户端。
         response应为aiohttp.ClientResponse实例
+        collect_metrics为True时统计事件数与事件间隔，默认从环境变量中获取: os.getenv("APPBUILDER_SSE_METRICS", "false")
         """
         self._response = response
         self._char_enc = char_enc
+        self.metrics = _StreamMetrics() if _metrics_enabled(collect_metrics) else None
 
     async def _read(self):
         """
         读取传入的事件源流并生成事件块。
         """
-        data = b''
+        parser = SSEParser()
         async for chunk in self._response.content.iter_any():
-            for line in chunk.splitlines(True):
-                data += line
-                if data.endswith((b'\r\r', b'\n\n', b'\r\n\r\n')):
-                    yield data
-                    data = b''
+            for block in parser.feed(chunk):
+                yield block
+        data = parser.flush()
         if data:
             yield data
 
@@ -161,56 +374,28 @@ class AsyncSSEClient:
         Returns:
             generator: 解析后的 Event 对象的生成器。
         """
-        async for chunk in self._read():
-            event = Event()
-            # Split before decoding so splitlines() only uses \r and \n
-            for line in chunk.splitlines():
-                # Decode the line.
-                line = line.decode(self._char_enc)
-                # Lines starting with a separator are comments and are to be ignored.
-                if not line.strip() or line.startswith(':'):
-                    continue
-
-                data = line.split(':', 1)
-                field = data[0]
-                # Ignore unknown fields.
-                if field not in event.__dict__:
-                    event.raw += line
+        debug = logger.isEnabledFor(logging.DEBUG)
+        metrics = self.metrics
+        try:
+            async for chunk in self._read():
+                event = _parse_event(chunk, self._char_enc, debug)
+                # Events with no data are not dispatched.
+                if not event.data:
                     continue
 
-                if len(data) > 1:
-                    # From the spec:
-                    # "If value starts with a single U+0020 SPACE character,
-                    # remove it from value."
-                    if data[1].startswith(' '):
-                        value = data[1][1:]
-                    else:
-                        value = data[1]
-                else:
-                    # If no value is present after the separator,
-                    # assume an empty value.
-                    value = ''
-
-                # The data field may come over multiple lines and their values are concatenated with each other.
-                if field == 'data':
-                    event.__dict__[field] += value + '\n'
-                    event.raw += value + '\n'
-                else:
-                    event.__dict__[field] = value
-                    event.raw += value
-
-            # Events with no data are not dispatched.
-            if not event.data:
-                continue
+                # If the data field ends with a newline, remove it.
+                if event.data.endswith('\n'):
+                    event.data = event.data[0:-1]
 
-            # If the data field ends with a newline, remove it.
-            if event.data.endswith('\n'):
-                event.data = event.data[0:-1]
+                # Empty event names default to 'message'
+                event.event = event.event or 'message'
 
-            # Empty event names default to 'message'
-            event.event = event.event or 'message'
-            
-            yield event
+                if metrics is not None:
+                    metrics.on_event()
+                yield event
+        finally:
+            if metrics is not None:
+                metrics.finish()
 
 
 class Event(object):